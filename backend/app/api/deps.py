@@ -12,6 +12,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.db.mongodb import get_database
 from app.core.security import decode_access_token
 from app.schemas.user import UserInDB
+from app.services.user_cache import user_cache
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/access-token")
@@ -45,8 +46,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from database
-    user = await db.users.find_one({"email": email})
+    # Get user from the cache or database
+    user = await user_cache.get(db, email)
     
     if user is None:
         raise HTTPException(
@@ -55,10 +56,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Convert ObjectId to string for Pydantic validation
-    user["_id"] = str(user["_id"])
-    
-    return UserInDB(**user)
+    return user
 
 
 async def get_current_active_user(
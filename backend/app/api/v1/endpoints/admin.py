@@ -5,17 +5,23 @@ Admin-only API endpoints for user management.
 Requires role == "admin".
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
-from typing import List, Optional
+from typing import Optional
 from pydantic import BaseModel
 from datetime import datetime
 
 from app.db.mongodb import get_database
 from app.models.land import LandModel
 from app.schemas.user import UserResponse, UserInDB
+from app.schemas.pagination import Page
 from app.api.deps import get_current_admin
+from app.services.registry_stats import registry_stats_service
+from app.services.user_cache import user_cache
+from app.services.registry_export import MEDIA_TYPES, ExportFormat, registry_export_service
+from app.utils.pagination import paginate
 
 router = APIRouter()
 
@@ -30,24 +36,25 @@ class WalletUpdateRequest(BaseModel):
     wallet_address: Optional[str] = None  # Pass null to remove wallet
 
 
-@router.get("/users", response_model=List[UserResponse])
+@router.get("/users", response_model=Page[UserResponse])
 async def list_users(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     current_user: UserInDB = Depends(get_current_admin),
     db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
-    List all users in the system.
+    List all users in the system, oldest first.
     Admin only.
     """
-    cursor = db.users.find({})
-    users = await cursor.to_list(length=500)
+    users, next_cursor = await paginate(db.users, {}, limit=limit, cursor=cursor)
 
     result = []
     for user in users:
         user["_id"] = str(user["_id"])
         result.append(user)
 
-    return result
+    return {"items": result, "next_cursor": next_cursor}
 
 
 @router.patch("/users/{user_id}/role", response_model=UserResponse)
@@ -85,6 +92,7 @@ async def update_user_role(
         {"_id": ObjectId(user_id)},
         {"$set": {"role": body.role}}
     )
+    await user_cache.invalidate(db, email=user["email"], user_id=user_id)
 
     user["_id"] = str(user["_id"])
     user["role"] = body.role
@@ -116,6 +124,7 @@ async def update_user_wallet(
             "wallet_linked_at": datetime.utcnow() if body.wallet_address else None,
         }}
     )
+    await user_cache.invalidate(db, email=user["email"], user_id=user_id)
 
     user["_id"] = str(user["_id"])
     user["wallet_address"] = body.wallet_address
@@ -124,14 +133,17 @@ async def update_user_wallet(
 
 @router.get("/transfers/disputed")
 async def get_disputed_transfers(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     current_user: UserInDB = Depends(get_current_admin),
     db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
-    Get all disputed transfers for admin mediation.
+    Get all disputed transfers for admin mediation, oldest first.
     """
-    cursor = db[LandModel.collection_name].find({"transfer_status": "disputed"})
-    lands = await cursor.to_list(length=100)
+    lands, next_cursor = await paginate(
+        db[LandModel.collection_name], {"transfer_status": "disputed"}, limit=limit, cursor=cursor
+    )
     
     result = []
     for land in lands:
@@ -140,4 +152,48 @@ async def get_disputed_transfers(
         land["owner_id"] = str(land["owner_id"])
         result.append(land)
         
-    return result
+    return {"items": result, "next_cursor": next_cursor}
+
+
+@router.post("/registry-stats/rebuild")
+async def rebuild_registry_stats(
+    current_user: UserInDB = Depends(get_current_admin),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
+    """
+    Recount the explorer stats counters from the lands collection.
+    """
+    return await registry_stats_service.rebuild(db)
+
+
+def _export(db: AsyncIOMotorDatabase, kind: str, format: ExportFormat) -> StreamingResponse:
+    filename = f"{kind}-{datetime.utcnow():%Y%m%d-%H%M%S}.{format}"
+    return StreamingResponse(
+        registry_export_service.stream(db, kind, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/export/lands")
+async def export_lands(
+    format: ExportFormat = "ndjson",
+    current_user: UserInDB = Depends(get_current_admin),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
+    """
+    Stream every land as NDJSON or CSV.
+    """
+    return _export(db, "lands", format)
+
+
+@router.get("/export/users")
+async def export_users(
+    format: ExportFormat = "ndjson",
+    current_user: UserInDB = Depends(get_current_admin),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
+    """
+    Stream every user (without password hashes) as NDJSON or CSV.
+    """
+    return _export(db, "users", format)
@@ -43,6 +43,8 @@ async def register(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except HTTPException:
+        raise  # e.g. 503 while password hashing is saturated
     except Exception as e:
         logger.error(f"Registration error: {e}")
         raise HTTPException(
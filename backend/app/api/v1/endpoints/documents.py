@@ -0,0 +1,134 @@
+"""
+Document Endpoints
+
+Serves registration documents by CID from the local document cache, so
+verifiers reviewing a land read its deeds at disk speed instead of going
+to a public IPFS gateway every time.
+"""
+
+import asyncio
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+
+from app.db.mongodb import get_database
+from app.models.ipfs_object import IpfsObjectModel
+from app.models.land import LandModel
+from app.services.document_cache import document_cache
+from app.services.pinata_service import pinata_service
+from app.utils.cid import CHUNK_SIZE
+
+router = APIRouter()
+
+_CID = re.compile(r"^[A-Za-z0-9]{46,100}$")
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# A CID names exactly one content forever
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+async def _known_document(db, cid: str) -> Optional[Dict[str, Any]]:
+    """The ipfs_objects record, or the land document entry, for a CID this registry stores"""
+    record = await db[IpfsObjectModel.collection_name].find_one(
+        {"_id": cid}, {"sha256": 1, "content_type": 1}
+    )
+    if record is not None:
+        return record
+    # Documents pinned before ipfs_objects existed
+    land = await db[LandModel.collection_name].find_one(
+        {"documents.ipfs_hash": cid}, {"documents.$": 1}
+    )
+    if land is not None:
+        return {"content_type": land["documents"][0].get("type")}
+    return None
+
+
+def _byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header into inclusive (start, end).
+
+    Returns None to send the whole document (no header, or a form we do not
+    serve, e.g. several ranges). Raises 416 if the range is unsatisfiable.
+    """
+    match = _RANGE.match(header.strip()) if header else None
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    else:  # Suffix range: the last N bytes
+        start, end = max(0, size - int(last)), size - 1
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+async def _read_range(handle, start: int, end: int):
+    try:
+        await asyncio.to_thread(handle.seek, start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await asyncio.to_thread(handle.read, min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        await asyncio.to_thread(handle.close)
+
+
+@router.api_route("/{cid}", methods=["GET", "HEAD"])
+async def get_document(cid: str, request: Request, db = Depends(get_database)):
+    """
+    Download a registration document by CID.
+
+    Only documents stored by this registry are served. The first request
+    fetches the document from the document store and checks it against its
+    CID; later requests are served from the on-disk cache. Supports
+    single-range Range requests, If-None-Match (the ETag is the CID) and
+    HEAD. Like the IPFS gateways it replaces, it needs no authentication.
+    """
+    if not _CID.match(cid):
+        raise HTTPException(status_code=400, detail="Invalid CID")
+
+    etag = f'"{cid}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in if_none_match:
+        return Response(status_code=304, headers=headers)
+
+    document = await _known_document(db, cid)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    handle, size = await document_cache.open(
+        cid, lambda: pinata_service.download(cid), sha256=document.get("sha256")
+    )
+    media_type = document.get("content_type") or "application/octet-stream"
+
+    # If-Range: only honour Range when the client's copy is this content
+    if_range = request.headers.get("if-range")
+    try:
+        byte_range = _byte_range(request.headers.get("range"), size) if if_range in (None, etag) else None
+    except HTTPException:
+        handle.close()
+        raise
+    start, end = byte_range or (0, size - 1)
+    headers["Content-Length"] = str(end - start + 1 if size else 0)
+    status_code = 200
+    if byte_range is not None:
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    if request.method == "HEAD" or size == 0:
+        handle.close()
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+    return StreamingResponse(
+        _read_range(handle, start, end), status_code=status_code, headers=headers, media_type=media_type
+    )
@@ -5,12 +5,16 @@ Public endpoints for the frontend Explorer page.
 No authentication required — these are read-only, public-facing stats.
 """
 
-from fastapi import APIRouter, Depends
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, Query
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 from app.db.mongodb import get_database
 from app.models.land import LandModel
+from app.services.blockchain import async_blockchain_service
+from app.services.event_indexer import event_indexer_service
+from app.services.registry_stats import registry_stats_service
+from app.utils.pagination import paginate
 
 router = APIRouter()
 
@@ -18,44 +22,111 @@ router = APIRouter()
 @router.get("/stats")
 async def get_explorer_stats(db=Depends(get_database)) -> Dict[str, Any]:
     """
-    Aggregate counts from MongoDB for the network stats cards:
+    Counts for the network stats cards:
     - total_properties: all land records
     - verified_properties: blockchain_status = 'verified'
     - pending_properties: blockchain_status = 'pending' or 'not_minted'
-    - total_users: count of documents in users collection
+    - rejected_properties: blockchain_status = 'rejected'
+    - active_users: distinct land owners
+
+    A point read of the registry_stats counters (REGISTRY_STATS_COUNTERS),
+    otherwise one $facet aggregation over the lands.
     """
-    collection = db[LandModel.collection_name]
+    stats = await registry_stats_service.get(db)
+    return {
+        "total_properties": stats["total"],
+        "verified_properties": stats["verified"],
+        "pending_properties": stats["pending"] + stats["not_minted"],
+        "rejected_properties": stats["rejected"],
+        "active_users": stats["owners"],
+    }
 
-    total = await collection.count_documents({})
-    verified = await collection.count_documents({"blockchain_status": "verified"})
-    pending = await collection.count_documents(
-        {"blockchain_status": {"$in": ["pending", "not_minted"]}}
-    )
-    rejected = await collection.count_documents({"blockchain_status": "rejected"})
 
-    # Count unique owner_ids as a proxy for active users
-    owner_ids = await collection.distinct("owner_id")
-    active_users = len(owner_ids)
+# Human-readable tx type per indexed contract event
+EVENT_TYPE_LABELS = {
+    "LandRegistered": "NFT Minted",
+    "LandVerified": "Verified On-Chain",
+    "LandRejected": "Application Rejected",
+    "LandTransferred": "Ownership Transferred",
+    "MetadataUpdated": "Metadata Updated",
+    "VerifierAdded": "Verifier Added",
+    "VerifierRemoved": "Verifier Removed",
+    "VerifierDeactivated": "Verifier Deactivated",
+    "VerifierReactivated": "Verifier Reactivated",
+    "DisputeCreated": "Dispute Opened",
+    "DisputeResolved": "Dispute Resolved",
+}
 
-    return {
-        "total_properties": total,
-        "verified_properties": verified,
-        "pending_properties": pending,
-        "rejected_properties": rejected,
-        "active_users": active_users,
-    }
+# Event argument holding the account that caused the event
+EVENT_ACTOR_ARGS = ("owner", "verifier", "from", "disputedBy", "resolvedBy", "verifierAddress")
+
+
+def _time_ago(value: Any) -> str:
+    """Format a timestamp as 'N secs/mins/hrs ago'"""
+    if not isinstance(value, datetime):
+        return str(value)
+    secs = int((datetime.utcnow() - value).total_seconds())
+    if secs < 60:
+        return f"{secs} secs ago"
+    if secs < 3600:
+        return f"{secs // 60} mins ago"
+    return f"{secs // 3600} hrs ago"
+
+
+def _short_address(address: str) -> str:
+    return f"{address[:6]}...{address[-4:]}" if len(address) > 10 else address
 
 
 @router.get("/transactions")
-async def get_recent_transactions(db=Depends(get_database)) -> List[Dict[str, Any]]:
+async def get_recent_transactions(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1),
+    db=Depends(get_database),
+) -> Dict[str, Any]:
+    """
+    Return indexed contract events as 'transactions', newest first, a page
+    at a time. Falls back to recently-updated land records while the chain
+    event indexer has not stored anything yet.
     """
-    Return the 20 most-recently-updated land records as 'transactions'.
+    if not await event_indexer_service.has_events(db):
+        return await _recent_land_updates(db, limit, cursor)
+    events, next_cursor = await event_indexer_service.recent_events(db, limit=limit, cursor=cursor)
+
+    token_ids = [e["token_id"] for e in events if e.get("token_id") is not None]
+    lands = await db[LandModel.collection_name].find(
+        {"token_id": {"$in": token_ids}}, {"_id": 1, "token_id": 1}
+    ).to_list(length=len(token_ids))
+    land_ids = {land["token_id"]: str(land["_id"]) for land in lands}
+
+    result = []
+    for event in events:
+        args = event.get("args", {})
+        actor = next((args[name] for name in EVENT_ACTOR_ARGS if name in args), "")
+        land_id = land_ids.get(event.get("token_id"))
+        result.append({
+            "hash": event["tx_hash"],
+            "type": EVENT_TYPE_LABELS.get(event["event"], event["event"]),
+            "from": _short_address(actor),
+            "to": "Registry Contract" if event["contract"] == "LandRegistry" else "Verification Contract",
+            "value": f"PROP-{land_id[:8].upper()}" if land_id else f"TOKEN-{event.get('token_id', '—')}",
+            "timestamp": _time_ago(event["block_timestamp"]),
+            "status": "confirmed" if event.get("confirmed") else "pending",
+            "token_id": event.get("token_id"),
+            "land_id": land_id,
+            "block_number": event["block_number"],
+        })
+
+    return {"items": result, "next_cursor": next_cursor}
+
+
+async def _recent_land_updates(db, limit: int, cursor: Optional[str]) -> Dict[str, Any]:
+    """
+    Return the most-recently-updated land records as 'transactions'.
     Each land update (register, mint, verify, reject) corresponds to a
     blockchain or DB write, making them the closest approximation to txns.
     """
-    collection = db[LandModel.collection_name]
-
-    cursor = collection.find(
+    lands, next_cursor = await paginate(
+        db[LandModel.collection_name],
         {},
         {
             "_id": 1,
@@ -67,10 +138,11 @@ async def get_recent_transactions(db=Depends(get_database)) -> List[Dict[str, An
             "updated_at": 1,
             "created_at": 1,
             "status": 1,
-        }
-    ).sort("updated_at", -1).limit(20)
-
-    lands = await cursor.to_list(length=20)
+        },
+        sort=[("updated_at", -1)],
+        limit=limit,
+        cursor=cursor,
+    )
 
     result = []
     for land in lands:
@@ -91,23 +163,11 @@ async def get_recent_transactions(db=Depends(get_database)) -> List[Dict[str, An
 
         tx_hash = land.get("blockchain_tx_hash") or ""
         updated_at = land.get("updated_at") or land.get("created_at") or datetime.utcnow()
-
-        # Format timestamp as a readable string
-        if isinstance(updated_at, datetime):
-            delta = datetime.utcnow() - updated_at
-            secs = int(delta.total_seconds())
-            if secs < 60:
-                time_str = f"{secs} secs ago"
-            elif secs < 3600:
-                time_str = f"{secs // 60} mins ago"
-            else:
-                time_str = f"{secs // 3600} hrs ago"
-        else:
-            time_str = str(updated_at)
+        time_str = _time_ago(updated_at)
 
         owner_id = str(land.get("owner_id", ""))
         # Truncate owner to look like an address
-        from_display = f"{owner_id[:6]}...{owner_id[-4:]}" if len(owner_id) > 10 else owner_id
+        from_display = _short_address(owner_id)
 
         result.append({
             "hash": tx_hash or str(land["_id"]),
@@ -121,18 +181,24 @@ async def get_recent_transactions(db=Depends(get_database)) -> List[Dict[str, An
             "land_id": str(land["_id"]),
         })
 
-    return result
+    return {"items": result, "next_cursor": next_cursor}
 
 
 @router.get("/properties")
-async def get_explorer_properties(db=Depends(get_database)) -> List[Dict[str, Any]]:
+async def get_explorer_properties(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1),
+    db=Depends(get_database),
+) -> Dict[str, Any]:
     """
-    Return land records (market feed) where is_for_sale == True and verified.
+    Return land records (market feed) where is_for_sale == True and verified,
+    most recently updated first, a page at a time.
     """
     collection = db[LandModel.collection_name]
     from app.models.user import UserModel
     
-    cursor = collection.find(
+    lands, next_cursor = await paginate(
+        collection,
         {
             "blockchain_status": "verified",
             "is_for_sale": True
@@ -150,15 +216,16 @@ async def get_explorer_properties(db=Depends(get_database)) -> List[Dict[str, An
             "owner_id": 1,
             "created_at": 1,
             "updated_at": 1,
-        }
-    ).sort("updated_at", -1).limit(50)
-
-    lands = await cursor.to_list(length=50)
+        },
+        sort=[("updated_at", -1)],
+        limit=limit,
+        cursor=cursor,
+    )
     
     # Pre-fetch users to get emails
     owner_ids = [l["owner_id"] for l in lands if "owner_id" in l]
     users_cursor = db[UserModel.collection_name].find({"_id": {"$in": owner_ids}}, {"email": 1, "full_name": 1})
-    users_map = {str(u["_id"]): u for u in await users_cursor.to_list(length=100)}
+    users_map = {str(u["_id"]): u for u in await users_cursor.to_list(length=len(owner_ids))}
 
     result = []
     for land in lands:
@@ -206,7 +273,7 @@ async def get_explorer_properties(db=Depends(get_database)) -> List[Dict[str, An
             "time_ago": time_str,
         })
 
-    return result
+    return {"items": result, "next_cursor": next_cursor}
 
 
 @router.get("/network")
@@ -217,34 +284,18 @@ async def get_network_info() -> Dict[str, Any]:
     - Current gas price (in Gwei)
     - Chain ID
     - Whether connected
+
+    Values come from the blockchain service's chain metadata cache, so
+    page views within a few seconds of each other share the same RPC calls.
     """
     try:
-        from app.services.blockchain import blockchain_service
-        w3 = blockchain_service.w3
-
-        is_connected = w3.is_connected()
-        if not is_connected:
-            return {
-                "connected": False,
-                "status": "disconnected",
-                "latest_block": None,
-                "gas_price_gwei": None,
-                "chain_id": None,
-                "network_name": "Sepolia Testnet",
-            }
-
-        latest_block = w3.eth.block_number
-        gas_price_wei = w3.eth.gas_price
-        gas_price_gwei = round(gas_price_wei / 1e9, 2)
-        chain_id = w3.eth.chain_id
+        chain = async_blockchain_service.chain
 
-        # Get latest block for timestamp (to compute block time)
-        latest_block_data = w3.eth.get_block("latest")
-        prev_block_data = w3.eth.get_block(latest_block - 1) if latest_block > 0 else None
-
-        block_time = None
-        if latest_block_data and prev_block_data:
-            block_time = int(latest_block_data["timestamp"]) - int(prev_block_data["timestamp"])
+        latest_block = await chain.block_number()
+        gas_price_wei = await chain.gas_price()
+        gas_price_gwei = round(gas_price_wei / 1e9, 2)
+        chain_id = await chain.chain_id()
+        block_time = await chain.block_time()
 
         return {
             "connected": True,
@@ -260,7 +311,7 @@ async def get_network_info() -> Dict[str, Any]:
         return {
             "connected": False,
             "status": "error",
-            "error": str(e),
+            "error": async_blockchain_service.provider.redact(str(e)),
             "latest_block": None,
             "gas_price_gwei": None,
             "chain_id": None,
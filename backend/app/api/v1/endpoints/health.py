@@ -6,10 +6,20 @@ API endpoints for service health monitoring.
 
 from fastapi import APIRouter, Depends, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from typing import Dict
+from typing import Any, Dict
 
+from app.api.deps import get_current_admin
 from app.db.mongodb import get_database
+from app.db.indexes import index_reconciler
 from app.core.config import settings
+from app.services.blockchain import async_blockchain_service
+from app.services.pinata_service import pinata_service
+from app.services.document_cache import document_cache
+from app.services.token_metadata import token_metadata_service
+from app.services.registry_export import registry_export_service
+from app.services.user_cache import user_cache
+from app.services.password_hasher import password_hasher
+from app.schemas.user import UserInDB
 
 router = APIRouter()
 
@@ -19,12 +29,15 @@ async def health_check():
     """
     Basic health check endpoint
     
-    Returns service status and version information
+    Returns service status and version information. `blockchain` is the
+    RPC readiness state (connecting, ready or unavailable); the API stays
+    up and serves database-backed routes while the node is unreachable.
     """
     return {
         "status": "healthy",
         "service": settings.APP_NAME,
-        "version": settings.APP_VERSION
+        "version": settings.APP_VERSION,
+        "blockchain": async_blockchain_service.readiness()["state"],
     }
 
 
@@ -51,3 +64,43 @@ async def database_health_check(
             "database": "disconnected",
             "error": str(e)
         }
+
+
+@router.get("/blockchain", response_model=Dict[str, Any])
+async def blockchain_health_check():
+    """
+    Blockchain RPC readiness endpoint
+    
+    Reports the last background probe of the RPC node; never waits on it
+    """
+    readiness = async_blockchain_service.readiness()
+    return {
+        "status": "healthy" if readiness["state"] == "ready" else "unhealthy",
+        **readiness,
+    }
+
+
+@router.get("/metrics", response_model=Dict[str, Any])
+async def metrics(current_user: UserInDB = Depends(get_current_admin)):
+    """
+    In-process cache, signer, RPC endpoint, IPFS upload, document cache,
+    token metadata, export, user cache and password hashing metrics, plus
+    the startup index reconciliation report (admin only: it includes the
+    signer address and nonce state)
+
+    Counters reset when the process restarts; with several workers each
+    reports its own.
+    """
+    return {
+        "gas_estimates": async_blockchain_service.gas_cache.stats(),
+        "chain_metadata": async_blockchain_service.chain.stats(),
+        "nonce": await async_blockchain_service.nonce_manager.status(),
+        "rpc": async_blockchain_service.provider.stats(),
+        "ipfs": pinata_service.stats(),
+        "document_cache": document_cache.stats(),
+        "token_metadata": token_metadata_service.stats(),
+        "indexes": index_reconciler.stats(),
+        "exports": registry_export_service.stats(),
+        "user_cache": user_cache.stats(),
+        "password_hashing": password_hasher.stats(),
+    }
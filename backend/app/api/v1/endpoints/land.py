@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Response, Query
+from typing import List, Optional, Union
 import json
 import re
 from datetime import datetime
 from bson import ObjectId
 
 from app.api.deps import get_current_user, get_current_verifier_or_admin
+from app.core.config import settings
 from app.db.mongodb import get_database
 
 from app.models.land import LandModel
@@ -17,16 +18,47 @@ from app.schemas.land import (
 from app.schemas.user import UserInDB
 from app.schemas.verifier import (
     VerifyLandRequest,
+    BatchVerifyLandsRequest,
     RejectLandRequest,
-    VerifyLandResponse,
     RejectLandResponse,
-    BlockchainTransactionResponse
 )
+from app.schemas.tx_job import TxJobAccepted, BatchTxJobsAccepted, BatchItemSkipped
+from app.schemas.pagination import Page
 from app.services.pinata_service import pinata_service
-from app.services.blockchain import blockchain_service
+from app.services.token_metadata import token_metadata_service
+from app.services.registry_stats import registry_stats_service
+from app.services.blockchain import async_blockchain_service as blockchain_service
+from app.services.tx_jobs import tx_job_service
+from app.services.event_indexer import event_indexer_service
+from app.services.chain_metadata import MAX_BATCH_SIZE
+from app.utils.pagination import paginate
 
 router = APIRouter()
 
+
+def _job_accepted(job: dict, message: str) -> TxJobAccepted:
+    """Build the 202 body for a freshly enqueued transaction job"""
+    job_id = str(job["_id"])
+    return TxJobAccepted(
+        message=message,
+        job_id=job_id,
+        kind=job["kind"],
+        land_id=str(job["land_id"]) if job.get("land_id") else None,
+        land_ids=[str(land_id) for land_id in job["land_ids"]] if job.get("land_ids") else None,
+        status=job["status"],
+        status_url=f"/api/v1/tx-jobs/{job_id}",
+    )
+
+
+def _verifier_address(current_user: UserInDB) -> str:
+    """Address verifications are recorded under on-chain for this user"""
+    if current_user.wallet_address:
+        return current_user.wallet_address
+    # MongoDB ID is 24 hex chars. Pad to 40 hex chars to create a valid deterministic Ethereum address
+    padded_id = str(current_user.id).zfill(40)
+    return f"0x{padded_id}"
+
+
 @router.post("/register", response_model=LandResponse)
 async def register_land(
     property_id: str = Form(...),
@@ -43,7 +75,7 @@ async def register_land(
 ):
     """
     Register a new land.
-    1. Uploads documents to Pinata IPFS.
+    1. Uploads documents to Pinata IPFS (content already pinned is not re-sent).
     2. Stores land details in MongoDB with 'pending' status.
     """
     
@@ -56,15 +88,16 @@ async def register_land(
     if existing:
         raise HTTPException(status_code=400, detail="Property ID is already registered")
     
-    # 1. Upload files to IPFS
-    uploaded_documents = []
-    for file in files:
-        cid = pinata_service.upload_file(file)
-        uploaded_documents.append({
+    # 1. Upload files to IPFS, concurrently (PINATA_UPLOAD_CONCURRENCY at a time)
+    cids = await pinata_service.upload_files(files)
+    uploaded_documents = [
+        {
             "name": file.filename,
             "ipfs_hash": cid,
             "type": file.content_type
-        })
+        }
+        for file, cid in zip(files, cids)
+    ]
     
     # 2. Create Land Record
     land_data = {
@@ -95,6 +128,8 @@ async def register_land(
     }
     
     result = await db[LandModel.collection_name].insert_one(land_data)
+    await pinata_service.add_references(cids)
+    await registry_stats_service.land_created(db, land_data["owner_id"])
     
     # Fetch and return
     created_land = await db[LandModel.collection_name].find_one({"_id": result.inserted_id})
@@ -105,11 +140,17 @@ async def register_land(
     
     return created_land
 
-@router.get("/my-lands", response_model=List[LandResponse])
-async def get_my_lands(current_user: UserInDB = Depends(get_current_user), db = Depends(get_database)):
-    """Fetch lands owned by current user"""
-    cursor = db[LandModel.collection_name].find({"owner_id": ObjectId(current_user.id)})
-    lands = await cursor.to_list(length=100)
+@router.get("/my-lands", response_model=Page[LandResponse])
+async def get_my_lands(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    current_user: UserInDB = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Fetch lands owned by current user, oldest first"""
+    lands, next_cursor = await paginate(
+        db[LandModel.collection_name], {"owner_id": ObjectId(current_user.id)}, limit=limit, cursor=cursor
+    )
     
     result = []
     for land in lands:
@@ -117,7 +158,7 @@ async def get_my_lands(current_user: UserInDB = Depends(get_current_user), db =
         land["owner_id"] = str(land["owner_id"])
         result.append(land)
         
-    return result
+    return {"items": result, "next_cursor": next_cursor}
 
 @router.get("/transfers/my")
 async def get_my_transfers(
@@ -157,20 +198,24 @@ async def get_my_transfers(
 # IMPORTANT: These static routes MUST be defined before /{land_id}
 # to prevent FastAPI from treating path segments as a land_id param.
 
-@router.get("/all-pending", response_model=List[LandResponse])
+@router.get("/all-pending", response_model=Page[LandResponse])
 async def get_all_pending_lands(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     current_user: UserInDB = Depends(get_current_verifier_or_admin),
     db = Depends(get_database)
 ):
     """
-    Get all lands that need verifier action:
+    Get all lands that need verifier action, oldest first:
     - blockchain_status = 'not_minted' (submitted, needs minting)
     - blockchain_status = 'pending' (minted, awaiting verify/reject)
     """
-    cursor = db[LandModel.collection_name].find(
-        {"blockchain_status": {"$in": ["not_minted", "pending"]}}
+    lands, next_cursor = await paginate(
+        db[LandModel.collection_name],
+        {"blockchain_status": {"$in": ["not_minted", "pending"]}},
+        limit=limit,
+        cursor=cursor,
     )
-    lands = await cursor.to_list(length=200)
 
     result = []
     for land in lands:
@@ -178,20 +223,23 @@ async def get_all_pending_lands(
         land["owner_id"] = str(land["owner_id"])
         result.append(land)
 
-    return result
+    return {"items": result, "next_cursor": next_cursor}
 
 
-@router.get("/pending/list", response_model=List[LandResponse])
+@router.get("/pending/list", response_model=Page[LandResponse])
 async def get_pending_lands(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     current_user: UserInDB = Depends(get_current_verifier_or_admin),
     db = Depends(get_database)
 ):
     """
     Get all pending lands (for verifiers)
-    Returns lands with blockchain_status = 'pending'
+    Returns lands with blockchain_status = 'pending', oldest first
     """
-    cursor = db[LandModel.collection_name].find({"blockchain_status": "pending"})
-    lands = await cursor.to_list(length=100)
+    lands, next_cursor = await paginate(
+        db[LandModel.collection_name], {"blockchain_status": "pending"}, limit=limit, cursor=cursor
+    )
     
     result = []
     for land in lands:
@@ -199,10 +247,10 @@ async def get_pending_lands(
         land["owner_id"] = str(land["owner_id"])
         result.append(land)
         
-    return result
+    return {"items": result, "next_cursor": next_cursor}
 
 
-@router.post("/{land_id}/mint")
+@router.post("/{land_id}/mint", response_model=TxJobAccepted, status_code=202)
 async def mint_land(
     land_id: str,
     current_user: UserInDB = Depends(get_current_verifier_or_admin),
@@ -213,9 +261,11 @@ async def mint_land(
 
     Steps:
     1. Fetch land from MongoDB — must be 'not_minted'
-    2. Upload metadata to IPFS (reuse first document hash or create metadata)
-    3. Call blockchain_service.register_land() → returns token_id
-    4. Update MongoDB: token_id, blockchain_status = 'pending'
+    2. Pin the token's metadata JSON to IPFS, batched with concurrent mints
+       (reused if it was pinned before and is unchanged)
+    3. Enqueue a 'mint' transaction job and return 202 with its id
+    4. The job worker sends registerLand and, once mined, sets
+       token_id and blockchain_status = 'pending' (poll GET /tx-jobs/{job_id})
     """
     if not ObjectId.is_valid(land_id):
         raise HTTPException(status_code=400, detail="Invalid land ID format")
@@ -230,10 +280,6 @@ async def mint_land(
             detail=f"Land is not in not_minted state (current: {land.get('blockchain_status')})"
         )
 
-    # Build ipfs_hash: prefer first doc hash, else use land ID as placeholder
-    docs = land.get("documents", [])
-    ipfs_hash = docs[0]["ipfs_hash"] if docs else land_id
-
     # Build location string — always ensure it's a str for Solidity ABI encoding
     raw_location = land.get("location", "")
     if isinstance(raw_location, dict):
@@ -254,49 +300,43 @@ async def mint_land(
     except (TypeError, ValueError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid area/price: {e}")
 
-    # Call blockchain service — raises on failure (error propagated to HTTP response)
+    # Token URI: ipfs://<directory CID>/<land id>.json
+    ipfs_hash = await token_metadata_service.token_uri(db, land)
+
     try:
-        result = blockchain_service.register_land(
-            property_id=land.get("property_id"),
-            ipfs_hash=ipfs_hash,
-            area=area,
-            price=price,
-            location=location_str,
-            owner_address="0x0000000000000000000000000000000000000000"
+        job = await tx_job_service.enqueue(
+            db,
+            kind="mint",
+            land_id=ObjectId(land_id),
+            params={
+                "property_id": land.get("property_id"),
+                "ipfs_hash": ipfs_hash,
+                "area": area,
+                "price": price,
+                "location": location_str,
+            },
+            requested_by=str(current_user.id),
+            expected_status=("not_minted",),
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Blockchain minting failed: {str(e)}")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
-    # result is guaranteed non-None (register_land now raises on failure)
-    token_id = result.get("token_id")
-
-    await db[LandModel.collection_name].update_one(
-        {"_id": ObjectId(land_id)},
-        {"$set": {
-            "token_id": token_id,
-            "blockchain_status": "pending",
-            "blockchain_tx_hash": result["tx_hash"],
-            "updated_at": datetime.utcnow()
-        }}
-    )
-
-    return {
-        "message": "Land minted successfully",
-        "land_id": land_id,
-        "token_id": token_id,
-        "tx_hash": result["tx_hash"],
-        "etherscan_url": f"https://sepolia.etherscan.io/tx/{result['tx_hash']}"
-    }
+    return _job_accepted(job, "Mint transaction queued")
 
 
-@router.get("/verified/list", response_model=List[LandResponse])
-async def get_verified_lands(db = Depends(get_database)):
+@router.get("/verified/list", response_model=Page[LandResponse])
+async def get_verified_lands(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db = Depends(get_database)
+):
     """
     Get all verified lands (public endpoint)
-    Returns lands with blockchain_status = 'verified'
+    Returns lands with blockchain_status = 'verified', oldest first
     """
-    cursor = db[LandModel.collection_name].find({"blockchain_status": "verified"})
-    lands = await cursor.to_list(length=100)
+    lands, next_cursor = await paginate(
+        db[LandModel.collection_name], {"blockchain_status": "verified"}, limit=limit, cursor=cursor
+    )
     
     result = []
     for land in lands:
@@ -304,7 +344,7 @@ async def get_verified_lands(db = Depends(get_database)):
         land["owner_id"] = str(land["owner_id"])
         result.append(land)
         
-    return result
+    return {"items": result, "next_cursor": next_cursor}
 
 
 @router.get("/verify-ownership/{land_id}", response_model=OwnershipVerificationResponse)
@@ -331,26 +371,32 @@ async def verify_ownership(
     ipfs_hash = None
     ipfs_url = None
     on_chain_owner = None
+    verification_count = land.get("verification_count", 0)
 
-    # Try to fetch live on-chain data if the land has been minted
+    # Read on-chain state if the land has been minted: from the chain event
+    # index when it has seen the token, otherwise live from the RPC node
     if token_id is not None:
         try:
-            on_chain = blockchain_service.get_land_details(token_id)
+            on_chain = await event_indexer_service.get_land_state(db, token_id)
+            if on_chain is None:
+                on_chain = await blockchain_service.get_land_details(token_id)
             if on_chain:
-                ipfs_hash = on_chain.get("ipfs_hash") or (land.get("documents") or [{}])[0].get("ipfs_hash")
+                ipfs_hash = on_chain.get("ipfs_hash")
                 on_chain_owner = on_chain.get("current_owner")
-                verification_count = on_chain.get("verification_count", 0)
+                if on_chain.get("verification_count") is not None:
+                    verification_count = on_chain["verification_count"]
         except Exception as e:
             print(f"[verify-ownership] blockchain lookup failed for token {token_id}: {e}")
 
     # Fallback to DB documents for ipfs_hash if not fetched from chain
-    if not ipfs_hash:
-        docs = land.get("documents", [])
-        if docs:
-            ipfs_hash = docs[0].get("ipfs_hash")
+    docs = land.get("documents", [])
+    if not ipfs_hash and docs:
+        ipfs_hash = docs[0].get("ipfs_hash")
 
-    if ipfs_hash:
-        ipfs_url = f"https://ipfs.io/ipfs/{ipfs_hash}"
+    # Link the first document; minted tokens record their metadata URI instead
+    document_cid = docs[0].get("ipfs_hash") if docs else ipfs_hash
+    if document_cid and "/" not in document_cid:
+        ipfs_url = f"{settings.PUBLIC_API_URL.rstrip('/')}/api/v1/documents/{document_cid}"
 
     tx_hash = land.get("blockchain_tx_hash")
     etherscan_url = f"https://sepolia.etherscan.io/tx/{tx_hash}" if tx_hash else None
@@ -367,7 +413,7 @@ async def verify_ownership(
         verified_at=land.get("verified_at"),
         verified_by=land.get("verified_by"),
         verified_by_list=land.get("verified_by_list", []),
-        verification_count=verification_count if token_id is not None else land.get("verification_count", 0),
+        verification_count=verification_count,
         rejection_reason=land.get("rejection_reason"),
         tx_hash=tx_hash,
         etherscan_url=etherscan_url,
@@ -407,11 +453,111 @@ async def delete_land(
     if land.get("status") != "rejected":
         raise HTTPException(status_code=400, detail="Only rejected applications can be deleted")
         
-    await db[LandModel.collection_name].delete_one({"_id": ObjectId(land_id)})
+    result = await db[LandModel.collection_name].delete_one({"_id": ObjectId(land_id)})
+    if result.deleted_count:
+        # Documents no other land uses are unpinned by the orphan sweep
+        await pinata_service.release_references(doc["ipfs_hash"] for doc in land.get("documents", []))
+        await registry_stats_service.land_deleted(db, land["owner_id"], land.get("blockchain_status"))
     return {"message": "Rejected application deleted successfully"}
 
 
-@router.post("/{land_id}/verify", response_model=VerifyLandResponse)
+@router.post("/batch/verify", response_model=BatchTxJobsAccepted, status_code=202)
+async def verify_lands_batch(
+    request: BatchVerifyLandsRequest,
+    current_user: UserInDB = Depends(get_current_verifier_or_admin),
+    db = Depends(get_database)
+):
+    """
+    Verify many lands on blockchain, VERIFY_BATCH_SIZE lands per
+    verifyLandBatch transaction.
+    Lands that cannot be verified now (unknown, not 'pending', not minted,
+    already verified by this user, or with a transaction in flight) are
+    listed in `skipped` rather than failing the request.
+    Returns 202 with one job per transaction; each confirmed job's result
+    has the per-land outcome read from the receipt's events.
+    Disabled (503) unless VERIFY_BATCH_ENABLED is set.
+    """
+    if not settings.VERIFY_BATCH_ENABLED:
+        raise HTTPException(
+            status_code=503,
+            detail="Batch verification is disabled: the configured LandRegistry has no verifyLandBatch"
+        )
+    if len(request.land_ids) > settings.VERIFY_BATCH_MAX_LANDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.VERIFY_BATCH_MAX_LANDS} lands can be verified per request"
+        )
+    invalid = [land_id for land_id in request.land_ids if not ObjectId.is_valid(land_id)]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid land ID format: {', '.join(invalid)}")
+
+    verifier_address = _verifier_address(current_user)
+    requested = list(dict.fromkeys(ObjectId(land_id) for land_id in request.land_ids))
+    found = {
+        land["_id"]: land async for land in db[LandModel.collection_name].find(
+            {"_id": {"$in": requested}},
+            {"blockchain_status": 1, "token_id": 1, "verified_by_list": 1, "active_tx_job_id": 1},
+        )
+    }
+
+    skipped: List[BatchItemSkipped] = []
+    lands = {}
+    for land_id in requested:
+        land = found.get(land_id)
+        if not land:
+            reason = "Land not found"
+        elif land.get("blockchain_status") != "pending":
+            reason = f"Land must be in 'pending' state to verify (current: {land.get('blockchain_status')})"
+        elif land.get("token_id") is None:
+            reason = "Land has no token ID (not minted yet)"
+        elif verifier_address in land.get("verified_by_list", []):
+            reason = "You have already verified this land"
+        elif land.get("active_tx_job_id") is not None:
+            reason = "A blockchain transaction for this land is already in progress"
+        else:
+            lands[land_id] = land["token_id"]
+            continue
+        skipped.append(BatchItemSkipped(land_id=str(land_id), reason=reason))
+
+    batch_size = max(1, min(settings.VERIFY_BATCH_SIZE, MAX_BATCH_SIZE))
+    pending = list(lands.items())
+    jobs = []
+    for start in range(0, len(pending), batch_size):
+        chunk = dict(pending[start:start + batch_size])
+        try:
+            job = await tx_job_service.enqueue_batch(
+                db,
+                kind="verify_batch",
+                lands=chunk,
+                params={"verifier_address": verifier_address},
+                requested_by=str(current_user.id),
+                expected_status=("pending",),
+            )
+        except ValueError as e:
+            skipped.extend(BatchItemSkipped(land_id=str(land_id), reason=str(e)) for land_id in chunk)
+            continue
+        # Lands claimed by another request between the read above and the claim
+        skipped.extend(
+            BatchItemSkipped(land_id=str(land_id), reason="A blockchain transaction for this land is already in progress")
+            for land_id in chunk if land_id not in job["land_ids"]
+        )
+        jobs.append(_job_accepted(job, f"Batch verification of {len(job['land_ids'])} lands queued"))
+
+    if not jobs:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "None of the lands can be verified", "skipped": [s.model_dump() for s in skipped]}
+        )
+
+    queued = sum(len(job.land_ids) for job in jobs)
+    return BatchTxJobsAccepted(
+        message=f"{queued} lands queued for verification in {len(jobs)} transactions",
+        jobs=jobs,
+        skipped=skipped,
+    )
+
+
+@router.post("/{land_id}/verify", response_model=TxJobAccepted, status_code=202)
 async def verify_land(
     land_id: str,
     request: VerifyLandRequest,
@@ -421,6 +567,7 @@ async def verify_land(
     """
     Verify a land on blockchain.
     Uses ADMIN_PRIVATE_KEY — no verifier private key required.
+    Returns 202 with a transaction job id; poll GET /tx-jobs/{job_id}.
     """
     if not ObjectId.is_valid(land_id):
         raise HTTPException(status_code=400, detail="Invalid land ID format")
@@ -439,80 +586,36 @@ async def verify_land(
     if token_id is None:
         raise HTTPException(status_code=400, detail="Land has no token ID (not minted yet)")
 
-    if current_user.wallet_address:
-        verifier_address = current_user.wallet_address
-    else:
-        # MongoDB ID is 24 hex chars. Pad to 40 hex chars to create a valid deterministic Ethereum address
-        padded_id = str(current_user.id).zfill(40)
-        verifier_address = f"0x{padded_id}"
-    try:
-        result = blockchain_service.verify_land(token_id, verifier_address)
-    except Exception as e:
-        error_msg = str(e)
-        if "execution reverted" in error_msg:
-            # Extract the pure revert reason if possible
-            reason = error_msg.split("execution reverted:")[-1].strip()
-            raise HTTPException(status_code=400, detail=f"Smart contract rejected the transaction: {reason}")
-        raise HTTPException(status_code=500, detail=f"Blockchain verification failed: {error_msg}")
-
-    if not result or result.get("status") != "success":
-        raise HTTPException(status_code=500, detail="Blockchain verification failed")
-
-    # Fetch updated details to see if fully verified
-    details = blockchain_service.get_land_details(token_id)
-    verification_count = details.get("verification_count", 0) if details else 0
-
-    if verification_count >= 3:
-        update_data = {
-            "blockchain_status": "verified",
-            "blockchain_tx_hash": result["tx_hash"],
-            "verified_at": datetime.utcnow(),
-            "verified_by": verifier_address,
-            "status": "verified",
-            "verification_count": verification_count,
-            "updated_at": datetime.utcnow()
-        }
-    else:
-        update_data = {
-            "blockchain_tx_hash": result["tx_hash"],
-            "verification_count": verification_count,
-            "updated_at": datetime.utcnow()
-            # Status remains 'pending'
-        }
+    verifier_address = _verifier_address(current_user)
 
-    await db[LandModel.collection_name].update_one(
-        {"_id": ObjectId(land_id)},
-        {
-            "$set": update_data,
-            "$addToSet": {"verified_by_list": verifier_address}
-        }
-    )
+    try:
+        job = await tx_job_service.enqueue(
+            db,
+            kind="verify",
+            land_id=ObjectId(land_id),
+            params={"token_id": token_id, "verifier_address": verifier_address},
+            requested_by=str(current_user.id),
+            expected_status=("pending",),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
-    return VerifyLandResponse(
-        message="Land verified successfully on blockchain",
-        land_id=land_id,
-        token_id=token_id,
-        transaction=BlockchainTransactionResponse(
-            tx_hash=result["tx_hash"],
-            status="success",
-            block_number=result.get("block_number"),
-            gas_used=result.get("gas_used")
-        ),
-        etherscan_url=f"https://sepolia.etherscan.io/tx/{result['tx_hash']}"
-    )
+    return _job_accepted(job, "Verification transaction queued")
 
 
-@router.post("/{land_id}/reject", response_model=RejectLandResponse)
+@router.post("/{land_id}/reject", response_model=Union[RejectLandResponse, TxJobAccepted])
 async def reject_land(
     land_id: str,
     request: RejectLandRequest,
+    response: Response,
     current_user: UserInDB = Depends(get_current_verifier_or_admin),
     db = Depends(get_database)
 ):
     """
     Reject a land.
     - If not_minted: MongoDB update only (no blockchain call needed).
-    - If pending: on-chain rejection via admin wallet, then MongoDB update.
+    - If pending: enqueue an on-chain rejection job via the admin wallet and
+      return 202 with its id; MongoDB is updated once the tx is mined.
     """
     if not ObjectId.is_valid(land_id):
         raise HTTPException(status_code=400, detail="Invalid land ID format")
@@ -533,8 +636,8 @@ async def reject_land(
 
     # --- Pre-mint rejection: no blockchain call ---
     if status == "not_minted":
-        await db[LandModel.collection_name].update_one(
-            {"_id": ObjectId(land_id)},
+        updated = await db[LandModel.collection_name].update_one(
+            {"_id": ObjectId(land_id), "blockchain_status": "not_minted", "active_tx_job_id": None},
             {"$set": {
                 "blockchain_status": "rejected",
                 "rejection_reason": request.reason,
@@ -544,6 +647,9 @@ async def reject_land(
                 "updated_at": datetime.utcnow()
             }}
         )
+        if updated.matched_count == 0:
+            raise HTTPException(status_code=409, detail="A blockchain transaction for this land is already in progress")
+        await registry_stats_service.status_changed(db, "not_minted", "rejected")
         return RejectLandResponse(
             message="Land application rejected (before minting)",
             land_id=land_id,
@@ -558,39 +664,19 @@ async def reject_land(
         raise HTTPException(status_code=400, detail="Land has no token ID")
 
     try:
-        result = blockchain_service.reject_land(token_id, request.reason)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Blockchain rejection failed: {str(e)}")
-
-    if not result or result.get("status") != "success":
-        raise HTTPException(status_code=500, detail="Blockchain rejection failed")
-
-    await db[LandModel.collection_name].update_one(
-        {"_id": ObjectId(land_id)},
-        {"$set": {
-            "blockchain_status": "rejected",
-            "blockchain_tx_hash": result["tx_hash"],
-            "verified_at": datetime.utcnow(),
-            "verified_by": verifier_id,
-            "rejection_reason": request.reason,
-            "status": "rejected",
-            "updated_at": datetime.utcnow()
-        }}
-    )
+        job = await tx_job_service.enqueue(
+            db,
+            kind="reject",
+            land_id=ObjectId(land_id),
+            params={"token_id": token_id, "reason": request.reason, "verifier_id": verifier_id},
+            requested_by=str(current_user.id),
+            expected_status=("pending",),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
-    return RejectLandResponse(
-        message="Land rejected on blockchain",
-        land_id=land_id,
-        token_id=token_id,
-        reason=request.reason,
-        transaction=BlockchainTransactionResponse(
-            tx_hash=result["tx_hash"],
-            status="success",
-            block_number=result.get("block_number"),
-            gas_used=result.get("gas_used")
-        ),
-        etherscan_url=f"https://sepolia.etherscan.io/tx/{result['tx_hash']}"
-    )
+    response.status_code = 202
+    return _job_accepted(job, "Rejection transaction queued")
 
 # ==================== TRANSFER & ESCROW ENDPOINTS ====================
 
@@ -719,6 +805,7 @@ async def release_transfer(
             "updated_at": datetime.utcnow()
         }}
     )
+    await registry_stats_service.owner_changed(db, land["owner_id"], ObjectId(buyer_id))
 
     return {"message": "Property successfully released to buyer."}
 
@@ -818,6 +905,7 @@ async def resolve_dispute(
                 "updated_at": datetime.utcnow()
             }}
         )
+        await registry_stats_service.owner_changed(db, land["owner_id"], ObjectId(buyer_id))
         return {"message": "Dispute resolved. Property forcefully transferred to buyer."}
         
     elif request.resolution == "cancel_transfer":
@@ -0,0 +1,55 @@
+"""
+Transaction Job Endpoints
+
+Status of background blockchain transactions (mint, verify, reject).
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from bson import ObjectId
+
+from app.api.deps import get_current_verifier_or_admin
+from app.db.mongodb import get_database
+from app.schemas.tx_job import TxJobResponse
+from app.schemas.user import UserInDB
+from app.services.tx_jobs import tx_job_service
+from app.utils.helpers import etherscan_tx_url
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=TxJobResponse)
+async def get_tx_job(
+    job_id: str,
+    current_user: UserInDB = Depends(get_current_verifier_or_admin),
+    db = Depends(get_database)
+):
+    """
+    Get the status of a transaction job.
+    Poll until status is 'confirmed' (see `result`) or 'failed' (see `error`).
+    'mined' means the tx is in a block that is not yet CONFIRMATION_DEPTH deep.
+    """
+    if not ObjectId.is_valid(job_id):
+        raise HTTPException(status_code=400, detail="Invalid job ID format")
+
+    job = await tx_job_service.get(db, ObjectId(job_id))
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    tx_hash = job.get("tx_hash")
+    return TxJobResponse(
+        id=str(job["_id"]),
+        kind=job["kind"],
+        land_id=str(job["land_id"]) if job.get("land_id") else None,
+        land_ids=[str(land_id) for land_id in job["land_ids"]] if job.get("land_ids") else None,
+        status=job["status"],
+        attempts=job.get("attempts", 0),
+        tx_hash=tx_hash,
+        etherscan_url=etherscan_tx_url(tx_hash) if tx_hash else None,
+        block_number=job.get("block_number"),
+        confirmations=job.get("confirmations"),
+        result=job.get("result"),
+        error=job.get("error"),
+        created_at=job["created_at"],
+        updated_at=job["updated_at"],
+        submitted_at=job.get("submitted_at"),
+    )
@@ -15,6 +15,7 @@ from app.api.deps import get_current_user
 from app.db.mongodb import get_database
 from app.schemas.user import UserInDB
 from app.models.user import UserModel
+from app.services.user_cache import user_cache
 
 # Wallet signature verification
 from eth_account.messages import encode_defunct
@@ -106,6 +107,7 @@ async def link_wallet(
             }
         }
     )
+    await user_cache.invalidate(db, email=current_user.email, user_id=current_user.id)
     
     return WalletResponse(
         wallet_address=request.wallet_address,
@@ -134,6 +136,7 @@ async def unlink_wallet(
             }
         }
     )
+    await user_cache.invalidate(db, email=current_user.email, user_id=current_user.id)
     
     return {"message": "Wallet successfully unlinked from your account"}
 
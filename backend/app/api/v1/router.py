@@ -5,7 +5,7 @@ Aggregates all v1 API endpoints.
 """
 
 from fastapi import APIRouter
-from app.api.v1.endpoints import health, auth, land, users, admin, explorer
+from app.api.v1.endpoints import health, auth, land, users, admin, explorer, tx_jobs, documents
 
 # Create main v1 router
 router = APIRouter()
@@ -17,6 +17,8 @@ router.include_router(land.router, prefix="/land", tags=["land"])
 router.include_router(users.router, prefix="/users", tags=["users"])
 router.include_router(admin.router, prefix="/admin", tags=["admin"])
 router.include_router(explorer.router, prefix="/explorer", tags=["explorer"])
+router.include_router(tx_jobs.router, prefix="/tx-jobs", tags=["tx-jobs"])
+router.include_router(documents.router, prefix="/documents", tags=["documents"])
 
 
 # Add more endpoint routers here as the API grows
@@ -0,0 +1,184 @@
+"""
+Contract Artifacts
+
+Loads contract ABIs and precomputes what the services need on hot paths:
+4-byte function selectors with their input/output types, and an event
+decoder per topic0.
+
+The Foundry outputs in this directory carry bytecode, source maps and
+metadata next to the ABI (~150 KB for LandRegistry). ``python -m
+app.contracts.build`` writes ABI-only artifacts with the selectors and
+event topics precomputed to ``abi/``; those are loaded when present and the
+Foundry output is only parsed as a fallback.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from eth_abi import decode, encode
+from eth_utils import (
+    event_abi_to_log_topic,
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+    to_checksum_address,
+)
+from hexbytes import HexBytes
+
+CONTRACTS_DIR = Path(__file__).parent
+SLIM_DIR = CONTRACTS_DIR / "abi"
+
+
+def _hex(value) -> str:
+    if isinstance(value, str):
+        return value.lower()
+    return "0x" + bytes(value).hex()
+
+
+def _normalize(abi_type: str, value: Any) -> Any:
+    """Match web3's decoded value shapes: checksummed addresses, HexBytes for bytes"""
+    if abi_type == "address":
+        return to_checksum_address(value)
+    if abi_type.startswith("bytes"):
+        return HexBytes(value)
+    return value
+
+
+class EventDecoder:
+    """Decodes one event's logs with eth_abi directly"""
+
+    def __init__(self, abi: Dict[str, Any], topic: str):
+        self.name = abi["name"]
+        self.topic = topic
+        inputs = abi["inputs"]
+        self.indexed = [(i["name"], i["type"]) for i in inputs if i.get("indexed")]
+        self.data = [(i["name"], i["type"]) for i in inputs if not i.get("indexed")]
+        self._data_types = [abi_type for _, abi_type in self.data]
+        self._order = [i["name"] for i in inputs]
+
+    def decode(self, log) -> Dict[str, Any]:
+        """
+        Decode a log whose topic0 is this event's.
+
+        Args:
+            log: Log entry from a receipt or eth_getLogs
+
+        Returns:
+            {"event": name, "args": {...}} with arguments in ABI order.
+            Indexed strings/bytes/arrays only exist as hashes in the
+            topics and are returned as such.
+        """
+        topics = log["topics"]
+        args: Dict[str, Any] = {}
+        for (name, abi_type), topic in zip(self.indexed, topics[1:]):
+            topic = HexBytes(topic)
+            if abi_type in ("string", "bytes") or abi_type.endswith("]"):
+                args[name] = topic
+            else:
+                (value,) = decode([abi_type], topic)
+                args[name] = _normalize(abi_type, value)
+        if self.data:
+            values = decode(self._data_types, HexBytes(log["data"]))
+            for (name, abi_type), value in zip(self.data, values):
+                args[name] = _normalize(abi_type, value)
+        return {"event": self.name, "args": {name: args[name] for name in self._order if name in args}}
+
+
+class FunctionSpec:
+    """Selector and types of one contract function"""
+
+    def __init__(self, abi: Dict[str, Any], selector: str):
+        self.name = abi["name"]
+        self.selector = selector
+        self.input_types = get_abi_input_types(abi)
+        self.output_types = get_abi_output_types(abi)
+        self._selector_bytes = bytes.fromhex(selector[2:])
+
+    def encode_call(self, args: Sequence[Any]) -> str:
+        """Calldata (0x-hex) for a call with positional args"""
+        return "0x" + (self._selector_bytes + encode(self.input_types, list(args))).hex()
+
+    def decode_output(self, data: bytes) -> tuple:
+        return decode(self.output_types, data)
+
+
+class ContractArtifact:
+    """ABI plus precomputed selector and event lookup tables for one contract"""
+
+    def __init__(self, name: str, abi: List[Dict[str, Any]],
+                 selectors: Optional[Dict[str, str]] = None,
+                 topics: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            name: Contract name, e.g. "LandRegistry"
+            abi: The contract ABI
+            selectors: Function name -> 0x selector, as written by the build
+                step; computed here when absent
+            topics: Event name -> 0x topic0, likewise
+        """
+        self.name = name
+        self.abi = abi
+        self.functions: Dict[str, FunctionSpec] = {}
+        self.events: Dict[str, EventDecoder] = {}
+        for item in abi:
+            if item.get("type") == "function" and item["name"] not in self.functions:
+                selector = (selectors or {}).get(item["name"]) or _hex(function_abi_to_4byte_selector(item))
+                self.functions[item["name"]] = FunctionSpec(item, selector)
+            elif item.get("type") == "event" and not item.get("anonymous"):
+                topic = (topics or {}).get(item["name"]) or _hex(event_abi_to_log_topic(item))
+                self.events[item["name"]] = EventDecoder(item, topic)
+        self.decoders: Dict[str, EventDecoder] = {decoder.topic: decoder for decoder in self.events.values()}
+
+    def decoder_for(self, log) -> Optional[EventDecoder]:
+        """The decoder for a log's topic0, or None if it is not one of ours"""
+        topics = log["topics"]
+        return self.decoders.get(_hex(topics[0])) if topics else None
+
+    def find_event(self, logs, event_name: str, address: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        First log in logs that is event_name (optionally emitted by
+        address), decoded; None if there is none.
+        """
+        topic = self.events[event_name].topic
+        for log in logs:
+            if not log["topics"] or _hex(log["topics"][0]) != topic:
+                continue
+            if address is not None and log["address"].lower() != address.lower():
+                continue
+            return self.events[event_name].decode(log)
+        return None
+
+    def slim(self) -> Dict[str, Any]:
+        """ABI-only artifact with precomputed lookup tables, as written by the build step"""
+        return {
+            "contractName": self.name,
+            "abi": self.abi,
+            "selectors": {name: spec.selector for name, spec in self.functions.items()},
+            "topics": {name: decoder.topic for name, decoder in self.events.items()},
+        }
+
+
+def read_foundry_abi(name: str) -> List[Dict[str, Any]]:
+    """ABI from the full Foundry output (or an ABI-only file) in this directory"""
+    with open(CONTRACTS_DIR / f"{name}.json", "r") as f:
+        contract_json = json.load(f)
+    # Foundry outputs comprehensive JSON with metadata, bytecode, and abi
+    return contract_json.get("abi", contract_json) if isinstance(contract_json, dict) else contract_json
+
+
+@lru_cache(maxsize=None)
+def load_artifact(name: str) -> ContractArtifact:
+    """
+    Load a contract's artifact, preferring the slim build output.
+
+    Args:
+        name: Contract name without extension, e.g. "LandRegistry"
+    """
+    slim_path = SLIM_DIR / f"{name}.json"
+    if slim_path.exists():
+        with open(slim_path, "r") as f:
+            slim = json.load(f)
+        return ContractArtifact(name, slim["abi"], slim.get("selectors"), slim.get("topics"))
+    return ContractArtifact(name, read_foundry_abi(name))
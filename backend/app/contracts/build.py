@@ -0,0 +1,88 @@
+"""
+Build ABI-only contract artifacts.
+
+Strips the Foundry outputs in app/contracts down to their ABI and writes
+them, with function selectors and event topics precomputed, to
+app/contracts/abi/. Re-run after replacing a contract JSON:
+
+    python -m app.contracts.build
+
+With --forge it first runs ``forge build`` and ``forge test`` in the
+repository's contracts/ project and copies the fresh outputs here, so a
+contract change lands as the compiler's artifact rather than an edited ABI:
+
+    python -m app.contracts.build --forge
+
+Every ABI function must have its selector in the artifact's deployed
+bytecode; an ABI that was changed without rebuilding the contract fails
+the build instead of producing calls the deployed contract cannot answer.
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+from typing import List
+
+from app.contracts.artifacts import CONTRACTS_DIR, SLIM_DIR, ContractArtifact, read_foundry_abi
+
+CONTRACTS = ("LandRegistry", "LandVerification", "Multicall3")
+# Built from contracts/src; Multicall3 is a canonical deployment, ABI only
+FOUNDRY_CONTRACTS = ("LandRegistry", "LandVerification")
+FOUNDRY_DIR = CONTRACTS_DIR.parents[2] / "contracts"
+
+
+def sync_from_forge() -> None:
+    """Build and test the Foundry project, then copy its outputs into app/contracts"""
+    for command in (["forge", "build"], ["forge", "test"]):
+        print(f"$ {' '.join(command)}")
+        subprocess.run(command, cwd=FOUNDRY_DIR, check=True)
+    for name in FOUNDRY_CONTRACTS:
+        shutil.copyfile(FOUNDRY_DIR / "out" / f"{name}.sol" / f"{name}.json", CONTRACTS_DIR / f"{name}.json")
+
+
+def unbuilt_functions(name: str) -> List[str]:
+    """ABI functions whose selector is missing from the Foundry output's deployed bytecode"""
+    with open(CONTRACTS_DIR / f"{name}.json", "r") as f:
+        contract_json = json.load(f)
+    deployed = contract_json.get("deployedBytecode") if isinstance(contract_json, dict) else None
+    if isinstance(deployed, dict):
+        deployed = deployed.get("object")
+    if not deployed:
+        return []
+    code = deployed.lower()
+    artifact = ContractArtifact(name, read_foundry_abi(name))
+    return [
+        f"{spec.name}({','.join(spec.input_types)})" for spec in artifact.functions.values()
+        if spec.selector[2:].lower() not in code
+    ]
+
+
+def build() -> None:
+    missing = {name: unbuilt_functions(name) for name in CONTRACTS}
+    missing = {name: functions for name, functions in missing.items() if functions}
+    if missing:
+        for name, functions in missing.items():
+            print(f"{name}: ABI has functions its bytecode does not: {', '.join(functions)}", file=sys.stderr)
+        sys.exit("Contract ABIs do not match their bytecode; rebuild with `python -m app.contracts.build --forge`")
+
+    SLIM_DIR.mkdir(exist_ok=True)
+    for name in CONTRACTS:
+        source = CONTRACTS_DIR / f"{name}.json"
+        artifact = ContractArtifact(name, read_foundry_abi(name))
+        target = SLIM_DIR / f"{name}.json"
+        with open(target, "w") as f:
+            json.dump(artifact.slim(), f, separators=(",", ":"))
+        print(
+            f"{name}: {source.stat().st_size:,} -> {target.stat().st_size:,} bytes, "
+            f"{len(artifact.functions)} functions, {len(artifact.events)} events"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--forge", action="store_true", help="forge build && forge test, then copy the outputs first")
+    if parser.parse_args().forge:
+        sync_from_forge()
+    build()
@@ -21,28 +21,106 @@ class Settings(BaseSettings):
     # Database
     MONGO_URL: str
     DB_NAME: str
+    PAGE_SIZE_DEFAULT: int = 50  # Items per page of list endpoints when no limit is given
+    PAGE_SIZE_MAX: int = 200  # Larger limits are capped to this
+    EXPORT_BATCH_SIZE: int = 1000  # Documents read and streamed at a time by /admin/export
     
     # Security
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PASSWORD_HASH_WORKERS: int = 4  # Threads running bcrypt; each keeps about one CPU core busy
+    PASSWORD_HASH_MAX_QUEUE: int = 32  # Hashes running or waiting before logins are shed with 503
+    USER_CACHE_TTL_SECONDS: float = 30.0  # How long an authenticated user is served from memory; 0 disables the cache
+    USER_CACHE_MAX_ENTRIES: int = 10000  # Least recently used users are dropped above this
+    USER_CACHE_INVALIDATION: str = "auto"  # Telling other workers about user changes: auto, change_stream, poll or none
+    USER_CACHE_POLL_SECONDS: float = 1.0  # Poll interval for USER_CACHE_INVALIDATION=poll
     
     # CORS
     CORS_ORIGINS: str = "*"
     
-    # Pinata (IPFS)
+    # Document storage (IPFS)
+    DOCUMENT_STORE: str = "pinata"  # Where documents are stored: pinata, kubo or filesystem
+    KUBO_API_URL: str = "http://127.0.0.1:5001"  # Kubo RPC API (DOCUMENT_STORE=kubo)
+    DOCUMENT_STORE_PATH: str = "data/documents"  # Root directory (DOCUMENT_STORE=filesystem)
     PINATA_API_KEY: Optional[str] = None
     PINATA_SECRET_API_KEY: Optional[str] = None
+    PINATA_API_URL: str = "https://api.pinata.cloud"
+    PINATA_GATEWAY_URL: str = "https://gateway.pinata.cloud"  # Downloads of pinned documents
+    # Pool, timeout, retry and breaker settings below also apply to DOCUMENT_STORE=kubo
+    PINATA_POOL_SIZE: int = 10  # Max concurrent HTTP connections to Pinata, across all requests
+    PINATA_UPLOAD_CONCURRENCY: int = 5  # Documents of one registration uploaded at once
+    PINATA_TIMEOUT_SECONDS: float = 300.0  # Total time allowed for one upload attempt
+    PINATA_CONNECT_TIMEOUT_SECONDS: float = 5.0  # Connecting (incl. waiting for a pooled connection)
+    PINATA_READ_TIMEOUT_SECONDS: float = 60.0  # Longest silence while waiting for Pinata's answer
+    PINATA_MAX_ATTEMPTS: int = 4  # Tries per request on timeouts, connection errors, 429 and 5xx
+    PINATA_RETRY_BASE_SECONDS: float = 0.5  # Backoff before retry n is random in [0, base * 2^(n-1)]
+    PINATA_RETRY_MAX_SECONDS: float = 8.0  # Cap on one backoff (and on an honoured Retry-After)
+    PINATA_BREAKER_FAILURES: int = 5  # Consecutive failed attempts that open the circuit breaker
+    PINATA_BREAKER_RESET_SECONDS: float = 30.0  # Fail fast this long before letting a trial request through
+    IPFS_DEDUPE_ENABLED: bool = True  # Skip uploading content already pinned (matched by sha256)
+    IPFS_UNPIN_GRACE_SECONDS: int = 3600  # How long unreferenced content stays pinned before the sweep unpins it
+    IPFS_ORPHAN_SWEEP_INTERVAL_SECONDS: float = 600.0  # 0 disables the background sweep
+    DOCUMENT_CACHE_PATH: str = "data/document_cache"  # On-disk cache behind GET /documents/{cid}
+    DOCUMENT_CACHE_MAX_BYTES: int = 2 * 1024 ** 3  # Least recently used documents are evicted above this
+    METADATA_BATCH_SIZE: int = 100  # Tokens whose metadata JSON is pinned in one directory upload
+    METADATA_BATCH_WINDOW_SECONDS: float = 0.25  # How long a mint waits for others to share its upload
     
     # Blockchain (Sepolia Testnet)
     SEPOLIA_RPC_URL: str
+    SEPOLIA_RPC_FALLBACK_URLS: str = ""  # Comma-separated extra endpoints pooled with SEPOLIA_RPC_URL
     LAND_REGISTRY_ADDRESS: str = "0x3f047c367c1d3876d432196f87dee4d7b3388b64"
     LAND_VERIFICATION_ADDRESS: str = "0x0dcd263f969b02d780a58cfde10cb48cc950e184"
     ADMIN_PRIVATE_KEY: str  # Private key for backend transactions (KEEP SECRET!)
+    RPC_POOL_SIZE: int = 20  # Max concurrent HTTP connections to the RPC node
+    RPC_TIMEOUT_SECONDS: float = 30.0  # Per-request RPC timeout
+    RPC_PROBE_TIMEOUT_SECONDS: float = 5.0  # Readiness probe timeout
+    RPC_PROBE_INTERVAL_SECONDS: float = 15.0  # Re-probe the node when readiness is older than this
+    RPC_HEDGE_AFTER_SECONDS: Optional[float] = None  # Also send slow reads to the next endpoint after this; None disables
+    RPC_ENDPOINT_COOLDOWN_SECONDS: float = 30.0  # Skip an endpoint this long after repeated failures
+    MULTICALL3_ADDRESS: str = "0xcA11bde05977b3631167028862bE2a173976CA11"  # Same address on every EVM chain
+    MULTICALL_BATCH_SIZE: int = 100  # Tokens per aggregate3 call / JSON-RPC batch
+    CHAIN_HEAD_CACHE_TTL_SECONDS: float = 2.0  # Latest block / block time cache
+    FEE_CACHE_TTL_SECONDS: float = 6.0  # Priority fee / gas price cache
+    
+    # Background transaction jobs
+    TX_JOB_WORKERS: int = 2
+    TX_JOB_POLL_INTERVAL_SECONDS: float = 2.0  # Idle poll and receipt poll interval
+    TX_JOB_LEASE_SECONDS: int = 60  # Job lease; the holding worker extends it every third of this while it works
+    TX_JOB_MAX_ATTEMPTS: int = 5  # Send attempts before a job is marked failed
+    TX_RECEIPT_TIMEOUT_SECONDS: int = 600  # Give up on a tx the node has lost after this long
+    TX_REPLACEMENT_FEE_BUMP: float = 1.25  # Fee multiplier per replacement of a stuck tx
+    VERIFY_BATCH_ENABLED: bool = False  # POST /land/batch/verify; the LandRegistry deployment must have verifyLandBatch
+    VERIFY_BATCH_SIZE: int = 50  # Lands per verifyLandBatch tx (capped at LandRegistry.MAX_BATCH_SIZE)
+    VERIFY_BATCH_MAX_LANDS: int = 500  # Lands accepted by one POST /land/batch/verify
+    CONFIRMATION_DEPTH: int = 3  # Blocks (including its own) before a tx/event is treated as final
+    
+    # Gas estimate cache (skips estimate_gas once a bucket is warm)
+    GAS_CACHE_WINDOW: int = 100  # Recent receipts kept per bucket
+    GAS_CACHE_MIN_SAMPLES: int = 10  # Below this, always call estimate_gas
+    GAS_CACHE_PERCENTILE: float = 99.0  # Percentile of gasUsed the limit is based on
+    GAS_CACHE_HEADROOM: float = 1.2  # Multiplier on that percentile
+    GAS_CACHE_MAX_SPREAD: float = 0.25  # Max (percentile - median) / median to trust a bucket
+    
+    # Admin signer nonce allocation
+    NONCE_BACKEND: str = "mongo"  # "mongo" (shared across workers) or "memory"
+    NONCE_RESYNC_SECONDS: float = 30.0  # Re-read pending/latest counts from the node this often
+    NONCE_STUCK_SECONDS: float = 180.0  # Chain not advancing past our nonce for this long = stuck
+    
+    # Chain event indexer
+    INDEXER_ENABLED: bool = True
+    INDEXER_START_BLOCK: Optional[int] = None  # Contract deployment block; None = start at the current head
+    INDEXER_POLL_INTERVAL_SECONDS: float = 12.0  # Roughly one Sepolia block
+    INDEXER_CHUNK_BLOCKS: int = 2000  # Initial block range per eth_getLogs
+    INDEXER_MAX_CHUNK_BLOCKS: int = 10000
+    
+    # Explorer stats
+    REGISTRY_STATS_COUNTERS: bool = True  # Keep registry_stats counters with $inc; False = one aggregation per request
     
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    PUBLIC_API_URL: str = "http://localhost:8000"  # How clients reach this API; used in links it returns
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -51,6 +129,12 @@ class Settings(BaseSettings):
         extra="ignore"
     )
     
+    @property
+    def rpc_urls(self) -> list[str]:
+        """SEPOLIA_RPC_URL followed by the fallback endpoints"""
+        fallbacks = [url.strip() for url in self.SEPOLIA_RPC_FALLBACK_URLS.split(",") if url.strip()]
+        return [self.SEPOLIA_RPC_URL] + fallbacks
+    
     @property
     def cors_origins_list(self) -> list[str]:
         """Convert CORS_ORIGINS string to list"""
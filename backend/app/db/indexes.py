@@ -0,0 +1,160 @@
+"""
+Index Reconciliation
+
+Every model declares the indexes its collection needs in create_indexes().
+On startup the declared indexes are compared with the ones each collection
+actually has:
+
+    missing     created, in a background task so that startup does not wait
+                on an index build over a large collection
+    mismatched  same keys but different options (unique, sparse, ...)
+    extra       present in the database but declared by no model
+
+Mismatched and extra indexes are only reported (logged and shown under
+"indexes" in /metrics): dropping or rebuilding an index on a live
+collection is left to an operator.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.logging import get_logger
+from app.models.cache_invalidation import CacheInvalidationModel
+from app.models.chain_event import ChainEventModel
+from app.models.ipfs_object import IpfsObjectModel
+from app.models.land import LandModel
+from app.models.tx_job import TxJobModel
+from app.models.user import UserModel
+
+logger = get_logger(__name__)
+
+# Models whose create_indexes() are applied at startup
+INDEXED_MODELS = (UserModel, LandModel, TxJobModel, ChainEventModel, IpfsObjectModel, CacheInvalidationModel)
+
+# Index options compared between the declaration and the database
+COMPARED_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+KeyPattern = Tuple[Tuple[str, Any], ...]
+
+
+def _key_pattern(keys) -> KeyPattern:
+    """Normalise a key list; servers may report directions as floats"""
+    return tuple(
+        (field, int(direction) if isinstance(direction, (int, float)) else direction)
+        for field, direction in keys
+    )
+
+
+def index_name(keys) -> str:
+    """The name MongoDB gives an index by default, e.g. owner_id_1_transfer_status_1"""
+    return "_".join(f"{field}_{direction}" for field, direction in _key_pattern(keys))
+
+
+def _options(index: Dict[str, Any]) -> Dict[str, Any]:
+    return {option: index[option] for option in COMPARED_OPTIONS if index.get(option)}
+
+
+class IndexReconciler:
+    """Applies the models' declared indexes and reports drift from them"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._report: Dict[str, Any] = {"status": "not_started"}
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Reconcile in the background (called on application startup)"""
+        self._report = {"status": "running"}
+        self._task = asyncio.create_task(self._run(db))
+
+    async def stop(self) -> None:
+        """Cancel a reconciliation still running (called on application shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return self._report
+
+    async def _run(self, db: AsyncIOMotorDatabase) -> None:
+        try:
+            await self.reconcile(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Index reconciliation failed: {e}")
+            self._report = {"status": "failed", "error": str(e)}
+
+    async def reconcile(self, db: AsyncIOMotorDatabase, models=INDEXED_MODELS) -> Dict[str, Any]:
+        """
+        Create missing indexes and report mismatched and extra ones.
+
+        Args:
+            db: Database instance
+            models: Model classes with collection_name and create_indexes()
+
+        Returns:
+            Per-collection lists of created, failed, mismatched and extra
+            index names, plus a status
+        """
+        started = datetime.utcnow()
+        collections = {}
+        for model in models:
+            collections[model.collection_name] = await self._reconcile_collection(
+                db[model.collection_name], model.create_indexes()
+            )
+        drift = any(
+            result["failed"] or result["mismatched"] or result["extra"] for result in collections.values()
+        )
+        self._report = {
+            "status": "drift" if drift else "ok",
+            "checked_at": started,
+            "collections": collections,
+        }
+        created = sum(len(result["created"]) for result in collections.values())
+        logger.info(f"Index reconciliation done: {created} created, status {self._report['status']}")
+        return self._report
+
+    async def _reconcile_collection(self, collection, declared: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        result = {"created": [], "failed": [], "mismatched": [], "extra": []}
+        existing = {
+            _key_pattern(info["key"]): (name, info)
+            for name, info in (await collection.index_information()).items()
+            if name != "_id_"
+        }
+
+        for index in declared:
+            keys = _key_pattern(index["keys"])
+            options = {k: v for k, v in index.items() if k != "keys"}
+            found = existing.pop(keys, None)
+            if found is not None:
+                name, info = found
+                if _options(info) != _options(options):
+                    result["mismatched"].append(name)
+                    logger.warning(
+                        f"Index {collection.name}.{name} has options {_options(info)}, "
+                        f"declared {_options(options)}; rebuild it to apply"
+                    )
+                continue
+
+            name = options.setdefault("name", index_name(keys))
+            try:
+                await collection.create_index(list(keys), **options)
+            except Exception as e:
+                # e.g. a unique index over data that already has duplicates
+                result["failed"].append(name)
+                logger.error(f"Creating index {collection.name}.{name} failed: {e}")
+                continue
+            result["created"].append(name)
+            logger.info(f"Created index {collection.name}.{name}")
+
+        for name, _ in existing.values():
+            result["extra"].append(name)
+            logger.warning(f"Index {collection.name}.{name} is not declared by any model")
+        return result
+
+
+index_reconciler = IndexReconciler()
@@ -11,7 +11,16 @@ from starlette.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
-from app.db.mongodb import connect_to_mongo, close_mongo_connection
+from app.db.mongodb import connect_to_mongo, close_mongo_connection, database
+from app.db.indexes import index_reconciler
+from app.services.blockchain import async_blockchain_service
+from app.services.tx_jobs import tx_job_service
+from app.services.event_indexer import event_indexer_service
+from app.services.pinata_service import pinata_service
+from app.services.document_cache import document_cache
+from app.services.registry_stats import registry_stats_service
+from app.services.user_cache import user_cache
+from app.services.password_hasher import password_hasher
 from app.api.v1.router import router as api_v1_router
 from app.middleware.error_handler import (
     http_exception_handler,
@@ -66,12 +75,31 @@ def create_application() -> FastAPI:
         """Run on application startup"""
         logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
         await connect_to_mongo()
+        await index_reconciler.start(database.db)
+        await async_blockchain_service.connect()
+        async_blockchain_service.nonce_manager.attach(database.db)
+        await async_blockchain_service.gas_cache.warm(database.db)
+        await tx_job_service.start(database.db)
+        await pinata_service.start(database.db)
+        await document_cache.start()
+        await registry_stats_service.start(database.db)
+        await user_cache.start(database.db)
+        if settings.INDEXER_ENABLED:
+            await event_indexer_service.start(database.db)
         logger.info("Application startup complete")
     
     @app.on_event("shutdown")
     async def shutdown_event():
         """Run on application shutdown"""
         logger.info("Shutting down application...")
+        await event_indexer_service.stop()
+        await tx_job_service.stop()
+        await pinata_service.stop()
+        await index_reconciler.stop()
+        await registry_stats_service.stop()
+        await user_cache.stop()
+        await password_hasher.stop()
+        await async_blockchain_service.close()
         await close_mongo_connection()
         logger.info("Application shutdown complete")
     
@@ -37,6 +37,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
                 "path": str(request.url.path)
             }
         },
+        headers=getattr(exc, "headers", None),
     )
 
 
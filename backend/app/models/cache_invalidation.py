@@ -0,0 +1,42 @@
+"""
+Cache Invalidation Database Models
+
+This module defines the messages API workers use to tell each other that
+cached entries are stale when MongoDB change streams are not available.
+"""
+
+
+class CacheInvalidationModel:
+    """
+    Cache invalidation document structure for MongoDB
+
+    Written by the process that changed a cached record and read by every
+    other process, which drops its own copy. Messages expire after an hour;
+    a process only looks at recent ones.
+    """
+
+    collection_name = "cache_invalidations"
+
+    EXPIRE_AFTER_SECONDS = 3600
+
+    # Example structure
+    structure = {
+        "_id": "ObjectId",
+        "cache": "str",  # e.g. "users"
+        "key": "Optional[str]",  # Cache key (user email)
+        "user_id": "Optional[str]",
+        "origin": "str",  # Process that wrote it (skips its own messages)
+        "created_at": "datetime",
+    }
+
+    @staticmethod
+    def create_indexes():
+        """
+        Define indexes for the cache_invalidations collection
+
+        Returns:
+            List of index definitions
+        """
+        return [
+            {"keys": [("created_at", 1)], "expireAfterSeconds": CacheInvalidationModel.EXPIRE_AFTER_SECONDS},
+        ]
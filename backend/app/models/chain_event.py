@@ -0,0 +1,70 @@
+"""
+Chain Event Database Models
+
+This module defines the structure of indexed contract events and the
+indexer's checkpoint.
+"""
+
+
+class ChainEventModel:
+    """
+    Chain event document structure for MongoDB
+
+    One document per LandRegistry/LandVerification log, written by the event
+    indexer. The _id is "<tx_hash>:<log_index>" so re-indexing a block range
+    overwrites instead of duplicating. Events stay unconfirmed until
+    CONFIRMATION_DEPTH blocks deep; until then they are re-checked on every
+    pass and deleted if their block is orphaned.
+    """
+
+    collection_name = "chain_events"
+
+    # Example structure
+    structure = {
+        "_id": "str",  # "<tx_hash>:<log_index>"
+        "contract": "Literal['LandRegistry', 'LandVerification']",
+        "event": "str",  # e.g. LandRegistered, LandVerified, DisputeCreated
+        "token_id": "Optional[int]",  # Land token the event refers to, if any
+        "args": "dict",  # Decoded event arguments (uint256 beyond int64 stored as str)
+        "block_number": "int",
+        "block_hash": "str",
+        "block_timestamp": "datetime",
+        "tx_hash": "str",
+        "log_index": "int",
+        "confirmed": "bool",  # At least CONFIRMATION_DEPTH blocks deep
+        "indexed_at": "datetime",
+    }
+
+    @staticmethod
+    def create_indexes():
+        """
+        Define indexes for the chain_events collection
+
+        Returns:
+            List of index definitions
+        """
+        return [
+            {"keys": [("block_number", -1), ("log_index", -1), ("_id", -1)]},  # Explorer feed pages
+            {"keys": [("token_id", 1), ("block_number", 1), ("log_index", 1)]},
+            {"keys": [("event", 1), ("block_number", -1)]},
+            {"keys": [("tx_hash", 1)]},
+        ]
+
+
+class IndexerCheckpointModel:
+    """
+    Indexer checkpoint document structure for MongoDB
+
+    Records how far an indexer has scanned so it resumes where it stopped.
+    """
+
+    collection_name = "indexer_checkpoints"
+
+    # Example structure
+    structure = {
+        "_id": "str",  # Indexer name, e.g. "chain_events"
+        "last_block": "int",  # Last block whose logs are stored (may still reorg)
+        "confirmed_block": "int",  # Last block treated as final, advanced per range; scans resume after it
+        "chunk_size": "int",  # Current adaptive block range per eth_getLogs
+        "updated_at": "datetime",
+    }
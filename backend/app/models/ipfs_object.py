@@ -0,0 +1,47 @@
+"""
+IPFS Object Database Models
+
+This module defines the structure of pinned document content, used to
+dedupe uploads and to unpin content no land refers to any more.
+"""
+
+
+class IpfsObjectModel:
+    """
+    IPFS object document structure for MongoDB
+
+    One document per distinct content pinned in the document store
+    (Pinata by default), keyed by its CID.
+    refcount counts the land documents pointing at it: incremented when a
+    land is registered, decremented when one is deleted. Objects left at
+    zero references for IPFS_UNPIN_GRACE_SECONDS are unpinned by the orphan
+    sweep and removed; pinned is cleared while that unpin is in flight.
+    """
+
+    collection_name = "ipfs_objects"
+
+    # Example structure
+    structure = {
+        "_id": "str",  # CID returned by the document store
+        "sha256": "str",  # Hex digest of the content
+        "local_cid": "str",  # CID computed before uploading (equals _id unless the store uses other CID settings)
+        "size": "int",  # Bytes
+        "content_type": "Optional[str]",  # As uploaded; served by GET /documents/{cid}
+        "refcount": "int",  # Land documents referring to this content
+        "pinned": "bool",
+        "created_at": "datetime",
+        "last_referenced_at": "datetime",  # Last upload, reference or release
+    }
+
+    @staticmethod
+    def create_indexes():
+        """
+        Define indexes for the ipfs_objects collection
+
+        Returns:
+            List of index definitions
+        """
+        return [
+            {"keys": [("sha256", 1)]},
+            {"keys": [("refcount", 1), ("last_referenced_at", 1)]},
+        ]
@@ -40,6 +40,12 @@ class LandModel:
         "verified_at": "Optional[datetime]",
         "verified_by": "Optional[str]",  # Verifier wallet address
         "rejection_reason": "Optional[str]",
+        "active_tx_job_id": "Optional[ObjectId]",  # In-flight tx_jobs entry, if any
+        "metadata": {  # Pinned token metadata JSON, reused while unchanged
+            "uri": "str",  # ipfs://<directory CID>/<land id>.json, the token's URI
+            "sha256": "str",
+            "pinned_at": "datetime"
+        },
         
         # Metadata
         "created_at": "datetime",
@@ -48,8 +54,26 @@ class LandModel:
 
     @staticmethod
     def create_indexes():
+        """
+        Define indexes for the lands collection
+
+        Returns:
+            List of index definitions
+        """
         return [
-            {"keys": [("owner_id", 1)]},
+            {"keys": [("property_id", 1)], "unique": True},
             {"keys": [("status", 1)]},
-            {"keys": [("property_id", 1)], "unique": True}
+            {"keys": [("documents.ipfs_hash", 1)]},
+            {"keys": [("token_id", 1)]},
+            # Paginated lists end in _id, the keyset tiebreaker (app/utils/pagination.py)
+            {"keys": [("updated_at", -1), ("_id", -1)]},  # Explorer recent activity
+            # Verifier queues and verified lands by status
+            {"keys": [("blockchain_status", 1), ("_id", 1)]},
+            # Explorer market feed: verified, for sale, newest first
+            {"keys": [("blockchain_status", 1), ("is_for_sale", 1), ("updated_at", -1), ("_id", -1)]},
+            {"keys": [("owner_id", 1), ("_id", 1)]},  # My lands
+            # Outgoing and incoming transfers
+            {"keys": [("owner_id", 1), ("transfer_status", 1)]},
+            {"keys": [("pending_buyer_id", 1), ("transfer_status", 1)]},
+            {"keys": [("transfer_status", 1), ("_id", 1)]},  # Admin dispute queue
         ]
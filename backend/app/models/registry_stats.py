@@ -0,0 +1,52 @@
+"""
+Registry Statistics Database Models
+
+This module defines the counters behind GET /explorer/stats, kept up to
+date by the land state transitions so the stats are a single point read.
+"""
+
+
+class RegistryStatsModel:
+    """
+    Registry counters document structure for MongoDB
+
+    A single document (_id "lands") with the number of lands in each
+    blockchain_status and the number of distinct owners. Land registration,
+    deletion, status changes and ownership transfers adjust it with $inc;
+    it is rebuilt from the lands collection when it does not exist.
+    """
+
+    collection_name = "registry_stats"
+
+    DOCUMENT_ID = "lands"
+    STATUSES = ("not_minted", "pending", "verified", "rejected")
+
+    # Example structure
+    structure = {
+        "_id": "str",  # "lands"
+        "total": "int",
+        "not_minted": "int",
+        "pending": "int",
+        "verified": "int",
+        "rejected": "int",
+        "owners": "int",  # Users owning at least one land
+        "rebuilt_at": "datetime",  # Last full recount from the lands collection
+        "updated_at": "datetime",
+    }
+
+
+class RegistryOwnerModel:
+    """
+    Per-owner land count document structure for MongoDB
+
+    Lets the owners counter change only when an owner's first land arrives
+    or last land leaves, without a distinct over the lands collection.
+    """
+
+    collection_name = "registry_owners"
+
+    # Example structure
+    structure = {
+        "_id": "ObjectId",  # Owner's user id
+        "lands": "int",
+    }
@@ -0,0 +1,80 @@
+"""
+Transaction Job Database Model
+
+This module defines the structure of background blockchain transaction jobs.
+"""
+
+
+class TxJobModel:
+    """
+    Transaction job document structure for MongoDB
+
+    One document per on-chain write (mint, verify, reject, or a
+    verify_batch covering several lands) requested through the API. Workers advance it through:
+        queued -> sending -> submitted -> mined -> confirmed | failed
+    The signed raw transaction is stored before it is broadcast, so a worker
+    that crashes mid-flight can re-send the same bytes instead of re-signing.
+    A mined job only changes the land once CONFIRMATION_DEPTH blocks have
+    built on it; if its block is orphaned first it drops back to submitted.
+    The nonce is stored before signing, and every worker write is fenced on
+    lease_owner, so a job taken over by another worker is never signed twice.
+    """
+
+    collection_name = "tx_jobs"
+
+    # Job lifecycle states
+    QUEUED = "queued"
+    SENDING = "sending"
+    SUBMITTED = "submitted"
+    MINED = "mined"
+    CONFIRMED = "confirmed"
+    FAILED = "failed"
+
+    ACTIVE_STATES = (QUEUED, SENDING, SUBMITTED, MINED)
+
+    # Example structure
+    structure = {
+        "_id": "ObjectId",
+        "kind": "Literal['mint', 'verify', 'reject', 'verify_batch']",
+        "land_id": "Optional[ObjectId]",  # Reference to Land; None for batch jobs
+        "land_ids": "List[ObjectId]",  # Batch jobs only: the lands, in params.token_ids order
+        "params": "dict",  # Contract call arguments (token_id, reason, ...)
+        "requested_by": "str",  # User id of the verifier/admin
+        "status": "str",  # See lifecycle states above
+        "attempts": "int",  # Number of failed send attempts so far
+        "tx_hash": "Optional[str]",
+        "raw_transaction": "Optional[str]",  # Signed tx (0x-hex), kept for re-broadcast
+        "nonce": "Optional[int]",  # Allocated by the admin signer's NonceManager, before signing
+        "replacements": "int",  # Times the tx was re-signed with higher fees
+        "replaced_tx_hashes": "List[str]",  # Earlier versions; any of them may be the one mined
+        "gas_bucket": "Optional[str]",  # Gas estimate cache key, e.g. "verifyLand+mint/3w"
+        "gas_limit": "Optional[int]",
+        "gas_used": "Optional[int]",  # From the receipt; warms the gas cache on restart
+        "block_number": "Optional[int]",  # Block the receipt is currently in
+        "block_hash": "Optional[str]",  # Compared on each poll to spot reorgs
+        "confirmations": "Optional[int]",
+        "result": "Optional[dict]",  # API-shaped outcome once confirmed
+        "error": "Optional[str]",
+        "next_attempt_at": "datetime",  # Earliest time a worker may pick it up
+        "lease_expires_at": "datetime",  # Claim held by a worker until then
+        "lease_owner": "Optional[str]",  # Token of the worker holding the claim; its writes match on it
+        "submitted_at": "Optional[datetime]",
+        "created_at": "datetime",
+        "updated_at": "datetime",
+    }
+
+    @staticmethod
+    def create_indexes():
+        """
+        Define indexes for the tx_jobs collection
+
+        Returns:
+            List of index definitions
+        """
+        return [
+            {"keys": [("status", 1), ("next_attempt_at", 1)]},
+            {"keys": [("land_id", 1), ("created_at", -1)]},
+            {"keys": [("land_ids", 1)], "sparse": True},
+            {"keys": [("tx_hash", 1)], "sparse": True},
+            {"keys": [("nonce", 1), ("status", 1)]},
+        ]
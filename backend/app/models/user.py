@@ -45,4 +45,5 @@ class UserModel:
         return [
             {"keys": [("email", 1)], "unique": True},
             {"keys": [("username", 1)], "unique": True},
+            {"keys": [("wallet_address", 1)]},
         ]
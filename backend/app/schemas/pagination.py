@@ -0,0 +1,13 @@
+"""
+Schemas for paginated list responses
+"""
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a list endpoint; pass next_cursor as ?cursor= for the next page"""
+    items: List[T]
+    next_cursor: Optional[str] = None  # None on the last page
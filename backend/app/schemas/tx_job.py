@@ -0,0 +1,49 @@
+"""
+Schemas for background blockchain transaction jobs
+"""
+from pydantic import BaseModel
+from typing import Optional, Literal, Dict, Any, List
+from datetime import datetime
+
+
+class TxJobAccepted(BaseModel):
+    """Response returned (HTTP 202) when a blockchain write is enqueued"""
+    message: str
+    job_id: str
+    kind: Literal["mint", "verify", "reject", "verify_batch"]
+    land_id: Optional[str] = None  # None for batch jobs
+    land_ids: Optional[List[str]] = None  # Batch jobs only
+    status: str
+    status_url: str
+
+
+class BatchItemSkipped(BaseModel):
+    """A land left out of a batch request"""
+    land_id: str
+    reason: str
+
+
+class BatchTxJobsAccepted(BaseModel):
+    """Response returned (HTTP 202) when a batch of lands is enqueued"""
+    message: str
+    jobs: List[TxJobAccepted]
+    skipped: List[BatchItemSkipped] = []
+
+
+class TxJobResponse(BaseModel):
+    """Current state of a transaction job"""
+    id: str
+    kind: Literal["mint", "verify", "reject", "verify_batch"]
+    land_id: Optional[str] = None
+    land_ids: Optional[List[str]] = None
+    status: Literal["queued", "sending", "submitted", "mined", "confirmed", "failed"]
+    attempts: int = 0
+    tx_hash: Optional[str] = None
+    etherscan_url: Optional[str] = None
+    block_number: Optional[int] = None
+    confirmations: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    submitted_at: Optional[datetime] = None
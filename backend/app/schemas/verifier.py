@@ -2,7 +2,7 @@
 Schemas for land verification endpoints
 """
 from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 from datetime import datetime
 
 
@@ -11,6 +11,11 @@ class VerifyLandRequest(BaseModel):
     pass  # No fields required; verifier identity comes from JWT
 
 
+class BatchVerifyLandsRequest(BaseModel):
+    """Request to verify several lands; they are sent in verifyLandBatch transactions"""
+    land_ids: List[str] = Field(..., min_length=1, description="Lands to verify, in order")
+
+
 class RejectLandRequest(BaseModel):
     """Request to reject a land"""
     reason: str = Field(..., min_length=5, max_length=500, description="Rejection reason")
@@ -8,7 +8,8 @@ from datetime import datetime, timezone
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.security import create_access_token
+from app.services.password_hasher import password_hasher
 from app.schemas.user import UserCreate, UserInDB
 from app.core.logging import get_logger
 
@@ -41,7 +42,7 @@ class AuthService:
             logger.warning(f"Login attempt for non-existent user: {email}")
             return None
         
-        if not verify_password(password, user["hashed_password"]):
+        if not await password_hasher.verify(password, user["hashed_password"]):
             logger.warning(f"Failed login attempt for user: {email}")
             return None
         
@@ -89,7 +90,7 @@ class AuthService:
             "email": user_data.email,
             "username": user_data.username,
             "full_name": user_data.full_name,
-            "hashed_password": get_password_hash(user_data.password),
+            "hashed_password": await password_hasher.hash(user_data.password),
             "is_active": True,
             "is_verified": False,
             "role": "user",  # Default role; use seed_admin.py to create verifier/admin
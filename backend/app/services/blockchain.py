@@ -1,241 +1,619 @@
 """
 Blockchain service for interacting with Sepolia smart contracts
 """
-import json
-import os
+import asyncio
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Dict, Any
-from web3 import Web3
-from web3.contract import Contract
-from web3.exceptions import ContractLogicError
+from typing import Optional, Dict, Any, Iterable, List
+import aiohttp
+from web3 import Web3, AsyncWeb3
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError, TransactionNotFound
 from eth_account import Account
+from app.contracts.artifacts import FunctionSpec, load_artifact
 from app.core.config import settings
+from app.services.chain_metadata import ChainMetadataCache, VERIFIER_ROLE
+from app.services.gas_estimator import GasEstimateCache
+from app.services.nonce_manager import NonceManager
+from app.services.rpc_pool import PooledAsyncHTTPProvider
 
-class BlockchainService:
-    """Service for interacting with Land Registry smart contracts on Sepolia"""
-    
-    def __init__(self):
-        self.w3 = Web3(Web3.HTTPProvider(settings.SEPOLIA_RPC_URL))
-        
-        if not self.w3.is_connected():
-            raise ConnectionError(f"Failed to connect to Sepolia RPC: {settings.SEPOLIA_RPC_URL}")
-        
-        # Load contract ABIs
-        self.land_registry_abi = self._load_abi("LandRegistry.json")
-        self.land_verification_abi = self._load_abi("LandVerification.json")
-        
-        # Initialize contracts
-        self.land_registry = self.w3.eth.contract(
+
+def _load_abi(filename: str) -> list:
+    """Load ABI from contracts directory (ABI-only build output when present)"""
+    return load_artifact(Path(filename).stem).abi
+
+
+def _format_land_details(details, count: int) -> Dict[str, Any]:
+    """Map the on-chain LandMetadata tuple to the API's dict shape."""
+    # LandMetadata struct order (LandRegistry.sol):
+    # [0] propertyId, [1] ipfsHash, [2] area, [3] price, [4] location,
+    # [5] currentOwner, [6] status, [7] registeredAt,
+    # [8] verifiedAt, [9] verifiedBy
+    return {
+        "property_id": details[0],
+        "ipfs_hash": details[1],
+        "area": details[2],
+        "price": str(details[3]),
+        "location": details[4],
+        "current_owner": details[5],
+        "status": details[6],        # 0=Pending, 1=Verified, 2=Rejected
+        "registered_at": details[7],
+        "verified_at": details[8],
+        "verified_by": details[9],
+        "verification_count": count,
+    }
+
+
+class AsyncBlockchainService:
+    """
+    Service for the Land Registry contracts on Sepolia, built on AsyncWeb3.
+
+    RPC traffic goes through one shared aiohttp session whose connector caps
+    the number of open sockets at settings.RPC_POOL_SIZE, so a burst of mints
+    queues for a connection instead of opening one socket per request.
+    Requests are spread over settings.rpc_urls by PooledAsyncHTTPProvider,
+    which picks the healthiest endpoint and fails over between them.
+    The session is bound to the running event loop, so it is created in
+    connect() (called on application startup) rather than in __init__.
+    """
+
+    def __init__(self, rpc_urls: Optional[List[str]] = None):
+        """
+        Args:
+            rpc_urls: JSON-RPC endpoints, best first (default: settings.rpc_urls)
+        """
+        # Nothing here touches the network or the ABI files: contracts and
+        # the signer are built on first use and the node is probed from
+        # connect(), so importing this module never blocks or fails on RPC.
+        self.provider = PooledAsyncHTTPProvider(
+            rpc_urls or settings.rpc_urls,
+            timeout=settings.RPC_TIMEOUT_SECONDS,
+            hedge_after=settings.RPC_HEDGE_AFTER_SECONDS,
+            cooldown=settings.RPC_ENDPOINT_COOLDOWN_SECONDS,
+        )
+        self.w3 = AsyncWeb3(self.provider)
+        self.chain = ChainMetadataCache(self.w3)
+        self.gas_cache = GasEstimateCache()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._multicall_available = True
+
+        # Readiness, refreshed by _probe(): connecting -> ready | unavailable
+        self.state = "connecting"
+        self.last_error: Optional[str] = None
+        self.checked_at: Optional[datetime] = None
+        self._probe_task: Optional[asyncio.Task] = None
+
+    @cached_property
+    def land_registry(self):
+        return self.w3.eth.contract(
             address=Web3.to_checksum_address(settings.LAND_REGISTRY_ADDRESS),
-            abi=self.land_registry_abi
+            abi=_load_abi("LandRegistry.json")
         )
-        
-        self.land_verification = self.w3.eth.contract(
+
+    @cached_property
+    def land_verification(self):
+        return self.w3.eth.contract(
             address=Web3.to_checksum_address(settings.LAND_VERIFICATION_ADDRESS),
-            abi=self.land_verification_abi
+            abi=_load_abi("LandVerification.json")
+        )
+
+    @cached_property
+    def multicall(self):
+        # Multicall3 batches many eth_calls into one; the JSON-RPC batch
+        # fallback is used on chains where it is not deployed.
+        return self.w3.eth.contract(
+            address=Web3.to_checksum_address(settings.MULTICALL3_ADDRESS),
+            abi=_load_abi("Multicall3.json")
         )
-    
-    def _load_abi(self, filename: str) -> list:
-        """Load ABI from contracts directory"""
-        contracts_dir = Path(__file__).parent.parent / "contracts"
-        abi_path = contracts_dir / filename
-        
-        with open(abi_path, 'r') as f:
-            contract_json = json.load(f)
-            # Foundry outputs comprehensive JSON with metadata, bytecode, and abi
-            # We only need the 'abi' field
-            return contract_json.get('abi', contract_json)
-    
-    def get_account_from_private_key(self, private_key: str) -> Account:
-        """Create account from private key"""
-        # Remove 0x prefix if present
-        if private_key.startswith('0x'):
-            private_key = private_key[2:]
-        return Account.from_key(private_key)
-    
-    def check_verifier_role(self, address: str) -> bool:
+
+    @cached_property
+    def _land_reads(self) -> Dict[str, FunctionSpec]:
+        functions = load_artifact("LandRegistry").functions
+        return {name: functions[name] for name in ("getLandDetails", "getVerificationCount")}
+
+    @cached_property
+    def admin_account(self):
+        return Account.from_key(settings.ADMIN_PRIVATE_KEY)
+
+    @cached_property
+    def nonce_manager(self) -> NonceManager:
+        return NonceManager(
+            self.admin_account.address,
+            transaction_count=self._transaction_count,
+            fill_gap=self._fill_nonce_gap,
+        )
+
+    async def connect(self) -> None:
+        """
+        Create the pooled HTTP session and hand it to the provider, then
+        start probing the node in the background. Never waits on the RPC.
+        """
+        if self._session is not None and not self._session.closed:
+            return
+        connector = aiohttp.TCPConnector(limit=settings.RPC_POOL_SIZE)
+        self._session = aiohttp.ClientSession(connector=connector)
+        await self.provider.cache_async_session(self._session)
+        self._schedule_probe()
+
+    def _schedule_probe(self) -> None:
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe())
+
+    async def _probe(self) -> None:
+        try:
+            # Every endpoint is probed so benched ones get a chance to recover
+            healthy = await asyncio.wait_for(self.provider.probe(), timeout=settings.RPC_PROBE_TIMEOUT_SECONDS)
+            if not healthy:
+                raise ConnectionError(f"No RPC endpoint answered: {self.provider}")
+            if self.state != "ready":
+                print(f"Blockchain RPC ready: {healthy}/{len(self.provider.endpoints)} endpoints")
+            self.state = "ready"
+            self.last_error = None
+        except Exception as e:
+            # Served by the unauthenticated /health/blockchain: no endpoint URLs
+            message = self.provider.redact(str(e)) or type(e).__name__
+            if self.state != "unavailable":
+                print(f"Blockchain RPC unavailable: {type(e).__name__}: {message}")
+            self.state = "unavailable"
+            self.last_error = message
+        finally:
+            self.checked_at = datetime.utcnow()
+
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Current RPC readiness without waiting on the node. A stale result
+        triggers a background re-probe for the next caller.
+        """
+        stale = self.checked_at is None or \
+            (datetime.utcnow() - self.checked_at).total_seconds() > settings.RPC_PROBE_INTERVAL_SECONDS
+        if stale and self._session is not None:
+            self._schedule_probe()
+        return {
+            "state": self.state,
+            "error": self.last_error,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+        }
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def is_connected(self) -> bool:
+        """Check whether the RPC node is reachable."""
+        return await self.w3.is_connected()
+
+    async def check_verifier_role(self, address: str) -> bool:
         """Check if address has VERIFIER_ROLE"""
         try:
             checksum_address = Web3.to_checksum_address(address)
-            # VERIFIER_ROLE = keccak256("VERIFIER_ROLE")
-            verifier_role = Web3.keccak(text="VERIFIER_ROLE")
-            
-            has_role = self.land_registry.functions.hasRole(
-                verifier_role,
+            return await self.land_registry.functions.hasRole(
+                VERIFIER_ROLE,
                 checksum_address
             ).call()
-            
-            return has_role
         except Exception as e:
             print(f"Error checking verifier role: {e}")
             return False
-    
-    def get_total_lands(self) -> int:
+
+    async def get_total_lands(self) -> int:
         """Get total number of registered lands"""
         try:
-            return self.land_registry.functions.getTotalLands().call()
+            return await self.land_registry.functions.getTotalLands().call()
         except Exception as e:
             print(f"Error getting total lands: {e}")
             return 0
-    
-    def get_land_details(self, token_id: int) -> Optional[Dict[str, Any]]:
+
+    async def get_land_details(self, token_id: int) -> Optional[Dict[str, Any]]:
         """Get land details from blockchain"""
+        details = await self.get_land_details_many([token_id])
+        return details.get(token_id)
+
+    async def get_land_details_many(self, token_ids: Iterable[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Get land details and verification counts for many tokens in as few
+        round-trips as possible: one Multicall3 aggregate3 call per
+        MULTICALL_BATCH_SIZE tokens, or one JSON-RPC batch per chunk where
+        Multicall3 is unavailable.
+
+        Args:
+            token_ids: Token IDs to read
+
+        Returns:
+            Dict keyed by token id; None for tokens that do not exist or
+            could not be read
+        """
+        token_ids = list(dict.fromkeys(token_ids))
+        size = settings.MULTICALL_BATCH_SIZE
+        chunks = [token_ids[i:i + size] for i in range(0, len(token_ids), size)]
+        results = await asyncio.gather(*(self._read_land_chunk(chunk) for chunk in chunks))
+
+        lands: Dict[int, Optional[Dict[str, Any]]] = {}
+        for chunk_result in results:
+            lands.update(chunk_result)
+        return lands
+
+    def _land_read_calls(self, token_ids: List[int]) -> List[str]:
+        """Calldata for getLandDetails then getVerificationCount, per token"""
+        details, count = self._land_reads["getLandDetails"], self._land_reads["getVerificationCount"]
+        return [
+            spec.encode_call([token_id])
+            for token_id in token_ids
+            for spec in (details, count)
+        ]
+
+    async def _read_land_chunk(self, token_ids: List[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+        calls = self._land_read_calls(token_ids)
         try:
-            details = self.land_registry.functions.getLandDetails(token_id).call()
-            # LandMetadata struct order (LandRegistry.sol):
-            # [0] ipfsHash, [1] area, [2] price, [3] location,
-            # [4] currentOwner, [5] status, [6] registeredAt,
-            # [7] verifiedAt, [8] verifiedBy
-            count = self.land_registry.functions.getVerificationCount(token_id).call()
-            return {
-                "ipfs_hash": details[0],
-                "area": details[1],
-                "price": str(details[2]),
-                "location": details[3],
-                "current_owner": details[4],
-                "status": details[5],        # 0=Pending, 1=Verified, 2=Rejected
-                "registered_at": details[6],
-                "verified_at": details[7],
-                "verified_by": details[8],
-                "verification_count": count,
-            }
+            if self._multicall_available:
+                try:
+                    raw = await self._aggregate3(calls)
+                except BadFunctionCallOutput:
+                    # No Multicall3 contract on this chain
+                    print("Multicall3 not available, falling back to JSON-RPC batches")
+                    self._multicall_available = False
+                    raw = await self._rpc_batch_call(calls)
+            else:
+                raw = await self._rpc_batch_call(calls)
         except Exception as e:
-            print(f"Error getting land details for token {token_id}: {e}")
-            return None
-    
-    def _build_tx_params(self, from_address: str, gas: int) -> dict:
-        """Build EIP-1559 transaction parameters, with legacy fallback."""
-        base_fee = self.w3.eth.get_block('latest').get('baseFeePerGas')
+            print(f"Error getting land details for tokens {token_ids}: {e}")
+            return {token_id: None for token_id in token_ids}
+
+        lands = {}
+        for i, token_id in enumerate(token_ids):
+            details_data, count_data = raw[2 * i], raw[2 * i + 1]
+            if details_data is None or count_data is None:
+                lands[token_id] = None
+                continue
+            try:
+                (details,) = self._land_reads["getLandDetails"].decode_output(details_data)
+                (count,) = self._land_reads["getVerificationCount"].decode_output(count_data)
+                lands[token_id] = _format_land_details(details, count)
+            except Exception as e:
+                print(f"Error decoding land details for token {token_id}: {e}")
+                lands[token_id] = None
+        return lands
+
+    async def _aggregate3(self, calls: List[str]) -> List[Optional[bytes]]:
+        """Run calls through Multicall3; None for each call that reverted"""
+        target = self.land_registry.address
+        results = await self.multicall.functions.aggregate3(
+            [(target, True, Web3.to_bytes(hexstr=data)) for data in calls]
+        ).call()
+        return [return_data if success else None for success, return_data in results]
+
+    async def _rpc_batch_call(self, calls: List[str]) -> List[Optional[bytes]]:
+        """Send calls as one JSON-RPC batch of eth_calls; None for each error"""
+        target = self.land_registry.address
+        responses = await self.provider.make_batch_request(
+            [("eth_call", [{"to": target, "data": data}, "latest"]) for data in calls]
+        )
+        if not isinstance(responses, list):
+            raise ValueError(f"RPC batch request failed: {responses.get('error')}")
+        return [
+            Web3.to_bytes(hexstr=response["result"]) if "result" in response else None
+            for response in responses
+        ]
+
+    async def _build_tx_params(self, from_address: str, gas: int, fee_multiplier: float = 1.0) -> dict:
+        """
+        Build EIP-1559 transaction parameters, with legacy fallback.
+        fee_multiplier > 1 bumps the fees, e.g. to replace a stuck transaction.
+        """
+        base_fee = await self.chain.base_fee()
+        chain_id = await self.chain.chain_id()
         if base_fee is not None:
             # EIP-1559
-            priority_fee = self.w3.eth.max_priority_fee or Web3.to_wei(1, 'gwei')
-            max_fee = base_fee * 2 + priority_fee
+            priority_fee = await self.chain.max_priority_fee() or Web3.to_wei(1, 'gwei')
+            priority_fee = int(priority_fee * fee_multiplier)
             return {
                 'from': from_address,
                 'gas': gas,
-                'maxFeePerGas': max_fee,
+                'maxFeePerGas': int((base_fee * 2 + priority_fee) * fee_multiplier),
                 'maxPriorityFeePerGas': priority_fee,
-                'chainId': self.w3.eth.chain_id,
-            }
-        else:
-            # Legacy fallback
-            gas_price = self.w3.eth.gas_price or Web3.to_wei(10, 'gwei')
-            return {
-                'from': from_address,
-                'gas': gas,
-                'gasPrice': gas_price,
-                'chainId': self.w3.eth.chain_id,
+                'chainId': chain_id,
             }
+        # Legacy fallback
+        gas_price = await self.chain.gas_price() or Web3.to_wei(10, 'gwei')
+        return {
+            'from': from_address,
+            'gas': gas,
+            'gasPrice': int(gas_price * fee_multiplier),
+            'chainId': chain_id,
+        }
+
+    async def _transaction_count(self, block_identifier: str) -> int:
+        return await self.w3.eth.get_transaction_count(self.admin_account.address, block_identifier)
+
+    async def _fill_nonce_gap(self, nonce: int) -> None:
+        """Send a zero-value self-transfer so the chain can move past nonce."""
+        sender = self.admin_account.address
+        tx_params = await self._build_tx_params(sender, gas=21000)
+        tx_params.update({'to': sender, 'value': 0, 'nonce': nonce})
+        signed_txn = self.admin_account.sign_transaction(tx_params)
+        await self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+
+    async def prepare_transaction(
+        self,
+        contract_fn,
+        label: str,
+        nonce: Optional[int] = None,
+        fee_multiplier: float = 1.0,
+        gas_bucket: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Estimate gas for a contract call and sign it with the admin wallet.
+
+        Nothing is broadcast: the caller can persist the signed payload first
+        and re-send the exact same bytes later without risking a second,
+        differently-nonced transaction.
+
+        Args:
+            contract_fn: Bound contract function to call
+            label: Short name used in log lines
+            nonce: Reuse this nonce (to replace a stuck tx) instead of
+                allocating a fresh one from the nonce manager
+            fee_multiplier: Scale fees, e.g. 1.25 for a replacement
+            gas_bucket: Gas cache key; when the cache is confident about it
+                the estimate_gas call is replaced by a single eth_call
+                that still catches a revert before anything is signed
+
+        Returns:
+            Dict with tx_hash, raw_transaction (0x-hex), nonce, gas_limit
+            and gas_bucket (record the receipt's gasUsed against it)
+        """
+        sender = self.admin_account.address
+        allocated = nonce is None
+        if allocated:
+            nonce = await self.nonce_manager.allocate()
+
+        try:
+            gas_limit = self.gas_cache.gas_limit(gas_bucket) if gas_bucket else None
+            estimated = gas_limit is None
+            if estimated:
+                try:
+                    estimated_gas = await contract_fn.estimate_gas({"from": sender})
+                    gas_limit = int(estimated_gas * 1.5)  # 50% safety buffer
+                except ContractLogicError:
+                    raise
+                except Exception as e:
+                    gas_limit = 500000  # safe fallback for cold storage
+                    print(f"[{label}] Gas estimation failed ({e}), using fallback: {gas_limit}")
+
+            tx_params = await self._build_tx_params(sender, gas=gas_limit, fee_multiplier=fee_multiplier)
+            tx_params['nonce'] = nonce
+            transaction = await contract_fn.build_transaction(tx_params)
+            if not estimated:
+                await self._simulate(transaction, label)
+            signed_txn = self.admin_account.sign_transaction(transaction)
+        except Exception:
+            # Never broadcast, so hand the nonce back rather than leave a gap
+            if allocated:
+                await self.nonce_manager.release(nonce)
+            raise
+
+        return {
+            "tx_hash": Web3.to_hex(signed_txn.hash),
+            "raw_transaction": Web3.to_hex(signed_txn.raw_transaction),
+            "nonce": nonce,
+            "gas_limit": gas_limit,
+            "gas_bucket": gas_bucket,
+        }
+
+    async def _simulate(self, transaction: Dict[str, Any], label: str) -> None:
+        """
+        Run a transaction with eth_call before it is signed. Without
+        estimate_gas this is the only check that it would not revert
+        (already verified, same verifier twice) and burn gas on-chain.
+
+        Raises:
+            ContractLogicError: The call reverts
+        """
+        call = {"from": transaction["from"], "to": transaction["to"], "data": transaction["data"]}
+        try:
+            await self.w3.eth.call(call)
+        except ContractLogicError:
+            raise
+        except Exception as e:
+            # Same as a failed estimate: the node could not say, send anyway
+            print(f"[{label}] Simulation failed ({e}), sending with the cached gas limit")
+
+    def _gas_bucket(self, fn_name: str, args: list, variant: Optional[str] = None) -> str:
+        calldata = self.land_registry.encode_abi(fn_name, args=args)
+        return self.gas_cache.bucket(fn_name, calldata, variant)
 
-    def verify_land(
+    async def prepare_register_land(
+        self,
+        property_id: str,
+        ipfs_hash: str,
+        area: int,
+        price: int,
+        location: str,
+        **overrides,
+    ) -> Dict[str, Any]:
+        """Sign a registerLand transaction without sending it."""
+        args = [property_id, ipfs_hash, area, price, location]
+        fn = self.land_registry.functions.registerLand(*args)
+        bucket = self._gas_bucket("registerLand", args)
+        return await self.prepare_transaction(fn, "Mint", gas_bucket=bucket, **overrides)
+
+    async def prepare_verify_land(
         self,
         token_id: int,
         verifier_address: str,
-    ) -> Optional[Dict[str, Any]]:
+        mints: bool = False,
+        **overrides,
+    ) -> Dict[str, Any]:
         """
-        Verify a land on blockchain using the admin wallet.
-        Passes the verifier_address to be tracked on-chain.
+        Sign a verifyLand transaction without sending it.
+        mints=True marks the verification that reaches the threshold and
+        mints the NFT, which is gas-cached separately.
         """
+        args = [token_id, Web3.to_checksum_address(verifier_address)]
+        fn = self.land_registry.functions.verifyLand(*args)
+        bucket = self._gas_bucket("verifyLand", args, variant="mint" if mints else None)
+        return await self.prepare_transaction(fn, "Verify", gas_bucket=bucket, **overrides)
+
+    async def prepare_reject_land(self, token_id: int, reason: str, **overrides) -> Dict[str, Any]:
+        """Sign a rejectLand transaction without sending it."""
+        args = [token_id, reason]
+        fn = self.land_registry.functions.rejectLand(*args)
+        bucket = self._gas_bucket("rejectLand", args)
+        return await self.prepare_transaction(fn, "Reject", gas_bucket=bucket, **overrides)
+
+    async def prepare_verify_many(
+        self,
+        token_ids: List[int],
+        verifier_address: str,
+        mints: int = 0,
+        **overrides,
+    ) -> Dict[str, Any]:
+        """
+        Sign one verifyLandBatch transaction for token_ids without sending it.
+        mints is how many of the tokens are expected to reach the threshold
+        and mint; batches are gas-cached per mint count.
+        """
+        args = [list(token_ids), Web3.to_checksum_address(verifier_address)]
+        fn = self.land_registry.functions.verifyLandBatch(*args)
+        bucket = self._gas_bucket("verifyLandBatch", args, variant=f"mint{mints}" if mints else None)
+        return await self.prepare_transaction(fn, "VerifyBatch", gas_bucket=bucket, **overrides)
+
+    async def send_raw_transaction(self, raw_transaction: str) -> str:
+        """Broadcast a signed transaction. Re-sending the same bytes is idempotent."""
+        tx_hash = await self.w3.eth.send_raw_transaction(raw_transaction)
+        return Web3.to_hex(tx_hash)
+
+    async def get_transaction_receipt(self, tx_hash: str):
+        """Return the receipt for tx_hash, or None if it has not been mined yet."""
         try:
-            admin_account = self.get_account_from_private_key(settings.ADMIN_PRIVATE_KEY)
-            nonce = self.w3.eth.get_transaction_count(admin_account.address)
+            return await self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
 
-            # Dynamically estimate gas instead of hardcoding 200k, as 3rd verification mints token
-            verifier_checksum = Web3.to_checksum_address(verifier_address)
-            try:
-                estimated_gas = self.land_registry.functions.verifyLand(
-                    token_id, 
-                    verifier_checksum
-                ).estimate_gas({"from": admin_account.address})
-                gas_limit = int(estimated_gas * 1.5)
-            except Exception as e:
-                gas_limit = 500000  # Fallback
-                print(f"Gas estimation failed for verifyLand: {e}")
+    async def is_transaction_known(self, tx_hash: str) -> bool:
+        """Whether the node has tx_hash in its mempool or chain."""
+        try:
+            await self.w3.eth.get_transaction(tx_hash)
+            return True
+        except TransactionNotFound:
+            return False
 
-            tx_params = self._build_tx_params(admin_account.address, gas=gas_limit)
-            tx_params['nonce'] = nonce
+    def registered_token_id(self, tx_receipt) -> Optional[int]:
+        """Extract the tokenId from a registerLand receipt's LandRegistered log."""
+        event = load_artifact("LandRegistry").find_event(
+            tx_receipt['logs'], "LandRegistered", address=self.land_registry.address
+        )
+        return event['args']['tokenId'] if event else None
 
-            transaction = self.land_registry.functions.verifyLand(
-                token_id, 
-                verifier_checksum
-            ).build_transaction(tx_params)
+    def batch_results(self, tx_receipt) -> Dict[int, Dict[str, Any]]:
+        """
+        Per-token outcome of a verifyLandBatch receipt, read from the
+        events the registry emitted for each token.
 
-            signed_txn = self.w3.eth.account.sign_transaction(
-                transaction,
-                private_key=settings.ADMIN_PRIVATE_KEY
-            )
+        Returns:
+            token_id -> {"outcome": "recorded" | "verified" | "skipped",
+            plus "verification_count" for verifications and "reason" for
+            skips}
+        """
+        registry = load_artifact("LandRegistry")
+        address = self.land_registry.address.lower()
+        results: Dict[int, Dict[str, Any]] = {}
+        for log in tx_receipt['logs']:
+            if log['address'].lower() != address:
+                continue
+            decoder = registry.decoder_for(log)
+            if decoder is None:
+                continue
+            args = decoder.decode(log)['args']
+            if decoder.name == "VerificationRecorded":
+                results[args['tokenId']] = {"outcome": "recorded", "verification_count": args['verificationCount']}
+            elif decoder.name == "LandVerified":
+                results.setdefault(args['tokenId'], {})["outcome"] = "verified"
+            elif decoder.name == "BatchItemSkipped":
+                # A token listed twice is skipped the second time; keep the first outcome
+                results.setdefault(args['tokenId'], {"outcome": "skipped", "reason": args['reason']})
+        return results
 
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+    def receipt_result(self, tx_hash: str, tx_receipt) -> Dict[str, Any]:
+        """Summarise a receipt in the shape the land endpoints return."""
+        return {
+            "tx_hash": tx_hash,
+            "status": "success" if tx_receipt['status'] == 1 else "failed",
+            "block_number": tx_receipt['blockNumber'],
+            "gas_used": tx_receipt['gasUsed'],
+            "signer": self.admin_account.address,
+        }
 
-            return {
-                "tx_hash": tx_hash.hex(),
-                "status": "success" if tx_receipt['status'] == 1 else "failed",
-                "block_number": tx_receipt['blockNumber'],
-                "gas_used": tx_receipt['gasUsed'],
-                "signer": admin_account.address,
-            }
+    async def _send_and_wait(self, prepared: Dict[str, Any]):
+        """Broadcast a prepared transaction and wait for its receipt."""
+        tx_hash = await self.send_raw_transaction(prepared["raw_transaction"])
+        tx_receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        if tx_receipt['status'] == 1:
+            self.gas_cache.record(prepared.get("gas_bucket"), tx_receipt['gasUsed'])
+        return tx_hash, tx_receipt
 
+    async def verify_land(
+        self,
+        token_id: int,
+        verifier_address: str,
+        mints: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Verify a land on blockchain using the admin wallet and wait for the receipt.
+        Passes the verifier_address to be tracked on-chain.
+        """
+        try:
+            prepared = await self.prepare_verify_land(token_id, verifier_address, mints=mints)
+            tx_hash, tx_receipt = await self._send_and_wait(prepared)
+            return self.receipt_result(tx_hash, tx_receipt)
         except ContractLogicError as e:
             print(f"Contract logic error verifying land {token_id}: {e}")
             raise
         except Exception as e:
             print(f"Error verifying land {token_id}: {e}")
             raise
-    
-    def reject_land(
+
+    async def reject_land(
         self,
         token_id: int,
         reason: str,
     ) -> Optional[Dict[str, Any]]:
         """
-        Reject a land on blockchain using the admin wallet.
+        Reject a land on blockchain using the admin wallet and wait for the receipt.
         """
         try:
-            admin_account = self.get_account_from_private_key(settings.ADMIN_PRIVATE_KEY)
-            nonce = self.w3.eth.get_transaction_count(admin_account.address)
-
-            try:
-                estimated_gas = self.land_registry.functions.rejectLand(
-                    token_id, reason
-                ).estimate_gas({"from": admin_account.address})
-                gas_limit = int(estimated_gas * 1.5)
-            except Exception as e:
-                gas_limit = 500000
-                print(f"Gas estimation failed for rejectLand: {e}")
-
-            tx_params = self._build_tx_params(admin_account.address, gas=gas_limit)
-            tx_params['nonce'] = nonce
-
-            transaction = self.land_registry.functions.rejectLand(
-                token_id,
-                reason
-            ).build_transaction(tx_params)
-
-            signed_txn = self.w3.eth.account.sign_transaction(
-                transaction,
-                private_key=settings.ADMIN_PRIVATE_KEY
-            )
-
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-
-            return {
-                "tx_hash": tx_hash.hex(),
-                "status": "success" if tx_receipt['status'] == 1 else "failed",
-                "block_number": tx_receipt['blockNumber'],
-                "gas_used": tx_receipt['gasUsed'],
-                "signer": admin_account.address,
-            }
-
+            prepared = await self.prepare_reject_land(token_id, reason)
+            tx_hash, tx_receipt = await self._send_and_wait(prepared)
+            return self.receipt_result(tx_hash, tx_receipt)
         except ContractLogicError as e:
             print(f"Contract logic error rejecting land {token_id}: {e}")
             raise
         except Exception as e:
             print(f"Error rejecting land {token_id}: {e}")
             raise
-    
-    def register_land(
+
+    async def verify_many(
+        self,
+        token_ids: List[int],
+        verifier_address: str,
+        mints: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Verify up to MAX_BATCH_SIZE lands in one transaction and wait for the
+        receipt. Tokens that cannot be verified are skipped on-chain rather
+        than reverting the batch; see batch_results().
+        """
+        try:
+            prepared = await self.prepare_verify_many(token_ids, verifier_address, mints=mints)
+            tx_hash, tx_receipt = await self._send_and_wait(prepared)
+            return {**self.receipt_result(tx_hash, tx_receipt), "results": self.batch_results(tx_receipt)}
+        except Exception as e:
+            print(f"Error verifying lands {list(token_ids)}: {e}")
+            raise
+
+    async def register_land(
         self,
         property_id: str,
         ipfs_hash: str,
@@ -245,85 +623,24 @@ class BlockchainService:
         owner_address: str
     ) -> Dict[str, Any]:
         """
-        Register/mint a new land NFT (called by backend on behalf of user).
+        Register/mint a new land NFT and wait for the receipt.
         Uses the admin wallet as the on-chain signer (msg.sender).
-        Raises on any failure so the calling endpoint can surface the real error.
+        Raises on any failure so the caller can surface the real error.
         """
-        import traceback
-
-        admin_account = self.get_account_from_private_key(settings.ADMIN_PRIVATE_KEY)
-        print(f"[Mint] Signer: {admin_account.address}")
-
-        nonce = self.w3.eth.get_transaction_count(admin_account.address)
-        print(f"[Mint] Nonce: {nonce}")
-
-        # Estimate gas dynamically — cold SSTORE slots on first mint cost more than warm
-        try:
-            estimated_gas = self.land_registry.functions.registerLand(
-                property_id, ipfs_hash, area, price, location
-            ).estimate_gas({"from": admin_account.address})
-            gas_limit = int(estimated_gas * 1.5)  # 50% safety buffer
-            print(f"[Mint] Estimated gas: {estimated_gas}, using limit: {gas_limit}")
-        except Exception as e:
-            gas_limit = 500000  # safe fallback for cold storage
-            print(f"[Mint] Gas estimation failed ({e}), using fallback: {gas_limit}")
-
-        tx_params = self._build_tx_params(admin_account.address, gas=gas_limit)
-        tx_params['nonce'] = nonce
-        print(f"[Mint] Gas params: {tx_params}")
-
-        try:
-            transaction = self.land_registry.functions.registerLand(
-                property_id,
-                ipfs_hash,
-                area,
-                price,
-                location
-            ).build_transaction(tx_params)
-        except Exception as e:
-            print(f"[Mint] build_transaction failed: {e}")
-            traceback.print_exc()
-            raise RuntimeError(f"Failed to build transaction: {e}")
-
-        try:
-            signed_txn = self.w3.eth.account.sign_transaction(
-                transaction,
-                private_key=settings.ADMIN_PRIVATE_KEY
-            )
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            print(f"[Mint] tx sent: {tx_hash.hex()}")
-
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-            print(f"[Mint] receipt status: {tx_receipt['status']}")
-
-            if tx_receipt['status'] != 1:
-                raise RuntimeError(f"Transaction reverted on-chain. tx_hash={tx_hash.hex()}")
+        prepared = await self.prepare_register_land(property_id, ipfs_hash, area, price, location)
+        tx_hash, tx_receipt = await self._send_and_wait(prepared)
+        print(f"[Mint] tx {tx_hash} receipt status: {tx_receipt['status']}")
 
-        except Exception as e:
-            print(f"[Mint] send/receipt failed: {e}")
-            traceback.print_exc()
-            raise
-
-        # Parse LandRegistered event to get token_id
-        token_id = None
-        for log in tx_receipt['logs']:
-            try:
-                event = self.land_registry.events.LandRegistered().process_log(log)
-                token_id = event['args']['tokenId']
-                break
-            except Exception:
-                continue
-
-        print(f"[Mint] token_id from event: {token_id}")
+        if tx_receipt['status'] != 1:
+            raise RuntimeError(f"Transaction reverted on-chain. tx_hash={tx_hash}")
 
         return {
-            "tx_hash": tx_hash.hex(),
-            "token_id": token_id,
+            "tx_hash": tx_hash,
+            "token_id": self.registered_token_id(tx_receipt),
             "status": "success",
             "block_number": tx_receipt['blockNumber'],
             "gas_used": tx_receipt['gasUsed']
         }
 
-
 # Singleton instance
-blockchain_service = BlockchainService()
+async_blockchain_service = AsyncBlockchainService()
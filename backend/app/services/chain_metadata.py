@@ -0,0 +1,96 @@
+"""
+Chain Metadata Cache
+
+Read-mostly chain data used on every transaction and explorer page view.
+Values that cannot change for a running node (chain id) are fetched once;
+head-of-chain data (latest block, fee suggestions) is cached for a few
+seconds and refreshed single-flight, so concurrent callers share one RPC
+call instead of each making their own.
+"""
+
+from typing import Any, Dict, Optional
+
+from web3 import AsyncWeb3, Web3
+
+from app.core.config import settings
+from app.utils.cache import SingleFlightTTL
+
+# AccessControl role id, keccak256 of the role name
+VERIFIER_ROLE = Web3.keccak(text="VERIFIER_ROLE")
+
+# Mirrors LandRegistry.REQUIRED_VERIFICATIONS: the verifyLand that reaches it mints
+REQUIRED_VERIFICATIONS = 3
+
+# Mirrors LandRegistry.MAX_BATCH_SIZE: most tokens per verifyLandBatch / rejectLandBatch
+MAX_BATCH_SIZE = 50
+
+
+class ChainMetadataCache:
+    """Memoized and TTL-cached chain metadata for one AsyncWeb3 instance"""
+
+    def __init__(self, w3: AsyncWeb3):
+        self.w3 = w3
+        head_ttl = settings.CHAIN_HEAD_CACHE_TTL_SECONDS
+        fee_ttl = settings.FEE_CACHE_TTL_SECONDS
+        self._cells = {
+            "chain_id": SingleFlightTTL(self._load_chain_id, ttl=None),
+            "latest_block": SingleFlightTTL(self._load_latest_block, ttl=head_ttl),
+            "block_time": SingleFlightTTL(self._load_block_time, ttl=head_ttl),
+            "max_priority_fee": SingleFlightTTL(self._load_max_priority_fee, ttl=fee_ttl),
+            "gas_price": SingleFlightTTL(self._load_gas_price, ttl=fee_ttl),
+        }
+
+    # ------------------------------------------------------------- loaders
+
+    async def _load_chain_id(self) -> int:
+        return await self.w3.eth.chain_id
+
+    async def _load_latest_block(self):
+        return await self.w3.eth.get_block("latest")
+
+    async def _load_block_time(self) -> Optional[int]:
+        latest = await self.latest_block()
+        if latest["number"] == 0:
+            return None
+        parent = await self.w3.eth.get_block(latest["number"] - 1)
+        return int(latest["timestamp"]) - int(parent["timestamp"])
+
+    async def _load_max_priority_fee(self) -> int:
+        return await self.w3.eth.max_priority_fee
+
+    async def _load_gas_price(self) -> int:
+        return await self.w3.eth.gas_price
+
+    # ------------------------------------------------------------- getters
+
+    async def chain_id(self) -> int:
+        """Chain id (fetched once per process)"""
+        return await self._cells["chain_id"].get()
+
+    async def latest_block(self):
+        """Latest block, at most CHAIN_HEAD_CACHE_TTL_SECONDS old"""
+        return await self._cells["latest_block"].get()
+
+    async def block_number(self) -> int:
+        """Latest block number, at most CHAIN_HEAD_CACHE_TTL_SECONDS old"""
+        return (await self.latest_block())["number"]
+
+    async def base_fee(self) -> Optional[int]:
+        """Latest block's base fee, or None on chains without EIP-1559"""
+        return (await self.latest_block()).get("baseFeePerGas")
+
+    async def block_time(self) -> Optional[int]:
+        """Seconds between the latest block and its parent"""
+        return await self._cells["block_time"].get()
+
+    async def max_priority_fee(self) -> int:
+        """Suggested priority fee in wei, at most FEE_CACHE_TTL_SECONDS old"""
+        return await self._cells["max_priority_fee"].get()
+
+    async def gas_price(self) -> int:
+        """Legacy gas price in wei, at most FEE_CACHE_TTL_SECONDS old"""
+        return await self._cells["gas_price"].get()
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-value cache counters for metrics output"""
+        return {name: cell.stats() for name, cell in self._cells.items()}
@@ -0,0 +1,187 @@
+"""
+Document Cache
+
+A size-bounded, on-disk LRU cache of documents in front of the document
+store, used by GET /documents/{cid}. Content is immutable by CID, so
+entries never go stale; they only leave the cache when it is over
+DOCUMENT_CACHE_MAX_BYTES.
+
+A miss downloads the document once into a temporary file, hashing it on the
+way, and only moves it into the cache if the content matches the CID.
+Concurrent requests for the same missing CID wait on that one download
+(single-flight), which runs as its own task so a client that disconnects
+does not cancel it for the others.
+"""
+
+import asyncio
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.utils.cid import UnixFSHasher
+
+logger = get_logger(__name__)
+
+
+class DocumentCache:
+    """
+    On-disk LRU of verified documents, keyed by CID.
+
+    The LRU order and sizes live in memory and are rebuilt from the cache
+    directory (oldest modification first) on start(). Files are laid out as
+    <root>/<last two CID characters>/<CID>.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.root = Path(root or settings.DOCUMENT_CACHE_PATH)
+        self.max_bytes = max_bytes or settings.DOCUMENT_CACHE_MAX_BYTES
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # CID -> size, least recently used first
+        self._bytes = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "bytes_fetched": 0,
+            "verify_failures": 0,
+        }
+
+    async def start(self) -> None:
+        """Index the cache directory (called on application startup)"""
+        entries = await asyncio.to_thread(self._scan)
+        self._entries = OrderedDict(entries)
+        self._bytes = sum(self._entries.values())
+        await self._evict()
+        logger.info(f"Document cache: {len(self._entries)} documents, {self._bytes / 2 ** 20:.1f} MiB")
+
+    def _scan(self) -> list:
+        tmp = self.root / ".tmp"
+        tmp.mkdir(parents=True, exist_ok=True)
+        for leftover in tmp.iterdir():  # Downloads interrupted by a restart
+            leftover.unlink(missing_ok=True)
+        found = []
+        for path in self.root.glob("??/*"):
+            stat = path.stat()
+            found.append((stat.st_mtime, path.name, stat.st_size))
+        return [(cid, size) for _, cid, size in sorted(found)]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            **self._stats,
+            "documents": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "in_flight": len(self._inflight),
+        }
+
+    def _path(self, cid: str) -> Path:
+        return self.root / cid[-2:] / cid
+
+    async def open(
+        self,
+        cid: str,
+        source: Callable[[], AsyncIterator[bytes]],
+        sha256: Optional[str] = None,
+    ) -> Tuple[BinaryIO, int]:
+        """
+        Open a cached document, downloading it first on a miss.
+
+        Args:
+            cid: Document CID (alphanumeric, as returned by the store)
+            source: Returns a fresh stream of the document's content
+            sha256: Expected sha256 hex digest; required to verify CIDs
+                other than CIDv0
+
+        Returns:
+            (open binary file, size); the caller closes the file
+
+        Raises:
+            HTTPException: 502 if the downloaded content does not match
+            the CID, or whatever the source raised
+        """
+        waited = False
+        for _ in range(3):
+            if cid in self._entries:
+                self._entries.move_to_end(cid)
+                try:
+                    handle = await asyncio.to_thread(open, self._path(cid), "rb")
+                except FileNotFoundError:
+                    self._forget(cid)  # Removed behind our back; fetch again
+                    continue
+                if not waited:
+                    self._stats["hits"] += 1
+                return handle, self._entries.get(cid) or os.fstat(handle.fileno()).st_size
+
+            task = self._inflight.get(cid)
+            if task is None:
+                self._stats["misses"] += 1
+                task = asyncio.create_task(self._fetch(cid, source, sha256))
+                self._inflight[cid] = task
+                task.add_done_callback(lambda _: self._inflight.pop(cid, None))
+            else:
+                self._stats["coalesced"] += 1
+            await asyncio.shield(task)
+            waited = True
+        raise HTTPException(status_code=503, detail="Document cache is full, try again later")
+
+    async def _fetch(self, cid: str, source: Callable[[], AsyncIterator[bytes]], sha256: Optional[str]) -> None:
+        hasher = UnixFSHasher()
+        fd, tmp_path = await asyncio.to_thread(tempfile.mkstemp, dir=self.root / ".tmp")
+        out = os.fdopen(fd, "wb")
+
+        def write(chunk: bytes) -> None:
+            hasher.update(chunk)
+            out.write(chunk)
+
+        try:
+            try:
+                async for chunk in source():
+                    await asyncio.to_thread(write, chunk)
+            finally:
+                await asyncio.to_thread(out.close)
+
+            if cid.startswith("Qm"):
+                verified = hasher.cid == cid
+            else:
+                verified = sha256 is not None and hasher.sha256 == sha256
+            if not verified:
+                self._stats["verify_failures"] += 1
+                logger.warning(f"Document {cid} failed verification (got {hasher.cid}, sha256 {hasher.sha256})")
+                raise HTTPException(status_code=502, detail="Document content does not match its CID")
+
+            path = self._path(cid)
+            await asyncio.to_thread(path.parent.mkdir, exist_ok=True)
+            await asyncio.to_thread(os.replace, tmp_path, path)
+        except BaseException:
+            await asyncio.to_thread(Path(tmp_path).unlink, missing_ok=True)
+            raise
+
+        self._stats["bytes_fetched"] += hasher.size
+        self._entries[cid] = hasher.size
+        self._bytes += hasher.size
+        await self._evict()
+
+    def _forget(self, cid: str) -> None:
+        self._bytes -= self._entries.pop(cid, 0)
+
+    async def _evict(self) -> None:
+        """Drop least recently used documents until under max_bytes; never the newest"""
+        victims = []
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            cid = next(iter(self._entries))
+            self._forget(cid)
+            victims.append(self._path(cid))
+        self._stats["evictions"] += len(victims)
+        # Readers that already opened a file keep their handle
+        for path in victims:
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+
+
+document_cache = DocumentCache()
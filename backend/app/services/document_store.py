@@ -0,0 +1,516 @@
+"""
+Document Stores
+
+Where registration documents live. Every store addresses content by its
+IPFS CID and streams both ways: put() reads the file object in chunks and
+get() yields the content in chunks, so no document is held in memory whole.
+put_directory() stores a set of small files (token metadata) as one UnixFS
+directory in a single request.
+
+    pinata      Pinata's pinning API (uploads) and gateway (downloads)
+    kubo        A self-hosted IPFS node through the Kubo RPC API
+    filesystem  Content-addressed files under DOCUMENT_STORE_PATH, named by
+                the CIDv0 IPFS would give them; needs no network at all
+
+settings.DOCUMENT_STORE selects the store behind pinata_service.
+
+The HTTP stores share one resilient request path: connect and read
+timeouts, retries with jittered exponential backoff on timeouts, connection
+errors, 429 and 5xx (adding the same bytes always gives the same CID, so
+re-sending is safe), and a circuit breaker that fails requests fast with a
+503 while the service keeps failing.
+"""
+
+import asyncio
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, FrozenSet, Optional, Tuple
+
+import aiohttp
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.utils.cid import CHUNK_SIZE, UnixFSHasher, directory_cid
+from app.utils.circuit_breaker import CircuitBreaker
+
+logger = get_logger(__name__)
+
+# Answers worth retrying: the service is rate limiting or having trouble
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class DocumentStore:
+    """
+    Content-addressed document storage.
+
+    Subclasses implement put/get/remove; connect/close bracket the
+    application's lifetime. Stores count what goes through them for
+    /metrics.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self._put_seconds = 0.0
+        self._stats = {
+            "uploads": 0,
+            "bytes_uploaded": 0,
+            "downloads": 0,
+            "bytes_downloaded": 0,
+        }
+
+    async def connect(self) -> None:
+        """Acquire resources (called on application startup)"""
+
+    async def close(self) -> None:
+        """Release resources (called on application shutdown)"""
+
+    async def put(self, file: BinaryIO, filename: str, content_type: str) -> str:
+        """
+        Store the content of a file object, read from the start in chunks.
+
+        Returns:
+            CID of the content
+        """
+        raise NotImplementedError
+
+    async def put_directory(self, files: Dict[str, bytes]) -> str:
+        """
+        Store small files as one directory, in one request.
+
+        Args:
+            files: File name -> content; names are plain (no "/")
+
+        Returns:
+            CID of the directory; each file is at <CID>/<name>
+        """
+        raise NotImplementedError
+
+    def get(self, cid: str) -> AsyncIterator[bytes]:
+        """
+        Stream stored content.
+
+        Raises:
+            HTTPException: 404 if the store does not have the CID
+        """
+        raise NotImplementedError
+
+    async def remove(self, cid: str) -> bool:
+        """Unpin/delete content. Returns False if the store could not be reached or refused."""
+        raise NotImplementedError
+
+    def _record_put(self, size: int, seconds: float) -> None:
+        self._stats["uploads"] += 1
+        self._stats["bytes_uploaded"] += size
+        self._put_seconds += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        seconds = self._put_seconds
+        return {
+            **self._stats,
+            "upload_bytes_per_second": round(self._stats["bytes_uploaded"] / seconds) if seconds else None,
+        }
+
+
+class HttpDocumentStore(DocumentStore):
+    """
+    Base for stores behind an HTTP API, over one pooled aiohttp session.
+
+    The session's connector caps open connections at PINATA_POOL_SIZE. It
+    is bound to the running event loop, so it is created in connect()
+    rather than in __init__.
+    """
+
+    label = "Document store"  # Service name used in error messages
+    retryable_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None):
+        super().__init__()
+        self._headers = headers or {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.PINATA_BREAKER_FAILURES,
+            reset_timeout=settings.PINATA_BREAKER_RESET_SECONDS,
+        )
+        self._stats.update({"attempts": 0, "retries": 0, "failures": 0})
+
+    async def connect(self) -> None:
+        """Create the pooled HTTP session. Makes no request."""
+        if self._session is not None and not self._session.closed:
+            return
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=settings.PINATA_POOL_SIZE),
+            timeout=aiohttp.ClientTimeout(
+                total=settings.PINATA_TIMEOUT_SECONDS,
+                connect=settings.PINATA_CONNECT_TIMEOUT_SECONDS,
+                sock_read=settings.PINATA_READ_TIMEOUT_SECONDS,
+            ),
+            headers=self._headers,
+        )
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "breaker": self.breaker.stats()}
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Full-jitter exponential backoff, at least Retry-After, capped"""
+        delay = random.uniform(0, settings.PINATA_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, settings.PINATA_RETRY_MAX_SECONDS)
+
+    def _unavailable(self, detail: str) -> HTTPException:
+        retry_after = max(1, round(self.breaker.retry_after() or settings.PINATA_RETRY_MAX_SECONDS))
+        return HTTPException(status_code=503, detail=detail, headers={"Retry-After": str(retry_after)})
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Callable[[], Any]] = None,
+        params: Optional[Dict[str, str]] = None,
+    ) -> aiohttp.ClientResponse:
+        """
+        Send a request with retries and the circuit breaker.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            data: Builds a fresh request body for each attempt
+            params: Query parameters
+
+        Returns:
+            The open response for any status that is not retried, success or
+            not; the caller must read or release it.
+
+        Raises:
+            HTTPException: 503 with Retry-After when the breaker is open or
+            every attempt failed
+        """
+        await self.connect()
+        error = None
+        for attempt in range(1, settings.PINATA_MAX_ATTEMPTS + 1):
+            if not self.breaker.allow():
+                raise self._unavailable(f"{self.label} is unavailable ({error or 'circuit breaker open'}), try again later")
+            self._stats["attempts"] += 1
+            retry_after = None
+            try:
+                response = await self._session.request(method, url, data=data() if data else None, params=params)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = repr(e)
+            else:
+                if response.status not in self.retryable_statuses:
+                    self.breaker.record_success()
+                    return response
+                error = f"HTTP {response.status}"
+                header = response.headers.get("Retry-After", "")
+                retry_after = float(header) if header.isdigit() else None
+                response.release()
+            self.breaker.record_failure()
+            if attempt < settings.PINATA_MAX_ATTEMPTS:
+                self._stats["retries"] += 1
+                delay = self._backoff(attempt, retry_after)
+                logger.warning(f"{self.label} {method} {url} failed ({error}), retry {attempt} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+        self._stats["failures"] += 1
+        raise self._unavailable(f"{self.label} request failed after {settings.PINATA_MAX_ATTEMPTS} attempts: {error}")
+
+    async def _request(self, method: str, url: str, **kwargs) -> Tuple[int, Any]:
+        """_send() and read the body: parsed JSON when the service sends JSON, else text"""
+        async with await self._send(method, url, **kwargs) as response:
+            if response.content_type == "application/json":
+                return response.status, await response.json()
+            return response.status, await response.text()
+
+    async def _missing(self, response: aiohttp.ClientResponse) -> bool:
+        """Whether a download response means the content does not exist"""
+        return response.status == 404
+
+    async def _stream(self, method: str, url: str, **kwargs) -> AsyncIterator[bytes]:
+        """_send() and yield the body in chunks; a 404 is reported as missing content"""
+        async with await self._send(method, url, **kwargs) as response:
+            if await self._missing(response):
+                raise HTTPException(status_code=404, detail="Document not found")
+            if response.status != 200:
+                self._stats["failures"] += 1
+                raise HTTPException(status_code=502, detail=f"{self.label} download failed: HTTP {response.status}")
+            self._stats["downloads"] += 1
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                self._stats["bytes_downloaded"] += len(chunk)
+                yield chunk
+
+    @staticmethod
+    def _form(file: BinaryIO, filename: str, content_type: str, **fields: str) -> Callable[[], aiohttp.FormData]:
+        def build() -> aiohttp.FormData:
+            # aiohttp reads the file object in chunks from a worker thread and
+            # sends Content-Length from its size, so nothing is buffered whole
+            file.seek(0)
+            data = aiohttp.FormData()
+            data.add_field("file", file, filename=filename, content_type=content_type)
+            for name, value in fields.items():
+                data.add_field(name, value)
+            return data
+        return build
+
+    @staticmethod
+    def _directory_form(files: Dict[str, bytes], prefix: str = "", **fields: str) -> Callable[[], aiohttp.FormData]:
+        def build() -> aiohttp.FormData:
+            # Unquoted, so a folder/name path reaches the server as such
+            data = aiohttp.FormData(quote_fields=False)
+            for name, content in files.items():
+                data.add_field("file", content, filename=prefix + name, content_type="application/json")
+            for name, value in fields.items():
+                data.add_field(name, value)
+            return data
+        return build
+
+
+class PinataStore(HttpDocumentStore):
+    """Pinata pinning API for uploads, the Pinata gateway for downloads"""
+
+    name = "pinata"
+    label = "Pinata"
+
+    def __init__(self):
+        self.base_url = settings.PINATA_API_URL.rstrip("/")
+        self.gateway_url = settings.PINATA_GATEWAY_URL.rstrip("/")
+        self.api_key = settings.PINATA_API_KEY
+        self.secret_key = settings.PINATA_SECRET_API_KEY
+        super().__init__(headers={
+            "pinata_api_key": self.api_key or "",
+            "pinata_secret_api_key": self.secret_key or "",
+        })
+
+        if not self.api_key or not self.secret_key:
+            print("Warning: Pinata API keys not found in environment variables.")
+
+    async def put(self, file: BinaryIO, filename: str, content_type: str) -> str:
+        if not self.api_key or not self.secret_key:
+            raise HTTPException(status_code=500, detail="Pinata configuration missing")
+
+        started = time.monotonic()
+        # Pin as CIDv0 so the CID matches the one computed locally
+        form = self._form(file, filename, content_type, pinataOptions='{"cidVersion": 0}')
+        status, body = await self._request("POST", f"{self.base_url}/pinning/pinFileToIPFS", data=form)
+        if status != 200:
+            self._stats["failures"] += 1
+            raise HTTPException(status_code=502, detail=f"Pinata rejected the upload: HTTP {status} {body}")
+        self._record_put(body.get("PinSize") or 0, time.monotonic() - started)
+        return body["IpfsHash"]
+
+    async def put_directory(self, files: Dict[str, bytes]) -> str:
+        if not self.api_key or not self.secret_key:
+            raise HTTPException(status_code=500, detail="Pinata configuration missing")
+
+        started = time.monotonic()
+        # Files under one folder are pinned as that folder; its CID is returned
+        form = self._directory_form(files, prefix="metadata/", pinataOptions='{"cidVersion": 0}')
+        status, body = await self._request("POST", f"{self.base_url}/pinning/pinFileToIPFS", data=form)
+        if status != 200:
+            self._stats["failures"] += 1
+            raise HTTPException(status_code=502, detail=f"Pinata rejected the upload: HTTP {status} {body}")
+        self._record_put(body.get("PinSize") or 0, time.monotonic() - started)
+        return body["IpfsHash"]
+
+    def get(self, cid: str) -> AsyncIterator[bytes]:
+        return self._stream("GET", f"{self.gateway_url}/ipfs/{cid}")
+
+    async def remove(self, cid: str) -> bool:
+        try:
+            status, body = await self._request("DELETE", f"{self.base_url}/pinning/unpin/{cid}")
+        except HTTPException as e:
+            logger.warning(f"Pinata unpin of {cid} failed: {e.detail}")
+            return False
+        if status in (200, 404):  # 404: not pinned (already unpinned)
+            return True
+        logger.warning(f"Pinata unpin of {cid} failed: HTTP {status} {body}")
+        return False
+
+
+class KuboStore(HttpDocumentStore):
+    """A Kubo (go-ipfs) node's RPC API; adds are pinned on the node"""
+
+    name = "kubo"
+    label = "Kubo"
+    # Kubo answers command errors (bad CID, not pinned) with 500
+    retryable_statuses = frozenset({408, 429, 502, 503, 504})
+
+    def __init__(self):
+        self.base_url = settings.KUBO_API_URL.rstrip("/")
+        super().__init__()
+
+    async def _missing(self, response: aiohttp.ClientResponse) -> bool:
+        return response.status == 500 and "not found" in await response.text()
+
+    async def put(self, file: BinaryIO, filename: str, content_type: str) -> str:
+        started = time.monotonic()
+        status, body = await self._request(
+            "POST",
+            f"{self.base_url}/api/v0/add",
+            data=self._form(file, filename, content_type),
+            params={"cid-version": "0", "pin": "true", "progress": "false"},
+        )
+        if status != 200:
+            self._stats["failures"] += 1
+            raise HTTPException(status_code=502, detail=f"Kubo rejected the upload: HTTP {status} {body}")
+        # One JSON object per added file, newline separated
+        added = json.loads(body.strip().splitlines()[-1]) if isinstance(body, str) else body
+        self._record_put(int(added.get("Size") or 0), time.monotonic() - started)
+        return added["Hash"]
+
+    async def put_directory(self, files: Dict[str, bytes]) -> str:
+        started = time.monotonic()
+        status, body = await self._request(
+            "POST",
+            f"{self.base_url}/api/v0/add",
+            data=self._directory_form(files),
+            params={"cid-version": "0", "pin": "true", "progress": "false", "wrap-with-directory": "true"},
+        )
+        if status != 200:
+            self._stats["failures"] += 1
+            raise HTTPException(status_code=502, detail=f"Kubo rejected the upload: HTTP {status} {body}")
+        # The wrapping directory is the last object, with an empty name
+        added = json.loads(body.strip().splitlines()[-1]) if isinstance(body, str) else body
+        self._record_put(sum(len(content) for content in files.values()), time.monotonic() - started)
+        return added["Hash"]
+
+    def get(self, cid: str) -> AsyncIterator[bytes]:
+        return self._stream("POST", f"{self.base_url}/api/v0/cat", params={"arg": cid})
+
+    async def remove(self, cid: str) -> bool:
+        try:
+            status, body = await self._request("POST", f"{self.base_url}/api/v0/pin/rm", params={"arg": cid})
+        except HTTPException as e:
+            logger.warning(f"Kubo unpin of {cid} failed: {e.detail}")
+            return False
+        if status == 200 or "not pinned" in str(body):
+            return True
+        logger.warning(f"Kubo unpin of {cid} failed: HTTP {status} {body}")
+        return False
+
+
+class FilesystemStore(DocumentStore):
+    """
+    Content-addressed files on local disk.
+
+    Each document is written once to <root>/<last two CID characters>/<CID>,
+    with the CID computed while the file is copied; a directory is a
+    directory of that name. File I/O runs in worker threads so the event
+    loop never waits on the disk.
+    """
+
+    name = "filesystem"
+
+    def __init__(self, root: Optional[str] = None):
+        super().__init__()
+        self.root = Path(root or settings.DOCUMENT_STORE_PATH)
+
+    async def connect(self) -> None:
+        await asyncio.to_thread((self.root / ".tmp").mkdir, parents=True, exist_ok=True)
+
+    def _path(self, cid: str) -> Path:
+        if not cid.isalnum():
+            raise HTTPException(status_code=404, detail="Document not found")
+        return self.root / cid[-2:] / cid
+
+    def _write(self, file: BinaryIO) -> Tuple[str, int]:
+        hasher = UnixFSHasher()
+        file.seek(0)
+        (self.root / ".tmp").mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root / ".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := file.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    out.write(chunk)
+            cid = hasher.cid
+            path = self._path(cid)
+            path.parent.mkdir(exist_ok=True)
+            os.replace(tmp_path, path)  # Same content, so replacing an existing copy is harmless
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return cid, hasher.size
+
+    async def put(self, file: BinaryIO, filename: str, content_type: str) -> str:
+        started = time.monotonic()
+        cid, size = await asyncio.to_thread(self._write, file)
+        self._record_put(size, time.monotonic() - started)
+        return cid
+
+    def _write_directory(self, files: Dict[str, bytes]) -> str:
+        cid = directory_cid(files)
+        path = self._path(cid)
+        if path.is_dir():
+            return cid
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(tempfile.mkdtemp(dir=self.root / ".tmp"))
+        try:
+            for name, content in files.items():
+                (tmp_path / name).write_bytes(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if not path.is_dir():  # Otherwise a concurrent put of the same directory won
+                raise
+        return cid
+
+    async def put_directory(self, files: Dict[str, bytes]) -> str:
+        started = time.monotonic()
+        cid = await asyncio.to_thread(self._write_directory, files)
+        self._record_put(sum(len(content) for content in files.values()), time.monotonic() - started)
+        return cid
+
+    async def get(self, cid: str) -> AsyncIterator[bytes]:
+        try:
+            handle = await asyncio.to_thread(open, self._path(cid), "rb")
+        except (FileNotFoundError, IsADirectoryError):
+            raise HTTPException(status_code=404, detail="Document not found")
+        self._stats["downloads"] += 1
+        try:
+            while chunk := await asyncio.to_thread(handle.read, CHUNK_SIZE):
+                self._stats["bytes_downloaded"] += len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(handle.close)
+
+    async def remove(self, cid: str) -> bool:
+        path = self._path(cid)
+        try:
+            await asyncio.to_thread(os.unlink, path)
+        except FileNotFoundError:
+            pass
+        except IsADirectoryError:
+            await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
+        return True
+
+
+DOCUMENT_STORES = {
+    PinataStore.name: PinataStore,
+    KuboStore.name: KuboStore,
+    FilesystemStore.name: FilesystemStore,
+}
+
+
+def create_document_store(name: Optional[str] = None) -> DocumentStore:
+    """
+    Build the store named by settings.DOCUMENT_STORE (or name).
+
+    Raises:
+        ValueError: Unknown store name
+    """
+    name = name or settings.DOCUMENT_STORE
+    if name not in DOCUMENT_STORES:
+        raise ValueError(f"Unknown DOCUMENT_STORE {name!r}; expected one of {', '.join(DOCUMENT_STORES)}")
+    return DOCUMENT_STORES[name]()
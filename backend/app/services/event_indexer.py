@@ -0,0 +1,343 @@
+"""
+Chain Event Indexer
+
+Tails LandRegistry and LandVerification logs into the ``chain_events``
+collection so that read endpoints can answer from MongoDB instead of making
+RPC calls per request.
+
+Logs are fetched with one ``eth_getLogs`` per block range. The range adapts:
+it halves when the node rejects or times out on a query (most providers cap
+the range or the number of results) and doubles again while queries come
+back small. After every range the checkpoint in ``indexer_checkpoints``
+records the last block scanned and the last block that is final (at least
+CONFIRMATION_DEPTH deep), and event documents are keyed by tx hash and log
+index, so a restart resumes where it stopped, also in the middle of the
+initial backfill, and re-scanning a range is harmless.
+
+Blocks less than CONFIRMATION_DEPTH deep can still be orphaned, so every
+pass re-scans from the last final block: at most CONFIRMATION_DEPTH blocks
+that were scanned before. Stored events in a re-scanned range that the node
+no longer returns were in orphaned blocks and are deleted; events that
+moved to a new block are overwritten with its hash.
+"""
+
+import asyncio
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReplaceOne
+from web3 import Web3
+
+from app.contracts.artifacts import EventDecoder, load_artifact
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.chain_event import ChainEventModel, IndexerCheckpointModel
+from app.services.blockchain import async_blockchain_service as blockchain_service
+from app.services.chain_metadata import REQUIRED_VERIFICATIONS
+from app.utils.pagination import paginate
+
+logger = get_logger(__name__)
+
+INDEXED_EVENTS = {
+    "LandRegistry": (
+        "LandRegistered",
+        "VerificationRecorded",
+        "LandVerified",
+        "LandRejected",
+        "LandTransferred",
+        "MetadataUpdated",
+    ),
+    "LandVerification": (
+        "VerifierAdded",
+        "VerifierRemoved",
+        "VerifierDeactivated",
+        "VerifierReactivated",
+        "DisputeCreated",
+        "DisputeResolved",
+    ),
+}
+
+# Event argument that carries the land token id, per event
+_TOKEN_ID_ARGS = ("tokenId", "landTokenId")
+
+_MAX_BSON_INT = 2 ** 63 - 1
+
+
+def _bson_value(value: Any) -> Any:
+    """Convert a decoded ABI value to something MongoDB can store"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return value if -_MAX_BSON_INT <= value <= _MAX_BSON_INT else str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return Web3.to_hex(value)
+    if isinstance(value, (list, tuple)):
+        return [_bson_value(v) for v in value]
+    return value
+
+
+class EventIndexerService:
+    """Resumable log indexer for the registry contracts"""
+
+    CHECKPOINT_ID = "chain_events"
+    # Shrink the range when a query returns more logs than this
+    TARGET_LOGS_PER_QUERY = 1000
+
+    def __init__(self):
+        self._db: Optional[AsyncIOMotorDatabase] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def _contracts(self) -> Dict[str, Any]:
+        return {
+            "LandRegistry": blockchain_service.land_registry,
+            "LandVerification": blockchain_service.land_verification,
+        }
+
+    @cached_property
+    def _addresses(self) -> List[str]:
+        return [contract.address for contract in self._contracts.values()]
+
+    @cached_property
+    def _decoders(self) -> Dict[str, Tuple[str, EventDecoder]]:
+        """topic0 -> (contract name, decoder for that event's logs)"""
+        decoders = {}
+        for contract_name, events in INDEXED_EVENTS.items():
+            artifact = load_artifact(contract_name)
+            for event_name in events:
+                decoder = artifact.events[event_name]
+                decoders[decoder.topic] = (contract_name, decoder)
+        return decoders
+
+    # ------------------------------------------------------------ lifecycle
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Start tailing logs (called on application startup)"""
+        self._db = db
+        self._task = asyncio.create_task(self._run())
+        logger.info("Started chain event indexer")
+
+    async def stop(self) -> None:
+        """Stop the indexer task (called on application shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.index_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Chain event indexing failed: {e}")
+            await asyncio.sleep(settings.INDEXER_POLL_INTERVAL_SECONDS)
+
+    # ------------------------------------------------------------- indexing
+
+    async def index_once(self) -> int:
+        """
+        Index everything between the checkpoint and the chain head.
+
+        Returns:
+            Number of events stored or re-checked
+        """
+        checkpoints = self._db[IndexerCheckpointModel.collection_name]
+        events = self._db[ChainEventModel.collection_name]
+        head = await blockchain_service.chain.block_number()
+
+        checkpoint = await checkpoints.find_one({"_id": self.CHECKPOINT_ID})
+        if checkpoint is None:
+            start = settings.INDEXER_START_BLOCK
+            if start is None:
+                logger.warning(
+                    "INDEXER_START_BLOCK is not set; indexing chain events from the current head only"
+                )
+                start = head
+            checkpoint = {"confirmed_block": start - 1, "chunk_size": settings.INDEXER_CHUNK_BLOCKS}
+
+        confirmed_block = checkpoint.get("confirmed_block", checkpoint.get("last_block", -1))
+        # Blocks after confirmed_block up to here were stored while they could still reorg
+        scanned_block = checkpoint.get("last_block", confirmed_block)
+        final_block = head - settings.CONFIRMATION_DEPTH + 1
+        from_block = confirmed_block + 1
+        chunk = checkpoint.get("chunk_size") or settings.INDEXER_CHUNK_BLOCKS
+        stored = 0
+
+        while from_block <= head:
+            to_block = min(from_block + chunk - 1, head)
+            try:
+                logs = await blockchain_service.w3.eth.get_logs({
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "address": self._addresses,
+                    "topics": [list(self._decoders)],
+                })
+            except Exception as e:
+                if chunk == 1:
+                    raise
+                chunk = max(1, chunk // 2)
+                logger.info(f"eth_getLogs {from_block}-{to_block} failed ({e}), retrying with {chunk} blocks")
+                continue
+
+            ids = await self._store(logs, final_block)
+            stored += len(ids)
+            if from_block <= scanned_block:
+                orphaned = await events.delete_many({
+                    "block_number": {"$gte": from_block, "$lte": min(to_block, scanned_block)},
+                    "_id": {"$nin": ids},
+                })
+                if orphaned.deleted_count:
+                    logger.warning(f"Removed {orphaned.deleted_count} chain events from orphaned blocks")
+
+            confirmed_block = max(confirmed_block, min(to_block, final_block))
+            await checkpoints.update_one(
+                {"_id": self.CHECKPOINT_ID},
+                {"$set": {
+                    "last_block": max(to_block, scanned_block),
+                    "confirmed_block": confirmed_block,
+                    "chunk_size": chunk,
+                    "updated_at": datetime.utcnow(),
+                }},
+                upsert=True,
+            )
+
+            if len(logs) > self.TARGET_LOGS_PER_QUERY:
+                chunk = max(1, chunk // 2)
+            elif len(logs) < self.TARGET_LOGS_PER_QUERY // 2:
+                chunk = min(chunk * 2, settings.INDEXER_MAX_CHUNK_BLOCKS)
+            from_block = to_block + 1
+
+        return stored
+
+    async def _store(self, logs: List[Any], final_block: int) -> List[str]:
+        """
+        Decode logs and upsert them as chain_events documents, confirmed if
+        their block is at or below final_block; returns their ids
+        """
+        if not logs:
+            return []
+
+        block_numbers = sorted({log["blockNumber"] for log in logs})
+        blocks = await asyncio.gather(
+            *(blockchain_service.w3.eth.get_block(number) for number in block_numbers)
+        )
+        timestamps = {
+            block["number"]: datetime.utcfromtimestamp(block["timestamp"]) for block in blocks
+        }
+
+        now = datetime.utcnow()
+        docs = []
+        for log in logs:
+            decoder = self._decoders.get(Web3.to_hex(log["topics"][0]))
+            if decoder is None:
+                continue
+            contract_name, event = decoder
+            try:
+                decoded = event.decode(log)
+            except Exception as e:
+                logger.warning(f"Could not decode log {Web3.to_hex(log['transactionHash'])}: {e}")
+                continue
+
+            args = {name: _bson_value(value) for name, value in decoded["args"].items()}
+            token_id = next((args[name] for name in _TOKEN_ID_ARGS if name in args), None)
+            tx_hash = Web3.to_hex(log["transactionHash"])
+            doc = {
+                "_id": f"{tx_hash}:{log['logIndex']}",
+                "contract": contract_name,
+                "event": decoded["event"],
+                "token_id": token_id,
+                "args": args,
+                "block_number": log["blockNumber"],
+                "block_hash": Web3.to_hex(log["blockHash"]),
+                "block_timestamp": timestamps[log["blockNumber"]],
+                "tx_hash": tx_hash,
+                "log_index": log["logIndex"],
+                "confirmed": log["blockNumber"] <= final_block,
+                "indexed_at": now,
+            }
+            docs.append(doc)
+
+        if docs:
+            await self._db[ChainEventModel.collection_name].bulk_write(
+                [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs],
+                ordered=False,
+            )
+        return [doc["_id"] for doc in docs]
+
+    # ---------------------------------------------------------------- reads
+
+    async def get_land_state(self, db: AsyncIOMotorDatabase, token_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild a land's on-chain state from its indexed events.
+
+        verification_count comes from VerificationRecorded. Registries
+        deployed before that event existed emit nothing for partial
+        verifications, so there it is only known once LandVerified has
+        fired and is None before that.
+
+        Args:
+            db: Database instance
+            token_id: Land token id
+
+        Returns:
+            State dict, or None if the token's LandRegistered event has not
+            been indexed
+        """
+        cursor = db[ChainEventModel.collection_name].find(
+            {"contract": "LandRegistry", "token_id": token_id}
+        ).sort([("block_number", 1), ("log_index", 1)])
+        events = await cursor.to_list(length=None)
+        if not events or events[0]["event"] != "LandRegistered":
+            return None
+
+        registered = events[0]
+        state = {
+            "token_id": token_id,
+            "property_id": registered["args"]["propertyId"],
+            "ipfs_hash": registered["args"]["ipfsHash"],
+            "current_owner": registered["args"]["owner"],
+            "status": 0,  # 0=Pending, 1=Verified, 2=Rejected
+            "registered_at": registered["block_timestamp"],
+            "verified_at": None,
+            "verified_by": None,
+            "verification_count": None,
+            "rejection_reason": None,
+            "last_tx_hash": registered["tx_hash"],
+        }
+        for event in events[1:]:
+            args = event["args"]
+            if event["event"] == "VerificationRecorded":
+                state["verification_count"] = args["verificationCount"]
+            elif event["event"] == "LandVerified":
+                state["status"] = 1
+                state["verified_at"] = event["block_timestamp"]
+                state["verified_by"] = args["verifier"]
+                state["verification_count"] = REQUIRED_VERIFICATIONS
+            elif event["event"] == "LandRejected":
+                state["status"] = 2
+                state["rejection_reason"] = args["reason"]
+            elif event["event"] == "LandTransferred":
+                state["current_owner"] = args["to"]
+            elif event["event"] == "MetadataUpdated":
+                state["ipfs_hash"] = args["newIpfsHash"]
+            state["last_tx_hash"] = event["tx_hash"]
+        return state
+
+    async def recent_events(
+        self, db: AsyncIOMotorDatabase, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """A page of indexed events, newest first, and the cursor of the next page"""
+        return await paginate(
+            db[ChainEventModel.collection_name], {},
+            sort=[("block_number", -1), ("log_index", -1)], limit=limit, cursor=cursor,
+        )
+
+    async def has_events(self, db: AsyncIOMotorDatabase) -> bool:
+        return await db[ChainEventModel.collection_name].find_one({}, {"_id": 1}) is not None
+
+
+event_indexer_service = EventIndexerService()
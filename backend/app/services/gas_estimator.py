@@ -0,0 +1,129 @@
+"""
+Gas Estimate Cache
+
+Learns how much gas each kind of registry transaction actually uses so the
+admin signer can skip the ``estimate_gas`` round-trip before sending.
+
+Receipts feed their ``gasUsed`` into a rolling window per bucket. A bucket
+is a contract function plus the shape of its calldata: string arguments
+(location, rejection reason) change how many storage slots a call writes,
+so calls are grouped by calldata length in 32-byte words. ``verifyLand``
+gets a separate bucket for the verification that reaches the threshold and
+mints the NFT, which costs several times more than the others.
+
+A bucket is used once it has GAS_CACHE_MIN_SAMPLES samples and its spread
+is small; the gas limit is then a high percentile of the window plus
+headroom. Otherwise the caller estimates as before.
+"""
+
+import math
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.tx_job import TxJobModel
+
+logger = get_logger(__name__)
+
+
+def _percentile(sorted_values: List[int], pct: float) -> int:
+    """Nearest-rank percentile of an ascending list"""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class GasEstimateCache:
+    """Rolling gasUsed percentiles per contract function and calldata shape"""
+
+    def __init__(self):
+        self._samples: Dict[str, Deque[int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def bucket(function_name: str, calldata: str, variant: Optional[str] = None) -> str:
+        """
+        Cache key for a call.
+
+        Args:
+            function_name: Contract function, e.g. "registerLand"
+            calldata: ABI-encoded call data (0x-hex)
+            variant: Distinguishes calls with the same calldata but a
+                different code path, e.g. "mint" for the final verifyLand
+
+        Returns:
+            Key like "registerLand/12w" or "verifyLand+mint/3w"
+        """
+        words = math.ceil((len(calldata) - 2) / 2 / 32)
+        name = f"{function_name}+{variant}" if variant else function_name
+        return f"{name}/{words}w"
+
+    def gas_limit(self, bucket: str) -> Optional[int]:
+        """
+        Gas limit to use without estimating, or None if the bucket is not
+        warm and tight enough to trust. Counts a hit or a miss.
+        """
+        samples = self._samples.get(bucket)
+        limit = None
+        if samples and len(samples) >= settings.GAS_CACHE_MIN_SAMPLES:
+            ordered = sorted(samples)
+            median = _percentile(ordered, 50)
+            high = _percentile(ordered, settings.GAS_CACHE_PERCENTILE)
+            if median and (high - median) / median <= settings.GAS_CACHE_MAX_SPREAD:
+                limit = int(high * settings.GAS_CACHE_HEADROOM)
+
+        if limit is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return limit
+
+    def record(self, bucket: Optional[str], gas_used: int) -> None:
+        """Add a receipt's gasUsed to its bucket"""
+        if not bucket or not gas_used:
+            return
+        samples = self._samples.get(bucket)
+        if samples is None:
+            samples = self._samples[bucket] = deque(maxlen=settings.GAS_CACHE_WINDOW)
+        samples.append(int(gas_used))
+
+    async def warm(self, db: AsyncIOMotorDatabase) -> None:
+        """Seed the buckets from recently confirmed transaction jobs"""
+        cursor = db[TxJobModel.collection_name].find(
+            {
+                "status": TxJobModel.CONFIRMED,
+                "gas_bucket": {"$ne": None},
+                "gas_used": {"$ne": None},
+                "updated_at": {"$gte": datetime.utcnow() - timedelta(days=30)},
+            },
+            {"gas_bucket": 1, "gas_used": 1},
+        ).sort("updated_at", 1)
+        count = 0
+        async for job in cursor:
+            self.record(job.get("gas_bucket"), job.get("gas_used"))
+            count += 1
+        if count:
+            logger.info(f"Warmed gas estimate cache from {count} confirmed jobs")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate and per-bucket percentiles for metrics output"""
+        lookups = self.hits + self.misses
+        buckets = {}
+        for bucket, samples in self._samples.items():
+            ordered = sorted(samples)
+            buckets[bucket] = {
+                "samples": len(ordered),
+                "p50": _percentile(ordered, 50),
+                "p95": _percentile(ordered, 95),
+                "max": ordered[-1],
+            }
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "buckets": buckets,
+        }
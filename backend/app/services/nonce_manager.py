@@ -0,0 +1,288 @@
+"""
+Nonce Manager
+
+Hands out transaction nonces for the backend's admin signer so that many
+transactions can be in flight at once without two of them sharing a nonce.
+
+Nonces are allocated from a local counter instead of asking the node for
+``get_transaction_count`` before every send. The counter lives in memory
+for a single process, or in the ``signer_nonces`` collection when several
+API workers share the key. Nonces that were allocated but never broadcast
+are released and handed out again first, so they do not leave gaps.
+The counter is periodically re-synced against the node's ``pending``
+count, and the manager reports when the chain stops advancing past one of
+our nonces (a stuck transaction).
+
+A nonce can also be lost without being released: a worker that crashes
+or is killed between allocate() and storing its transaction. The node's
+pending count then stops at that nonce while higher ones are handed out.
+If no active transaction job owns the nonce for NONCE_STUCK_SECONDS, the
+resync fills it with a no-op transaction so the rest of the queue can be
+mined.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.tx_job import TxJobModel
+
+logger = get_logger(__name__)
+
+
+class _MemoryNonceStore:
+    """Process-local nonce state"""
+
+    name = "memory"
+
+    def __init__(self):
+        self._next: Optional[int] = None
+        self._released: List[int] = []
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Dict[str, Any]:
+        return {"next_nonce": self._next, "released": list(self._released)}
+
+    async def advance_to(self, nonce: int) -> None:
+        async with self._lock:
+            if self._next is None or self._next < nonce:
+                self._next = nonce
+
+    async def increment(self) -> Optional[int]:
+        async with self._lock:
+            if self._next is None:
+                return None
+            nonce = self._next
+            self._next += 1
+            return nonce
+
+    async def take_released(self) -> Optional[int]:
+        async with self._lock:
+            return self._released.pop(0) if self._released else None
+
+    async def release(self, nonce: int) -> None:
+        async with self._lock:
+            if nonce not in self._released:
+                self._released.append(nonce)
+                self._released.sort()
+
+    async def prune_released_below(self, nonce: int) -> None:
+        async with self._lock:
+            self._released = [n for n in self._released if n >= nonce]
+
+
+class _MongoNonceStore:
+    """Nonce state shared by every process through one MongoDB document"""
+
+    name = "mongo"
+    collection_name = "signer_nonces"
+
+    def __init__(self, db: AsyncIOMotorDatabase, address: str):
+        self._collection = db[self.collection_name]
+        self._key = address.lower()
+
+    async def get(self) -> Dict[str, Any]:
+        doc = await self._collection.find_one({"_id": self._key}) or {}
+        return {"next_nonce": doc.get("next_nonce"), "released": doc.get("released", [])}
+
+    async def advance_to(self, nonce: int) -> None:
+        await self._collection.update_one(
+            {"_id": self._key},
+            {"$max": {"next_nonce": nonce}, "$setOnInsert": {"released": []}},
+            upsert=True,
+        )
+
+    async def increment(self) -> Optional[int]:
+        # No upsert: a missing document has no known next nonce, and
+        # $inc on nothing would start the counter at 0
+        doc = await self._collection.find_one_and_update(
+            {"_id": self._key, "next_nonce": {"$ne": None}},
+            {"$inc": {"next_nonce": 1}},
+            return_document=ReturnDocument.BEFORE,
+        )
+        return doc["next_nonce"] if doc else None
+
+    async def take_released(self) -> Optional[int]:
+        # released is kept sorted, so popping the head returns the lowest gap
+        doc = await self._collection.find_one_and_update(
+            {"_id": self._key, "released.0": {"$exists": True}},
+            {"$pop": {"released": -1}},
+            return_document=ReturnDocument.BEFORE,
+        )
+        return doc["released"][0] if doc else None
+
+    async def release(self, nonce: int) -> None:
+        await self._collection.update_one(
+            {"_id": self._key, "released": {"$ne": nonce}},
+            {"$push": {"released": {"$each": [nonce], "$sort": 1}}},
+        )
+
+    async def prune_released_below(self, nonce: int) -> None:
+        await self._collection.update_one(
+            {"_id": self._key},
+            {"$pull": {"released": {"$lt": nonce}}},
+        )
+
+
+class NonceManager:
+    """Atomic nonce allocation for a single signing address"""
+
+    def __init__(
+        self,
+        address: str,
+        transaction_count: Callable[[str], Awaitable[int]],
+        fill_gap: Callable[[int], Awaitable[None]],
+    ):
+        """
+        Args:
+            address: The signer's address
+            transaction_count: Coroutine returning the node's tx count for a
+                block identifier ("latest" or "pending")
+            fill_gap: Coroutine that sends a no-op transaction at a nonce
+        """
+        self.address = address
+        self._transaction_count = transaction_count
+        self._fill_gap = fill_gap
+        self._store = _MemoryNonceStore()
+        self._db: Optional[AsyncIOMotorDatabase] = None
+        self._sync_lock = asyncio.Lock()
+        self._last_sync = 0.0
+        self._chain_latest: Optional[int] = None
+        self._chain_pending: Optional[int] = None
+        # When the chain's confirmed count last moved, for stuck detection
+        self._latest_since = time.monotonic()
+        # Unowned nonce the node's pending count is stuck at, and since when
+        self._orphan: Optional[int] = None
+        self._orphan_since = 0.0
+
+    def attach(self, db: AsyncIOMotorDatabase) -> None:
+        """
+        Share nonce state with other processes through MongoDB, and look up
+        which nonces transaction jobs own before filling a gap
+        """
+        self._db = db
+        if settings.NONCE_BACKEND == "mongo" and db is not None:
+            self._store = _MongoNonceStore(db, self.address)
+        self._last_sync = 0.0
+
+    async def allocate(self) -> int:
+        """Reserve the next nonce for a transaction about to be signed"""
+        if time.monotonic() - self._last_sync > settings.NONCE_RESYNC_SECONDS:
+            await self.resync()
+
+        nonce = await self._store.take_released()
+        if nonce is None:
+            nonce = await self._store.increment()
+        if nonce is None:
+            # The counter is gone (signer_nonces document deleted, or a fresh
+            # database since the last resync): seed it from the node again
+            await self.resync()
+            nonce = await self._store.increment()
+        if nonce is None:
+            raise RuntimeError(f"Nonce counter for {self.address} is missing after resync")
+        return nonce
+
+    async def release(self, nonce: int) -> None:
+        """Return a nonce whose transaction was never broadcast"""
+        await self._store.release(nonce)
+
+    async def resync(self) -> None:
+        """Reconcile the local counter with the node's pending/latest counts"""
+        async with self._sync_lock:
+            latest = await self._transaction_count("latest")
+            pending = await self._transaction_count("pending")
+
+            if latest != self._chain_latest:
+                self._latest_since = time.monotonic()
+            self._chain_latest = latest
+            self._chain_pending = pending
+            self._last_sync = time.monotonic()
+
+            # Anything below the confirmed count has been used on-chain
+            await self._store.prune_released_below(latest)
+            # Never hand out a nonce the node already has a transaction for
+            await self._store.advance_to(pending)
+
+            # The chain is waiting on a nonce we released: plug the gap
+            released = await self._store.take_released()
+            if released is None:
+                await self._fill_orphan(pending)
+            elif released == latest:
+                logger.warning(f"Nonce gap at {released} for {self.address}, sending filler tx")
+                try:
+                    await self._fill_gap(released)
+                except Exception as e:
+                    logger.error(f"Failed to fill nonce gap {released}: {e}")
+                    await self._store.release(released)
+            else:
+                await self._store.release(released)
+                await self._fill_orphan(pending)
+
+    async def _fill_orphan(self, pending: int) -> None:
+        """
+        Fill the nonce the node's pending count stops at if it was handed
+        out but no active tx_jobs job owns it (its worker died before
+        storing it). Jobs keep their nonce across retries and take-overs, so
+        an owned nonce is still going to be sent. The gap must last
+        NONCE_STUCK_SECONDS, so a transaction between allocate() and its
+        broadcast is not mistaken for one.
+        """
+        state = await self._store.get()
+        if self._db is None or state["next_nonce"] is None or pending >= state["next_nonce"] \
+                or pending in state["released"]:
+            self._orphan = None
+            return
+        owner = await self._db[TxJobModel.collection_name].find_one(
+            {"nonce": pending, "status": {"$in": list(TxJobModel.ACTIVE_STATES)}}, {"_id": 1}
+        )
+        if owner is not None:
+            self._orphan = None
+            return
+        if self._orphan != pending:
+            self._orphan, self._orphan_since = pending, time.monotonic()
+            return
+        if time.monotonic() - self._orphan_since < settings.NONCE_STUCK_SECONDS:
+            return
+
+        logger.warning(f"Nonce {pending} for {self.address} was allocated but never sent, sending filler tx")
+        try:
+            await self._fill_gap(pending)
+            self._orphan = None
+        except Exception as e:
+            logger.error(f"Failed to fill nonce gap {pending}: {e}")
+
+    async def stuck_nonce(self) -> Optional[int]:
+        """
+        Return the nonce blocking our queue if the chain has not confirmed a
+        new transaction from this signer for NONCE_STUCK_SECONDS while we
+        still have transactions outstanding, else None.
+        """
+        # Called on every receipt poll: the counts are at most
+        # NONCE_RESYNC_SECONDS old, far below NONCE_STUCK_SECONDS
+        if self._chain_latest is None or time.monotonic() - self._last_sync > settings.NONCE_RESYNC_SECONDS:
+            await self.resync()
+        state = await self._store.get()
+        outstanding = (state["next_nonce"] or 0) > self._chain_latest
+        stalled = time.monotonic() - self._latest_since > settings.NONCE_STUCK_SECONDS
+        return self._chain_latest if outstanding and stalled else None
+
+    async def status(self) -> Dict[str, Any]:
+        """Snapshot for health/metrics output"""
+        state = await self._store.get()
+        in_flight = None
+        if state["next_nonce"] is not None and self._chain_latest is not None:
+            in_flight = state["next_nonce"] - self._chain_latest
+        return {
+            "address": self.address,
+            "backend": self._store.name,
+            "next_nonce": state["next_nonce"],
+            "released": state["released"],
+            "chain_latest": self._chain_latest,
+            "chain_pending": self._chain_pending,
+            "in_flight": in_flight,
+        }
@@ -0,0 +1,115 @@
+"""
+Password Hasher
+
+bcrypt takes 100-300 ms of CPU per hash or verification by design. Run on
+the event loop, a burst of logins or registrations stalls every other
+request. Hashing runs instead on a dedicated pool of PASSWORD_HASH_WORKERS
+threads (bcrypt releases the GIL, so they run in parallel with the loop and
+with each other).
+
+At most PASSWORD_HASH_MAX_QUEUE hashes are accepted at once, running or
+waiting for a thread. Beyond that the request is answered 503 with
+Retry-After straight away rather than queued behind work that would take
+longer than a client waits.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.security import get_password_hash, verify_password
+
+logger = get_logger(__name__)
+
+
+class PasswordHasher:
+    """bcrypt on a bounded thread pool with load shedding"""
+
+    def __init__(self, workers: Optional[int] = None, max_queue: Optional[int] = None):
+        """
+        Args:
+            workers: Threads hashing at once (default PASSWORD_HASH_WORKERS)
+            max_queue: Hashes accepted at once, running or waiting (default PASSWORD_HASH_MAX_QUEUE)
+        """
+        self.workers = workers or settings.PASSWORD_HASH_WORKERS
+        self.max_queue = max_queue or settings.PASSWORD_HASH_MAX_QUEUE
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._busy_seconds = 0.0
+        self._max_wait = 0.0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # Created on first use, so scripts using AuthService need no startup call
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def stop(self) -> None:
+        """Shut the pool down (called on application shutdown)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_hash_ms": round(self._busy_seconds / self.completed * 1000, 1) if self.completed else None,
+            "max_wait_ms": round(self._max_wait * 1000, 1),
+        }
+
+    async def hash(self, password: str) -> str:
+        """bcrypt hash of password"""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Whether password matches hashed_password"""
+        return await self._run(verify_password, password, hashed_password)
+
+    async def _run(self, function: Callable, *args) -> Any:
+        if self._pending >= self.max_queue:
+            self.rejected += 1
+            logger.warning(f"Password hashing saturated ({self._pending} pending); shedding request")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in requests, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        self._pending += 1
+        queued = time.perf_counter()
+        timing: Dict[str, float] = {}
+
+        def timed():
+            started = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                timing["wait"] = started - queued
+                timing["busy"] = time.perf_counter() - started
+
+        future = asyncio.get_running_loop().run_in_executor(self._pool(), timed)
+        # Released when the thread is done, not when the request is: a
+        # cancelled request does not stop a hash that is already running
+        future.add_done_callback(lambda _: self._finished(timing))
+        return await asyncio.shield(future)
+
+    def _finished(self, timing: Dict[str, float]) -> None:
+        self._pending -= 1
+        if timing:
+            self.completed += 1
+            self._busy_seconds += timing["busy"]
+            self._max_wait = max(self._max_wait, timing["wait"])
+
+
+password_hasher = PasswordHasher()
@@ -1,50 +1,257 @@
-import os
-import requests
-from fastapi import UploadFile, HTTPException
+"""
+Pinata IPFS service
+
+Stores land documents in the DocumentStore selected by
+settings.DOCUMENT_STORE (Pinata by default; see document_store.py) and
+streams them from disk/memory, so a large deed never sits in memory whole.
+
+Pinned content is tracked in the ipfs_objects collection. Before uploading,
+the document's CID and sha256 are computed locally; content that is already
+pinned is not sent again. Lands hold references to the objects they use, and
+objects no land refers to are unpinned by a background sweep.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from fastapi import UploadFile
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
 from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.ipfs_object import IpfsObjectModel
+from app.services.document_store import DocumentStore, create_document_store
+from app.utils.cid import file_digest
+
+logger = get_logger(__name__)
+
 
 class PinataService:
-    BASE_URL = "https://api.pinata.cloud"
-    
-    def __init__(self):
-        self.api_key = settings.PINATA_API_KEY
-        self.secret_key = settings.PINATA_SECRET_API_KEY
-        
-        if not self.api_key or not self.secret_key:
-            print("Warning: Pinata API keys not found in environment variables.")
-
-    def upload_file(self, file: UploadFile) -> str:
-        """
-        Upload a file to Pinata IPFS
-        Returns: IPFS Hash (CID)
-        """
-        if not self.api_key or not self.secret_key:
-            raise HTTPException(status_code=500, detail="Pinata configuration missing")
-
-        url = f"{self.BASE_URL}/pinning/pinFileToIPFS"
-        
-        # Prepare headers (requires specific format for boundary, let requests handle it)
-        headers = {
-            "pinata_api_key": self.api_key,
-            "pinata_secret_api_key": self.secret_key
+    """
+    Document storage with dedupe and reference counting.
+
+    upload_files() caps how many of one registration's documents are in
+    flight at once; the store's own connection pool caps them across all
+    requests. Dedupe and reference counting need the database and are
+    enabled by start(db); without it every upload goes to the store.
+    """
+
+    def __init__(self, store: Optional[DocumentStore] = None):
+        self.store = store or create_document_store()
+        self._db: Optional[AsyncIOMotorDatabase] = None
+        self._sweeper: Optional[asyncio.Task] = None
+        self._stats = {
+            "dedupe_hits": 0,
+            "bytes_deduped": 0,
+            "cid_mismatches": 0,
+            "unpinned": 0,
         }
-        
-        try:
-            # Read file content
-            file_content = file.file.read()
-            files = { 'file': (file.filename, file_content) }
-            
-            response = requests.post(url, headers=headers, files=files)
-            
-            # Reset file pointer for other uses if needed
+
+    async def connect(self) -> None:
+        """Prepare the document store (e.g. its HTTP session). Makes no request."""
+        await self.store.connect()
+
+    async def close(self) -> None:
+        """Release the document store's resources."""
+        await self.store.close()
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Connect and start the orphan sweep (application startup)"""
+        await self.connect()
+        self._db = db
+        if settings.IPFS_ORPHAN_SWEEP_INTERVAL_SECONDS > 0:
+            self._sweeper = asyncio.create_task(self._run_sweeper())
+
+    async def stop(self) -> None:
+        """Stop the orphan sweep and close the document store (application shutdown)"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            await asyncio.gather(self._sweeper, return_exceptions=True)
+            self._sweeper = None
+        self._db = None
+        await self.close()
+
+    @property
+    def _objects(self):
+        return self._db[IpfsObjectModel.collection_name] if self._db is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.store.name, **self._stats, **self.store.stats()}
+
+    # -------------------------------------------------------------- uploads
+
+    async def upload_file(self, file: UploadFile) -> str:
+        """
+        Store a file in the document store, streaming it from disk/memory.
+
+        The file is hashed first (one pass over the spooled file in a worker
+        thread); if the same content is already pinned its CID is returned
+        without uploading.
+
+        Returns:
+            IPFS Hash (CID)
+        """
+        objects = self._objects if settings.IPFS_DEDUPE_ENABLED else None
+        local_cid = sha256 = None
+        if objects is not None:
             file.file.seek(0)
-            
-            if response.status_code == 200:
-                return response.json()['IpfsHash']
+            local_cid, sha256, size = await asyncio.to_thread(file_digest, file.file)
+            existing = await objects.find_one_and_update(
+                {"sha256": sha256, "pinned": True},
+                {"$set": {"last_referenced_at": datetime.utcnow()}},
+            )
+            if existing is not None:
+                self._stats["dedupe_hits"] += 1
+                self._stats["bytes_deduped"] += size
+                return existing["_id"]
+
+        cid = await self.store.put(
+            file.file,
+            file.filename or "file",
+            file.content_type or "application/octet-stream",
+        )
+
+        if objects is not None:
+            if cid != local_cid:
+                # e.g. the Pinata account defaults to CIDv1; dedupe still works by sha256
+                self._stats["cid_mismatches"] += 1
+                logger.warning(f"{self.store.name} returned {cid} for content hashed locally as {local_cid}")
+            now = datetime.utcnow()
+            await objects.update_one(
+                {"_id": cid},
+                {
+                    "$set": {"sha256": sha256, "local_cid": local_cid, "size": size,
+                             "content_type": file.content_type, "pinned": True,
+                             "last_referenced_at": now},
+                    "$setOnInsert": {"refcount": 0, "created_at": now},
+                },
+                upsert=True,
+            )
+        return cid
+
+    async def upload_files(self, files: List[UploadFile], concurrency: Optional[int] = None) -> List[str]:
+        """
+        Upload several files concurrently.
+
+        Args:
+            files: Files to upload
+            concurrency: Most uploads in flight at once for this call
+                (default: settings.PINATA_UPLOAD_CONCURRENCY)
+
+        Returns:
+            CIDs in the same order as files. If any upload fails the rest
+            are cancelled and its error is raised.
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.PINATA_UPLOAD_CONCURRENCY)
+
+        async def upload(file: UploadFile) -> str:
+            async with semaphore:
+                return await self.upload_file(file)
+
+        tasks = [asyncio.create_task(upload(file)) for file in files]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def pin_directory(self, files: Dict[str, bytes]) -> str:
+        """
+        Pin small files (e.g. token metadata JSON) as one directory.
+
+        Not tracked in ipfs_objects: token metadata stays pinned for as
+        long as the token exists.
+
+        Returns:
+            CID of the directory; each file is at <CID>/<name>
+        """
+        return await self.store.put_directory(files)
+
+    # ----------------------------------------------------------- references
+
+    async def _adjust_refcounts(self, cids: Iterable[str], delta: int) -> None:
+        if self._objects is None:
+            return
+        now = datetime.utcnow()
+        # One operation per reference, so a CID used twice counts twice
+        operations = [
+            UpdateOne({"_id": cid}, {"$inc": {"refcount": delta}, "$set": {"last_referenced_at": now}})
+            for cid in cids
+        ]
+        if operations:
+            await self._objects.bulk_write(operations, ordered=False)
+
+    async def add_references(self, cids: Iterable[str]) -> None:
+        """Record that a newly stored land refers to these CIDs"""
+        await self._adjust_refcounts(cids, 1)
+
+    async def release_references(self, cids: Iterable[str]) -> None:
+        """
+        Record that a deleted land no longer refers to these CIDs.
+
+        Content left unreferenced is unpinned by the orphan sweep once
+        IPFS_UNPIN_GRACE_SECONDS have passed, so a re-submission of the same
+        document soon after still skips the upload. CIDs with no
+        ipfs_objects record (pinned before dedupe existed) are left alone.
+        """
+        await self._adjust_refcounts(cids, -1)
+
+    # -------------------------------------------------------------- unpinning
+
+    def download(self, cid: str) -> AsyncIterator[bytes]:
+        """Stream a document's content from the document store"""
+        return self.store.get(cid)
+
+    async def unpin(self, cid: str) -> bool:
+        """Unpin a CID in the document store. Returns False if the store could not be reached or refused."""
+        return await self.store.remove(cid)
+
+    async def unpin_orphans(self, grace_seconds: Optional[int] = None) -> int:
+        """
+        Unpin content no land has referred to for grace_seconds.
+
+        Each object is claimed by clearing pinned before the store is called, so
+        concurrent uploads of the same content stop deduping against it and
+        two sweeps never unpin the same object.
+
+        Returns:
+            Number of objects unpinned
+        """
+        if self._objects is None:
+            return 0
+        if grace_seconds is None:
+            grace_seconds = settings.IPFS_UNPIN_GRACE_SECONDS
+        cutoff = datetime.utcnow() - timedelta(seconds=grace_seconds)
+        unpinned = 0
+        while True:
+            orphan = await self._objects.find_one_and_update(
+                {"refcount": {"$lte": 0}, "pinned": True, "last_referenced_at": {"$lte": cutoff}},
+                {"$set": {"pinned": False}},
+            )
+            if orphan is None:
+                return unpinned
+            if await self.unpin(orphan["_id"]):
+                await self._objects.delete_one({"_id": orphan["_id"], "pinned": False})
+                self._stats["unpinned"] += 1
+                unpinned += 1
             else:
-                raise HTTPException(status_code=500, detail=f"Pinata upload failed: {response.text}")
-                
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+                # Leave it for the next sweep
+                await self._objects.update_one({"_id": orphan["_id"]}, {"$set": {"pinned": True}})
+                return unpinned
+
+    async def _run_sweeper(self) -> None:
+        while True:
+            await asyncio.sleep(settings.IPFS_ORPHAN_SWEEP_INTERVAL_SECONDS)
+            try:
+                count = await self.unpin_orphans()
+                if count:
+                    logger.info(f"Unpinned {count} orphaned IPFS objects")
+            except Exception as e:
+                logger.error(f"IPFS orphan sweep failed: {e!r}")
+
 
 pinata_service = PinataService()
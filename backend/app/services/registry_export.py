@@ -0,0 +1,164 @@
+"""
+Registry Export
+
+Full dumps of the lands and users collections for admins and auditors,
+streamed as NDJSON or CSV. Documents are read from a Motor cursor in
+batches of EXPORT_BATCH_SIZE and each batch is encoded and handed to the
+response before the next one is fetched, so memory stays the same however
+many documents are exported. Only the exported fields are read from the
+database; password hashes never leave it.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Literal, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.land import LandModel
+from app.models.user import UserModel
+
+logger = get_logger(__name__)
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Exported fields, in CSV column order; dotted names are nested fields
+EXPORTS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "lands": (LandModel.collection_name, (
+        "_id", "property_id", "title", "description", "owner_id", "area", "price",
+        "location.address", "location.lat", "location.lng", "documents",
+        "status", "blockchain_status", "token_id", "blockchain_tx_hash",
+        "verified_at", "verified_by", "rejection_reason",
+        "is_for_sale", "transfer_status", "pending_buyer_id",
+        "created_at", "updated_at",
+    )),
+    "users": (UserModel.collection_name, (
+        "_id", "email", "username", "full_name", "role", "is_active", "is_verified",
+        "wallet_address", "wallet_linked_at", "created_at", "updated_at",
+    )),
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _field(document: Dict[str, Any], path: str) -> Any:
+    for key in path.split("."):
+        if not isinstance(document, dict):
+            return None
+        document = document.get(key)
+    return document
+
+
+# A cell starting with one of these is run as a formula by Excel and Sheets
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        # Land documents: their CIDs, space separated
+        value = " ".join(item.get("ipfs_hash", "") if isinstance(item, dict) else str(item) for item in value)
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        # Titles, addresses and names are user input: quote them as text
+        return "'" + value
+    return value
+
+
+class RegistryExportService:
+    """Streams collection dumps and counts what was exported"""
+
+    def __init__(self):
+        self._active = 0
+        self._exports = 0
+        self._rows = 0
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self._active,
+            "exports": self._exports,
+            "rows": self._rows,
+            "bytes": self._bytes,
+        }
+
+    async def stream(self, db: AsyncIOMotorDatabase, kind: str, format: ExportFormat) -> AsyncIterator[bytes]:
+        """
+        Encoded rows of one collection, oldest first
+
+        Args:
+            db: Database instance
+            kind: A key of EXPORTS ("lands" or "users")
+            format: "ndjson" (one JSON object per line) or "csv" (with a header row)
+
+        Yields:
+            One chunk per batch of EXPORT_BATCH_SIZE documents
+        """
+        collection, fields = EXPORTS[kind]
+        projection = {field: 1 for field in fields}
+        cursor = db[collection].find({}, projection, batch_size=settings.EXPORT_BATCH_SIZE).sort("_id", 1)
+        encode = self._csv_rows if format == "csv" else self._ndjson_rows
+
+        self._active += 1
+        self._exports += 1
+        rows = 0
+        try:
+            if format == "csv":
+                yield self._count(self._csv_rows([], fields, header=True), 0)
+            batch: List[Dict[str, Any]] = []
+            async for document in cursor:
+                batch.append(document)
+                if len(batch) == settings.EXPORT_BATCH_SIZE:
+                    yield self._count(encode(batch, fields), len(batch))
+                    rows += len(batch)
+                    batch = []
+            if batch:
+                yield self._count(encode(batch, fields), len(batch))
+                rows += len(batch)
+            logger.info(f"Exported {rows} {kind} as {format}")
+        finally:
+            # Also reached when the client disconnects mid-export
+            self._active -= 1
+            await cursor.close()
+
+    def _count(self, chunk: bytes, rows: int) -> bytes:
+        self._rows += rows
+        self._bytes += len(chunk)
+        return chunk
+
+    @staticmethod
+    def _ndjson_rows(batch: List[Dict[str, Any]], fields: Tuple[str, ...]) -> bytes:
+        lines = []
+        for document in batch:
+            document["id"] = document.pop("_id")
+            lines.append(json.dumps(document, default=_json_default, separators=(",", ":")))
+        lines.append("")
+        return "\n".join(lines).encode()
+
+    @staticmethod
+    def _csv_rows(batch: List[Dict[str, Any]], fields: Tuple[str, ...], header: bool = False) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if header:
+            writer.writerow("id" if field == "_id" else field for field in fields)
+        for document in batch:
+            writer.writerow(_csv_value(_field(document, field)) for field in fields)
+        return buffer.getvalue().encode()
+
+
+registry_export_service = RegistryExportService()
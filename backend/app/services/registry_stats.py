@@ -0,0 +1,169 @@
+"""
+Registry Statistics
+
+Land counts for the public explorer. compute() gets every count in one
+$facet aggregation over the lands collection. With REGISTRY_STATS_COUNTERS
+enabled, the registry_stats counters document is kept current instead: the
+endpoints and job handlers that create, delete, re-status or transfer a
+land report it here, and the counters are adjusted with $inc, so reading
+the stats is one point read however many lands exist.
+
+The counters document is built by rebuild() at startup when it does not
+exist. A change whose $inc matches no document (startup has not finished
+building it, or it was deleted to force a recount) starts that rebuild in
+the background; until it is done get() falls back to compute().
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.land import LandModel
+from app.models.registry_stats import RegistryOwnerModel, RegistryStatsModel
+
+logger = get_logger(__name__)
+
+STATUSES = RegistryStatsModel.STATUSES
+
+
+def _status(value: Optional[str]) -> str:
+    """Lands created before blockchain_status existed count as not_minted"""
+    return value if value in STATUSES else "not_minted"
+
+
+class RegistryStatsService:
+    """Explorer counts: one $facet aggregation, or the counters document"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Build the counters document in the background if missing (application startup)"""
+        if settings.REGISTRY_STATS_COUNTERS:
+            self._task = asyncio.create_task(self._ensure(db))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _ensure(self, db: AsyncIOMotorDatabase) -> None:
+        try:
+            if await db[RegistryStatsModel.collection_name].count_documents({"_id": RegistryStatsModel.DOCUMENT_ID}) == 0:
+                await self.rebuild(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Building registry stats failed: {e}")
+
+    # ------------------------------------------------------------- reading
+
+    async def compute(self, db: AsyncIOMotorDatabase) -> Dict[str, int]:
+        """Count lands by status and distinct owners in one aggregation"""
+        pipeline = [{"$facet": {
+            "by_status": [{"$group": {"_id": "$blockchain_status", "count": {"$sum": 1}}}],
+            "owners": [{"$group": {"_id": "$owner_id"}}, {"$count": "count"}],
+        }}]
+        result = (await db[LandModel.collection_name].aggregate(pipeline).to_list(length=1))[0]
+        counts = {status: 0 for status in STATUSES}
+        for row in result["by_status"]:
+            counts[_status(row["_id"])] += row["count"]
+        return {
+            "total": sum(counts.values()),
+            **counts,
+            "owners": result["owners"][0]["count"] if result["owners"] else 0,
+        }
+
+    async def get(self, db: AsyncIOMotorDatabase) -> Dict[str, int]:
+        """Current counts: the counters document when enabled and built, else compute()"""
+        if settings.REGISTRY_STATS_COUNTERS:
+            document = await db[RegistryStatsModel.collection_name].find_one({"_id": RegistryStatsModel.DOCUMENT_ID})
+            if document is not None:
+                return {key: document.get(key, 0) for key in ("total", *STATUSES, "owners")}
+        return await self.compute(db)
+
+    async def rebuild(self, db: AsyncIOMotorDatabase) -> Dict[str, int]:
+        """
+        Recount everything from the lands collection.
+
+        Changes counted while the recount runs may be lost; it is meant for
+        startup and for repairing drift, not for routine use.
+        """
+        # Per-owner counts are written server side; owner ids never reach the app
+        await db[LandModel.collection_name].aggregate([
+            {"$group": {"_id": "$owner_id", "lands": {"$sum": 1}}},
+            {"$out": RegistryOwnerModel.collection_name},
+        ]).to_list(length=None)
+        counts = await self.compute(db)
+        now = datetime.utcnow()
+        await db[RegistryStatsModel.collection_name].update_one(
+            {"_id": RegistryStatsModel.DOCUMENT_ID},
+            {"$set": {**counts, "rebuilt_at": now, "updated_at": now}},
+            upsert=True,
+        )
+        logger.info(f"Rebuilt registry stats: {counts}")
+        return counts
+
+    # ------------------------------------------------------------- changes
+
+    async def _inc(self, db: AsyncIOMotorDatabase, changes: Dict[str, int]) -> None:
+        """Apply $inc to the counters; rebuild them if the document is missing"""
+        changes = {key: delta for key, delta in changes.items() if delta}
+        if not settings.REGISTRY_STATS_COUNTERS or not changes:
+            return
+        result = await db[RegistryStatsModel.collection_name].update_one(
+            {"_id": RegistryStatsModel.DOCUMENT_ID},
+            {"$inc": changes, "$set": {"updated_at": datetime.utcnow()}},
+        )
+        if result.matched_count == 0 and (self._task is None or self._task.done()):
+            logger.warning("Registry stats counters missing, rebuilding")
+            self._task = asyncio.create_task(self._ensure(db))
+
+    async def _owner_delta(self, db: AsyncIOMotorDatabase, owner_id, delta: int) -> int:
+        """Adjust one owner's land count; returns the change in distinct owners"""
+        owner = await db[RegistryOwnerModel.collection_name].find_one_and_update(
+            {"_id": owner_id},
+            {"$inc": {"lands": delta}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        if delta > 0 and owner["lands"] == delta:
+            return 1
+        if delta < 0 and owner["lands"] <= 0:
+            await db[RegistryOwnerModel.collection_name].delete_one({"_id": owner_id, "lands": {"$lte": 0}})
+            return -1
+        return 0
+
+    async def land_created(self, db: AsyncIOMotorDatabase, owner_id, status: str = "not_minted") -> None:
+        """A land was inserted"""
+        if settings.REGISTRY_STATS_COUNTERS:
+            owners = await self._owner_delta(db, owner_id, 1)
+            await self._inc(db, {"total": 1, _status(status): 1, "owners": owners})
+
+    async def land_deleted(self, db: AsyncIOMotorDatabase, owner_id, status: Optional[str]) -> None:
+        """A land was deleted"""
+        if settings.REGISTRY_STATS_COUNTERS:
+            owners = await self._owner_delta(db, owner_id, -1)
+            await self._inc(db, {"total": -1, _status(status): -1, "owners": owners})
+
+    async def status_changed(self, db: AsyncIOMotorDatabase, old: Optional[str], new: str, count: int = 1) -> None:
+        """count lands moved from blockchain_status old to new"""
+        old, new = _status(old), _status(new)
+        if old != new and count:
+            await self._inc(db, {old: -count, new: count})
+
+    async def owner_changed(self, db: AsyncIOMotorDatabase, old_owner, new_owner) -> None:
+        """A land was transferred"""
+        if old_owner == new_owner or not settings.REGISTRY_STATS_COUNTERS:
+            return
+        owners = await self._owner_delta(db, new_owner, 1) + await self._owner_delta(db, old_owner, -1)
+        await self._inc(db, {"owners": owners})
+
+
+registry_stats_service = RegistryStatsService()
@@ -0,0 +1,382 @@
+"""
+RPC Endpoint Pool
+
+An AsyncWeb3 provider that spreads JSON-RPC traffic over several nodes.
+
+Every endpoint keeps an exponentially weighted moving average (EWMA) of its
+latency and error rate. Reads go to the endpoint with the best score and
+fail over to the next one on transport errors (timeouts, refused
+connections, HTTP 429/5xx). Endpoints that fail repeatedly sit out a
+cooldown; they come back through the background probe or once every other
+endpoint is cooling down too.
+
+Read-only calls in HEDGED_METHODS can be hedged: if the first endpoint has
+not answered after RPC_HEDGE_AFTER_SECONDS, the same request goes to the
+next-best endpoint and whichever answers first wins.
+
+Writes never hedge. Transactions are signed locally with a nonce from the
+NonceManager, so failing over only re-broadcasts the same signed bytes
+(same hash, same nonce) to another node. Nonce and mempool lookups stick to
+the endpoint that last accepted a write so the pending nonce and
+"is this transaction known" answers stay consistent.
+
+Provider URLs usually carry an API key in their path, so endpoints are
+only ever shown by label (scheme and host) in stats, logs and errors.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import aiohttp
+from eth_utils import keccak, to_hex
+from web3.providers.async_base import AsyncJSONBaseProvider
+from yarl import URL
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Smoothing factor: weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.3
+
+# Latency assumed for an endpoint that has not answered yet
+INITIAL_LATENCY_SECONDS = 0.1
+
+# Score multiplier per unit of error rate (an endpoint failing half its
+# requests scores as if it were 6x slower)
+ERROR_PENALTY = 10.0
+
+# Consecutive failures before an endpoint is benched for the cooldown
+FAILURES_BEFORE_COOLDOWN = 3
+
+# Side-effect free calls whose result does not depend on the node's mempool
+HEDGED_METHODS = frozenset({
+    "eth_call",
+    "eth_blockNumber",
+    "eth_chainId",
+    "eth_getBlockByNumber",
+    "eth_getBlockByHash",
+    "eth_getLogs",
+    "eth_getCode",
+    "eth_getTransactionReceipt",
+})
+
+# Calls pinned to the endpoint that last accepted a transaction
+STICKY_METHODS = frozenset({
+    "eth_sendRawTransaction",
+    "eth_getTransactionCount",
+    "eth_getTransactionByHash",
+})
+
+# JSON-RPC error codes that mean "this node is overloaded", not "bad request"
+RETRYABLE_RPC_CODES = frozenset({-32005, 429})
+
+# Node answers to a re-broadcast of a transaction it already has
+ALREADY_KNOWN_ERRORS = ("already known", "known transaction", "already imported")
+
+
+class EndpointError(Exception):
+    """Transport-level failure of a single endpoint; the request can fail over"""
+
+
+def endpoint_label(url: str) -> str:
+    """scheme://host[:port] of an RPC URL, without credentials, path or query"""
+    try:
+        parsed = URL(url)
+    except ValueError:
+        return "<invalid url>"
+    if not parsed.host:
+        return "<invalid url>"
+    port = f":{parsed.explicit_port}" if parsed.explicit_port else ""
+    return f"{parsed.scheme}://{parsed.host}{port}"
+
+
+class RpcEndpoint:
+    """Health statistics for one JSON-RPC URL"""
+
+    def __init__(self, url: str, label: Optional[str] = None):
+        self.url = url
+        self.label = label or endpoint_label(url)
+        self.latency = INITIAL_LATENCY_SECONDS  # EWMA, seconds
+        self.error_rate = 0.0  # EWMA of failures, 0..1
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.hedges = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.last_error: Optional[str] = None
+
+    def redact(self, text: str) -> str:
+        """text with this endpoint's URL (and so its API key) replaced by the label"""
+        secrets = {self.url}
+        try:
+            parsed = URL(self.url)
+            secrets.add(str(parsed))
+            if parsed.path_qs not in ("", "/"):
+                secrets.add(parsed.path_qs)
+        except ValueError:
+            pass
+        # Whole URLs first, then a path that shows up on its own
+        for secret in sorted(secrets, key=len, reverse=True):
+            text = text.replace(secret, self.label if "://" in secret else "/***")
+        return text
+
+    @property
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+    def score(self) -> float:
+        """Expected cost of sending a request here; lower is better"""
+        return self.latency * (1 + self.in_flight) * (1 + ERROR_PENALTY * self.error_rate)
+
+    def observe(self, latency: float, ok: bool, cooldown: float, error: Optional[str] = None) -> None:
+        """Fold one request's outcome into the moving averages"""
+        self.requests += 1
+        self.error_rate += EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+        if ok:
+            self.latency += EWMA_ALPHA * (latency - self.latency)
+            self.consecutive_failures = 0
+            self.cooldown_until = 0.0
+            return
+        # A timeout tells us the node is at least this slow
+        self.latency = max(self.latency, latency)
+        self.errors += 1
+        self.consecutive_failures += 1
+        self.last_error = error
+        if self.consecutive_failures >= FAILURES_BEFORE_COOLDOWN:
+            self.cooldown_until = time.monotonic() + cooldown
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.label,
+            "latency_ms": round(self.latency * 1000, 1),
+            "error_rate": round(self.error_rate, 4),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "hedges": self.hedges,
+            "cooling_down": self.cooling_down,
+            "last_error": self.last_error,
+        }
+
+
+class PooledAsyncHTTPProvider(AsyncJSONBaseProvider):
+    """AsyncWeb3 provider that routes each request to the healthiest endpoint"""
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        timeout: float,
+        hedge_after: Optional[float] = None,
+        cooldown: float = 30.0,
+    ):
+        """
+        Args:
+            urls: JSON-RPC endpoints; the first one wins ties
+            timeout: Per-attempt request timeout in seconds
+            hedge_after: Seconds before a hedged read is also sent to the
+                next endpoint; None disables hedging
+            cooldown: Seconds a repeatedly failing endpoint is skipped
+        """
+        super().__init__()
+        if not urls:
+            raise ValueError("At least one RPC URL is required")
+        urls = list(dict.fromkeys(urls))
+        labels = [endpoint_label(url) for url in urls]
+        # Two keys for the same provider: tell them apart by position
+        self.endpoints = [
+            RpcEndpoint(url, label if labels.count(label) == 1 else f"{label}#{index + 1}")
+            for index, (url, label) in enumerate(zip(urls, labels))
+        ]
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+        self.cooldown = cooldown
+        self._writer: Optional[RpcEndpoint] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def __str__(self) -> str:
+        return f"RPC pool {[endpoint.label for endpoint in self.endpoints]}"
+
+    def redact(self, text: str) -> str:
+        """text with every endpoint URL replaced by its label"""
+        for endpoint in self.endpoints:
+            text = endpoint.redact(text)
+        return text
+
+    async def cache_async_session(self, session: aiohttp.ClientSession) -> aiohttp.ClientSession:
+        """Use session (and its connection limit) for every endpoint"""
+        self._session = session
+        return session
+
+    async def disconnect(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return await self.probe() > 0
+
+    # ------------------------------------------------------------- routing
+
+    def ranked(self) -> List[RpcEndpoint]:
+        """Endpoints in the order a read would try them"""
+        available = [endpoint for endpoint in self.endpoints if not endpoint.cooling_down]
+        benched = [endpoint for endpoint in self.endpoints if endpoint.cooling_down]
+        # Benched endpoints stay as a last resort, soonest-back first
+        return sorted(available, key=RpcEndpoint.score) + \
+            sorted(benched, key=lambda endpoint: endpoint.cooldown_until)
+
+    def _route(self, method: str) -> List[RpcEndpoint]:
+        ranked = self.ranked()
+        if method in STICKY_METHODS and self._writer is not None and not self._writer.cooling_down:
+            ranked.remove(self._writer)
+            ranked.insert(0, self._writer)
+        return ranked
+
+    # ------------------------------------------------------------ requests
+
+    def _session_or_raise(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Same failure mode as an unreachable node until connect() runs
+            raise EndpointError("RPC pool has no HTTP session; call connect() first")
+        return self._session
+
+    async def _post(self, endpoint: RpcEndpoint, payload: bytes) -> Any:
+        """POST payload to one endpoint and decode the reply, scoring the attempt"""
+        session = self._session_or_raise()
+        endpoint.in_flight += 1
+        started = time.monotonic()
+        try:
+            async with session.post(
+                endpoint.url,
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as response:
+                if response.status == 429 or response.status >= 500:
+                    raise EndpointError(f"HTTP {response.status}")
+                response.raise_for_status()
+                body = self.decode_rpc_response(await response.read())
+            error = body.get("error") if isinstance(body, dict) else None
+            if error and error.get("code") in RETRYABLE_RPC_CODES:
+                raise EndpointError(f"RPC {error.get('code')}: {error.get('message')}")
+        except asyncio.CancelledError:
+            # Lost a hedge race: says nothing about the endpoint's health
+            raise
+        except (EndpointError, aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            # aiohttp errors quote the request URL
+            message = endpoint.redact(str(e)) or type(e).__name__
+            endpoint.observe(time.monotonic() - started, ok=False, cooldown=self.cooldown, error=message)
+            if endpoint.consecutive_failures == FAILURES_BEFORE_COOLDOWN:
+                logger.warning(f"RPC endpoint {endpoint.label} benched for {self.cooldown:.0f}s: {message}")
+            raise EndpointError(f"{endpoint.label}: {message}") from e
+        finally:
+            endpoint.in_flight -= 1
+        endpoint.observe(time.monotonic() - started, ok=True, cooldown=self.cooldown)
+        return body
+
+    async def _send(self, method: str, payload: bytes) -> Any:
+        """Try endpoints in routing order until one answers"""
+        endpoints = self._route(method)
+        hedge = self.hedge_after is not None and method in HEDGED_METHODS
+        errors = []
+        while endpoints:
+            endpoint = endpoints.pop(0)
+            try:
+                if hedge and endpoints:
+                    body, endpoint = await self._hedged(endpoint, endpoints, payload)
+                else:
+                    body = await self._post(endpoint, payload)
+            except EndpointError as e:
+                errors.append(str(e))
+                continue
+            if method == "eth_sendRawTransaction":
+                self._writer = endpoint
+            return body
+        raise ConnectionError(f"All RPC endpoints failed for {method}: {'; '.join(errors)}")
+
+    async def _hedged(self, primary: RpcEndpoint, remaining: List[RpcEndpoint], payload: bytes):
+        """
+        Send to primary; if it is slower than hedge_after, also send to the
+        next endpoint in remaining (removing it) and take the first
+        successful answer.
+
+        Returns:
+            (decoded body, endpoint that answered)
+        """
+        first = asyncio.ensure_future(self._post(primary, payload))
+        done, _ = await asyncio.wait({first}, timeout=self.hedge_after)
+        if done:
+            return first.result(), primary
+
+        backup = remaining.pop(0)
+        backup.hedges += 1
+        second = asyncio.ensure_future(self._post(backup, payload))
+        owners = {first: primary, second: backup}
+        pending = set(owners)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result(), owners[task]
+            # Both failed: surface the primary's error so the caller fails over
+            return first.result(), primary
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def make_request(self, method, params: Any):
+        payload = self.encode_rpc_request(method, params)
+        response = await self._send(method, payload)
+        if method == "eth_sendRawTransaction":
+            response = self._accept_known_transaction(response, params)
+        return response
+
+    async def make_batch_request(self, batch_requests: List[tuple]):
+        payload = self.encode_batch_rpc_request(batch_requests)
+        method = batch_requests[0][0] if batch_requests else ""
+        response = await self._send(method, payload)
+        if isinstance(response, list):
+            response.sort(key=lambda item: item.get("id", 0))
+        return response
+
+    @staticmethod
+    def _accept_known_transaction(response: Dict[str, Any], params: Any) -> Dict[str, Any]:
+        """
+        After a failover the transaction may already have reached the node
+        (or its peers) through the endpoint that timed out. The bytes are
+        identical, so "already known" means the broadcast succeeded.
+        """
+        error = response.get("error")
+        if not error or not any(text in str(error.get("message", "")).lower() for text in ALREADY_KNOWN_ERRORS):
+            return response
+        tx_hash = to_hex(keccak(hexstr=params[0]))
+        return {"jsonrpc": "2.0", "id": response.get("id"), "result": tx_hash}
+
+    # -------------------------------------------------------------- health
+
+    async def probe(self) -> int:
+        """
+        Send eth_blockNumber to every endpoint so benched ones can recover
+        and idle ones get a fresh latency sample.
+
+        Returns:
+            Number of endpoints that answered
+        """
+        payload = self.encode_rpc_request("eth_blockNumber", [])
+        results = await asyncio.gather(
+            *(self._post(endpoint, payload) for endpoint in self.endpoints),
+            return_exceptions=True,
+        )
+        return sum(1 for result in results if not isinstance(result, Exception))
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-endpoint scores for metrics output"""
+        return {
+            "hedge_after_seconds": self.hedge_after,
+            "writer": self._writer.label if self._writer else None,
+            "endpoints": [endpoint.stats() for endpoint in self.ranked()],
+        }
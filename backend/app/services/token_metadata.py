@@ -0,0 +1,174 @@
+"""
+Token Metadata
+
+Builds the ERC-721 metadata JSON a land token's URI points to, and pins it.
+
+Mints that arrive close together share one upload: each land's JSON joins
+a pending batch, which is pinned as one directory, <CID>/<land id>.json,
+once METADATA_BATCH_SIZE lands are waiting or METADATA_BATCH_WINDOW_SECONDS
+after the first one arrived. Mass minting therefore costs one IPFS
+round-trip per batch rather than one per token.
+
+The resulting URI is cached on the land together with the sha256 of the
+JSON, so minting a land again (after a failed mint job) reuses the pinned
+file unless the land's details changed.
+"""
+
+import asyncio
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.land import LandModel
+from app.services.pinata_service import pinata_service
+
+logger = get_logger(__name__)
+
+
+class TokenMetadataService:
+    """Builds token metadata and pins it in batched directory uploads"""
+
+    def __init__(self):
+        self._pending: Dict[str, Tuple[bytes, asyncio.Future]] = {}  # File name -> (JSON, URI future)
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._uploads = set()
+        self._stats = {
+            "batches": 0,
+            "tokens_pinned": 0,
+            "cache_hits": 0,
+            "failures": 0,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        batches = self._stats["batches"]
+        return {
+            **self._stats,
+            "tokens_per_batch": round(self._stats["tokens_pinned"] / batches, 1) if batches else None,
+            "pending": len(self._pending),
+        }
+
+    @staticmethod
+    def build(land: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ERC-721 metadata for a land.
+
+        Holds only what does not change while the land is listed (no price
+        or sale state), so the pinned file stays valid.
+        """
+        land_id = str(land["_id"])
+        attributes = [
+            {"trait_type": "Property ID", "value": land.get("property_id")},
+            {"trait_type": "Area", "value": land.get("area"), "display_type": "number"},
+        ]
+        location = land.get("location")
+        if isinstance(location, dict):
+            if location.get("address"):
+                attributes.append({"trait_type": "Address", "value": location["address"]})
+            if location.get("lat") is not None and location.get("lng") is not None:
+                attributes.append({"trait_type": "Coordinates", "value": f"{location['lat']},{location['lng']}"})
+        elif location:
+            attributes.append({"trait_type": "Address", "value": str(location)})
+
+        return {
+            "name": land.get("title") or f"Land {land.get('property_id')}",
+            "description": land.get("description") or "",
+            "external_url": f"{settings.PUBLIC_API_URL.rstrip('/')}/api/v1/land/{land_id}",
+            "attributes": attributes,
+            "properties": {
+                "land_id": land_id,
+                "documents": [
+                    {"name": doc.get("name"), "type": doc.get("type"), "uri": f"ipfs://{doc['ipfs_hash']}"}
+                    for doc in land.get("documents", [])
+                ],
+            },
+        }
+
+    @staticmethod
+    def encode(metadata: Dict[str, Any]) -> bytes:
+        """Canonical JSON bytes, so the same metadata always hashes the same"""
+        return json.dumps(metadata, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+    async def token_uri(self, db: AsyncIOMotorDatabase, land: Dict[str, Any]) -> str:
+        """
+        URI of the land's pinned metadata JSON, pinning it if needed.
+
+        Waits for the batch the land joins to be uploaded.
+
+        Returns:
+            ipfs://<directory CID>/<land id>.json
+
+        Raises:
+            HTTPException: The upload failed (from the document store)
+        """
+        content = self.encode(self.build(land))
+        digest = hashlib.sha256(content).hexdigest()
+        cached = land.get("metadata") or {}
+        if cached.get("sha256") == digest and cached.get("uri"):
+            self._stats["cache_hits"] += 1
+            return cached["uri"]
+
+        uri = await self._enqueue(f"{land['_id']}.json", content)
+        await db[LandModel.collection_name].update_one(
+            {"_id": land["_id"]},
+            {"$set": {"metadata": {"uri": uri, "sha256": digest, "pinned_at": datetime.utcnow()}}},
+        )
+        return uri
+
+    async def _enqueue(self, name: str, content: bytes) -> str:
+        entry = self._pending.get(name)
+        if entry is not None and entry[0] != content:
+            self._flush()  # An older version of the same file is waiting; let it go first
+            entry = None
+        if entry is None:
+            future = asyncio.get_running_loop().create_future()
+            # Mark failures as seen even if every waiter has gone away
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._pending[name] = (content, future)
+        else:
+            future = entry[1]
+
+        if len(self._pending) >= settings.METADATA_BATCH_SIZE:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                settings.METADATA_BATCH_WINDOW_SECONDS, self._flush
+            )
+        # A caller that goes away does not take the upload down with it
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Start uploading the pending batch"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.create_task(self._upload(batch))
+            self._uploads.add(task)
+            task.add_done_callback(self._uploads.discard)
+
+    async def _upload(self, batch: Dict[str, Tuple[bytes, asyncio.Future]]) -> None:
+        try:
+            cid = await pinata_service.pin_directory({name: content for name, (content, _) in batch.items()})
+        except Exception as e:
+            self._stats["failures"] += 1
+            logger.warning(f"Pinning metadata for {len(batch)} tokens failed: {e}")
+            for _, future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self._stats["batches"] += 1
+        self._stats["tokens_pinned"] += len(batch)
+        logger.info(f"Pinned metadata for {len(batch)} tokens as {cid}")
+        for name, (_, future) in batch.items():
+            if not future.done():
+                future.set_result(f"ipfs://{cid}/{name}")
+
+
+token_metadata_service = TokenMetadataService()
@@ -0,0 +1,758 @@
+"""
+Transaction Job Service
+
+Durable background pipeline for on-chain writes. Endpoints enqueue a job in
+the ``tx_jobs`` collection and return immediately; worker tasks sign, send
+and poll for the receipt, then apply the resulting state change to ``lands``.
+
+A worker claims a job by leasing it under a fresh lease_owner token, which
+it keeps extending while it works. Every write to the job is fenced on that
+token, so once a lease has expired and another worker has taken the job
+over, the first worker's writes fail with LeaseLost and it stops. The nonce
+is stored on the job before the transaction is signed: a worker that takes
+over a job in 'sending' signs at the same nonce, never a second one.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.land import LandModel
+from app.models.tx_job import TxJobModel
+from app.services.blockchain import async_blockchain_service as blockchain_service
+from app.services.chain_metadata import REQUIRED_VERIFICATIONS
+from app.services.registry_stats import registry_stats_service
+from app.utils.helpers import etherscan_tx_url
+
+logger = get_logger(__name__)
+
+
+class LeaseLost(Exception):
+    """The job's lease expired and another worker claimed it"""
+
+
+def _lease_deadline() -> datetime:
+    return datetime.utcnow() + timedelta(seconds=settings.TX_JOB_LEASE_SECONDS)
+
+
+class TxJobService:
+    """Enqueues transaction jobs and runs the workers that execute them"""
+
+    def __init__(self):
+        self._db: Optional[AsyncIOMotorDatabase] = None
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    # ------------------------------------------------------------------ API
+
+    async def enqueue(
+        self,
+        db: AsyncIOMotorDatabase,
+        kind: str,
+        land_id: ObjectId,
+        params: Dict[str, Any],
+        requested_by: str,
+        expected_status: tuple,
+    ) -> Dict[str, Any]:
+        """
+        Create a job for a land, claiming the land so only one chain write is
+        in flight for it at a time.
+
+        Args:
+            db: Database instance
+            kind: "mint", "verify" or "reject"
+            land_id: Land the transaction acts on
+            params: Contract call arguments
+            requested_by: Id of the user who triggered the job
+            expected_status: blockchain_status values the land must be in
+
+        Returns:
+            The inserted job document
+
+        Raises:
+            ValueError: If the land changed state or already has a job in flight
+        """
+        job_id = ObjectId()
+        claimed = await db[LandModel.collection_name].update_one(
+            {
+                "_id": land_id,
+                "blockchain_status": {"$in": list(expected_status)},
+                "active_tx_job_id": None,
+            },
+            {"$set": {"active_tx_job_id": job_id}}
+        )
+        if claimed.modified_count == 0:
+            raise ValueError("A blockchain transaction for this land is already in progress")
+
+        job = _new_job(job_id, kind, land_id, params, requested_by)
+        await self._insert(db, job)
+        logger.info(f"Enqueued {kind} job {job_id} for land {land_id}")
+        return job
+
+    async def enqueue_batch(
+        self,
+        db: AsyncIOMotorDatabase,
+        kind: str,
+        lands: Dict[ObjectId, int],
+        params: Dict[str, Any],
+        requested_by: str,
+        expected_status: tuple,
+    ) -> Dict[str, Any]:
+        """
+        Create one job for several lands, claiming those that are free.
+
+        Lands that changed state or already have a job in flight are left
+        out instead of failing the whole batch; the job's land_ids and
+        params["token_ids"] list, in order, the lands it actually carries.
+
+        Args:
+            db: Database instance
+            kind: "verify_batch"
+            lands: Land id -> token id, in submission order
+            params: Contract call arguments shared by every land
+            requested_by: Id of the user who triggered the job
+            expected_status: blockchain_status values the lands must be in
+
+        Returns:
+            The inserted job document
+
+        Raises:
+            ValueError: If none of the lands could be claimed
+        """
+        job_id = ObjectId()
+        collection = db[LandModel.collection_name]
+        await collection.update_many(
+            {
+                "_id": {"$in": list(lands)},
+                "blockchain_status": {"$in": list(expected_status)},
+                "active_tx_job_id": None,
+            },
+            {"$set": {"active_tx_job_id": job_id}}
+        )
+        claimed = {
+            doc["_id"] async for doc in collection.find(
+                {"_id": {"$in": list(lands)}, "active_tx_job_id": job_id}, {"_id": 1}
+            )
+        }
+        if not claimed:
+            raise ValueError("Land changed state or already has a blockchain transaction in progress")
+
+        land_ids = [land_id for land_id in lands if land_id in claimed]
+        job = _new_job(job_id, kind, None, {**params, "token_ids": [lands[i] for i in land_ids]}, requested_by)
+        job["land_ids"] = land_ids
+        await self._insert(db, job)
+        logger.info(f"Enqueued {kind} job {job_id} for {len(land_ids)} lands")
+        return job
+
+    async def _insert(self, db: AsyncIOMotorDatabase, job: Dict[str, Any]) -> None:
+        """Store a new job, handing its lands back if that fails, and wake a worker"""
+        try:
+            await db[TxJobModel.collection_name].insert_one(job)
+        except Exception:
+            await self._release_land(db, job)
+            raise
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def get(self, db: AsyncIOMotorDatabase, job_id: ObjectId) -> Optional[Dict[str, Any]]:
+        """Fetch a job by id"""
+        return await db[TxJobModel.collection_name].find_one({"_id": job_id})
+
+    # -------------------------------------------------------------- workers
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Start the worker tasks (called on application startup)"""
+        self._db = db
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run_worker(i))
+            for i in range(settings.TX_JOB_WORKERS)
+        ]
+        logger.info(f"Started {len(self._tasks)} transaction job workers")
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks (called on application shutdown)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run_worker(self, worker_no: int) -> None:
+        while True:
+            try:
+                job = await self._claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[tx-worker {worker_no}] claim failed: {e}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=settings.TX_JOB_POLL_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            heartbeat = asyncio.create_task(self._keep_leased(job))
+            try:
+                await self._process(job)
+            except asyncio.CancelledError:
+                raise
+            except LeaseLost as e:
+                logger.warning(f"[tx-worker {worker_no}] {e}")
+            except Exception as e:
+                logger.error(f"[tx-worker {worker_no}] job {job['_id']} errored: {e}", exc_info=True)
+                try:
+                    await self._retry_or_fail(job, str(e))
+                except LeaseLost as lost:
+                    logger.warning(f"[tx-worker {worker_no}] {lost}")
+            finally:
+                heartbeat.cancel()
+
+    async def _claim(self) -> Optional[Dict[str, Any]]:
+        """Atomically lease the next due job under a new lease_owner token"""
+        now = datetime.utcnow()
+        return await self._db[TxJobModel.collection_name].find_one_and_update(
+            {
+                "status": {"$in": list(TxJobModel.ACTIVE_STATES)},
+                "next_attempt_at": {"$lte": now},
+                "lease_expires_at": {"$lte": now},
+            },
+            {"$set": {"lease_expires_at": _lease_deadline(), "lease_owner": uuid.uuid4().hex}},
+            sort=[("next_attempt_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _keep_leased(self, job: Dict[str, Any]) -> None:
+        """Extend the job's lease until this worker releases (or loses) it"""
+        jobs = self._db[TxJobModel.collection_name]
+        while True:
+            await asyncio.sleep(settings.TX_JOB_LEASE_SECONDS / 3)
+            try:
+                extended = await jobs.update_one(
+                    {"_id": job["_id"], "lease_owner": job["lease_owner"]},
+                    {"$set": {"lease_expires_at": _lease_deadline()}}
+                )
+            except Exception as e:
+                logger.warning(f"Extending the lease of job {job['_id']} failed: {e}")
+                continue
+            if extended.matched_count == 0:
+                return
+
+    async def _update(self, job: Dict[str, Any], update: Dict[str, Any], release: bool = False) -> None:
+        """
+        Apply update to the job, provided this worker still holds its lease
+
+        Args:
+            job: The claimed job
+            update: MongoDB update document
+            release: Also hand the lease back, so the job can be claimed
+                again from its next_attempt_at
+
+        Raises:
+            LeaseLost: Another worker has claimed the job since
+        """
+        if release:
+            fields = {"lease_expires_at": datetime.utcnow(), "lease_owner": None}
+            update = {**update, "$set": {**update.get("$set", {}), **fields}}
+        result = await self._db[TxJobModel.collection_name].update_one(
+            {"_id": job["_id"], "lease_owner": job["lease_owner"]}, update
+        )
+        if result.matched_count == 0:
+            raise LeaseLost(f"Job {job['_id']} lease expired and was claimed by another worker")
+
+    async def _process(self, job: Dict[str, Any]) -> None:
+        if job["status"] in (TxJobModel.SUBMITTED, TxJobModel.MINED):
+            await self._check_receipt(job)
+        else:
+            # queued, or 'sending' whose worker died before the signed tx was saved
+            await self._submit(job)
+
+    async def _prepare(self, job: Dict[str, Any], **overrides) -> Dict[str, Any]:
+        params = job["params"]
+        if job["kind"] == "mint":
+            return await blockchain_service.prepare_register_land(
+                params["property_id"],
+                params["ipfs_hash"],
+                params["area"],
+                params["price"],
+                params["location"],
+                **overrides,
+            )
+        if job["kind"] == "verify":
+            # Only one job per land is in flight, so the stored count is current
+            land = await self._db[LandModel.collection_name].find_one(
+                {"_id": job["land_id"]}, {"verification_count": 1}
+            )
+            mints = (land or {}).get("verification_count", 0) + 1 >= REQUIRED_VERIFICATIONS
+            return await blockchain_service.prepare_verify_land(
+                params["token_id"], params["verifier_address"], mints=mints, **overrides
+            )
+        if job["kind"] == "verify_batch":
+            # Lands this batch takes to the threshold mint, which costs more gas
+            mints = await self._db[LandModel.collection_name].count_documents({
+                "_id": {"$in": job["land_ids"]},
+                "verification_count": {"$gte": REQUIRED_VERIFICATIONS - 1},
+            })
+            return await blockchain_service.prepare_verify_many(
+                params["token_ids"], params["verifier_address"], mints=mints, **overrides
+            )
+        if job["kind"] == "reject":
+            return await blockchain_service.prepare_reject_land(
+                params["token_id"], params["reason"], **overrides
+            )
+        raise ValueError(f"Unknown job kind: {job['kind']}")
+
+    async def _submit(self, job: Dict[str, Any]) -> None:
+        """Reserve a nonce, sign, persist, then broadcast the job's transaction"""
+        sending = {
+            "status": TxJobModel.SENDING,
+            "lease_expires_at": _lease_deadline(),
+            "updated_at": datetime.utcnow(),
+        }
+        if job.get("nonce") is None:
+            nonce = await blockchain_service.nonce_manager.allocate()
+            try:
+                await self._update(job, {"$set": {**sending, "nonce": nonce}})
+            except LeaseLost:
+                await blockchain_service.nonce_manager.release(nonce)
+                raise
+            job["nonce"] = nonce
+        else:
+            # Taken over, or retried, before its transaction was stored
+            await self._update(job, {"$set": sending})
+
+        try:
+            prepared = await self._prepare(job, nonce=job["nonce"])
+        except ContractLogicError as e:
+            # The call reverts in simulation; retrying will not help
+            await self._fail(job, _revert_reason(e))
+            return
+
+        now = datetime.utcnow()
+        await self._update(job, {"$set": {
+            "status": TxJobModel.SUBMITTED,
+            "tx_hash": prepared["tx_hash"],
+            "raw_transaction": prepared["raw_transaction"],
+            "gas_bucket": prepared["gas_bucket"],
+            "gas_limit": prepared["gas_limit"],
+            "submitted_at": now,
+            "lease_expires_at": _lease_deadline(),
+            "updated_at": now,
+        }})
+
+        error = None
+        try:
+            await blockchain_service.send_raw_transaction(prepared["raw_transaction"])
+            logger.info(f"Job {job['_id']} sent tx {prepared['tx_hash']} (nonce {prepared['nonce']})")
+        except Exception as e:
+            # The receipt check re-broadcasts the stored bytes if the node never saw them
+            logger.warning(f"Job {job['_id']} broadcast failed, will retry: {e}")
+            error = str(e)
+        await self._update(job, {"$set": {
+            "next_attempt_at": now + timedelta(seconds=settings.TX_JOB_POLL_INTERVAL_SECONDS),
+            **({"error": error} if error else {}),
+        }}, release=True)
+
+    async def _find_receipt(self, job: Dict[str, Any]):
+        """Receipt for the job's tx, or for any tx it replaced that got mined instead"""
+        for tx_hash in [job["tx_hash"], *job.get("replaced_tx_hashes", [])]:
+            receipt = await blockchain_service.get_transaction_receipt(tx_hash)
+            if receipt is not None:
+                return tx_hash, receipt
+        return None, None
+
+    async def _check_receipt(self, job: Dict[str, Any]) -> None:
+        """Poll once for the job's receipt and settle or reschedule it"""
+        mined_hash, receipt = await self._find_receipt(job)
+        now = datetime.utcnow()
+
+        if receipt is None and job["status"] == TxJobModel.MINED:
+            # Its block was orphaned: the tx is back in the mempool (or gone),
+            # so wait for it to be mined again
+            logger.warning(f"Job {job['_id']} block {job['block_number']} was reorged out")
+            job["submitted_at"] = now
+            await self._update(job, {"$set": {
+                "status": TxJobModel.SUBMITTED,
+                "block_number": None,
+                "block_hash": None,
+                "confirmations": None,
+                "submitted_at": now,
+                "updated_at": now,
+            }})
+
+        if receipt is None:
+            age = (now - job["submitted_at"]).total_seconds()
+            if await blockchain_service.is_transaction_known(job["tx_hash"]):
+                if age > settings.NONCE_STUCK_SECONDS and \
+                        job["nonce"] == await blockchain_service.nonce_manager.stuck_nonce():
+                    await self._replace(job)
+                    return
+            elif age > settings.TX_RECEIPT_TIMEOUT_SECONDS:
+                # The node lost it and it never came back: free the nonce for reuse
+                await blockchain_service.nonce_manager.release(job["nonce"])
+                await self._fail(job, f"Transaction dropped: not mined within {settings.TX_RECEIPT_TIMEOUT_SECONDS}s")
+                return
+            else:
+                try:
+                    await blockchain_service.send_raw_transaction(job["raw_transaction"])
+                except Exception as e:
+                    if "nonce too low" in str(e).lower():
+                        # Another tx took this nonce, so ours can never be mined
+                        await self._fail(job, f"Transaction superseded: {e}")
+                        return
+                    logger.warning(f"Job {job['_id']} re-broadcast failed: {e}")
+            await self._update(job, {"$set": {
+                "next_attempt_at": now + timedelta(seconds=settings.TX_JOB_POLL_INTERVAL_SECONDS),
+            }}, release=True)
+            return
+
+        if mined_hash != job["tx_hash"]:
+            # An earlier, replaced version of the tx was the one mined
+            job["tx_hash"] = mined_hash
+            await self._update(job, {"$set": {"tx_hash": mined_hash}})
+
+        head = await blockchain_service.chain.block_number()
+        block_hash = Web3.to_hex(receipt["blockHash"])
+        confirmations = head - receipt["blockNumber"] + 1
+        if job.get("block_hash") not in (None, block_hash):
+            logger.warning(
+                f"Job {job['_id']} tx moved from block {job['block_hash']} to {block_hash} after a reorg"
+            )
+        if confirmations < settings.CONFIRMATION_DEPTH:
+            await self._update(job, {"$set": {
+                "status": TxJobModel.MINED,
+                "block_number": receipt["blockNumber"],
+                "block_hash": block_hash,
+                "confirmations": max(confirmations, 0),
+                "next_attempt_at": now + timedelta(seconds=settings.TX_JOB_POLL_INTERVAL_SECONDS),
+                "updated_at": now,
+            }}, release=True)
+            return
+
+        await self._update(job, {"$set": {
+            "block_number": receipt["blockNumber"],
+            "block_hash": block_hash,
+            "confirmations": confirmations,
+        }})
+
+        if receipt["status"] != 1:
+            await self._fail(job, f"Transaction reverted on-chain. tx_hash={job['tx_hash']}")
+            return
+
+        blockchain_service.gas_cache.record(job.get("gas_bucket"), receipt["gasUsed"])
+
+        result = await self._apply(job, receipt)
+        await self._update(job, {"$set": {
+            "status": TxJobModel.CONFIRMED,
+            "gas_used": receipt["gasUsed"],
+            "result": result,
+            "error": None,
+            "updated_at": datetime.utcnow(),
+        }}, release=True)
+        logger.info(f"Job {job['_id']} confirmed in block {receipt['blockNumber']}")
+
+    async def _apply(self, job: Dict[str, Any], receipt) -> Dict[str, Any]:
+        """Apply the land state change for a successful receipt"""
+        land_id = job["land_id"]
+        tx_hash = job["tx_hash"]
+        params = job["params"]
+        now = datetime.utcnow()
+        transaction = {
+            "tx_hash": tx_hash,
+            "status": "success",
+            "block_number": receipt["blockNumber"],
+            "block_hash": Web3.to_hex(receipt["blockHash"]),
+            "gas_used": receipt["gasUsed"],
+        }
+
+        if job["kind"] == "mint":
+            token_id = blockchain_service.registered_token_id(receipt)
+            await self._update_land(land_id, {
+                "token_id": token_id,
+                "blockchain_status": "pending",
+                "blockchain_tx_hash": tx_hash,
+                "active_tx_job_id": None,
+                "updated_at": now
+            })
+            return {
+                "message": "Land minted successfully",
+                "land_id": str(land_id),
+                "token_id": token_id,
+                "tx_hash": tx_hash,
+                "etherscan_url": etherscan_tx_url(tx_hash),
+            }
+
+        if job["kind"] == "verify":
+            token_id = params["token_id"]
+            verifier_address = params["verifier_address"]
+            details = await blockchain_service.get_land_details(token_id)
+            if details is None:
+                # A failed read must not record a count of 0; the worker
+                # retries the receipt check, which re-applies the update
+                raise ConnectionError(f"Could not read verification count for token {token_id}")
+            verification_count = details.get("verification_count", 0)
+
+            update_data = {
+                "blockchain_tx_hash": tx_hash,
+                "verification_count": verification_count,
+                "active_tx_job_id": None,
+                "updated_at": now
+            }
+            if verification_count >= REQUIRED_VERIFICATIONS:
+                update_data.update({
+                    "blockchain_status": "verified",
+                    "verified_at": now,
+                    "verified_by": verifier_address,
+                    "status": "verified",
+                })
+
+            await self._update_land(land_id, update_data, {"$addToSet": {"verified_by_list": verifier_address}})
+            return {
+                "message": "Land verified successfully on blockchain",
+                "land_id": str(land_id),
+                "token_id": token_id,
+                "transaction": transaction,
+                "etherscan_url": etherscan_tx_url(tx_hash),
+            }
+
+        if job["kind"] == "verify_batch":
+            return await self._apply_verify_batch(job, receipt, transaction)
+
+        # reject
+        await self._update_land(land_id, {
+            "blockchain_status": "rejected",
+            "blockchain_tx_hash": tx_hash,
+            "verified_at": now,
+            "verified_by": params["verifier_id"],
+            "rejection_reason": params["reason"],
+            "status": "rejected",
+            "active_tx_job_id": None,
+            "updated_at": now
+        })
+        return {
+            "message": "Land rejected on blockchain",
+            "land_id": str(land_id),
+            "token_id": params["token_id"],
+            "reason": params["reason"],
+            "transaction": transaction,
+            "etherscan_url": etherscan_tx_url(tx_hash),
+        }
+
+    async def _update_land(self, land_id: ObjectId, fields: Dict[str, Any], extra: Optional[Dict[str, Any]] = None) -> None:
+        """$set fields on a land, counting a blockchain_status change in the registry stats"""
+        before = await self._db[LandModel.collection_name].find_one_and_update(
+            {"_id": land_id},
+            {"$set": fields, **(extra or {})},
+            projection={"blockchain_status": 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+        # Compared with the previous value, so re-applying a receipt counts nothing
+        if before is not None and "blockchain_status" in fields:
+            await registry_stats_service.status_changed(
+                self._db, before.get("blockchain_status"), fields["blockchain_status"]
+            )
+
+    async def _apply_verify_batch(self, job: Dict[str, Any], receipt, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply each land's outcome from a verifyLandBatch receipt's events"""
+        tx_hash = job["tx_hash"]
+        verifier_address = job["params"]["verifier_address"]
+        outcomes = blockchain_service.batch_results(receipt)
+        now = datetime.utcnow()
+
+        updates, results = [], []
+        for land_id, token_id in zip(job["land_ids"], job["params"]["token_ids"]):
+            outcome = outcomes.get(token_id, {"outcome": "skipped", "reason": "No event emitted for token"})
+            results.append({"land_id": str(land_id), "token_id": token_id, **outcome})
+            if outcome["outcome"] == "skipped":
+                # Nothing changed on-chain; just hand the land back
+                updates.append(UpdateOne(
+                    {"_id": land_id, "active_tx_job_id": job["_id"]},
+                    {"$set": {"active_tx_job_id": None}}
+                ))
+                continue
+
+            update_data = {
+                "blockchain_tx_hash": tx_hash,
+                "verification_count": outcome["verification_count"],
+                "active_tx_job_id": None,
+                "updated_at": now
+            }
+            if outcome["outcome"] == "verified":
+                update_data.update({
+                    "blockchain_status": "verified",
+                    "verified_at": now,
+                    "verified_by": verifier_address,
+                    "status": "verified",
+                })
+            updates.append(UpdateOne(
+                {"_id": land_id},
+                {"$set": update_data, "$addToSet": {"verified_by_list": verifier_address}}
+            ))
+
+        lands = self._db[LandModel.collection_name]
+        # Statuses the lands this batch verifies had, for the registry stats
+        verified = [land_id for land_id, result in zip(job["land_ids"], results) if result["outcome"] == "verified"]
+        previous: Dict[Optional[str], int] = {}
+        if verified:
+            async for land in lands.find(
+                {"_id": {"$in": verified}, "blockchain_status": {"$ne": "verified"}}, {"blockchain_status": 1}
+            ):
+                status = land.get("blockchain_status")
+                previous[status] = previous.get(status, 0) + 1
+        await lands.bulk_write(updates, ordered=False)
+        for status, count in previous.items():
+            await registry_stats_service.status_changed(self._db, status, "verified", count)
+        recorded = sum(1 for r in results if r["outcome"] != "skipped")
+        return {
+            "message": f"Verification recorded on blockchain for {recorded} of {len(results)} lands",
+            "lands": results,
+            "transaction": transaction,
+            "etherscan_url": etherscan_tx_url(tx_hash),
+        }
+
+    async def _replace(self, job: Dict[str, Any]) -> None:
+        """Re-sign a stuck transaction at the same nonce with higher fees"""
+        replacements = job.get("replacements", 0) + 1
+        prepared = await self._prepare(
+            job,
+            nonce=job["nonce"],
+            fee_multiplier=settings.TX_REPLACEMENT_FEE_BUMP ** replacements,
+        )
+        now = datetime.utcnow()
+        await self._update(job, {
+            "$set": {
+                "tx_hash": prepared["tx_hash"],
+                "raw_transaction": prepared["raw_transaction"],
+                "replacements": replacements,
+                "submitted_at": now,
+                "lease_expires_at": _lease_deadline(),
+                "updated_at": now,
+            },
+            "$push": {"replaced_tx_hashes": job["tx_hash"]},
+        })
+        logger.warning(
+            f"Job {job['_id']} stuck at nonce {job['nonce']}, "
+            f"replaced {job['tx_hash']} with {prepared['tx_hash']}"
+        )
+        await blockchain_service.send_raw_transaction(prepared["raw_transaction"])
+        await self._update(job, {"$set": {
+            "next_attempt_at": now + timedelta(seconds=settings.TX_JOB_POLL_INTERVAL_SECONDS),
+        }}, release=True)
+
+    async def _retry_or_fail(self, job: Dict[str, Any], error: str) -> None:
+        """Reschedule a job that hit a transient error, or fail it for good"""
+        # The error may have struck after a write: act on the stored job
+        current = await self._db[TxJobModel.collection_name].find_one(
+            {"_id": job["_id"], "lease_owner": job["lease_owner"]}
+        )
+        if current is None:
+            raise LeaseLost(f"Job {job['_id']} lease expired and was claimed by another worker")
+        job = current
+
+        if job.get("tx_hash"):
+            # Already signed: leave it to the receipt check, never re-sign
+            now = datetime.utcnow()
+            await self._update(job, {"$set": {
+                "status": TxJobModel.SUBMITTED,
+                "error": error,
+                "next_attempt_at": now + timedelta(seconds=settings.TX_JOB_POLL_INTERVAL_SECONDS),
+            }}, release=True)
+            return
+
+        attempts = job.get("attempts", 0) + 1
+        if attempts >= settings.TX_JOB_MAX_ATTEMPTS:
+            await self._fail(job, error)
+            return
+
+        # The stored nonce is kept: the retry signs at the same one
+        now = datetime.utcnow()
+        await self._update(job, {"$set": {
+            "status": TxJobModel.QUEUED,
+            "attempts": attempts,
+            "error": error,
+            "next_attempt_at": now + timedelta(seconds=2 ** attempts),
+            "updated_at": now,
+        }}, release=True)
+
+    async def _fail(self, job: Dict[str, Any], error: str) -> None:
+        logger.warning(f"Job {job['_id']} ({job['kind']}) failed: {error}")
+        await self._update(job, {"$set": {
+            "status": TxJobModel.FAILED,
+            "error": error,
+            "updated_at": datetime.utcnow(),
+        }}, release=True)
+        if job.get("nonce") is not None and not job.get("tx_hash"):
+            # Reserved but never signed into a stored transaction
+            await blockchain_service.nonce_manager.release(job["nonce"])
+        await self._release_land(self._db, job)
+
+    @staticmethod
+    async def _release_land(db: AsyncIOMotorDatabase, job: Dict[str, Any]) -> None:
+        await db[LandModel.collection_name].update_many(
+            {"_id": {"$in": job.get("land_ids") or [job["land_id"]]}, "active_tx_job_id": job["_id"]},
+            {"$set": {"active_tx_job_id": None}}
+        )
+
+
+def _new_job(
+    job_id: ObjectId,
+    kind: str,
+    land_id: Optional[ObjectId],
+    params: Dict[str, Any],
+    requested_by: str,
+) -> Dict[str, Any]:
+    """A queued job document; batch jobs pass land_id=None and set land_ids"""
+    now = datetime.utcnow()
+    return {
+        "_id": job_id,
+        "kind": kind,
+        "land_id": land_id,
+        "params": params,
+        "requested_by": requested_by,
+        "status": TxJobModel.QUEUED,
+        "attempts": 0,
+        "tx_hash": None,
+        "raw_transaction": None,
+        "nonce": None,
+        "replacements": 0,
+        "replaced_tx_hashes": [],
+        "block_number": None,
+        "block_hash": None,
+        "confirmations": None,
+        "gas_bucket": None,
+        "gas_limit": None,
+        "gas_used": None,
+        "result": None,
+        "error": None,
+        "next_attempt_at": now,
+        "lease_expires_at": now,
+        "lease_owner": None,
+        "submitted_at": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _revert_reason(error: ContractLogicError) -> str:
+    message = str(error)
+    if "execution reverted:" in message:
+        return "Smart contract rejected the transaction: " + message.split("execution reverted:")[-1].strip()
+    return f"Smart contract rejected the transaction: {message}"
+
+
+# Create service instance
+tx_job_service = TxJobService()
@@ -0,0 +1,189 @@
+"""
+User Cache
+
+get_current_user runs on every authenticated request. Instead of reading
+the user from MongoDB each time, users are kept in a TTL + LRU cache keyed
+by email (the token subject) for USER_CACHE_TTL_SECONDS.
+
+Endpoints that change a user (role, wallet) call invalidate() so the
+change takes effect on the next request. Other API processes are told in
+one of two ways (USER_CACHE_INVALIDATION):
+
+    change_stream   every process watches the users collection and drops
+                    any user that is updated, replaced or deleted; this also
+                    covers changes made outside the API. Needs a replica set
+                    (MongoDB Atlas always is one)
+    poll            invalidate() writes a cache_invalidations message that
+                    the other processes poll for every USER_CACHE_POLL_SECONDS
+    auto            change_stream if the server supports it, else poll
+    none            no cross-process invalidation; only the TTL bounds how
+                    long another process serves a stale user
+
+A process that cannot reach its invalidation source keeps serving from the
+cache, so the TTL is the upper bound on staleness in every mode.
+"""
+
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.cache_invalidation import CacheInvalidationModel
+from app.models.user import UserModel
+from app.schemas.user import UserInDB
+from app.utils.cache import TTLLRUCache
+
+logger = get_logger(__name__)
+
+CACHE_NAME = "users"
+
+
+class UserCache:
+    """Read-through cache of users for request authentication"""
+
+    def __init__(self):
+        self.cache = TTLLRUCache(settings.USER_CACHE_TTL_SECONDS, settings.USER_CACHE_MAX_ENTRIES)
+        self.mode = "none"
+        self._origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._task: Optional[asyncio.Task] = None
+        self._seen: Dict[ObjectId, datetime] = {}
+        self.published = 0
+        self.received = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.USER_CACHE_TTL_SECONDS > 0
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Start listening for other processes' invalidations (application startup)"""
+        mode = settings.USER_CACHE_INVALIDATION
+        if not self.enabled or mode == "none":
+            return
+        if mode in ("auto", "change_stream") and await self._change_streams_supported(db):
+            self.mode = "change_stream"
+            self._task = asyncio.create_task(self._watch(db))
+        elif mode == "change_stream":
+            logger.warning("User cache: change streams are not supported by this MongoDB; relying on the TTL")
+        else:
+            self.mode = "poll"
+            self._task = asyncio.create_task(self._poll(db))
+        logger.info(f"User cache: TTL {self.cache.ttl}s, cross-process invalidation via {self.mode}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.cache.stats(),
+            "invalidation": self.mode,
+            "invalidations_published": self.published,
+            "invalidations_received": self.received,
+        }
+
+    # ------------------------------------------------------------- reading
+
+    async def get(self, db: AsyncIOMotorDatabase, email: str) -> Optional[UserInDB]:
+        """The user with this email, from the cache or the database; None if there is none"""
+        async def load() -> Optional[UserInDB]:
+            user = await db[UserModel.collection_name].find_one({"email": email})
+            if user is None:
+                return None
+            user["_id"] = str(user["_id"])
+            return UserInDB(**user)
+
+        user = await self.cache.get(email, load) if self.enabled else await load()
+        # A copy, so that a request changing its user object does not change the cache
+        return user.model_copy() if user is not None else None
+
+    # ------------------------------------------------------------- invalidation
+
+    async def invalidate(
+        self, db: AsyncIOMotorDatabase, email: Optional[str] = None, user_id: Optional[str] = None
+    ) -> None:
+        """
+        Drop a user that was just changed, in this process and (in poll mode)
+        the others. Call after the database write.
+        """
+        if not self.enabled:
+            return
+        self._drop(email, user_id)
+        if self.mode != "poll":
+            return
+        try:
+            await db[CacheInvalidationModel.collection_name].insert_one({
+                "cache": CACHE_NAME,
+                "key": email,
+                "user_id": user_id,
+                "origin": self._origin,
+                "created_at": datetime.utcnow(),
+            })
+            self.published += 1
+        except Exception as e:
+            logger.error(f"Publishing user cache invalidation failed: {e}")
+
+    def _drop(self, email: Optional[str], user_id: Optional[str]) -> None:
+        if email is not None:
+            self.cache.invalidate(email)
+        if user_id is not None:
+            self.cache.invalidate_where(lambda key, user: user.id == user_id)
+
+    async def _change_streams_supported(self, db: AsyncIOMotorDatabase) -> bool:
+        try:
+            async with db[UserModel.collection_name].watch(max_await_time_ms=1):
+                return True
+        except Exception as e:
+            logger.info(f"User cache: change streams unavailable ({e})")
+            return False
+
+    async def _watch(self, db: AsyncIOMotorDatabase) -> None:
+        pipeline = [{"$match": {"operationType": {"$in": ["update", "replace", "delete"]}}}]
+        while True:
+            try:
+                async with db[UserModel.collection_name].watch(pipeline) as stream:
+                    async for change in stream:
+                        self.received += 1
+                        self._drop(None, str(change["documentKey"]["_id"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Changes missed while reconnecting: start over from an empty cache
+                logger.error(f"User cache change stream failed: {e}")
+                self.cache.clear()
+                await asyncio.sleep(settings.USER_CACHE_POLL_SECONDS)
+
+    async def _poll(self, db: AsyncIOMotorDatabase) -> None:
+        # Messages are read again for a while after they are written, to
+        # allow for clock skew between processes; _seen skips repeats
+        lookback = timedelta(seconds=settings.USER_CACHE_POLL_SECONDS + 5)
+        collection = db[CacheInvalidationModel.collection_name]
+        while True:
+            try:
+                now = datetime.utcnow()
+                async for message in collection.find({
+                    "cache": CACHE_NAME,
+                    "origin": {"$ne": self._origin},
+                    "created_at": {"$gte": now - lookback},
+                }):
+                    if message["_id"] not in self._seen:
+                        self._seen[message["_id"]] = now
+                        self.received += 1
+                        self._drop(message.get("key"), message.get("user_id"))
+                self._seen = {key: seen for key, seen in self._seen.items() if now - seen <= lookback * 2}
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Polling user cache invalidations failed: {e}")
+            await asyncio.sleep(settings.USER_CACHE_POLL_SECONDS)
+
+
+user_cache = UserCache()
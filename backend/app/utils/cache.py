@@ -0,0 +1,179 @@
+"""
+Caching Utilities
+
+In-process caches for values that are expensive to fetch (an RPC or
+database round-trip) and safe to serve slightly stale.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class SingleFlightTTL:
+    """
+    One cached value with a time-to-live and single-flight refresh.
+
+    While the value is fresh it is returned without calling the loader. Once
+    it expires, the first caller starts a refresh and every concurrent
+    caller awaits that same refresh, so a burst of requests costs at most
+    one upstream call. Failed loads are not cached.
+    """
+
+    def __init__(self, loader: Callable[[], Awaitable[Any]], ttl: Optional[float]):
+        """
+        Args:
+            loader: Coroutine function that fetches the value
+            ttl: Seconds a loaded value stays fresh; None caches it forever
+        """
+        self._loader = loader
+        self.ttl = ttl
+        self._value: Any = None
+        self._loaded = False
+        self._expires_at = 0.0
+        self._inflight: Optional[asyncio.Future] = None
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get(self) -> Any:
+        """Return the cached value, refreshing it if it has expired"""
+        if self._loaded and (self.ttl is None or time.monotonic() < self._expires_at):
+            self.hits += 1
+            return self._value
+
+        if self._inflight is None:
+            self.misses += 1
+            self._inflight = asyncio.ensure_future(self._refresh())
+        else:
+            self.coalesced += 1
+        # shield: a cancelled caller must not cancel the load others wait on
+        return await asyncio.shield(self._inflight)
+
+    async def _refresh(self) -> Any:
+        try:
+            value = await self._loader()
+            self._value = value
+            self._loaded = True
+            if self.ttl is not None:
+                self._expires_at = time.monotonic() + self.ttl
+            return value
+        finally:
+            self._inflight = None
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next get() reloads it"""
+        self._loaded = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for metrics output"""
+        return {
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+class TTLLRUCache:
+    """
+    Values by key with a time-to-live, at most max_entries of them.
+
+    Loads are single-flight per key like SingleFlightTTL. When the cache is
+    full the least recently used entry is evicted. invalidate() also
+    discards a load of that key still in progress, so a value read before
+    the change that caused the invalidation is never stored. Loaders
+    returning None (e.g. not found) are not cached.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        """
+        Args:
+            ttl: Seconds a loaded value stays fresh; 0 disables caching
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, loading it with loader if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = self._inflight[key] = asyncio.ensure_future(self._load(key, loader))
+        else:
+            self.coalesced += 1
+        # shield: a cancelled caller must not cancel the load others wait on
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        task = asyncio.current_task()
+        try:
+            value = await loader()
+        finally:
+            # Not current if invalidated while loading
+            current = self._inflight.get(key) is task
+            if current:
+                del self._inflight[key]
+        if current and value is not None and self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop key, and any load of it in progress, so the next get() reloads it"""
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+        self.invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """
+        Drop every cached entry for which predicate(key, value) is true, and
+        every load in progress (their values are not known yet); returns how
+        many entries were dropped
+        """
+        keys = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+        for key in keys:
+            del self._entries[key]
+        self._inflight.clear()
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for metrics output"""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "ttl_seconds": self.ttl,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,159 @@
+"""
+IPFS content identifiers computed locally
+
+Reproduces the CID Pinata (and `ipfs add` with default options) assigns to
+a file pinned with pinFileToIPFS: a CIDv0 over a UnixFS dag-pb DAG of
+256 KiB chunks, at most 174 links per node, built with the balanced layout.
+The hasher is fed chunks as they are read, so a file is never held whole;
+it keeps only the hash and sizes of each finished node. directory_cid()
+gives the CID of a UnixFS directory of such files, as pinned by a folder
+upload or `ipfs add --wrap-with-directory`.
+"""
+
+import hashlib
+from typing import BinaryIO, Dict, List, Sequence, Tuple
+
+CHUNK_SIZE = 256 * 1024  # Default size-262144 chunker
+MAX_LINKS = 174  # Default links per node of the balanced layout
+
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_UNIXFS_DIRECTORY = 1
+_UNIXFS_FILE = 2
+
+# (block sha256, cumulative DAG size, file bytes below the node)
+_Node = Tuple[bytes, int, int]
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _field(number: int, value: bytes) -> bytes:
+    """Length-delimited protobuf field"""
+    return _varint(number << 3 | 2) + _varint(len(value)) + value
+
+
+def _uint_field(number: int, value: int) -> bytes:
+    """Varint protobuf field"""
+    return _varint(number << 3) + _varint(value)
+
+
+def _multihash(digest: bytes) -> bytes:
+    return b"\x12\x20" + digest  # sha2-256, 32 bytes
+
+
+def _base58(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = _BASE58_ALPHABET[remainder] + encoded
+    padding = len(data) - len(data.lstrip(b"\0"))
+    return "1" * padding + encoded
+
+
+def _block(data: bytes, links: List[_Node] = (), names: Sequence[str] = ()) -> Tuple[bytes, int]:
+    """Serialize a dag-pb node (links first, then data); returns (sha256, size)"""
+    names = names or [""] * len(links)
+    encoded = b"".join(
+        _field(2, _field(1, _multihash(digest)) + _field(2, name.encode()) + _uint_field(3, tsize))
+        for (digest, tsize, _), name in zip(links, names)
+    ) + _field(1, data)
+    return hashlib.sha256(encoded).digest(), len(encoded)
+
+
+def _leaf(chunk: bytes) -> _Node:
+    unixfs = _uint_field(1, _UNIXFS_FILE)
+    if chunk:
+        unixfs += _field(2, chunk)
+    unixfs += _uint_field(3, len(chunk))
+    digest, size = _block(unixfs)
+    return digest, size, len(chunk)
+
+
+def _parent(children: List[_Node]) -> _Node:
+    filesize = sum(child[2] for child in children)
+    unixfs = _uint_field(1, _UNIXFS_FILE) + _uint_field(3, filesize)
+    unixfs += b"".join(_uint_field(4, child[2]) for child in children)
+    digest, size = _block(unixfs, children)
+    return digest, size + sum(child[1] for child in children), filesize
+
+
+class UnixFSHasher:
+    """
+    Incremental CIDv0 + sha256 of a file's bytes.
+
+    Usage:
+        hasher = UnixFSHasher()
+        for chunk in chunks:
+            hasher.update(chunk)
+        hasher.cid, hasher.sha256, hasher.size
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._leaves: List[_Node] = []
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+
+    def update(self, data: bytes) -> None:
+        self._sha256.update(data)
+        self.size += len(data)
+        self._buffer += data
+        while len(self._buffer) >= CHUNK_SIZE:
+            self._leaves.append(_leaf(bytes(self._buffer[:CHUNK_SIZE])))
+            del self._buffer[:CHUNK_SIZE]
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    def _root(self) -> _Node:
+        leaves = list(self._leaves)
+        if self._buffer or not leaves:
+            leaves.append(_leaf(bytes(self._buffer)))
+        # Group each level into parents of MAX_LINKS until one root is left;
+        # this yields the same tree as the balanced builder filling left to right
+        level = leaves
+        while len(level) > 1:
+            level = [_parent(level[i:i + MAX_LINKS]) for i in range(0, len(level), MAX_LINKS)]
+        return level[0]
+
+    @property
+    def cid(self) -> str:
+        return _base58(_multihash(self._root()[0]))
+
+
+def directory_cid(files: Dict[str, bytes]) -> str:
+    """
+    CIDv0 of a flat UnixFS directory holding files (name -> content).
+
+    Links are sorted by name, as IPFS orders them, so the CID does not
+    depend on the order files were added in.
+    """
+    names = sorted(files)
+    links = []
+    for name in names:
+        hasher = UnixFSHasher()
+        hasher.update(files[name])
+        links.append(hasher._root())
+    digest, _ = _block(_uint_field(1, _UNIXFS_DIRECTORY), links, names)
+    return _base58(_multihash(digest))
+
+
+def file_digest(file: BinaryIO, read_size: int = CHUNK_SIZE) -> Tuple[str, str, int]:
+    """
+    CID, sha256 and size of a file object, read from its current position in chunks.
+
+    Returns:
+        (CIDv0, sha256 hex, size in bytes)
+    """
+    hasher = UnixFSHasher()
+    while chunk := file.read(read_size):
+        hasher.update(chunk)
+    return hasher.cid, hasher.sha256, hasher.size
@@ -0,0 +1,94 @@
+"""
+Circuit Breaker
+
+Stops calling a dependency that keeps failing, so requests fail fast
+instead of each waiting out its own timeouts and retries.
+"""
+
+import time
+from typing import Any, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed: calls go through; failure_threshold failures in a row open it.
+    open: calls are refused until reset_timeout seconds have passed.
+    half_open: one trial call at a time goes through; success closes the
+    breaker, failure opens it for another reset_timeout.
+
+    Callers ask allow() before a call and report record_success() or
+    record_failure() after it. Not thread-safe; meant for one event loop.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets a trial call through (0 unless open)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Whether a call may go through now; counts refusals"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        now = time.monotonic()
+        # A trial that never reported back (e.g. cancelled) is given up on
+        # after reset_timeout so the breaker cannot stick half-open
+        if state == HALF_OPEN and (not self._trial_in_flight or now - self._trial_started_at >= self.reset_timeout):
+            self._trial_in_flight = True
+            self._trial_started_at = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        trial_failed = self._trial_in_flight
+        self._trial_in_flight = False
+        if trial_failed or self._consecutive_failures >= self.failure_threshold:
+            if self._state != OPEN or trial_failed:
+                self.times_opened += 1
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after_seconds": round(self.retry_after(), 1),
+        }
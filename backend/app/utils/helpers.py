@@ -72,3 +72,16 @@ def safe_get(dictionary: Dict[str, Any], *keys, default=None) -> Any:
         else:
             return default
     return current
+
+
+def etherscan_tx_url(tx_hash: str) -> str:
+    """
+    Build the Sepolia Etherscan link for a transaction
+    
+    Args:
+        tx_hash: 0x-prefixed transaction hash
+        
+    Returns:
+        Etherscan transaction URL
+    """
+    return f"https://sepolia.etherscan.io/tx/{tx_hash}"
@@ -0,0 +1,108 @@
+"""
+Keyset Pagination
+
+List endpoints return one page at a time with an opaque cursor for the
+next. Instead of skipping the rows before the page, each page continues
+after the sort key of the last item returned, so with an index on the
+sort keys any page costs the same as the first.
+
+_id is always the last sort key, which makes the order total: items with
+equal sort keys are neither repeated nor skipped across pages. Declare the
+index as (filter fields..., sort keys..., _id). Sort keys should be set on
+every document; items missing one are only reachable in descending order.
+"""
+
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import json_util
+from bson.errors import InvalidBSON
+from fastapi import HTTPException
+
+from app.core.config import settings
+
+Sort = Sequence[Tuple[str, int]]
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Opaque, URL-safe cursor for the sort key values of the last item of a page"""
+    raw = json_util.dumps(values, json_options=json_util.CANONICAL_JSON_OPTIONS).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """
+    Sort key values from a cursor
+
+    Raises:
+        HTTPException: 400 if the cursor was not issued for this sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json_util.loads(raw, json_options=json_util.CANONICAL_JSON_OPTIONS)
+    except (binascii.Error, InvalidBSON, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != length:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def _order(sort: Sort) -> List[Tuple[str, int]]:
+    """The sort with the _id tiebreaker, in the direction of the last key"""
+    order = [(field, direction) for field, direction in sort if field != "_id"]
+    return order + [("_id", order[-1][1] if order else 1)]
+
+
+def _after(order: List[Tuple[str, int]], values: List[Any]) -> Dict[str, Any]:
+    """Filter for the items that sort after values"""
+    clauses = []
+    for i, (field, direction) in enumerate(order):
+        clause = {previous: value for (previous, _), value in zip(order[:i], values[:i])}
+        clause[field] = {"$gt" if direction == 1 else "$lt": values[i]}
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def page_size(limit: Optional[int]) -> int:
+    """The requested limit, defaulted and capped to PAGE_SIZE_MAX"""
+    return max(1, min(limit or settings.PAGE_SIZE_DEFAULT, settings.PAGE_SIZE_MAX))
+
+
+async def paginate(
+    collection,
+    filter: Dict[str, Any],
+    projection: Optional[Dict[str, Any]] = None,
+    *,
+    sort: Sort = (),
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch one page of a collection
+
+    Args:
+        collection: Motor collection
+        filter: Query filter
+        projection: Optional projection; sort fields are always returned
+        sort: (field, direction) pairs; _id is appended as the tiebreaker
+        limit: Page size (see page_size)
+        cursor: next_cursor of the previous page, None for the first
+
+    Returns:
+        The page's documents and the cursor of the next page (None on the last)
+    """
+    order = _order(sort)
+    limit = page_size(limit)
+    if cursor is not None:
+        after = _after(order, decode_cursor(cursor, len(order)))
+        filter = {"$and": [filter, after]} if filter else after
+    if projection is not None and any(projection.values()):
+        projection = {**projection, **{field: 1 for field, _ in order}}
+
+    # One extra document tells whether there is a next page
+    items = await collection.find(filter, projection).sort(order).limit(limit + 1).to_list(length=limit + 1)
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor([items[-1].get(field) for field, _ in order])
@@ -0,0 +1,7 @@
+"""
+Benchmarks
+
+Standalone performance scripts for the backend. Each module is runnable with
+``python -m benchmarks.<name>`` from the backend/ directory and prints its
+results to stdout. None of them need a live Sepolia node.
+"""
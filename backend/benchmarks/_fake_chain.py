@@ -0,0 +1,658 @@
+"""
+In-process fake chain for load testing the blockchain paths.
+
+FakeChain is a JSON-RPC server that executes LandRegistry calls in Python
+against an in-memory state instead of a real EVM. It implements the subset of
+the API the backend uses (fees, nonces, gas estimation, raw transactions,
+receipts, eth_call incl. Multicall3 aggregate3, eth_getLogs) and emits
+LandRegistry and Transfer logs ABI-encoded
+exactly as the compiled contract would, so the tx job worker, the event
+indexer and the land read paths all run unmodified against it.
+
+Transactions wait in a mempool and are mined every ``block_time`` seconds in
+nonce order per sender. Failure injection:
+
+    error_rate   fraction of HTTP requests answered with 503
+    drop_rate    fraction of new transactions accepted but never mined
+    latency      per-request delay (inherited from RpcStub)
+    down         answer everything with 503 (inherited from RpcStub)
+
+Contract semantics follow contracts/src/LandRegistry.sol: property ids are
+unique, each verifier address counts once, the REQUIRED_VERIFICATIONS-th
+verification mints the token, and the batch calls skip (rather than revert
+on) tokens that fail their checks. Gas used is a deterministic function of the
+call so the gas estimate cache behaves as it would on a real chain.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import rlp
+from aiohttp import web
+from eth_abi import encode
+from eth_account import Account
+from eth_account.typed_transactions import TypedTransaction
+from eth_utils import function_signature_to_4byte_selector, get_abi_output_types
+from hexbytes import HexBytes
+from web3 import Web3
+
+from app.core.config import settings
+from app.services.blockchain import _load_abi
+from app.services.chain_metadata import MAX_BATCH_SIZE, REQUIRED_VERIFICATIONS, VERIFIER_ROLE
+from benchmarks._rpc_stub import CHAIN_ID, RpcStub
+
+GWEI = 10 ** 9
+BASE_FEE = 1 * GWEI
+PRIORITY_FEE = 1 * GWEI
+ZERO_ADDRESS = "0x" + "00" * 20
+ERROR_SELECTOR = function_signature_to_4byte_selector("Error(string)")
+
+# LandRegistry.VerificationStatus
+PENDING, VERIFIED, REJECTED = 0, 1, 2
+
+
+class RpcError(Exception):
+    """Answered as a JSON-RPC error object"""
+
+    def __init__(self, message: str, code: int = -32000, data: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class Revert(RpcError):
+    """Contract require() failure, encoded like geth's execution reverted"""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        data = "0x" + (ERROR_SELECTOR + encode(["string"], [reason])).hex()
+        super().__init__(f"execution reverted: {reason}", code=3, data=data)
+
+
+def _hex(value) -> str:
+    """decode_function_input returns bytes args as hex strings; accept either"""
+    return value if isinstance(value, str) else Web3.to_hex(value)
+
+
+def _words(*strings: str) -> int:
+    return sum((len(s.encode()) + 31) // 32 for s in strings)
+
+
+class FakeChain(RpcStub):
+    """A threaded JSON-RPC server backed by an in-memory LandRegistry"""
+
+    def __init__(
+        self,
+        block_time: float = 1.0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        verifiers: Optional[Set[str]] = None,
+        seed: Optional[int] = None,
+        port: int = 0,
+    ):
+        """
+        Args:
+            block_time: Seconds between blocks
+            latency: Seconds added to every RPC request
+            error_rate: Fraction of requests answered with HTTP 503
+            drop_rate: Fraction of new transactions silently dropped
+            verifiers: Addresses holding VERIFIER_ROLE; None grants it to all
+            seed: Seed for the failure injection RNG
+            port: Port to listen on; 0 picks a free one
+        """
+        super().__init__(latency=latency, port=port)
+        self.block_time = block_time
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.verifiers = {Web3.to_checksum_address(a) for a in verifiers} if verifiers is not None else None
+        self._random = random.Random(seed)
+
+        codec = Web3()
+        self.registry = codec.eth.contract(
+            address=Web3.to_checksum_address(settings.LAND_REGISTRY_ADDRESS), abi=_load_abi("LandRegistry.json")
+        )
+        self.verification = Web3.to_checksum_address(settings.LAND_VERIFICATION_ADDRESS)
+        self.multicall = codec.eth.contract(
+            address=Web3.to_checksum_address(settings.MULTICALL3_ADDRESS), abi=_load_abi("Multicall3.json")
+        )
+        self._events = {
+            name: self.registry.events[name]().abi
+            for name in ("LandRegistered", "VerificationRecorded", "LandVerified", "LandRejected",
+                         "BatchItemSkipped", "Transfer")
+        }
+
+        # Contract state
+        self.lands: Dict[int, Dict[str, Any]] = {}
+        self.property_ids: Set[str] = set()
+        self.verification_counts: Dict[int, int] = {}
+        self.has_verified: Set[tuple] = set()
+        self.next_token_id = 0
+
+        # Chain state
+        self.nonces: Dict[str, int] = {}
+        self.mempool: Dict[str, Dict[str, Any]] = {}  # tx_hash -> tx
+        self.transactions: Dict[str, Dict[str, Any]] = {}  # mined tx_hash -> tx
+        self.receipts: Dict[str, Dict[str, Any]] = {}
+        self.logs: List[Dict[str, Any]] = []
+        now = int(time.time())
+        self.blocks: List[Dict[str, Any]] = [self._new_block(0, "0x" + "00" * 32, now - 1, [])]
+
+        self.stats = {"injected_errors": 0, "dropped_txs": 0, "mined_txs": 0, "reverted_txs": 0}
+
+    # -------------------------------------------------------------- server
+
+    def start(self) -> "FakeChain":
+        super().start()
+        self._miner = asyncio.run_coroutine_threadsafe(self._mine_forever(), self._loop)
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._miner.cancel()
+        super().stop()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.stats["injected_errors"] += 1
+            return web.Response(status=503, text="injected failure")
+        return await super()._handle(request)
+
+    def _dispatch(self, req: dict) -> dict:
+        method, params = req["method"], req.get("params") or []
+        try:
+            return {"jsonrpc": "2.0", "id": req["id"], "result": self._result(method, params)}
+        except RpcError as e:
+            error = {"code": e.code, "message": str(e)}
+            if e.data is not None:
+                error["data"] = e.data
+            return {"jsonrpc": "2.0", "id": req["id"], "error": error}
+
+    def _result(self, method: str, params: list):
+        handler = getattr(self, "_rpc_" + method, None)
+        if handler is None:
+            raise RpcError(f"the method {method} does not exist/is not available", code=-32601)
+        return handler(*params)
+
+    # -------------------------------------------------------------- mining
+
+    async def _mine_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.block_time)
+            try:
+                self.mine()
+            except Exception as e:
+                print(f"FakeChain: mining block failed: {e!r}")
+
+    def _new_block(self, number: int, parent_hash: str, timestamp: int, tx_hashes: List[str]) -> Dict[str, Any]:
+        block_hash = Web3.to_hex(Web3.keccak(text=f"{number}:{parent_hash}:{timestamp}:{','.join(tx_hashes)}"))
+        return {
+            "number": number,
+            "hash": block_hash,
+            "parentHash": parent_hash,
+            "timestamp": timestamp,
+            "transactions": tx_hashes,
+        }
+
+    def mine(self) -> Dict[str, Any]:
+        """Mine one block with every executable mempool transaction"""
+        parent = self.blocks[-1]
+        timestamp = max(int(time.time()), parent["timestamp"] + 1)
+        ordered = sorted(self.mempool.values(), key=lambda tx: (tx["from"], tx["nonce"]))
+        included = []
+        for tx in ordered:
+            if tx["nonce"] == self.nonces.get(tx["from"], 0):
+                included.append(tx)
+                self.nonces[tx["from"]] = tx["nonce"] + 1
+            elif tx["nonce"] < self.nonces.get(tx["from"], 0):
+                # Its nonce was taken by another tx; geth evicts it
+                del self.mempool[tx["hash"]]
+
+        block = self._new_block(parent["number"] + 1, parent["hash"], timestamp, [tx["hash"] for tx in included])
+        self.blocks.append(block)
+        cumulative_gas = 0
+        log_index = 0
+        for index, tx in enumerate(included):
+            del self.mempool[tx["hash"]]
+            try:
+                gas_used, logs = self._execute(tx["from"], tx["to"], tx["data"], timestamp)
+                status = 1
+            except Revert:
+                gas_used, logs, status = 30_000, [], 0
+                self.stats["reverted_txs"] += 1
+            cumulative_gas += gas_used
+            for log in logs:
+                log.update({
+                    "blockNumber": block["number"],
+                    "blockHash": block["hash"],
+                    "transactionHash": tx["hash"],
+                    "transactionIndex": index,
+                    "logIndex": log_index,
+                    "removed": False,
+                })
+                log_index += 1
+            self.logs.extend(logs)
+            tx.update({"blockNumber": block["number"], "blockHash": block["hash"], "transactionIndex": index})
+            self.transactions[tx["hash"]] = tx
+            self.receipts[tx["hash"]] = {
+                "transactionHash": tx["hash"],
+                "transactionIndex": hex(index),
+                "blockHash": block["hash"],
+                "blockNumber": hex(block["number"]),
+                "from": tx["from"],
+                "to": tx["to"],
+                "contractAddress": None,
+                "cumulativeGasUsed": hex(cumulative_gas),
+                "gasUsed": hex(gas_used),
+                "effectiveGasPrice": hex(min(tx["max_fee"], BASE_FEE + tx["priority_fee"])),
+                "logs": [self._format_log(log) for log in logs],
+                "logsBloom": "0x" + "00" * 256,
+                "status": hex(status),
+                "type": hex(tx["type"]),
+            }
+            self.stats["mined_txs"] += 1
+        return block
+
+    # ----------------------------------------------------------- contract
+
+    def _execute(self, sender: str, to: Optional[str], data: str, timestamp: int, dry_run: bool = False):
+        """
+        Run a LandRegistry transaction.
+
+        Returns:
+            (gas used, list of raw logs); raises Revert on require() failure
+        """
+        if to is None or Web3.to_checksum_address(to) != self.registry.address:
+            return 21_000, []
+        fn, args = self.registry.decode_function_input(data)
+        name = fn.fn_name
+
+        if name == "registerLand":
+            property_id, ipfs_hash, area, price, location = (
+                args["propertyId"], args["ipfsHash"], args["area"], args["price"], args["location"]
+            )
+            if len(property_id.encode()) != 14:
+                raise Revert("Property ID must be exactly 14 characters")
+            if property_id in self.property_ids:
+                raise Revert("Property ID is already registered")
+            if not ipfs_hash:
+                raise Revert("IPFS hash cannot be empty")
+            if area <= 0:
+                raise Revert("Area must be greater than 0")
+            gas = 160_000 + 22_000 * _words(property_id, ipfs_hash, location)
+            if dry_run:
+                return gas, []
+            token_id = self.next_token_id
+            self.next_token_id += 1
+            self.property_ids.add(property_id)
+            self.lands[token_id] = {
+                "propertyId": property_id,
+                "ipfsHash": ipfs_hash,
+                "area": area,
+                "price": price,
+                "location": location,
+                "currentOwner": sender,
+                "status": PENDING,
+                "registeredAt": timestamp,
+                "verifiedAt": 0,
+                "verifiedBy": ZERO_ADDRESS,
+            }
+            return gas, [self._log("LandRegistered", tokenId=token_id, owner=sender, propertyId=property_id,
+                                   ipfsHash=ipfs_hash, area=area, price=price)]
+
+        if name == "verifyLand":
+            self._require_verifier(sender)
+            verifier = Web3.to_checksum_address(args["verifierAddress"])
+            gas, logs = self._verify(args["tokenId"], verifier, timestamp, dry_run)
+            return 21_000 + gas, logs
+
+        if name == "rejectLand":
+            self._require_verifier(sender)
+            gas, logs = self._reject(args["tokenId"], sender, args["reason"], dry_run)
+            return 21_000 + gas + 14_000 * _words(args["reason"]), logs
+
+        if name in ("verifyLandBatch", "rejectLandBatch"):
+            self._require_verifier(sender)
+            token_ids = args["tokenIds"]
+            if not 0 < len(token_ids) <= MAX_BATCH_SIZE:
+                raise Revert("Invalid batch size")
+            gas, logs = 26_000, []
+            if name == "rejectLandBatch":
+                gas += 14_000 * _words(args["reason"])
+            for token_id in token_ids:
+                try:
+                    if name == "verifyLandBatch":
+                        verifier = Web3.to_checksum_address(args["verifierAddress"])
+                        item_gas, item_logs = self._verify(token_id, verifier, timestamp, dry_run)
+                    else:
+                        item_gas, item_logs = self._reject(token_id, sender, args["reason"], dry_run)
+                except Revert as e:
+                    item_gas, item_logs = 6_000, [self._log("BatchItemSkipped", tokenId=token_id, reason=e.reason)]
+                gas += item_gas
+                logs += item_logs
+            return gas, ([] if dry_run else logs)
+
+        raise Revert(f"{name} is not supported by the fake chain")
+
+    def _pending_land(self, token_id: int) -> Dict[str, Any]:
+        land = self.lands.get(token_id)
+        if land is None:
+            raise Revert("Land does not exist")
+        if land["status"] != PENDING:
+            raise Revert("Land is not pending verification")
+        return land
+
+    def _verify(self, token_id: int, verifier: str, timestamp: int, dry_run: bool):
+        """One verification, as LandRegistry._recordVerification; gas excludes the tx base cost"""
+        land = self._pending_land(token_id)
+        if (token_id, verifier) in self.has_verified:
+            raise Revert("You have already verified this land")
+        count = self.verification_counts.get(token_id, 0) + 1
+        mints = count == REQUIRED_VERIFICATIONS
+        gas = 174_000 if mints else 51_000
+        if dry_run:
+            return gas, []
+        self.has_verified.add((token_id, verifier))
+        self.verification_counts[token_id] = count
+        land["verifiedBy"] = verifier
+        logs = [self._log("VerificationRecorded", tokenId=token_id, verifier=verifier, verificationCount=count)]
+        if mints:
+            land.update({"status": VERIFIED, "verifiedAt": timestamp})
+            logs += [
+                self._log("Transfer", **{"from": ZERO_ADDRESS, "to": land["currentOwner"], "tokenId": token_id}),
+                self._log("LandVerified", tokenId=token_id, verifier=verifier, timestamp=timestamp),
+            ]
+        return gas, logs
+
+    def _reject(self, token_id: int, sender: str, reason: str, dry_run: bool):
+        """One rejection; gas excludes the tx base cost and the reason's calldata"""
+        land = self._pending_land(token_id)
+        if dry_run:
+            return 17_000, []
+        land["status"] = REJECTED
+        return 17_000, [self._log("LandRejected", tokenId=token_id, verifier=sender, reason=reason)]
+
+    def _require_verifier(self, sender: str) -> None:
+        if self.verifiers is not None and sender not in self.verifiers:
+            role = Web3.to_hex(VERIFIER_ROLE)
+            raise Revert(f"AccessControl: account {sender.lower()} is missing role {role}")
+
+    def _call(self, to: str, data: str) -> bytes:
+        """Run a view function and return its ABI-encoded result"""
+        to = Web3.to_checksum_address(to)
+        if to == self.multicall.address:
+            return self._aggregate3(data)
+        if to != self.registry.address:
+            return b""
+        fn, args = self.registry.decode_function_input(data)
+        output_types = get_abi_output_types(fn.abi)
+        name = fn.fn_name
+        if name == "getLandDetails":
+            land = self.lands.get(args["tokenId"])
+            if land is None:
+                raise Revert("Land does not exist")
+            keys = ("propertyId", "ipfsHash", "area", "price", "location", "currentOwner",
+                    "status", "registeredAt", "verifiedAt", "verifiedBy")
+            return encode(output_types, [tuple(land[key] for key in keys)])
+        if name == "getVerificationCount":
+            return encode(output_types, [self.verification_counts.get(args["tokenId"], 0)])
+        if name == "getTotalLands":
+            return encode(output_types, [self.next_token_id])
+        if name == "REQUIRED_VERIFICATIONS":
+            return encode(output_types, [REQUIRED_VERIFICATIONS])
+        if name == "hasRole":
+            account = Web3.to_checksum_address(args["account"])
+            granted = self.verifiers is None or account in self.verifiers
+            return encode(output_types, [granted and _hex(args["role"]) == Web3.to_hex(VERIFIER_ROLE)])
+        raise Revert(f"{name} is not supported by the fake chain")
+
+    def _aggregate3(self, data: str) -> bytes:
+        fn, args = self.multicall.decode_function_input(data)
+        results = []
+        for call in args["calls"]:
+            if isinstance(call, dict):
+                call = (call["target"], call["allowFailure"], call["callData"])
+            target, allow_failure, call_data = call
+            try:
+                results.append((True, self._call(target, _hex(call_data))))
+            except Revert as e:
+                if not allow_failure:
+                    raise
+                results.append((False, Web3.to_bytes(hexstr=e.data)))
+        return encode(get_abi_output_types(fn.abi), [results])
+
+    def _log(self, event: str, **values) -> Dict[str, Any]:
+        abi = self._events[event]
+        topics = [self.registry.events[event]().topic]
+        data_types, data_values = [], []
+        for param in abi["inputs"]:
+            if param["indexed"]:
+                topics.append(Web3.to_hex(encode([param["type"]], [values[param["name"]]])))
+            else:
+                data_types.append(param["type"])
+                data_values.append(values[param["name"]])
+        return {
+            "address": self.registry.address,
+            "topics": topics,
+            "data": Web3.to_hex(encode(data_types, data_values)),
+        }
+
+    @staticmethod
+    def _format_log(log: Dict[str, Any]) -> Dict[str, Any]:
+        formatted = dict(log)
+        for key in ("blockNumber", "transactionIndex", "logIndex"):
+            formatted[key] = hex(log[key])
+        return formatted
+
+    # ---------------------------------------------------------- json-rpc
+
+    def _block_at(self, tag) -> Optional[Dict[str, Any]]:
+        if tag in ("latest", "pending", "safe", "finalized"):
+            return self.blocks[-1]
+        if tag == "earliest":
+            return self.blocks[0]
+        number = int(tag, 16)
+        return self.blocks[number] if number < len(self.blocks) else None
+
+    def _format_block(self, block: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "number": hex(block["number"]),
+            "hash": block["hash"],
+            "parentHash": block["parentHash"],
+            "timestamp": hex(block["timestamp"]),
+            "baseFeePerGas": hex(BASE_FEE),
+            "gasLimit": hex(30_000_000),
+            "gasUsed": "0x0",
+            "miner": ZERO_ADDRESS,
+            "difficulty": "0x0",
+            "extraData": "0x",
+            "logsBloom": "0x" + "00" * 256,
+            "nonce": "0x0000000000000000",
+            "sha3Uncles": "0x" + "00" * 32,
+            "stateRoot": "0x" + "00" * 32,
+            "receiptsRoot": "0x" + "00" * 32,
+            "transactionsRoot": "0x" + "00" * 32,
+            "size": "0x0",
+            "transactions": block["transactions"],
+            "uncles": [],
+        }
+
+    def _format_tx(self, tx: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "hash": tx["hash"],
+            "nonce": hex(tx["nonce"]),
+            "from": tx["from"],
+            "to": tx["to"],
+            "input": tx["data"],
+            "value": "0x0",
+            "gas": hex(tx["gas"]),
+            "gasPrice": hex(tx["max_fee"]),
+            "maxFeePerGas": hex(tx["max_fee"]),
+            "maxPriorityFeePerGas": hex(tx["priority_fee"]),
+            "type": hex(tx["type"]),
+            "chainId": hex(CHAIN_ID),
+            "blockNumber": hex(tx["blockNumber"]) if "blockNumber" in tx else None,
+            "blockHash": tx.get("blockHash"),
+            "transactionIndex": hex(tx["transactionIndex"]) if "transactionIndex" in tx else None,
+            "v": "0x0",
+            "r": "0x0",
+            "s": "0x0",
+        }
+
+    def _rpc_eth_chainId(self):
+        return hex(CHAIN_ID)
+
+    def _rpc_net_version(self):
+        return str(CHAIN_ID)
+
+    def _rpc_eth_blockNumber(self):
+        return hex(self.blocks[-1]["number"])
+
+    def _rpc_eth_getBlockByNumber(self, tag, full=False):
+        block = self._block_at(tag)
+        return self._format_block(block) if block else None
+
+    def _rpc_eth_getBlockByHash(self, block_hash, full=False):
+        block = next((b for b in reversed(self.blocks) if b["hash"] == block_hash), None)
+        return self._format_block(block) if block else None
+
+    def _rpc_eth_maxPriorityFeePerGas(self):
+        return hex(PRIORITY_FEE)
+
+    def _rpc_eth_gasPrice(self):
+        return hex(BASE_FEE + PRIORITY_FEE)
+
+    def _rpc_eth_getCode(self, address, tag="latest"):
+        address = Web3.to_checksum_address(address)
+        deployed = (self.registry.address, self.verification, self.multicall.address)
+        return "0x6080" if address in deployed else "0x"
+
+    def _rpc_eth_getTransactionCount(self, address, tag="latest"):
+        address = Web3.to_checksum_address(address)
+        nonce = self.nonces.get(address, 0)
+        if tag == "pending":
+            queued = {tx["nonce"] for tx in self.mempool.values() if tx["from"] == address}
+            while nonce in queued:
+                nonce += 1
+        return hex(nonce)
+
+    def _rpc_eth_call(self, call, tag="latest"):
+        data = call.get("data") or call.get("input") or "0x"
+        if call.get("to") and Web3.to_checksum_address(call["to"]) == self.registry.address:
+            fn, _ = self.registry.decode_function_input(data)
+            if fn.abi.get("stateMutability") not in ("view", "pure"):
+                # Simulating a transaction: run it without keeping the changes
+                sender = Web3.to_checksum_address(call.get("from") or ZERO_ADDRESS)
+                self._execute(sender, call["to"], data, self.blocks[-1]["timestamp"], dry_run=True)
+                return "0x"
+        return Web3.to_hex(self._call(call["to"], data))
+
+    def _rpc_eth_estimateGas(self, call, tag="latest"):
+        sender = Web3.to_checksum_address(call.get("from") or ZERO_ADDRESS)
+        data = call.get("data") or call.get("input") or "0x"
+        gas, _ = self._execute(sender, call.get("to"), data, self.blocks[-1]["timestamp"], dry_run=True)
+        return hex(int(gas * 1.05))
+
+    def _rpc_eth_sendRawTransaction(self, raw):
+        tx = self._decode_raw(raw)
+        known = self.mempool.get(tx["hash"]) or self.transactions.get(tx["hash"])
+        if known is not None:
+            if tx["hash"] in self.transactions:
+                raise RpcError("nonce too low")
+            raise RpcError("already known")
+        if tx["chain_id"] not in (None, CHAIN_ID):
+            raise RpcError("invalid chain id for signer")
+        if tx["nonce"] < self.nonces.get(tx["from"], 0):
+            raise RpcError(f"nonce too low: next nonce {self.nonces.get(tx['from'], 0)}, tx nonce {tx['nonce']}")
+
+        for pending in list(self.mempool.values()):
+            if pending["from"] == tx["from"] and pending["nonce"] == tx["nonce"]:
+                if tx["max_fee"] < pending["max_fee"] * 1.1 or tx["priority_fee"] < pending["priority_fee"] * 1.1:
+                    raise RpcError("replacement transaction underpriced")
+                del self.mempool[pending["hash"]]
+
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            # Accepted by this node, lost before reaching a miner
+            self.stats["dropped_txs"] += 1
+            return tx["hash"]
+        self.mempool[tx["hash"]] = tx
+        return tx["hash"]
+
+    def _rpc_eth_getTransactionByHash(self, tx_hash):
+        tx = self.mempool.get(tx_hash) or self.transactions.get(tx_hash)
+        return self._format_tx(tx) if tx else None
+
+    def _rpc_eth_getTransactionReceipt(self, tx_hash):
+        return self.receipts.get(tx_hash)
+
+    def _rpc_eth_getLogs(self, criteria):
+        head = self.blocks[-1]["number"]
+        start = self._block_at(criteria.get("fromBlock", "latest"))["number"]
+        end_block = self._block_at(criteria.get("toBlock", "latest"))
+        end = end_block["number"] if end_block else head
+        addresses = criteria.get("address")
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        addresses = {Web3.to_checksum_address(a) for a in addresses} if addresses else None
+        topic_filters = criteria.get("topics") or []
+
+        matched = []
+        for log in self.logs:
+            if not start <= log["blockNumber"] <= end:
+                continue
+            if addresses is not None and log["address"] not in addresses:
+                continue
+            if not self._topics_match(log["topics"], topic_filters):
+                continue
+            matched.append(self._format_log(log))
+        return matched
+
+    @staticmethod
+    def _topics_match(topics: List[str], filters: list) -> bool:
+        for position, wanted in enumerate(filters):
+            if wanted is None:
+                continue
+            options = wanted if isinstance(wanted, list) else [wanted]
+            if position >= len(topics) or topics[position].lower() not in [o.lower() for o in options]:
+                return False
+        return True
+
+    @staticmethod
+    def _decode_raw(raw: str) -> Dict[str, Any]:
+        data = Web3.to_bytes(hexstr=raw)
+        sender = Account.recover_transaction(data)
+        if data[0] <= 0x7f:
+            fields = TypedTransaction.from_bytes(HexBytes(data)).as_dict()
+            tx = {
+                "type": fields["type"],
+                "chain_id": fields["chainId"],
+                "nonce": fields["nonce"],
+                "to": fields["to"],
+                "data": fields["data"],
+                "gas": fields["gas"],
+                "max_fee": fields.get("maxFeePerGas", fields.get("gasPrice")),
+                "priority_fee": fields.get("maxPriorityFeePerGas", fields.get("gasPrice")),
+            }
+        else:
+            nonce, gas_price, gas, to, value, payload, v, r, s = rlp.decode(data)
+            v = int.from_bytes(v, "big")
+            price = int.from_bytes(gas_price, "big")
+            tx = {
+                "type": 0,
+                "chain_id": (v - 35) // 2 if v >= 35 else None,
+                "nonce": int.from_bytes(nonce, "big"),
+                "to": to,
+                "data": payload,
+                "gas": int.from_bytes(gas, "big"),
+                "max_fee": price,
+                "priority_fee": price,
+            }
+        tx.update({
+            "hash": Web3.to_hex(Web3.keccak(data)),
+            "from": sender,
+            "to": Web3.to_checksum_address(tx["to"]) if tx["to"] else None,
+            "data": Web3.to_hex(tx["data"]),
+        })
+        return tx
@@ -0,0 +1,63 @@
+"""
+Minimal Kubo RPC API stand-in used by the benchmarks.
+
+Implements the calls KuboStore makes: POST /api/v0/add (multipart, returns
+{"Name", "Hash", "Size"} with the CIDv0, or the wrapping directory's with
+wrap-with-directory), POST /api/v0/cat?arg=<cid> and
+POST /api/v0/pin/rm?arg=<cid>, answering command errors with 500 the way
+Kubo does. Shares PinataStub's threading, latency and fault injection, and
+always keeps uploaded content so cat can serve it.
+"""
+
+from aiohttp import web
+
+from benchmarks._pinata_stub import PinataStub
+
+
+class KuboStub(PinataStub):
+    """A threaded aiohttp server implementing add, cat and pin/rm."""
+
+    def __init__(self, latency: float = 0.0, **kwargs):
+        kwargs["keep_content"] = True
+        super().__init__(latency=latency, **kwargs)
+
+    def _routes(self, app: web.Application) -> None:
+        app.router.add_post("/api/v0/add", self._add)
+        app.router.add_post("/api/v0/cat", self._cat)
+        app.router.add_post("/api/v0/pin/rm", self._pin_rm)
+
+    @staticmethod
+    def _error(message: str) -> web.Response:
+        return web.json_response({"Message": message, "Code": 0, "Type": "error"}, status=500)
+
+    async def _add(self, request: web.Request) -> web.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if request.query.get("cid-version", "0") != "0":
+                return self._error("stub only produces CIDv0")
+            wrap = request.query.get("wrap-with-directory") == "true"
+            cid, size = await self._receive(request, wrap=wrap)
+            failure = self._failure()
+            if failure is not None:
+                return failure
+            return web.json_response({"Name": "" if wrap else cid, "Hash": cid, "Size": str(size)})
+        finally:
+            self.in_flight -= 1
+
+    async def _cat(self, request: web.Request) -> web.StreamResponse:
+        failure = self._failure()
+        if failure is not None:
+            return failure
+        if request.query.get("arg") not in self.pins:
+            return self._error("block was not found locally (offline)")
+        return self._content(request.query["arg"])
+
+    async def _pin_rm(self, request: web.Request) -> web.Response:
+        failure = self._failure()
+        if failure is not None:
+            return failure
+        if self.pins.pop(request.query.get("arg"), None) is None:
+            return self._error("not pinned or pinned indirectly")
+        self.unpins += 1
+        return web.json_response({"Pins": [request.query["arg"]]})
@@ -0,0 +1,193 @@
+"""
+Minimal Pinata API stand-in used by the benchmarks.
+
+Answers POST /pinning/pinFileToIPFS after reading the multipart body in
+chunks, so clients that stream and clients that buffer are measured the same
+way, and DELETE /pinning/unpin/{cid}. The returned "IpfsHash" is the file's
+CIDv0, computed as Pinata would; for a folder upload (files named
+folder/name) it is the folder's. With ``keep_content`` the uploaded bytes
+are kept in a temporary directory and served back by the gateway route
+GET /ipfs/{cid}, after ``gateway_latency`` seconds (a public gateway's time
+to first byte).
+
+Every upload is held for ``latency`` seconds on top of receiving its body,
+to mimic Pinata's own processing. ``error_rate`` of requests are answered
+with ``error_status`` (429 with a Retry-After, or a 5xx) instead;
+``latency``, ``error_rate`` and ``down`` can be changed while it runs. Like
+RpcStub it runs on its own thread and event loop so that blocking callers
+cannot stall it.
+"""
+
+import asyncio
+import os
+import random
+import shutil
+import tempfile
+import threading
+from typing import Optional, Tuple
+
+from aiohttp import web
+
+from app.utils.cid import UnixFSHasher, directory_cid
+
+
+class PinataStub:
+    """A threaded aiohttp server implementing pinFileToIPFS, unpin and the gateway."""
+
+    def __init__(self, latency: float = 0.3, port: int = 0, error_rate: float = 0.0,
+                 error_status: int = 503, seed: int = 0, keep_content: bool = False,
+                 gateway_latency: float = 0.0):
+        self.latency = latency
+        self.gateway_latency = gateway_latency
+        self.port = port  # 0 picks a free port
+        self.down = False  # Answer every request with HTTP 503
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self.uploads = 0
+        self.bytes_received = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.pins = {}  # CID -> size of everything currently pinned
+        self.unpins = 0
+        self.directory_uploads = 0
+        self.gateway_requests = 0
+        self.url = None
+        self._content_dir = tempfile.mkdtemp(prefix="pinata-stub-") if keep_content else None
+        self._loop = None
+        self._runner = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    def start(self) -> "PinataStub":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._content_dir is not None:
+            shutil.rmtree(self._content_dir, ignore_errors=True)
+
+    def _routes(self, app: web.Application) -> None:
+        app.router.add_post("/pinning/pinFileToIPFS", self._pin_file)
+        app.router.add_delete("/pinning/unpin/{cid}", self._unpin)
+        app.router.add_get("/ipfs/{cid}", self._gateway)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        app = web.Application(client_max_size=1024 ** 3)
+        self._routes(app)
+        self._runner = web.AppRunner(app, access_log=None)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", self.port)
+        self._loop.run_until_complete(site.start())
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        self._ready.set()
+        self._loop.run_forever()
+
+    def _failure(self) -> Optional[web.Response]:
+        """The injected error response for this request, if any"""
+        if self.down:
+            return web.Response(status=503, text="pinata unavailable")
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.errors += 1
+            headers = {"Retry-After": "1"} if self.error_status == 429 else None
+            return web.json_response({"error": "injected"}, status=self.error_status, headers=headers)
+        return None
+
+    async def _receive(self, request: web.Request, wrap: bool = False) -> Tuple[str, int]:
+        """
+        Read the multipart "file" part in chunks; returns (CID, size).
+
+        Parts named folder/name, or every part with ``wrap``, are small files
+        pinned together as one directory, whose CID is returned.
+        """
+        hasher = UnixFSHasher()
+        directory = {}
+        out = None
+        if self._content_dir is not None:
+            fd, tmp_path = tempfile.mkstemp(dir=self._content_dir)
+            out = os.fdopen(fd, "wb")
+        try:
+            reader = await request.multipart()
+            async for part in reader:
+                if part.name != "file":
+                    continue
+                if wrap or "/" in (part.filename or ""):
+                    directory[part.filename.rsplit("/", 1)[-1]] = bytes(await part.read())
+                    continue
+                while chunk := await part.read_chunk(2 ** 16):
+                    hasher.update(chunk)
+                    if out is not None:
+                        out.write(chunk)
+        finally:
+            if out is not None:
+                out.close()
+        if directory:
+            if out is not None:
+                os.unlink(tmp_path)
+            cid, size = directory_cid(directory), sum(len(content) for content in directory.values())
+            self.uploads += 1
+            self.directory_uploads += 1
+            self.bytes_received += size
+            self.pins[cid] = size
+            return cid, size
+        cid = hasher.cid
+        if out is not None:
+            os.replace(tmp_path, os.path.join(self._content_dir, cid))
+        self.uploads += 1
+        self.bytes_received += hasher.size
+        self.pins[cid] = hasher.size
+        return cid, hasher.size
+
+    def _content(self, cid: str) -> web.StreamResponse:
+        if self._content_dir is None or cid not in self.pins:
+            return web.json_response({"error": "not found"}, status=404)
+        return web.FileResponse(os.path.join(self._content_dir, cid))
+
+    async def _pin_file(self, request: web.Request) -> web.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.down:
+                return web.Response(status=503, text="pinata unavailable")
+            if "pinata_api_key" not in request.headers:
+                return web.json_response({"error": "missing api key"}, status=401)
+
+            cid, size = await self._receive(request)
+            await asyncio.sleep(self.latency)
+            # Fail after taking the whole body, as a gateway timing out would
+            failure = self._failure()
+            if failure is not None:
+                return failure
+            return web.json_response({
+                "IpfsHash": cid,
+                "PinSize": size,
+                "Timestamp": "1970-01-01T00:00:00.000Z",
+            })
+        finally:
+            self.in_flight -= 1
+
+    async def _unpin(self, request: web.Request) -> web.Response:
+        failure = self._failure()
+        if failure is not None:
+            return failure
+        if self.pins.pop(request.match_info["cid"], None) is None:
+            return web.json_response({"error": "CURRENT_USER_HAS_NOT_PINNED_CID"}, status=404)
+        self.unpins += 1
+        return web.Response(text="OK")
+
+    async def _gateway(self, request: web.Request) -> web.StreamResponse:
+        self.gateway_requests += 1
+        await asyncio.sleep(self.gateway_latency)
+        failure = self._failure()
+        if failure is not None:
+            return failure
+        return self._content(request.match_info["cid"])
@@ -0,0 +1,151 @@
+"""
+Minimal JSON-RPC stand-in used by the benchmarks.
+
+Answers just enough of the Ethereum JSON-RPC API for AsyncBlockchainService to
+estimate, sign, send and wait for a transaction. Every response is delayed
+by a fixed latency to mimic a remote node; ``latency`` and ``down`` can be
+changed while it runs to simulate a slow or failed node. The server runs on its own thread
+and event loop so that blocking (sync Web3) callers cannot stall it.
+"""
+
+import asyncio
+import threading
+import time
+
+from aiohttp import web
+from web3 import Web3
+
+CHAIN_ID = 11155111
+
+
+class RpcStub:
+    """A threaded aiohttp JSON-RPC server with configurable latency."""
+
+    def __init__(self, latency: float = 0.05, blocks_to_mine: int = 3, port: int = 0):
+        self.latency = latency
+        self.port = port  # 0 picks a free port
+        self.down = False  # Answer every request with HTTP 503
+        self.requests = 0
+        self.blocks_to_mine = blocks_to_mine
+        self.url = None
+        self._sent = {}  # tx_hash -> number of receipt polls so far
+        self._mined = {}  # tx_hash -> block it was mined in
+        self._nonce = 0
+        self._loop = None
+        self._runner = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    def start(self) -> "RpcStub":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", self.port)
+        self._loop.run_until_complete(site.start())
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        body = await request.json()
+        await asyncio.sleep(self.latency)
+        if self.down:
+            return web.Response(status=503, text="node unavailable")
+        if isinstance(body, list):
+            return web.json_response([self._dispatch(item) for item in body])
+        return web.json_response(self._dispatch(body))
+
+    def _dispatch(self, req: dict) -> dict:
+        method, params = req["method"], req.get("params") or []
+        result = self._result(method, params)
+        return {"jsonrpc": "2.0", "id": req["id"], "result": result}
+
+    def _result(self, method: str, params: list):
+        if method == "eth_chainId":
+            return hex(CHAIN_ID)
+        if method == "eth_blockNumber":
+            return hex(int(time.time()))
+        if method == "eth_getTransactionCount":
+            return hex(self._nonce)
+        if method == "eth_estimateGas":
+            return hex(180_000)
+        if method in ("eth_maxPriorityFeePerGas", "eth_gasPrice"):
+            return hex(Web3.to_wei(1, "gwei"))
+        if method == "eth_getBlockByNumber":
+            return self._block()
+        if method == "eth_sendRawTransaction":
+            tx_hash = Web3.to_hex(Web3.keccak(hexstr=params[0]))
+            if tx_hash not in self._sent:
+                self._nonce += 1
+                self._sent[tx_hash] = 0
+            return tx_hash
+        if method == "eth_getLogs":
+            return []
+        if method == "eth_getTransactionReceipt":
+            return self._receipt(params[0])
+        return None
+
+    def _block(self) -> dict:
+        number = int(time.time())
+        return {
+            "number": hex(number),
+            "hash": "0x" + f"{number:064x}",
+            "parentHash": "0x" + f"{number - 1:064x}",
+            "timestamp": hex(number),
+            "baseFeePerGas": hex(Web3.to_wei(2, "gwei")),
+            "gasLimit": hex(30_000_000),
+            "gasUsed": "0x0",
+            "miner": "0x" + "00" * 20,
+            "difficulty": "0x0",
+            "extraData": "0x",
+            "logsBloom": "0x" + "00" * 256,
+            "nonce": "0x0000000000000000",
+            "sha3Uncles": "0x" + "00" * 32,
+            "stateRoot": "0x" + "00" * 32,
+            "receiptsRoot": "0x" + "00" * 32,
+            "transactionsRoot": "0x" + "00" * 32,
+            "size": "0x0",
+            "transactions": [],
+            "uncles": [],
+        }
+
+    def _receipt(self, tx_hash: str):
+        polls = self._sent.get(tx_hash)
+        if polls is None:
+            return None
+        self._sent[tx_hash] = polls + 1
+        if polls < self.blocks_to_mine:
+            return None
+        block = self._mined.setdefault(tx_hash, self._block())
+        return {
+            "blockHash": block["hash"],
+            "blockNumber": block["number"],
+            "contractAddress": None,
+            "cumulativeGasUsed": hex(150_000),
+            "effectiveGasPrice": hex(Web3.to_wei(3, "gwei")),
+            "from": "0x" + "00" * 20,
+            "gasUsed": hex(150_000),
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "status": "0x1",
+            "to": "0x" + "00" * 20,
+            "transactionHash": tx_hash,
+            "transactionIndex": "0x0",
+            "type": "0x2",
+        }
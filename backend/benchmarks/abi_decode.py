@@ -0,0 +1,137 @@
+"""
+Benchmark: contract artifact loading and receipt/log decoding.
+
+Compares the previous approach (json.load of the full Foundry output, web3
+Contract event objects, try/except process_log over every receipt log)
+with the slim artifacts from ``python -m app.contracts.build`` and the
+topic0 -> decoder map in app/contracts/artifacts.py.
+
+    python -m benchmarks.abi_decode
+    python -m benchmarks.abi_decode --logs 5000
+
+Reports memory retained after loading both registry contracts, the time to
+find the LandRegistered log in a receipt, and the time to decode a batch
+of mixed event logs as the indexer does.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from app.contracts import artifacts
+from app.contracts.artifacts import CONTRACTS_DIR, load_artifact
+
+REGISTRY = Web3.to_checksum_address("0x3f047c367c1d3876d432196f87dee4d7b3388b64")
+CONTRACTS = ("LandRegistry", "LandVerification")
+
+
+def _load_old():
+    """The previous loader: full Foundry JSON, web3 Contract, event objects"""
+    w3 = Web3()
+    loaded = {}
+    for name in CONTRACTS:
+        with open(CONTRACTS_DIR / f"{name}.json") as f:
+            abi = json.load(f)["abi"]
+        contract = w3.eth.contract(address=REGISTRY, abi=abi)
+        events = {item["name"]: contract.events[item["name"]]() for item in abi if item["type"] == "event"}
+        loaded[name] = (contract, events)
+    return loaded
+
+
+def _load_new():
+    artifacts.load_artifact.cache_clear()
+    return {name: load_artifact(name) for name in CONTRACTS}
+
+
+def _retained(loader) -> tuple:
+    """(retained KiB, peak KiB, seconds) for one call of loader"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = loader()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 1024, peak / 1024, elapsed
+
+
+def _make_log(event_name: str, values: dict) -> dict:
+    decoder = load_artifact("LandRegistry").events[event_name]
+    topics = [HexBytes(decoder.topic)]
+    topics += [HexBytes(encode([abi_type], [values[name]])) for name, abi_type in decoder.indexed]
+    data = encode([t for _, t in decoder.data], [values[name] for name, _ in decoder.data])
+    return {"address": REGISTRY, "topics": topics, "data": HexBytes(data), "logIndex": 0,
+            "transactionHash": HexBytes(b"\x01" * 32), "blockHash": HexBytes(b"\x02" * 32),
+            "blockNumber": 1, "transactionIndex": 0}
+
+
+def _timeit(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logs", type=int, default=2000, help="logs in the indexer decode batch")
+    parser.add_argument("--repeat", type=int, default=2000, help="receipt parses to time")
+    args = parser.parse_args()
+
+    old_mem = _retained(_load_old)
+    new_mem = _retained(_load_new)
+    print(f"{'load':<22} {'retained KiB':>13} {'peak KiB':>10} {'ms':>8}")
+    print(f"{'foundry + web3 events':<22} {old_mem[0]:>13.0f} {old_mem[1]:>10.0f} {old_mem[2] * 1000:>8.1f}")
+    print(f"{'slim artifact':<22} {new_mem[0]:>13.0f} {new_mem[1]:>10.0f} {new_mem[2] * 1000:>8.1f}")
+
+    old = _load_old()
+    contract, events = old["LandRegistry"]
+    registry = load_artifact("LandRegistry")
+    owner = "0x" + "ab" * 20
+
+    # verifyLand's minting receipt carries Transfer then LandVerified; a
+    # registerLand receipt carries LandRegistered. Put it last to show the
+    # cost of failed process_log attempts on the other logs.
+    receipt_logs = [
+        _make_log("Transfer", {"from": "0x" + "00" * 20, "to": owner, "tokenId": 7}),
+        _make_log("LandVerified", {"tokenId": 7, "verifier": owner, "timestamp": 1_700_000_000}),
+        _make_log("LandRegistered", {"tokenId": 7, "owner": owner, "propertyId": "ABCDEFGHIJKLMN",
+                                     "ipfsHash": "Qm" + "x" * 44, "area": 100, "price": 5}),
+    ]
+
+    def old_receipt():
+        for log in receipt_logs:
+            try:
+                return contract.events.LandRegistered().process_log(log)["args"]["tokenId"]
+            except Exception:
+                continue
+
+    def new_receipt():
+        return registry.find_event(receipt_logs, "LandRegistered", address=REGISTRY)["args"]["tokenId"]
+
+    assert old_receipt() == new_receipt() == 7
+    print()
+    print(f"receipt tokenId lookup  old={_timeit(old_receipt, args.repeat):.0f}us "
+          f"new={_timeit(new_receipt, args.repeat):.0f}us")
+
+    batch = [receipt_logs[i % len(receipt_logs)] for i in range(args.logs)]
+    old_by_topic = {Web3.to_hex(HexBytes(e.topic)): e for e in events.values()}
+
+    def old_batch():
+        return [old_by_topic[Web3.to_hex(log["topics"][0])].process_log(log)["args"] for log in batch]
+
+    def new_batch():
+        return [registry.decoder_for(log).decode(log)["args"] for log in batch]
+
+    assert [dict(a) for a in old_batch()] == new_batch()
+    print(f"indexer decode {args.logs} logs  old={_timeit(old_batch, 3) / 1000:.1f}ms "
+          f"new={_timeit(new_batch, 3) / 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
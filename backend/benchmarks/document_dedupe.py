@@ -0,0 +1,148 @@
+"""
+Benchmark: re-submitted registration documents with and without dedupe.
+
+Simulates --registrations registrations of --docs documents each, where a
+--resubmit fraction of them upload the exact documents of an earlier
+registration (a rejected application sent again). Each run stores the
+documents through PinataService.upload_files and records the land's
+references, once with IPFS_DEDUPE_ENABLED off and once on, and reports wall
+time, uploads and bytes sent to Pinata. Afterwards every land is deleted
+(references released) and the orphan sweep is run with no grace period, to
+check that exactly the distinct content is unpinned.
+
+    python -m benchmarks.document_dedupe
+    python -m benchmarks.document_dedupe --registrations 40 --resubmit 0.8 --size-mib 4
+
+Uploads go to the local Pinata stub (benchmarks/_pinata_stub.py), which
+holds each upload for --latency seconds. Needs a MongoDB at MONGO_URL; the
+benchmark uses (and drops) DB_NAME=land_registry_dedupe_bench by default.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+
+def _upload_files(documents: list) -> list:
+    """UploadFiles backed by spooled temp files, as Starlette builds them"""
+    from tempfile import SpooledTemporaryFile
+    from fastapi import UploadFile
+
+    files = []
+    for i, content in enumerate(documents):
+        spooled = SpooledTemporaryFile(max_size=2 ** 20)
+        spooled.write(content)
+        spooled.seek(0)
+        files.append(UploadFile(spooled, size=len(content), filename=f"doc-{i}.pdf",
+                                headers={"content-type": "application/pdf"}))
+    return files
+
+
+def _submissions(args) -> list:
+    """Document contents per registration; re-submissions reuse an earlier set"""
+    rng = random.Random(args.seed)
+    size = int(args.size_mib * 2 ** 20)
+    submissions = []
+    for _ in range(args.registrations):
+        if submissions and rng.random() < args.resubmit:
+            submissions.append(rng.choice(submissions))
+        else:
+            submissions.append([rng.randbytes(size) for _ in range(args.docs)])
+    return submissions
+
+
+async def _run_once(db, stub, submissions: list, dedupe: bool) -> dict:
+    from app.core.config import settings
+    from app.models.ipfs_object import IpfsObjectModel
+    from app.services.pinata_service import pinata_service
+
+    await db[IpfsObjectModel.collection_name].drop()
+    stub.uploads = stub.bytes_received = 0
+    stub.pins.clear()
+    settings.IPFS_DEDUPE_ENABLED = dedupe
+
+    await pinata_service.start(db)
+    try:
+        lands = []
+        start = time.perf_counter()
+        for documents in submissions:
+            cids = await pinata_service.upload_files(_upload_files(documents))
+            await pinata_service.add_references(cids)
+            lands.append(cids)
+        wall = time.perf_counter() - start
+
+        result = {
+            "wall": wall,
+            "uploads": stub.uploads,
+            "mib_sent": stub.bytes_received / 2 ** 20,
+            "distinct": len({cid for cids in lands for cid in cids}),
+        }
+        if dedupe:
+            for cids in lands:
+                await pinata_service.release_references(cids)
+            result["unpinned"] = await pinata_service.unpin_orphans(grace_seconds=0)
+            result["still_pinned"] = len(stub.pins)
+        return result
+    finally:
+        await pinata_service.stop()
+
+
+async def run(args, stub) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from app.core.config import settings
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    db = client[settings.DB_NAME]
+    try:
+        submissions = _submissions(args)
+        results = {
+            "dedupe off": await _run_once(db, stub, submissions, dedupe=False),
+            "dedupe on": await _run_once(db, stub, submissions, dedupe=True),
+        }
+    finally:
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+
+    print(f"registrations={args.registrations} docs={args.docs} size={args.size_mib} MiB "
+          f"resubmit={args.resubmit} latency={args.latency}s")
+    print(f"{'run':<11} {'wall s':>7} {'uploads':>8} {'MiB sent':>9} {'distinct CIDs':>14}")
+    for name, r in results.items():
+        print(f"{name:<11} {r['wall']:>7.2f} {r['uploads']:>8} {r['mib_sent']:>9.1f} {r['distinct']:>14}")
+    on = results["dedupe on"]
+    print(f"after deleting every land: {on['unpinned']} objects unpinned, {on['still_pinned']} left pinned on the stub")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--registrations", type=int, default=20)
+    parser.add_argument("--docs", type=int, default=3, help="documents per registration")
+    parser.add_argument("--size-mib", type=float, default=2.0)
+    parser.add_argument("--resubmit", type=float, default=0.6, help="fraction of registrations re-sending earlier documents")
+    parser.add_argument("--latency", type=float, default=0.3, help="Pinata processing time per upload")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    from benchmarks._pinata_stub import PinataStub
+
+    stub = PinataStub(latency=args.latency).start()
+    # The app reads its settings at import, so point it at the stub first
+    os.environ["PINATA_API_URL"] = stub.url
+    os.environ["PINATA_API_KEY"] = "bench"
+    os.environ["PINATA_SECRET_API_KEY"] = "bench"
+    os.environ["IPFS_ORPHAN_SWEEP_INTERVAL_SECONDS"] = "0"
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_dedupe_bench")
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    try:
+        asyncio.run(run(args, stub))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark: verifiers reviewing documents through GET /documents/{cid}.
+
+Registers --docs documents of --size-mib through PinataService into the
+local Pinata stub, whose gateway waits --gateway-latency seconds before
+answering. --verifiers concurrent reviewers then each read every document:
+
+    gateway      straight from the (stub) IPFS gateway, as the links did before
+    proxy cold   through GET /documents/{cid} with an empty cache; concurrent
+                 requests for one document share a single upstream fetch
+    proxy warm   the same again, now served from the on-disk cache
+    range        --ranges random 64 KiB Range requests against cached documents
+
+and reports wall time, MiB/s delivered and upstream gateway requests per
+phase, plus the cache's counters.
+
+    python -m benchmarks.document_review
+    python -m benchmarks.document_review --verifiers 10 --docs 8 --size-mib 10
+
+Needs a MongoDB at MONGO_URL; the benchmark uses (and drops) its own
+database, DB_NAME=land_registry_review_bench by default. Only the
+documents router is mounted, with the benchmark's database.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+
+def _upload_files(count: int, size: int) -> list:
+    from io import BytesIO
+    from fastapi import UploadFile
+
+    return [
+        UploadFile(BytesIO(os.urandom(size)), size=size, filename=f"deed-{i}.pdf",
+                   headers={"content-type": "application/pdf"})
+        for i in range(count)
+    ]
+
+
+async def _phase(stub, fetch, cids: list, verifiers: int) -> dict:
+    before = stub.gateway_requests
+    started = time.perf_counter()
+    sizes = await asyncio.gather(*(fetch(cid) for _ in range(verifiers) for cid in cids))
+    wall = time.perf_counter() - started
+    return {
+        "wall": wall,
+        "mib_s": sum(sizes) / 2 ** 20 / wall,
+        "upstream": stub.gateway_requests - before,
+    }
+
+
+async def run(args, stub) -> None:
+    import aiohttp
+    import httpx
+    from fastapi import FastAPI
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.api.v1.endpoints import documents
+    from app.core.config import settings
+    from app.db.mongodb import get_database
+    from app.services.document_cache import DocumentCache
+    from app.services.pinata_service import pinata_service
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    db = client[settings.DB_NAME]
+    cache_dir = tempfile.TemporaryDirectory(prefix="document-cache-bench-")
+    cache = DocumentCache(root=cache_dir.name, max_bytes=int(args.cache_mib * 2 ** 20))
+    documents.document_cache = cache
+
+    app = FastAPI()
+    app.include_router(documents.router, prefix="/documents")
+    app.dependency_overrides[get_database] = lambda: db
+
+    await pinata_service.start(db)
+    await cache.start()
+    try:
+        cids = await pinata_service.upload_files(_upload_files(args.docs, int(args.size_mib * 2 ** 20)))
+        sizes = dict(zip(cids, [int(args.size_mib * 2 ** 20)] * len(cids)))
+
+        async with aiohttp.ClientSession() as session, httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        ) as api:
+
+            async def gateway(cid: str) -> int:
+                async with session.get(f"{stub.url}/ipfs/{cid}") as response:
+                    return len(await response.read())
+
+            async def proxy(cid: str) -> int:
+                response = await api.get(f"/documents/{cid}")
+                response.raise_for_status()
+                return len(response.content)
+
+            results = {
+                "gateway": await _phase(stub, gateway, cids, args.verifiers),
+                "proxy cold": await _phase(stub, proxy, cids, args.verifiers),
+                "proxy warm": await _phase(stub, proxy, cids, args.verifiers),
+            }
+
+            rng = random.Random(1)
+            latencies = []
+            for _ in range(args.ranges):
+                cid = rng.choice(cids)
+                start = rng.randrange(0, sizes[cid] - 65536)
+                started = time.perf_counter()
+                response = await api.get(f"/documents/{cid}", headers={"Range": f"bytes={start}-{start + 65535}"})
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 206 and len(response.content) == 65536
+            not_modified = await api.get(f"/documents/{cids[0]}", headers={"If-None-Match": f'"{cids[0]}"'})
+    finally:
+        await pinata_service.stop()
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+        cache_dir.cleanup()
+
+    print(f"verifiers={args.verifiers} docs={args.docs} size={args.size_mib} MiB "
+          f"gateway_latency={args.gateway_latency}s")
+    print(f"{'phase':<11} {'wall s':>7} {'MiB/s':>8} {'upstream requests':>18}")
+    for name, r in results.items():
+        print(f"{name:<11} {r['wall']:>7.2f} {r['mib_s']:>8.1f} {r['upstream']:>18}")
+    print(f"range: {args.ranges} x 64 KiB, p50 {statistics.median(latencies) * 1000:.1f} ms, "
+          f"max {max(latencies) * 1000:.1f} ms; If-None-Match -> {not_modified.status_code}")
+    print(f"cache: {cache.stats()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--verifiers", type=int, default=5)
+    parser.add_argument("--docs", type=int, default=4)
+    parser.add_argument("--size-mib", type=float, default=5.0)
+    parser.add_argument("--gateway-latency", type=float, default=0.5, help="gateway time to first byte")
+    parser.add_argument("--ranges", type=int, default=100)
+    parser.add_argument("--cache-mib", type=float, default=1024.0)
+    args = parser.parse_args()
+
+    from benchmarks._pinata_stub import PinataStub
+
+    stub = PinataStub(latency=0.0, keep_content=True, gateway_latency=args.gateway_latency).start()
+    # The app reads its settings at import, so point it at the stub first
+    os.environ["PINATA_API_URL"] = stub.url
+    os.environ["PINATA_GATEWAY_URL"] = stub.url
+    os.environ["PINATA_API_KEY"] = "bench"
+    os.environ["PINATA_SECRET_API_KEY"] = "bench"
+    os.environ["IPFS_ORPHAN_SWEEP_INTERVAL_SECONDS"] = "0"
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_review_bench")
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    try:
+        asyncio.run(run(args, stub))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
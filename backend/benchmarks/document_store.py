@@ -0,0 +1,167 @@
+"""
+Benchmark: put/get throughput of each DocumentStore for 1 KB - 50 MB documents.
+
+For every store and document size it puts --total-mib worth of distinct
+documents (at least one, at most --max-docs), --concurrency at a time,
+then streams each back with get(), and reports documents/s and MiB/s both
+ways. The first document of every size is re-hashed on the way back and
+must come back with the CID put() returned.
+
+    python -m benchmarks.document_store
+    python -m benchmarks.document_store --stores filesystem,kubo --kubo-url http://127.0.0.1:5001
+    python -m benchmarks.document_store --sizes 1K,1M,50M --concurrency 8
+
+filesystem writes under a temporary directory. pinata and kubo run against
+the local stubs (benchmarks/_pinata_stub.py, benchmarks/_kubo_stub.py),
+which add --latency per upload, unless --kubo-url points at a real Kubo
+node. Against the stubs the numbers are mostly the client's own cost:
+streaming, hashing and HTTP framing.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+UNITS = {"K": 1024, "M": 1024 ** 2}
+
+
+def _parse_size(text: str) -> int:
+    text = text.strip().upper().rstrip("B")
+    if text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+def _label(size: int) -> str:
+    for unit, factor in reversed(UNITS.items()):
+        if size >= factor:
+            return f"{size / factor:g} {unit}iB"
+    return f"{size} B"
+
+
+def _documents(size: int, count: int, directory: str) -> list:
+    """count distinct documents of size bytes, as open temp files"""
+    files = []
+    for _ in range(count):
+        file = tempfile.TemporaryFile(dir=directory)
+        remaining = size
+        while remaining:
+            remaining -= file.write(os.urandom(min(remaining, 2 ** 20)))
+        files.append(file)
+    return files
+
+
+async def _bench_store(store, sizes: list, args, workdir: str) -> list:
+    from app.utils.cid import UnixFSHasher
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    rows = []
+    await store.connect()
+    try:
+        for size in sizes:
+            count = max(1, min(args.max_docs, int(args.total_mib * 2 ** 20) // size))
+            files = _documents(size, count, workdir)
+
+            async def put(file):
+                async with semaphore:
+                    return await store.put(file, "document.pdf", "application/pdf")
+
+            async def get(cid: str, verify: bool) -> str:
+                async with semaphore:
+                    hasher = UnixFSHasher() if verify else None
+                    async for chunk in store.get(cid):
+                        if hasher is not None:
+                            hasher.update(chunk)
+                    return hasher.cid if hasher is not None else cid
+
+            started = time.perf_counter()
+            cids = await asyncio.gather(*(put(file) for file in files))
+            put_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            fetched = await asyncio.gather(*(get(cid, i == 0) for i, cid in enumerate(cids)))
+            get_seconds = time.perf_counter() - started
+            assert fetched == cids, f"{store.name}: content read back does not match its CID"
+
+            for file in files:
+                file.close()
+            for cid in cids:
+                await store.remove(cid)
+            mib = count * size / 2 ** 20
+            rows.append((store.name, size, count, count / put_seconds, mib / put_seconds,
+                         count / get_seconds, mib / get_seconds))
+    finally:
+        await store.close()
+    return rows
+
+
+async def run(args, stores: dict) -> None:
+    sizes = [_parse_size(size) for size in args.sizes.split(",")]
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="document-store-bench-") as workdir:
+        for name, store in stores.items():
+            rows += await _bench_store(store, sizes, args, workdir)
+
+    print(f"concurrency={args.concurrency} total={args.total_mib} MiB per size latency={args.latency}s")
+    print(f"{'store':<11} {'size':>9} {'docs':>5} {'put docs/s':>11} {'put MiB/s':>10} "
+          f"{'get docs/s':>11} {'get MiB/s':>10}")
+    for name, size, count, put_docs, put_mib, get_docs, get_mib in rows:
+        print(f"{name:<11} {_label(size):>9} {count:>5} {put_docs:>11.1f} {put_mib:>10.1f} "
+              f"{get_docs:>11.1f} {get_mib:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stores", default="filesystem,pinata,kubo")
+    parser.add_argument("--sizes", default="1K,64K,1M,10M,50M")
+    parser.add_argument("--total-mib", type=float, default=100.0, help="data per store and size")
+    parser.add_argument("--max-docs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0, help="stub processing time per upload")
+    parser.add_argument("--kubo-url", help="a real Kubo RPC API instead of the stub")
+    args = parser.parse_args()
+
+    from benchmarks._pinata_stub import PinataStub
+    from benchmarks._kubo_stub import KuboStub
+
+    names = [name.strip() for name in args.stores.split(",")]
+    stubs = []
+    if "pinata" in names:
+        pinata = PinataStub(latency=args.latency, keep_content=True).start()
+        stubs.append(pinata)
+        # The app reads its settings at import, so point it at the stub first
+        os.environ["PINATA_API_URL"] = pinata.url
+        os.environ["PINATA_GATEWAY_URL"] = pinata.url
+        os.environ["PINATA_API_KEY"] = "bench"
+        os.environ["PINATA_SECRET_API_KEY"] = "bench"
+    if "kubo" in names:
+        if args.kubo_url:
+            os.environ["KUBO_API_URL"] = args.kubo_url
+        else:
+            kubo = KuboStub(latency=args.latency).start()
+            stubs.append(kubo)
+            os.environ["KUBO_API_URL"] = kubo.url
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("DB_NAME", "land_registry_bench")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+
+    from app.services.document_store import FilesystemStore, create_document_store
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="document-store-") as root:
+            stores = {
+                name: FilesystemStore(root) if name == "filesystem" else create_document_store(name)
+                for name in names
+            }
+            asyncio.run(run(args, stores))
+    finally:
+        for stub in stubs:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: uploading a registration's documents to Pinata.
+
+Compares the previous upload path (blocking requests.post of
+file.file.read(), one document after another, called from the event loop)
+with PinataService.upload_files (pooled aiohttp session, bodies streamed from
+the spooled temp file, documents uploaded concurrently).
+
+    python -m benchmarks.document_upload
+    python -m benchmarks.document_upload --docs 5 --size-mib 16 --latency 0.5
+
+Uploads go to a local Pinata stub (benchmarks/_pinata_stub.py) that holds
+each upload for --latency seconds. Reports wall time, the longest event-loop
+stall seen by a 10 ms ticker while uploading, and the peak memory allocated
+by Python during the upload.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+
+from benchmarks._pinata_stub import PinataStub
+
+
+def _make_files(count: int, size: int) -> list:
+    """UploadFiles backed by spooled temp files, as Starlette builds them"""
+    from tempfile import SpooledTemporaryFile
+    from fastapi import UploadFile
+
+    files = []
+    chunk = os.urandom(2 ** 20)
+    for i in range(count):
+        # Starlette rolls uploads over 1 MiB to disk
+        spooled = SpooledTemporaryFile(max_size=2 ** 20)
+        written = 0
+        while written < size:
+            written += spooled.write(chunk[:size - written])
+        spooled.seek(0)
+        files.append(UploadFile(spooled, size=size, filename=f"deed-{i}.pdf",
+                                headers={"content-type": "application/pdf"}))
+    return files
+
+
+def _upload_blocking(stub_url: str, files: list) -> list:
+    """The previous PinataService.upload_file, once per document"""
+    import requests
+
+    cids = []
+    for file in files:
+        file_content = file.file.read()
+        response = requests.post(
+            f"{stub_url}/pinning/pinFileToIPFS",
+            headers={"pinata_api_key": "bench", "pinata_secret_api_key": "bench"},
+            files={"file": (file.filename, file_content)},
+        )
+        file.file.seek(0)
+        cids.append(response.json()["IpfsHash"])
+    return cids
+
+
+async def _measure(upload) -> dict:
+    """Run upload() next to a 10 ms ticker; wall time, max loop stall, peak memory"""
+    stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal stall
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            stall = max(stall, time.perf_counter() - start - 0.01)
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(0.02)
+    tracemalloc.start()
+    start = time.perf_counter()
+    cids = await upload()
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    done.set()
+    await ticking
+    return {"wall": wall, "stall": stall, "peak_mib": peak / 2 ** 20, "cids": cids}
+
+
+async def run(args, stub: PinataStub) -> None:
+    from app.services.pinata_service import pinata_service
+
+    await pinata_service.connect()
+    try:
+        files = _make_files(args.docs, int(args.size_mib * 2 ** 20))
+
+        async def old():
+            return _upload_blocking(stub.url, files)
+
+        async def new():
+            return await pinata_service.upload_files(files)
+
+        results = {"sequential + blocking": await _measure(old)}
+        stub.max_in_flight = 0
+        results["concurrent + streaming"] = await _measure(new)
+        assert results["sequential + blocking"]["cids"] == results["concurrent + streaming"]["cids"]
+    finally:
+        await pinata_service.close()
+
+    print(f"docs={args.docs} size={args.size_mib} MiB latency={args.latency}s "
+          f"concurrency={os.environ['PINATA_UPLOAD_CONCURRENCY']}")
+    print(f"{'upload path':<24} {'wall s':>7} {'loop stall ms':>14} {'peak MiB':>9}")
+    for name, r in results.items():
+        print(f"{name:<24} {r['wall']:>7.2f} {r['stall'] * 1000:>14.0f} {r['peak_mib']:>9.1f}")
+    print(f"stub: {stub.uploads} uploads, max {stub.max_in_flight} in flight (concurrent run)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=5)
+    parser.add_argument("--size-mib", type=float, default=8.0)
+    parser.add_argument("--latency", type=float, default=0.3, help="Pinata processing time per upload")
+    parser.add_argument("--concurrency", type=int, default=5, help="PINATA_UPLOAD_CONCURRENCY")
+    args = parser.parse_args()
+
+    stub = PinataStub(latency=args.latency).start()
+    # The app reads its settings at import, so point it at the stub first
+    os.environ["PINATA_API_URL"] = stub.url
+    os.environ["PINATA_API_KEY"] = "bench"
+    os.environ["PINATA_SECRET_API_KEY"] = "bench"
+    os.environ["PINATA_UPLOAD_CONCURRENCY"] = str(args.concurrency)
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("DB_NAME", "land_registry_bench")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    try:
+        asyncio.run(run(args, stub))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+Benchmark: end-to-end mint and verify throughput through the FastAPI app.
+
+Runs the app against FakeChain (benchmarks/_fake_chain.py), an in-process
+JSON-RPC chain that executes LandRegistry calls and emits real ABI-encoded
+logs, so no Sepolia ETH is spent and blocks come every --block-time seconds.
+The full startup path runs: tx job workers, nonce manager, gas cache and the
+event indexer.
+
+For N lands it:
+
+    1. POSTs /land/{id}/mint for every land and waits for the jobs to confirm;
+       the token metadata is pinned to the local Pinata stub
+       (benchmarks/_pinata_stub.py), --pin-latency per upload
+    2. runs REQUIRED_VERIFICATIONS rounds of POST /land/{id}/verify, one
+       verifier account per round, the last of which mints the NFTs; with
+       --batch each round is one POST /land/batch/verify instead, sent as
+       verifyLandBatch transactions of VERIFY_BATCH_SIZE lands
+
+and reports per-phase throughput, job latency (enqueue -> confirmed), gas
+per land and failures, plus what the fake chain and the indexer saw.
+
+    python -m benchmarks.e2e_mint_verify --lands 50
+    python -m benchmarks.e2e_mint_verify --lands 50 --batch
+    python -m benchmarks.e2e_mint_verify --lands 50 --error-rate 0.05 --drop-rate 0.1
+
+Needs a MongoDB at MONGO_URL; the benchmark uses (and drops) its own
+database, DB_NAME=land_registry_e2e_bench by default. Land documents are
+inserted directly: the Pinata upload in /land/register is not part of the
+blockchain path being measured.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import time
+from datetime import datetime
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _create_user(db, name: str, role: str, wallet_address=None) -> str:
+    from app.core.security import create_access_token
+
+    now = datetime.utcnow()
+    email = f"{name}@example.com"
+    await db.users.insert_one({
+        "email": email,
+        "username": name,
+        "hashed_password": "!",
+        "full_name": name,
+        "is_active": True,
+        "is_verified": True,
+        "role": role,
+        "wallet_address": wallet_address,
+        "created_at": now,
+        "updated_at": now,
+    })
+    return create_access_token({"sub": email})
+
+
+async def _create_lands(db, count: int, owner_token: str) -> list:
+    from app.core.security import decode_access_token
+    from app.models.land import LandModel
+
+    owner = await db.users.find_one({"email": decode_access_token(owner_token)["sub"]})
+    now = datetime.utcnow()
+    run = int(time.time()) % 10_000
+    docs = [{
+        "property_id": f"B{run:04d}{i:09d}",
+        "owner_id": owner["_id"],
+        "title": f"Benchmark land {i}",
+        "description": "e2e benchmark",
+        "area": 100 + i,
+        "price": 1000,
+        "location": {"lat": 0.0, "lng": 0.0, "address": f"Plot {i}, Benchmark Rd"},
+        "documents": [{"name": "deed.pdf", "ipfs_hash": f"QmBenchmark{i:036d}", "type": "application/pdf"}],
+        "status": "pending",
+        "is_for_sale": False,
+        "blockchain_id": None,
+        "blockchain_status": "not_minted",
+        "token_id": None,
+        "blockchain_tx_hash": None,
+        "verified_at": None,
+        "verified_by": None,
+        "verification_count": 0,
+        "rejection_reason": None,
+        "created_at": now,
+        "updated_at": now,
+    } for i in range(count)]
+    result = await db[LandModel.collection_name].insert_many(docs)
+    return [str(land_id) for land_id in result.inserted_ids]
+
+
+async def _run_phase(client, name: str, requests, poll_interval: float, timeout: float) -> dict:
+    """
+    POST each (path, token, body), then poll the jobs they enqueued until
+    settled. A batch request enqueues several jobs of several lands each.
+
+    Returns:
+        Phase summary: wall time, confirmed/failed counts, latencies, gas
+    """
+    start = time.perf_counter()
+    enqueued_at, lands_in = {}, {}
+    rejected = 0
+
+    async def enqueue(path, token, body):
+        nonlocal rejected
+        response = await client.post(path, json=body, headers={"Authorization": f"Bearer {token}"})
+        if response.status_code != 202:
+            rejected += 1
+            print(f"  {path}: HTTP {response.status_code} {response.text[:120]}")
+            return
+        accepted = response.json()
+        for job in accepted.get("jobs", [accepted]):
+            enqueued_at[job["job_id"]] = time.perf_counter()
+            lands_in[job["job_id"]] = len(job.get("land_ids") or [job["land_id"]])
+
+    await asyncio.gather(*(enqueue(*request) for request in requests))
+
+    latencies, failed, pending = [], [], set(enqueued_at)
+    lands, gas_used = 0, 0
+    token = requests[0][1]
+    deadline = time.perf_counter() + timeout
+    while pending and time.perf_counter() < deadline:
+        await asyncio.sleep(poll_interval)
+        responses = await asyncio.gather(*(
+            client.get(f"/api/v1/tx-jobs/{job_id}", headers={"Authorization": f"Bearer {token}"})
+            for job_id in pending
+        ))
+        for job_id, response in zip(list(pending), responses):
+            job = response.json()
+            if job.get("status") == "confirmed":
+                latencies.append(time.perf_counter() - enqueued_at[job_id])
+                lands += lands_in[job_id]
+                gas_used += (job["result"].get("transaction") or {}).get("gas_used") or 0
+                pending.discard(job_id)
+            elif job.get("status") == "failed":
+                failed.append(job.get("error"))
+                pending.discard(job_id)
+
+    wall = time.perf_counter() - start
+    summary = {
+        "phase": name,
+        "jobs": len(enqueued_at),
+        "confirmed": len(latencies),
+        "failed": len(failed),
+        "timed_out": len(pending),
+        "rejected": rejected,
+        "lands": lands,
+        "wall": wall,
+        "tps": len(latencies) / wall if wall else 0.0,
+        "lps": lands / wall if wall else 0.0,
+        "gas_per_land": gas_used / lands if lands and gas_used else None,
+        "p50": statistics.median(latencies) if latencies else None,
+        "p99": _percentile(latencies, 99) if latencies else None,
+    }
+    for error in sorted(set(failed))[:3]:
+        print(f"  {name} failure: {error}")
+    return summary
+
+
+def _print_summary(s: dict) -> None:
+    latency = f"p50={s['p50']:.2f}s p99={s['p99']:.2f}s" if s["p50"] is not None else "no confirmed jobs"
+    gas = f" gas/land={s['gas_per_land']:,.0f}" if s["gas_per_land"] else ""
+    print(
+        f"{s['phase']:<9} jobs={s['jobs']:<4} confirmed={s['confirmed']:<4} failed={s['failed']:<3} "
+        f"timed_out={s['timed_out']:<3} wall={s['wall']:.1f}s {s['tps']:.2f} tx/s "
+        f"{s['lps']:.2f} lands/s {latency}{gas}"
+    )
+
+
+async def run(chain, args) -> None:
+    import httpx
+    from app.db.mongodb import database
+    from app.main import app
+    from app.models.chain_event import ChainEventModel
+    from app.models.land import LandModel
+    from app.services.chain_metadata import REQUIRED_VERIFICATIONS
+
+    await app.router.startup()
+    db = database.db
+    try:
+        owner_token = await _create_user(db, "bench_owner", "user")
+        admin_token = await _create_user(db, "bench_admin", "admin")
+        verifier_tokens = [
+            await _create_user(db, f"bench_verifier{i}", "verifier", f"0x{i + 1:040x}")
+            for i in range(REQUIRED_VERIFICATIONS)
+        ]
+        land_ids = await _create_lands(db, args.lands, owner_token)
+
+        transport = httpx.ASGITransport(app=app)
+        limits = dict(poll_interval=args.poll, timeout=args.timeout)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            summaries = [await _run_phase(
+                client, "mint",
+                [(f"/api/v1/land/{land_id}/mint", admin_token, None) for land_id in land_ids],
+                **limits,
+            )]
+            for round_no, token in enumerate(verifier_tokens, start=1):
+                if args.batch:
+                    requests = [("/api/v1/land/batch/verify", token, {"land_ids": land_ids})]
+                else:
+                    requests = [(f"/api/v1/land/{land_id}/verify", token, {}) for land_id in land_ids]
+                summaries.append(await _run_phase(client, f"verify#{round_no}", requests, **limits))
+            metrics = (await client.get("/api/v1/metrics", headers={"Authorization": f"Bearer {admin_token}"})).json()
+
+        # Give the indexer one more poll to catch the last blocks
+        await asyncio.sleep(args.block_time * 2)
+        events = db[ChainEventModel.collection_name]
+        registered = await events.count_documents({"event": "LandRegistered"})
+        verified = await events.count_documents({"event": "LandVerified"})
+        lands_verified = await db[LandModel.collection_name].count_documents({"blockchain_status": "verified"})
+    finally:
+        await app.router.shutdown()
+
+    print(
+        f"lands={args.lands} block_time={args.block_time}s rpc_latency={args.rpc_latency * 1000:.0f}ms "
+        f"error_rate={args.error_rate} drop_rate={args.drop_rate} batch={args.batch}"
+    )
+    for summary in summaries:
+        _print_summary(summary)
+    total = sum(s["confirmed"] for s in summaries)
+    wall = sum(s["wall"] for s in summaries)
+    print(f"overall   {total} confirmed txs in {wall:.1f}s = {total / wall:.2f} tx/s")
+    print(f"chain     blocks={len(chain.blocks) - 1} {chain.stats}")
+    gas = metrics.get("gas_estimates", {})
+    print(f"gas cache hits={gas.get('hits')} misses={gas.get('misses')} hit_rate={gas.get('hit_rate')}")
+    token_metadata = metrics.get("token_metadata", {})
+    print(f"metadata  tokens={token_metadata.get('tokens_pinned')} uploads={token_metadata.get('batches')} "
+          f"failures={token_metadata.get('failures')}")
+    print(f"indexer   LandRegistered={registered}/{args.lands} LandVerified={verified}/{args.lands}")
+    print(f"database  lands verified={lands_verified}/{args.lands}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lands", type=int, default=20)
+    parser.add_argument("--block-time", type=float, default=1.0, help="seconds between blocks")
+    parser.add_argument("--rpc-latency", type=float, default=0.01, help="seconds per RPC request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of RPC requests failing with 503")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="fraction of transactions silently dropped")
+    parser.add_argument("--workers", type=int, default=4, help="TX_JOB_WORKERS")
+    parser.add_argument("--confirmations", type=int, default=2, help="CONFIRMATION_DEPTH")
+    parser.add_argument("--poll", type=float, default=0.25, help="job status / worker poll interval")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds to wait for each phase")
+    parser.add_argument("--batch", action="store_true", help="verify through POST /land/batch/verify")
+    parser.add_argument("--batch-size", type=int, default=50, help="VERIFY_BATCH_SIZE")
+    parser.add_argument("--pin-latency", type=float, default=0.3, help="Pinata stub time per metadata upload")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    from benchmarks._pinata_stub import PinataStub
+
+    pinata = PinataStub(latency=args.pin_latency).start()
+
+    # The app reads its settings at import, so point it at the chain first
+    port = _free_port()
+    os.environ["SEPOLIA_RPC_URL"] = f"http://127.0.0.1:{port}"
+    os.environ["TX_JOB_WORKERS"] = str(args.workers)
+    os.environ["TX_JOB_POLL_INTERVAL_SECONDS"] = str(args.poll)
+    os.environ["CONFIRMATION_DEPTH"] = str(args.confirmations)
+    os.environ["VERIFY_BATCH_SIZE"] = str(args.batch_size)
+    os.environ["VERIFY_BATCH_ENABLED"] = "true" if args.batch else "false"
+    os.environ["INDEXER_POLL_INTERVAL_SECONDS"] = str(args.block_time)
+    os.environ["INDEXER_START_BLOCK"] = "0"
+    os.environ["DOCUMENT_STORE"] = "pinata"
+    os.environ["PINATA_API_URL"] = pinata.url
+    os.environ["PINATA_API_KEY"] = "bench"
+    os.environ["PINATA_SECRET_API_KEY"] = "bench"
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_e2e_bench")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+
+    from benchmarks._fake_chain import FakeChain
+
+    chain = FakeChain(
+        block_time=args.block_time,
+        latency=args.rpc_latency,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+        port=port,
+    ).start()
+    try:
+        asyncio.run(_with_clean_db(chain, args))
+    finally:
+        chain.stop()
+        pinata.stop()
+
+
+async def _with_clean_db(chain, args) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from app.core.config import settings
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    try:
+        await run(chain, args)
+    finally:
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
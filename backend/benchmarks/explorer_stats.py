@@ -0,0 +1,161 @@
+"""
+Benchmark: GET /explorer/stats as the registry grows.
+
+Seeds --lands lands (spread over --owners owners and the four
+blockchain_status values) and times three ways of getting the explorer
+counts, --requests times each:
+
+    queries    the previous endpoint: four count_documents and a distinct("owner_id")
+    facet      RegistryStatsService.compute(): one $facet aggregation
+    counters   RegistryStatsService.get(): a point read of the registry_stats document
+
+Then it registers, re-statuses, transfers and deletes lands through the
+service hooks, as the endpoints and job handlers do, and checks that the
+counters still agree with a recount.
+
+    python -m benchmarks.explorer_stats
+    python -m benchmarks.explorer_stats --lands 200000 --owners 20000
+
+Needs a MongoDB at MONGO_URL; the benchmark uses (and drops) its own
+database, DB_NAME=land_registry_stats_bench by default.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime
+
+from bson import ObjectId
+
+
+async def _seed(db, args, owners: list) -> None:
+    from app.models.land import LandModel
+    from app.models.registry_stats import RegistryStatsModel
+
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    for start in range(0, args.lands, 10000):
+        await db[LandModel.collection_name].insert_many([{
+            "property_id": f"S{i:09d}",
+            "title": f"Benchmark land {i}",
+            "owner_id": rng.choice(owners),
+            "blockchain_status": rng.choice(RegistryStatsModel.STATUSES),
+            "transfer_status": "none",
+            "created_at": now,
+            "updated_at": now,
+        } for i in range(start, min(start + 10000, args.lands))])
+
+
+async def _queries(db) -> dict:
+    """What GET /explorer/stats ran before the $facet aggregation"""
+    from app.models.land import LandModel
+
+    lands = db[LandModel.collection_name]
+    pending = await lands.count_documents({"blockchain_status": {"$in": ["pending", "not_minted"]}})
+    return {
+        "total": await lands.count_documents({}),
+        "verified": await lands.count_documents({"blockchain_status": "verified"}),
+        "pending": pending,
+        "rejected": await lands.count_documents({"blockchain_status": "rejected"}),
+        "owners": len(await lands.distinct("owner_id")),
+    }
+
+
+async def _time(call, requests: int) -> tuple:
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        result = await call()
+        latencies.append(time.perf_counter() - started)
+    return statistics.median(latencies), max(latencies), result
+
+
+async def _churn(db, service, owners: list, seed: int) -> None:
+    """Land changes reported through the hooks, as the endpoints make them"""
+    from app.models.land import LandModel
+
+    rng = random.Random(seed)
+    lands = db[LandModel.collection_name]
+    newcomer = ObjectId()
+    for i in range(50):
+        owner = newcomer if i == 0 else rng.choice(owners)
+        land = {"property_id": f"C{i:09d}", "owner_id": owner, "blockchain_status": "not_minted"}
+        await lands.insert_one(land)
+        await service.land_created(db, owner)
+    for land in await lands.find({"blockchain_status": "pending"}).limit(40).to_list(None):
+        new = rng.choice(("verified", "rejected"))
+        await lands.update_one({"_id": land["_id"]}, {"$set": {"blockchain_status": new}})
+        await service.status_changed(db, "pending", new)
+    for land in await lands.find({}).limit(30).to_list(None):
+        buyer = rng.choice(owners + [ObjectId()])
+        await lands.update_one({"_id": land["_id"]}, {"$set": {"owner_id": buyer}})
+        await service.owner_changed(db, land["owner_id"], buyer)
+    for land in await lands.find({"owner_id": newcomer}).to_list(None):
+        await lands.delete_one({"_id": land["_id"]})
+        await service.land_deleted(db, land["owner_id"], land["blockchain_status"])
+
+
+async def run(args) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.core.config import settings
+    from app.services.registry_stats import RegistryStatsService
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    db = client[settings.DB_NAME]
+    service = RegistryStatsService()
+    owners = [ObjectId() for _ in range(args.owners)]
+    rows = []
+    try:
+        started = time.perf_counter()
+        await _seed(db, args, owners)
+        seeded = time.perf_counter() - started
+        started = time.perf_counter()
+        await service.rebuild(db)
+        rebuilt = time.perf_counter() - started
+
+        queries = await _time(lambda: _queries(db), args.requests)
+        facet = await _time(lambda: service.compute(db), args.requests)
+        counters = await _time(lambda: service.get(db), args.requests)
+        rows = [("queries", queries), ("facet", facet), ("counters", counters)]
+        assert queries[2]["total"] == facet[2]["total"] == counters[2]["total"]
+        assert queries[2]["owners"] == facet[2]["owners"] == counters[2]["owners"]
+
+        await _churn(db, service, owners, args.seed)
+        after, expected = await service.get(db), await service.compute(db)
+    finally:
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+
+    print(f"lands={args.lands} owners={args.owners} requests={args.requests} "
+          f"(seeded in {seeded:.1f}s, counters rebuilt in {rebuilt * 1000:.0f} ms)")
+    print(f"{'method':<9} {'p50 ms':>8} {'max ms':>8}")
+    for name, (p50, worst, _) in rows:
+        print(f"{name:<9} {p50 * 1000:>8.2f} {worst * 1000:>8.2f}")
+    print(f"counts: {counters[2]}")
+    print(f"after changes: counters {'match' if after == expected else 'DRIFT'} the recount: {after}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lands", type=int, default=50000)
+    parser.add_argument("--owners", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=20, help="timed calls per method")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_stats_bench")
+    os.environ["REGISTRY_STATS_COUNTERS"] = "true"
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark: streaming registry exports, rows/sec and memory by size.
+
+Seeds lands up to each of --sizes in turn and exports them through
+GET /admin/export/lands as NDJSON and CSV, reading the StreamingResponse
+body the way the server sends it. For each export it reports rows/sec,
+MiB/s and the process RSS growth while streaming (sampled at every chunk).
+Finally it builds the largest NDJSON export in memory (to_list + dumps), as
+a paginated or non-streaming endpoint would, for comparison.
+
+    python -m benchmarks.export_stream
+    python -m benchmarks.export_stream --sizes 1000 100000 1000000
+
+Needs a MongoDB at MONGO_URL; the benchmark uses (and drops) its own
+database, DB_NAME=land_registry_export_bench by default. RSS is read from
+/proc (Linux); elsewhere only the process peak is shown.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import resource
+import time
+from datetime import datetime
+
+
+def _rss() -> int:
+    """Current resident set size in bytes"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+async def _seed(db, start: int, end: int) -> None:
+    from bson import ObjectId
+
+    from app.models.land import LandModel
+
+    now = datetime.utcnow()
+    for first in range(start, end, 10000):
+        await db[LandModel.collection_name].insert_many([{
+            "property_id": f"E{i:09d}",
+            "title": f"Benchmark land {i}",
+            "description": "export benchmark, a typical short description of the plot",
+            "owner_id": ObjectId(),
+            "area": 100 + i % 900,
+            "price": 1000 + i,
+            "location": {"lat": 12.97, "lng": 77.59, "address": f"Plot {i}, Benchmark Rd"},
+            "documents": [{"name": "deed.pdf", "ipfs_hash": f"QmBenchmark{i:036d}", "type": "application/pdf"}],
+            "status": "verified",
+            "blockchain_status": "verified",
+            "token_id": i,
+            "blockchain_tx_hash": "0x" + f"{i:064x}",
+            "is_for_sale": i % 3 == 0,
+            "transfer_status": "none",
+            "created_at": now,
+            "updated_at": now,
+        } for i in range(first, min(first + 10000, end))])
+
+
+async def _export(db, format: str) -> dict:
+    from app.api.v1.endpoints.admin import export_lands
+
+    gc.collect()
+    baseline = peak = _rss()
+    rows = size = 0
+    started = time.perf_counter()
+    response = await export_lands(format=format, current_user=None, db=db)
+    async for chunk in response.body_iterator:
+        size += len(chunk)
+        rows += chunk.count(b"\n")
+        peak = max(peak, _rss())
+    wall = time.perf_counter() - started
+    if format == "csv":
+        rows -= 1  # header
+    return {"rows": rows, "wall": wall, "bytes": size, "growth": peak - baseline}
+
+
+async def _buffered(db) -> dict:
+    """The whole export built in memory before sending"""
+    from app.models.land import LandModel
+    from app.services.registry_export import EXPORTS, _json_default
+
+    gc.collect()
+    baseline = _rss()
+    started = time.perf_counter()
+    fields = EXPORTS["lands"][1]
+    documents = await db[LandModel.collection_name].find({}, {field: 1 for field in fields}).to_list(length=None)
+    body = "\n".join(json.dumps(document, default=_json_default) for document in documents).encode()
+    growth = _rss() - baseline
+    return {"rows": len(documents), "wall": time.perf_counter() - started, "bytes": len(body), "growth": growth}
+
+
+async def run(args) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.core.config import settings
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    db = client[settings.DB_NAME]
+    rows = []
+    try:
+        seeded = 0
+        for size in sorted(args.sizes):
+            await _seed(db, seeded, size)
+            seeded = size
+            for format in ("ndjson", "csv"):
+                rows.append((f"stream {format}", await _export(db, format)))
+        rows.append(("buffered ndjson", await _buffered(db)))
+    finally:
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+
+    print(f"sizes={sorted(args.sizes)} EXPORT_BATCH_SIZE={settings.EXPORT_BATCH_SIZE}")
+    print(f"{'export':<16} {'rows':>9} {'rows/s':>9} {'MiB/s':>7} {'MiB':>8} {'RSS growth MiB':>15}")
+    for name, r in rows:
+        print(f"{name:<16} {r['rows']:>9} {r['rows'] / r['wall']:>9.0f} {r['bytes'] / 2 ** 20 / r['wall']:>7.1f} "
+              f"{r['bytes'] / 2 ** 20:>8.1f} {r['growth'] / 2 ** 20:>15.1f}")
+    print(f"process peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="lands exported")
+    parser.add_argument("--batch-size", type=int, default=1000, help="EXPORT_BATCH_SIZE")
+    args = parser.parse_args()
+
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_export_bench")
+    os.environ["EXPORT_BATCH_SIZE"] = str(args.batch_size)
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: /health latency while mints are in flight.
+
+Starts a local JSON-RPC stub with a fixed per-call latency, fires N concurrent
+register_land() calls, and meanwhile polls GET /api/v1/ through the ASGI app
+in the same event loop. Reports p50/p99/max of the health check.
+
+    python -m benchmarks.health_during_mints
+
+Mints go straight to the service (no MongoDB needed).
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from benchmarks._rpc_stub import RpcStub
+
+
+def _percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _poll_health(client, stop: asyncio.Event, samples: list) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/api/v1/")
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+
+
+async def run(mints: int) -> None:
+    import httpx
+    from app.main import app
+    from app.services.blockchain import async_blockchain_service
+
+    await async_blockchain_service.connect()
+
+    async def mint(i: int):
+        kwargs = dict(
+            property_id=f"BENCH{i:09d}",
+            ipfs_hash="QmBenchmark",
+            area=100,
+            price=1,
+            location="benchmark",
+            owner_address="0x0000000000000000000000000000000000000000",
+        )
+        return await async_blockchain_service.register_land(**kwargs)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        stop = asyncio.Event()
+        samples: list = []
+        poller = asyncio.create_task(_poll_health(client, stop, samples))
+        await asyncio.sleep(0.2)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(mint(i) for i in range(mints)))
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await poller
+
+    await async_blockchain_service.close()
+
+    print(f"mints={mints} wall={elapsed:.2f}s health_samples={len(samples)}")
+    print(
+        f"/health latency ms: p50={statistics.median(samples):.1f} "
+        f"p99={_percentile(samples, 99):.1f} max={max(samples):.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mints", type=int, default=20)
+    parser.add_argument("--rpc-latency", type=float, default=0.05, help="seconds per RPC call")
+    args = parser.parse_args()
+
+    stub = RpcStub(latency=args.rpc_latency).start()
+    os.environ["SEPOLIA_RPC_URL"] = stub.url
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("DB_NAME", "land_registry_bench")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    try:
+        asyncio.run(run(args.mints))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
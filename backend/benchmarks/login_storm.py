@@ -0,0 +1,164 @@
+"""
+Benchmark: login throughput and /health latency during a login storm.
+
+Seeds --users users with real bcrypt password hashes, then sends --logins
+POST /auth/login requests, --concurrency at a time, while polling GET
+/health/ in the same event loop. Runs it twice:
+
+    inline   bcrypt verification on the event loop, as before
+    pool     PasswordHasher: PASSWORD_HASH_WORKERS threads, at most
+             PASSWORD_HASH_MAX_QUEUE hashes accepted, the rest shed with 503
+
+and reports successful logins/sec, 503s, login latency and /health
+p50/p99/max for each.
+
+    python -m benchmarks.login_storm
+    python -m benchmarks.login_storm --concurrency 100   # more clients than PASSWORD_HASH_MAX_QUEUE: shedding
+
+Needs a MongoDB at MONGO_URL; the benchmark uses (and drops) its own
+database, DB_NAME=land_registry_login_bench by default. Only the auth and
+health routers are mounted, with the benchmark's database.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from datetime import datetime
+
+PASSWORD = "correct horse battery staple"
+
+
+def _percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _InlineHasher:
+    """The previous behaviour: bcrypt called directly from the coroutine"""
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        from app.core.security import verify_password
+
+        return verify_password(password, hashed_password)
+
+
+async def _poll_health(api, stop: asyncio.Event, samples: list) -> None:
+    # Timed from when the request was due, so time the event loop was
+    # blocked before it could even send the request counts too
+    while not stop.is_set():
+        due = time.perf_counter() + 0.005
+        await asyncio.sleep(0.005)
+        await api.get("/health/")
+        samples.append((time.perf_counter() - due) * 1000)
+
+
+async def _storm(api, args) -> dict:
+    latencies, statuses = [], {}
+    queue = list(range(args.logins))
+
+    async def client():
+        while queue:
+            i = queue.pop()
+            started = time.perf_counter()
+            response = await api.post(
+                "/auth/login", json={"email": f"user{i % args.users}@example.com", "password": PASSWORD}
+            )
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                latencies.append((time.perf_counter() - started) * 1000)
+
+    stop = asyncio.Event()
+    health: list = []
+    poller = asyncio.create_task(_poll_health(api, stop, health))
+    await asyncio.sleep(0.2)
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    wall = time.perf_counter() - started
+    stop.set()
+    await poller
+    return {"wall": wall, "statuses": statuses, "latencies": latencies, "health": health}
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import FastAPI
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.api.v1.endpoints import auth, health
+    from app.core.config import settings
+    from app.core.security import get_password_hash
+    from app.db.mongodb import get_database
+    from app.services import auth_service as auth_service_module
+    from app.services.password_hasher import PasswordHasher
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    db = client[settings.DB_NAME]
+
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+    app.include_router(health.router, prefix="/health")
+    app.dependency_overrides[get_database] = lambda: db
+
+    hashed = get_password_hash(PASSWORD)
+    now = datetime.utcnow()
+    await db.users.insert_many([{
+        "email": f"user{i}@example.com",
+        "username": f"user{i}",
+        "hashed_password": hashed,
+        "is_active": True,
+        "is_verified": False,
+        "role": "user",
+        "created_at": now,
+        "updated_at": now,
+    } for i in range(args.users)])
+
+    rows = []
+    pool = PasswordHasher(workers=args.workers, max_queue=args.max_queue)
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as api:
+            for name, hasher in (("inline", _InlineHasher()), ("pool", pool)):
+                auth_service_module.password_hasher = hasher
+                rows.append((name, await _storm(api, args)))
+        stats = pool.stats()
+    finally:
+        await pool.stop()
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+
+    print(f"logins={args.logins} concurrency={args.concurrency} workers={args.workers} "
+          f"max_queue={args.max_queue} cpus={os.cpu_count()}")
+    print(f"{'mode':<7} {'ok/s':>6} {'ok':>5} {'503':>5} {'login p50':>10} {'login p99':>10} "
+          f"{'health p50':>11} {'health p99':>11} {'health max':>11}")
+    for name, r in rows:
+        ok = r["statuses"].get(200, 0)
+        login = r["latencies"] or [0.0]
+        print(f"{name:<7} {ok / r['wall']:>6.1f} {ok:>5} {r['statuses'].get(503, 0):>5} "
+              f"{statistics.median(login):>10.0f} {_percentile(login, 99):>10.0f} "
+              f"{statistics.median(r['health']):>11.1f} {_percentile(r['health'], 99):>11.1f} "
+              f"{max(r['health']):>11.1f}")
+    print(f"pool: {stats}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20, help="clients logging in at once")
+    parser.add_argument("--workers", type=int, default=4, help="PASSWORD_HASH_WORKERS")
+    parser.add_argument("--max-queue", type=int, default=32, help="PASSWORD_HASH_MAX_QUEUE")
+    args = parser.parse_args()
+
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_login_bench")
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
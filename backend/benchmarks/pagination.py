@@ -0,0 +1,147 @@
+"""
+Benchmark: page cost by depth, offset (skip) vs cursor pagination.
+
+Seeds --lands verified lands for sale, with updated_at values shared by
+--ties lands each so that pages split runs of equal sort keys. Then walks
+every page of two public list endpoints through the API:
+
+    verified    GET /land/verified/list         sorted by _id
+    market      GET /explorer/properties        sorted by updated_at, newest first
+
+following next_cursor, and for comparison reads the same pages with
+skip/limit, as offset pagination would. Reports the time of the first,
+middle and last page of each, and checks that the cursor walk returned every
+land exactly once.
+
+    python -m benchmarks.pagination
+    python -m benchmarks.pagination --lands 100000 --page-size 200
+
+Needs a MongoDB at MONGO_URL; the benchmark uses (and drops) its own
+database, DB_NAME=land_registry_pagination_bench by default. Only the land
+and explorer routers are mounted, with the benchmark's database.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+
+async def _seed(db, args) -> None:
+    from app.models.land import LandModel
+    from bson import ObjectId
+
+    start = datetime.utcnow() - timedelta(days=1)
+    owner = ObjectId()
+    for first in range(0, args.lands, 10000):
+        await db[LandModel.collection_name].insert_many([{
+            "property_id": f"P{i:09d}",
+            "title": f"Benchmark land {i}",
+            "description": "pagination benchmark",
+            "area": 100,
+            "price": 1000,
+            "location": {"lat": 0.0, "lng": 0.0, "address": f"Plot {i}"},
+            "documents": [],
+            "owner_id": owner,
+            "status": "verified",
+            "blockchain_status": "verified",
+            "is_for_sale": True,
+            "transfer_status": "none",
+            "created_at": start,
+            "updated_at": start + timedelta(seconds=i // args.ties),
+        } for i in range(first, min(first + 10000, args.lands))])
+
+
+async def _walk(api, url: str, page_size: int) -> tuple:
+    """Every page through the cursors: (seconds per page, ids seen)"""
+    timings, ids, cursor = [], [], None
+    while True:
+        params = {"limit": page_size, **({"cursor": cursor} if cursor else {})}
+        started = time.perf_counter()
+        response = await api.get(url, params=params)
+        timings.append(time.perf_counter() - started)
+        response.raise_for_status()
+        page = response.json()
+        ids += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            return timings, ids
+
+
+async def _offset(collection, filter: dict, sort: list, page_size: int, pages: int) -> list:
+    """The same pages with skip/limit"""
+    timings = []
+    for page in range(pages):
+        started = time.perf_counter()
+        await collection.find(filter).sort(sort).skip(page * page_size).limit(page_size).to_list(length=page_size)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import FastAPI
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.api.v1.endpoints import explorer, land
+    from app.core.config import settings
+    from app.db.indexes import IndexReconciler
+    from app.db.mongodb import get_database
+    from app.models.land import LandModel
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    db = client[settings.DB_NAME]
+
+    app = FastAPI()
+    app.include_router(land.router, prefix="/land")
+    app.include_router(explorer.router, prefix="/explorer")
+    app.dependency_overrides[get_database] = lambda: db
+
+    lands = db[LandModel.collection_name]
+    market = {"blockchain_status": "verified", "is_for_sale": True}
+    rows = []
+    try:
+        await IndexReconciler().reconcile(db, models=(LandModel,))
+        await _seed(db, args)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as api:
+            for name, url, filter, sort in (
+                ("verified", "/land/verified/list", {"blockchain_status": "verified"}, [("_id", 1)]),
+                ("market", "/explorer/properties", market, [("updated_at", -1), ("_id", -1)]),
+            ):
+                cursor_timings, ids = await _walk(api, url, args.page_size)
+                offset_timings = await _offset(lands, filter, sort, args.page_size, len(cursor_timings))
+                complete = len(ids) == len(set(ids)) == args.lands
+                rows.append((name, "cursor", cursor_timings, complete))
+                rows.append((name, "offset", offset_timings, None))
+    finally:
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+
+    print(f"lands={args.lands} page_size={args.page_size} ties={args.ties}")
+    print(f"{'endpoint':<9} {'method':<7} {'pages':>6} {'first ms':>9} {'middle ms':>10} {'last ms':>8}  complete")
+    for name, method, timings, complete in rows:
+        first, middle, last = timings[0], timings[len(timings) // 2], timings[-1]
+        print(f"{name:<9} {method:<7} {len(timings):>6} {first * 1000:>9.2f} {middle * 1000:>10.2f} "
+              f"{last * 1000:>8.2f}  {'' if complete is None else ('yes' if complete else 'NO')}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lands", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--ties", type=int, default=7, help="lands sharing each updated_at value")
+    args = parser.parse_args()
+
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_pagination_bench")
+    os.environ["PAGE_SIZE_MAX"] = str(max(args.page_size, 200))
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
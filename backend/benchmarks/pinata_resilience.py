@@ -0,0 +1,160 @@
+"""
+Benchmark: document uploads while Pinata misbehaves.
+
+Runs --uploads document uploads (--concurrency at a time) through
+PinataService against the local Pinata stub (benchmarks/_pinata_stub.py)
+in a series of scenarios:
+
+    healthy      every request succeeds
+    flaky        --error-rate of requests answer 503
+    rate limited --error-rate of requests answer 429 with Retry-After: 1
+    hung         Pinata takes longer than PINATA_READ_TIMEOUT_SECONDS to answer
+    outage       every request answers 503; afterwards Pinata recovers and
+                 one more upload is sent once the breaker lets a trial through
+
+Flaky and hung also run with PINATA_MAX_ATTEMPTS=1 and the breaker
+disabled, which is how uploads behaved before. For each run it reports
+successful and failed uploads, upload latency p50/p99 (failures included),
+attempts, retries, breaker openings and fast-failed requests.
+
+    python -m benchmarks.pinata_resilience
+    python -m benchmarks.pinata_resilience --uploads 100 --error-rate 0.4
+
+Timeouts and backoff are scaled down (read timeout 1s, backoff base 0.1s,
+breaker reset 2s) so the run takes seconds. No MongoDB needed: the service
+is not started with a database, so uploads are not deduped.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+
+def _percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _upload_file(i: int, size: int):
+    from io import BytesIO
+    from fastapi import UploadFile
+
+    return UploadFile(BytesIO(os.urandom(size)), size=size, filename=f"deed-{i}.pdf",
+                      headers={"content-type": "application/pdf"})
+
+
+async def _scenario(stub, args, *, latency: float, error_rate: float = 0.0, error_status: int = 503,
+                    down: bool = False, resilient: bool = True, recover: bool = False) -> dict:
+    from app.core.config import settings
+    from app.services.pinata_service import PinataService
+    from app.utils.circuit_breaker import CircuitBreaker
+
+    stub.latency, stub.error_rate, stub.error_status, stub.down = latency, error_rate, error_status, down
+    settings.PINATA_MAX_ATTEMPTS = args.attempts if resilient else 1
+    service = PinataService()
+    if not resilient:
+        service.store.breaker = CircuitBreaker(failure_threshold=10 ** 9, reset_timeout=0)
+    await service.connect()
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies, ok, failed = [], 0, 0
+
+    async def upload(i: int) -> None:
+        nonlocal ok, failed
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await service.upload_file(_upload_file(i, args.size_kib * 1024))
+                ok += 1
+            except Exception:
+                failed += 1
+            latencies.append(time.perf_counter() - started)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(upload(i) for i in range(args.uploads)))
+        wall = time.perf_counter() - started
+        recovered = None
+        if recover:
+            stub.down = False
+            await asyncio.sleep(service.store.breaker.retry_after())
+            await upload(args.uploads)
+            recovered = service.store.breaker.state
+    finally:
+        await service.close()
+
+    stats = service.stats()
+    return {
+        "ok": ok,
+        "failed": failed,
+        "wall": wall,
+        "p50": statistics.median(latencies),
+        "p99": _percentile(latencies, 99),
+        "attempts": stats["attempts"],
+        "retries": stats["retries"],
+        "opened": stats["breaker"]["times_opened"],
+        "fast_failed": stats["breaker"]["rejected"],
+        "recovered": recovered,
+    }
+
+
+async def run(args, stub) -> None:
+    slow = 1.5  # Above the 1s read timeout
+    runs = {
+        "healthy": dict(latency=args.latency),
+        "flaky": dict(latency=args.latency, error_rate=args.error_rate),
+        "flaky, no retries": dict(latency=args.latency, error_rate=args.error_rate, resilient=False),
+        "rate limited": dict(latency=args.latency, error_rate=args.error_rate, error_status=429),
+        "hung": dict(latency=slow),
+        "hung, no retries": dict(latency=slow, resilient=False),
+        "outage": dict(latency=args.latency, down=True, recover=True),
+    }
+    results = {name: await _scenario(stub, args, **kwargs) for name, kwargs in runs.items()}
+
+    print(f"uploads={args.uploads} concurrency={args.concurrency} size={args.size_kib} KiB "
+          f"latency={args.latency}s error_rate={args.error_rate} attempts={args.attempts}")
+    print(f"{'scenario':<18} {'ok':>4} {'failed':>6} {'wall s':>7} {'p50 ms':>7} {'p99 ms':>7} "
+          f"{'attempts':>8} {'retries':>7} {'opened':>6} {'fast-failed':>11}")
+    for name, r in results.items():
+        print(f"{name:<18} {r['ok']:>4} {r['failed']:>6} {r['wall']:>7.2f} {r['p50'] * 1000:>7.0f} "
+              f"{r['p99'] * 1000:>7.0f} {r['attempts']:>8} {r['retries']:>7} {r['opened']:>6} {r['fast_failed']:>11}")
+    print(f"outage: breaker {results['outage']['recovered']} after Pinata recovered")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--uploads", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--size-kib", type=int, default=512)
+    parser.add_argument("--latency", type=float, default=0.1, help="Pinata processing time per upload")
+    parser.add_argument("--error-rate", type=float, default=0.3, help="share of requests failing in flaky / rate limited")
+    parser.add_argument("--attempts", type=int, default=4, help="PINATA_MAX_ATTEMPTS")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    from benchmarks._pinata_stub import PinataStub
+
+    stub = PinataStub(latency=args.latency, seed=args.seed).start()
+    # The app reads its settings at import, so point it at the stub first
+    os.environ["PINATA_API_URL"] = stub.url
+    os.environ["PINATA_API_KEY"] = "bench"
+    os.environ["PINATA_SECRET_API_KEY"] = "bench"
+    os.environ["PINATA_READ_TIMEOUT_SECONDS"] = "1"
+    os.environ["PINATA_RETRY_BASE_SECONDS"] = "0.1"
+    os.environ["PINATA_RETRY_MAX_SECONDS"] = "1"
+    os.environ["PINATA_BREAKER_RESET_SECONDS"] = "2"
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("DB_NAME", "land_registry_bench")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    try:
+        asyncio.run(run(args, stub))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Check: every hot query is served by an index (no COLLSCAN).
+
+Applies the models' declared indexes with IndexReconciler to a scratch
+database, then asks MongoDB to explain each query in HOT_QUERIES, the
+filters and sorts the API and services run on every request or poll. Prints
+the winning plan of each and exits with status 1 if any of them scans a
+whole collection.
+
+    python -m benchmarks.query_plans
+    python -m benchmarks.query_plans --database land_registry   # as-is, no indexes created
+
+Needs a MongoDB at MONGO_URL (explain is not available on mock servers).
+The scratch database, DB_NAME=land_registry_plans_check by default, is
+dropped afterwards. With --database an existing database is explained
+without changing it, which shows what production is missing.
+
+Add a query here when adding one to a request path.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+
+def _find(collection: str, filter: dict, sort: dict = None, limit: int = 0) -> tuple:
+    command = {"find": collection, "filter": filter}
+    if sort:
+        command["sort"] = sort
+    if limit:
+        command["limit"] = limit
+    return collection, command
+
+
+def _update(collection: str, query: dict) -> tuple:
+    return collection, {"update": collection, "updates": [{"q": query, "u": {"$set": {"x": 1}}, "multi": True}]}
+
+
+def hot_queries() -> dict:
+    """Label -> (collection, command to explain)"""
+    user_id, job_id, now = ObjectId(), ObjectId(), datetime.utcnow()
+    transfer_states = {"$in": ["pending", "paid", "disputed"]}
+    return {
+        # lands
+        "land by property_id": _find("lands", {"property_id": "P-1"}),
+        "my lands": _find("lands", {"owner_id": user_id}, sort={"_id": 1}, limit=51),
+        "my lands, next page": _find("lands", {"owner_id": user_id, "_id": {"$gt": job_id}}, sort={"_id": 1}, limit=51),
+        "incoming transfers": _find("lands", {"pending_buyer_id": str(user_id), "transfer_status": transfer_states}),
+        "outgoing transfers": _find("lands", {"owner_id": user_id, "transfer_status": transfer_states}),
+        "verifier queue": _find(
+            "lands", {"blockchain_status": {"$in": ["not_minted", "pending"]}}, sort={"_id": 1}, limit=51
+        ),
+        "pending lands": _find("lands", {"blockchain_status": "pending"}, sort={"_id": 1}, limit=51),
+        "verified lands": _find("lands", {"blockchain_status": "verified"}, sort={"_id": 1}, limit=51),
+        "admin disputes": _find("lands", {"transfer_status": "disputed"}, sort={"_id": 1}, limit=51),
+        "lands by token_id": _find("lands", {"token_id": {"$in": [1, 2, 3]}}),
+        "land by document CID": _find("lands", {"documents.ipfs_hash": "Qm"}),
+        "explorer activity": _find("lands", {}, sort={"updated_at": -1, "_id": -1}, limit=21),
+        "explorer market": _find(
+            "lands", {"blockchain_status": "verified", "is_for_sale": True},
+            sort={"updated_at": -1, "_id": -1}, limit=51,
+        ),
+        "explorer market, next page": _find(
+            "lands",
+            {"$and": [
+                {"blockchain_status": "verified", "is_for_sale": True},
+                {"$or": [{"updated_at": {"$lt": now}}, {"updated_at": now, "_id": {"$lt": job_id}}]},
+            ]},
+            sort={"updated_at": -1, "_id": -1}, limit=51,
+        ),
+        "release lands of a job": _update("lands", {"_id": {"$in": [user_id]}, "active_tx_job_id": job_id}),
+        # registry_stats
+        "explorer stats": _find("registry_stats", {"_id": "lands"}),
+        "owner land count": _find("registry_owners", {"_id": user_id}),
+        # users
+        "user by email": _find("users", {"email": "a@example.com"}),
+        "user by username": _find("users", {"username": "a"}),
+        "user by wallet": _find("users", {"wallet_address": "0xabc"}),
+        "admin users": _find("users", {"_id": {"$gt": user_id}}, sort={"_id": 1}, limit=51),
+        # cache_invalidations
+        "user cache poll": _find(
+            "cache_invalidations", {"cache": "users", "origin": {"$ne": "1-a"}, "created_at": {"$gte": now}}
+        ),
+        # tx_jobs
+        "claim next job": _find(
+            "tx_jobs",
+            {"status": {"$in": ["queued", "sending", "submitted", "mined"]},
+             "next_attempt_at": {"$lte": now}, "lease_expires_at": {"$lte": now}},
+            sort={"next_attempt_at": 1}, limit=1,
+        ),
+        "job owning a nonce": _find(
+            "tx_jobs", {"nonce": 7, "status": {"$in": ["queued", "sending", "submitted", "mined"]}}
+        ),
+        "warm gas cache": _find(
+            "tx_jobs",
+            {"status": "confirmed", "gas_bucket": {"$ne": None}, "gas_used": {"$ne": None},
+             "updated_at": {"$gte": now - timedelta(days=30)}},
+            sort={"updated_at": 1},
+        ),
+        # chain_events
+        "token history": _find(
+            "chain_events", {"contract": "LandRegistry", "token_id": 1}, sort={"block_number": 1, "log_index": 1}
+        ),
+        "recent events": _find(
+            "chain_events", {}, sort={"block_number": -1, "log_index": -1, "_id": -1}, limit=21
+        ),
+        # ipfs_objects
+        "dedupe lookup": _find("ipfs_objects", {"sha256": "00", "pinned": True}),
+        "orphan sweep": _find(
+            "ipfs_objects", {"refcount": {"$lte": 0}, "pinned": True, "last_referenced_at": {"$lte": now}}
+        ),
+    }
+
+
+def _stages(plan) -> list:
+    """(stage, index name) for every stage of a plan tree"""
+    found = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            found.append((plan["stage"], plan.get("indexName")))
+        for value in plan.values():
+            found += _stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            found += _stages(item)
+    return found
+
+
+async def run(args) -> int:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.core.config import settings
+    from app.db.indexes import IndexReconciler
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    scratch = args.database is None
+    db = client[settings.DB_NAME if scratch else args.database]
+    scans = []
+    try:
+        if scratch:
+            await client.drop_database(settings.DB_NAME)
+            report = await IndexReconciler().reconcile(db)
+            print(f"indexes: {report['status']}")
+
+        for label, (_, command) in hot_queries().items():
+            explained = await db.command("explain", command, verbosity="queryPlanner")
+            stages = _stages(explained["queryPlanner"]["winningPlan"])
+            plan = " > ".join(f"{stage}({index})" if index else stage for stage, index in stages)
+            collscan = any(stage == "COLLSCAN" for stage, _ in stages)
+            if collscan:
+                scans.append(label)
+            print(f"{'FAIL' if collscan else 'ok  '} {label:<26} {plan}")
+    finally:
+        if scratch:
+            await client.drop_database(settings.DB_NAME)
+        client.close()
+
+    if scans:
+        print(f"{len(scans)} hot queries scan a whole collection: {', '.join(scans)}")
+        return 1
+    print("every hot query uses an index")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database", help="explain against this existing database instead of a scratch one")
+    args = parser.parse_args()
+
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_plans_check")
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: read latency and write failover across a pool of RPC nodes.
+
+Starts three local JSON-RPC stubs and drives reads through
+AsyncBlockchainService's pooled provider while the primary node degrades:
+
+    steady     all nodes healthy
+    slow       primary answers after --slow-latency seconds
+    down       primary answers HTTP 503
+
+Each phase runs once with a single endpoint (the old behaviour), once with
+the pool and once with the pool plus hedged reads. A final step signs one
+transaction, takes the node that accepted it down and re-broadcasts the same
+bytes to check the failover keeps the hash and nonce.
+
+    python -m benchmarks.rpc_failover
+    python -m benchmarks.rpc_failover --reads 500 --slow-latency 1.0
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from benchmarks._rpc_stub import RpcStub
+
+
+def _percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _reads(service, count: int, concurrency: int):
+    """Issue count eth_blockNumber reads; returns (latencies ms, errors)"""
+    samples, errors = [], 0
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one():
+        nonlocal errors
+        async with gate:
+            start = time.perf_counter()
+            try:
+                await service.w3.eth.block_number
+            except Exception:
+                errors += 1
+                return
+            samples.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(count)))
+    return samples, errors
+
+
+async def run_reads(stubs, args) -> None:
+    from app.services.blockchain import AsyncBlockchainService
+
+    setups = [
+        ("single", [stubs[0].url], None),
+        ("pool", [stub.url for stub in stubs], None),
+        ("pool+hedge", [stub.url for stub in stubs], args.hedge_after),
+    ]
+    print(f"{'phase':<8} {'setup':<11} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for phase in ("steady", "slow", "down"):
+        for name, urls, hedge_after in setups:
+            for stub in stubs:
+                stub.latency, stub.down = args.rpc_latency, False
+            if phase == "slow":
+                stubs[0].latency = args.slow_latency
+            if phase == "down":
+                stubs[0].down = True
+
+            service = AsyncBlockchainService(rpc_urls=urls)
+            service.provider.hedge_after = hedge_after
+            await service.connect()
+            # Let the pool learn the current latencies before measuring
+            await _reads(service, args.concurrency, args.concurrency)
+            samples, errors = await _reads(service, args.reads, args.concurrency)
+            await service.close()
+
+            p50 = f"{statistics.median(samples):.1f}" if samples else "-"
+            p99 = f"{_percentile(samples, 99):.1f}" if samples else "-"
+            print(f"{phase:<8} {name:<11} {p50:>8} {p99:>8} {errors:>7}")
+
+
+async def run_write_failover(stubs) -> None:
+    from app.services.blockchain import AsyncBlockchainService
+    from app.services.rpc_pool import endpoint_label
+
+    for stub in stubs:
+        stub.down = False
+    service = AsyncBlockchainService(rpc_urls=[stub.url for stub in stubs])
+    await service.connect()
+    prepared = await service.prepare_register_land("BENCH000000001", "QmBenchmark", 100, 1, "benchmark")
+    first = await service.send_raw_transaction(prepared["raw_transaction"])
+    writer = service.provider.stats()["writer"]
+    next(stub for stub in stubs if endpoint_label(stub.url) == writer).down = True
+    second = await service.send_raw_transaction(prepared["raw_transaction"])
+    failover = service.provider.stats()["writer"]
+    await service.close()
+
+    print(
+        f"write failover: nonce={prepared['nonce']} {writer} -> {failover} "
+        f"same_hash={first == second}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reads", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rpc-latency", type=float, default=0.03, help="seconds per RPC call on healthy nodes")
+    parser.add_argument("--slow-latency", type=float, default=0.5, help="seconds per RPC call on the slow primary")
+    parser.add_argument("--hedge-after", type=float, default=0.1, help="seconds before a read is hedged")
+    args = parser.parse_args()
+
+    stubs = [RpcStub(latency=args.rpc_latency).start() for _ in range(3)]
+    os.environ["SEPOLIA_RPC_URL"] = stubs[0].url
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("DB_NAME", "land_registry_bench")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    try:
+        asyncio.run(run_reads(stubs, args))
+        asyncio.run(run_write_failover(stubs))
+    finally:
+        for stub in stubs:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: app import + first request with the RPC node offline.
+
+Runs each sample in a fresh interpreter, so module import is measured cold.
+The child imports app.main, then serves GET /api/v1/ and GET
+/api/v1/blockchain through the ASGI app. The RPC URL points at an address
+that never answers, so anything that waits on the node at import time or on
+the first request shows up as a budget breach.
+
+    python -m benchmarks.startup_time
+    python -m benchmarks.startup_time --budget 3 --runs 5
+
+Exits non-zero if the median import + first request exceeds --budget seconds.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Blackholed address: connections hang instead of being refused
+OFFLINE_RPC_URL = "http://10.255.255.1:8545"
+
+
+def _child() -> None:
+    start = time.perf_counter()
+    from app.main import app
+    imported = time.perf_counter()
+
+    import asyncio
+    import httpx
+
+    async def first_requests():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            health = await client.get("/api/v1/")
+            first = time.perf_counter()
+            readiness = await client.get("/api/v1/blockchain")
+            return health.json(), first, readiness.json()
+
+    health, first, readiness = asyncio.run(first_requests())
+    print(json.dumps({
+        "import_s": imported - start,
+        "first_request_s": first - imported,
+        "total_s": first - start,
+        "health": health,
+        "blockchain": readiness,
+    }))
+
+
+def _sample(rpc_url: str) -> dict:
+    env = dict(os.environ)
+    env["SEPOLIA_RPC_URL"] = rpc_url
+    env.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    env.setdefault("DB_NAME", "land_registry_bench")
+    env.setdefault("JWT_SECRET_KEY", "benchmark")
+    env.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup_time", "--child"],
+        env=env, capture_output=True, text=True, timeout=120,
+    )
+    if out.returncode != 0:
+        raise RuntimeError(f"app failed to start:\n{out.stderr}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget", type=float, default=5.0, help="seconds for import + first request")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--rpc-url", default=OFFLINE_RPC_URL)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+        return
+
+    samples = [_sample(args.rpc_url) for _ in range(args.runs)]
+    for s in samples:
+        print(
+            f"import={s['import_s']:.2f}s first_request={s['first_request_s'] * 1000:.0f}ms "
+            f"total={s['total_s']:.2f}s blockchain={s['health'].get('blockchain')}"
+        )
+    median = statistics.median(s["total_s"] for s in samples)
+    verdict = "OK" if median <= args.budget else "OVER BUDGET"
+    print(f"median import + first request: {median:.2f}s (budget {args.budget:.2f}s) {verdict}")
+    if median > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark: pinning token metadata JSON for a mass mint.
+
+Creates --lands lands and has each one's metadata pinned through
+TokenMetadataService.token_uri(), as POST /land/{id}/mint does, with the
+mints arriving spread over --arrival seconds. Runs it twice against the
+local Pinata stub (benchmarks/_pinata_stub.py), which holds every upload
+for --latency seconds:
+
+    per-token   METADATA_BATCH_SIZE=1: one pin per token
+    batched     METADATA_BATCH_SIZE=--batch-size, METADATA_BATCH_WINDOW_SECONDS=--window
+
+and reports wall time, uploads sent, per-mint latency and mints that failed
+(e.g. timing out waiting for one of PINATA_POOL_SIZE connections), then
+mints the batched lands again to show the cached URIs being reused without
+uploading.
+
+    python -m benchmarks.token_metadata
+    python -m benchmarks.token_metadata --lands 500 --arrival 5 --latency 1.0
+
+Needs a MongoDB at MONGO_URL; the benchmark uses (and drops) its own
+database, DB_NAME=land_registry_metadata_bench by default.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime
+
+
+async def _create_lands(db, count: int, tag: str) -> list:
+    from app.models.land import LandModel
+
+    now = datetime.utcnow()
+    lands = [{
+        "property_id": f"{tag}{i:09d}",
+        "title": f"Benchmark land {i}",
+        "description": "metadata benchmark",
+        "area": 100 + i,
+        "price": 1000,
+        "location": {"lat": 0.0, "lng": 0.0, "address": f"Plot {i}, Benchmark Rd"},
+        "documents": [{"name": "deed.pdf", "ipfs_hash": f"QmBenchmark{i:036d}", "type": "application/pdf"}],
+        "status": "verified",
+        "blockchain_status": "not_minted",
+        "created_at": now,
+        "updated_at": now,
+    } for i in range(count)]
+    await db[LandModel.collection_name].insert_many(lands)
+    return lands
+
+
+async def _mint_all(service, db, lands: list, arrival: float, seed: int) -> dict:
+    from fastapi import HTTPException
+
+    rng = random.Random(seed)
+    latencies = []
+    failures = 0
+
+    async def mint(land: dict) -> str:
+        nonlocal failures
+        await asyncio.sleep(rng.uniform(0, arrival))
+        started = time.perf_counter()
+        try:
+            uri = await service.token_uri(db, land)
+        except HTTPException:
+            failures += 1
+            return None
+        latencies.append(time.perf_counter() - started)
+        return uri
+
+    started = time.perf_counter()
+    uris = await asyncio.gather(*(mint(land) for land in lands))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "wall": wall,
+        "uris": uris,
+        "failures": failures,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "p99": latencies[max(0, int(len(latencies) * 0.99) - 1)] if latencies else 0.0,
+    }
+
+
+async def run(args, stub) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.core.config import settings
+    from app.models.land import LandModel
+    from app.services.pinata_service import pinata_service
+    from app.services.token_metadata import TokenMetadataService
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    db = client[settings.DB_NAME]
+    await pinata_service.connect()
+    rows = []
+    try:
+        for name, batch_size in (("per-token", 1), ("batched", args.batch_size)):
+            settings.METADATA_BATCH_SIZE = batch_size
+            settings.METADATA_BATCH_WINDOW_SECONDS = args.window
+            service = TokenMetadataService()
+            lands = await _create_lands(db, args.lands, "M" if batch_size == 1 else "N")
+            uploads = stub.uploads
+            result = await _mint_all(service, db, lands, args.arrival, args.seed)
+            rows.append((name, result, stub.uploads - uploads))
+
+        # Mint the batched lands again, as after failed mint jobs: cached URIs
+        batched = await db[LandModel.collection_name].find({"property_id": {"$regex": "^N"}}).to_list(None)
+        uploads = stub.uploads
+        again = await _mint_all(service, db, batched, 0, args.seed)
+        assert sorted(again["uris"]) == sorted(rows[-1][1]["uris"]), "re-mint changed token URIs"
+        rows.append(("re-mint", again, stub.uploads - uploads))
+        stats = service.stats()
+    finally:
+        await pinata_service.close()
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+
+    print(f"lands={args.lands} arrival={args.arrival}s latency={args.latency}s "
+          f"batch_size={args.batch_size} window={args.window}s")
+    print(f"{'mode':<10} {'wall s':>7} {'uploads':>8} {'failed':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, result, uploads in rows:
+        print(f"{name:<10} {result['wall']:>7.2f} {uploads:>8} {result['failures']:>7} "
+              f"{result['p50'] * 1000:>8.1f} {result['p99'] * 1000:>8.1f}")
+    print(f"example URI: {rows[1][1]['uris'][0]}")
+    print(f"batched service: {stats}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lands", type=int, default=200)
+    parser.add_argument("--arrival", type=float, default=2.0, help="mints arrive uniformly over this many seconds")
+    parser.add_argument("--latency", type=float, default=0.5, help="stub processing time per upload")
+    parser.add_argument("--batch-size", type=int, default=100, help="METADATA_BATCH_SIZE when batched")
+    parser.add_argument("--window", type=float, default=0.25, help="METADATA_BATCH_WINDOW_SECONDS")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    from benchmarks._pinata_stub import PinataStub
+
+    stub = PinataStub(latency=args.latency).start()
+    # The app reads its settings at import, so point it at the stub first
+    os.environ["DOCUMENT_STORE"] = "pinata"
+    os.environ["PINATA_API_URL"] = stub.url
+    os.environ["PINATA_API_KEY"] = "bench"
+    os.environ["PINATA_SECRET_API_KEY"] = "bench"
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_metadata_bench")
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    try:
+        asyncio.run(run(args, stub))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Benchmark: authenticated requests with and without the user cache.
+
+Seeds --users users and sends --requests authenticated GET /auth/me
+requests from them (--concurrency at a time) through the API, first with
+USER_CACHE_TTL_SECONDS=0 (a users read per request, as before) and then
+with the cache on. Reports requests/sec, latency and users-collection reads.
+
+Then checks invalidation with two workers sharing the database: worker A
+serves the API, worker B is a second UserCache. --changes times an admin
+changes a user's role through PATCH /admin/users/{id}/role on A while B has
+that user cached; reports how long B keeps serving the old role
+(USER_CACHE_POLL_SECONDS bounds it in poll mode).
+
+    python -m benchmarks.user_cache
+    python -m benchmarks.user_cache --invalidation change_stream   # needs a replica set
+
+Needs a MongoDB at MONGO_URL; the benchmark uses (and drops) its own
+database, DB_NAME=land_registry_user_cache_bench by default. Only the auth
+and admin routers are mounted, with the benchmark's database.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime
+
+
+async def _seed(db, count: int) -> list:
+    from app.core.security import create_access_token
+
+    now = datetime.utcnow()
+    users = [{
+        "email": f"user{i}@example.com",
+        "username": f"user{i}",
+        "hashed_password": "not-a-real-hash",
+        "full_name": f"User {i}",
+        "is_active": True,
+        "is_verified": False,
+        "role": "admin" if i == 0 else "user",
+        "created_at": now,
+        "updated_at": now,
+    } for i in range(count)]
+    await db.users.insert_many(users)
+    for user in users:
+        user["token"] = create_access_token({"sub": user["email"]})
+    return users
+
+
+async def _requests(api, users: list, args) -> dict:
+    rng = random.Random(args.seed)
+    latencies = []
+    queue = [rng.choice(users[1:]) for _ in range(args.requests)]
+
+    async def client():
+        while queue:
+            user = queue.pop()
+            started = time.perf_counter()
+            response = await api.get("/auth/me", headers={"Authorization": f"Bearer {user['token']}"})
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": args.requests / wall,
+        "p50": statistics.median(latencies),
+        "p99": latencies[max(0, int(len(latencies) * 0.99) - 1)],
+    }
+
+
+async def _propagation(api, db, users: list, args) -> list:
+    """Seconds worker B served a user's old role after A changed it"""
+    from app.services.user_cache import UserCache
+
+    worker_b = UserCache()
+    await worker_b.start(db)
+    admin = {"Authorization": f"Bearer {users[0]['token']}"}
+    delays = []
+    try:
+        for i in range(args.changes):
+            user = users[1 + i % (len(users) - 1)]
+            before = await worker_b.get(db, user["email"])
+            role = "verifier" if before.role == "user" else "user"
+            started = time.perf_counter()
+            response = await api.patch(f"/admin/users/{user['_id']}/role", json={"role": role}, headers=admin)
+            response.raise_for_status()
+            while (await worker_b.get(db, user["email"])).role != role:
+                if time.perf_counter() - started > args.timeout:
+                    break
+                await asyncio.sleep(0.005)
+            delays.append(time.perf_counter() - started)
+        return delays, worker_b.stats()
+    finally:
+        await worker_b.stop()
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import FastAPI
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.api.v1.endpoints import admin, auth
+    from app.core.config import settings
+    from app.db.indexes import IndexReconciler
+    from app.db.mongodb import get_database
+    from app.models.cache_invalidation import CacheInvalidationModel
+    from app.services import user_cache as user_cache_module
+    from app.utils.cache import TTLLRUCache
+
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    await client.drop_database(settings.DB_NAME)
+    db = client[settings.DB_NAME]
+
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+    app.include_router(admin.router, prefix="/admin")
+    app.dependency_overrides[get_database] = lambda: db
+    cache = user_cache_module.user_cache
+    rows = []
+    try:
+        await IndexReconciler().reconcile(db, models=(CacheInvalidationModel,))
+        users = await _seed(db, args.users)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as api:
+            ttl = settings.USER_CACHE_TTL_SECONDS
+            settings.USER_CACHE_TTL_SECONDS = 0
+            result = await _requests(api, users, args)
+            rows.append(("no cache", result, args.requests))
+
+            settings.USER_CACHE_TTL_SECONDS = ttl
+            cache.cache = TTLLRUCache(ttl, settings.USER_CACHE_MAX_ENTRIES)
+            await cache.start(db)
+            result = await _requests(api, users, args)
+            rows.append(("cache", result, cache.cache.misses))
+            delays, worker_b = await _propagation(api, db, users, args)
+            stats = cache.stats()
+            await cache.stop()
+    finally:
+        await client.drop_database(settings.DB_NAME)
+        client.close()
+
+    print(f"users={args.users} requests={args.requests} concurrency={args.concurrency} "
+          f"ttl={settings.USER_CACHE_TTL_SECONDS}s invalidation={args.invalidation}")
+    print(f"{'mode':<9} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'user reads':>11}")
+    for name, result, reads in rows:
+        print(f"{name:<9} {result['rps']:>8.0f} {result['p50'] * 1000:>8.2f} {result['p99'] * 1000:>8.2f} {reads:>11}")
+    print(f"worker A: {stats}")
+    print(f"role change seen by worker B ({worker_b['invalidation']}): p50 {statistics.median(delays) * 1000:.0f} ms, "
+          f"max {max(delays) * 1000:.0f} ms over {len(delays)} changes")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--changes", type=int, default=10, help="role changes for the invalidation check")
+    parser.add_argument("--invalidation", default="poll", choices=["poll", "change_stream"])
+    parser.add_argument("--poll-seconds", type=float, default=1.0, help="USER_CACHE_POLL_SECONDS")
+    parser.add_argument("--timeout", type=float, default=60.0, help="give up waiting for worker B after this")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "land_registry_user_cache_bench")
+    os.environ["USER_CACHE_INVALIDATION"] = args.invalidation
+    os.environ["USER_CACHE_POLL_SECONDS"] = str(args.poll_seconds)
+    os.environ.setdefault("SEPOLIA_RPC_URL", "http://127.0.0.1:9")
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("ADMIN_PRIVATE_KEY", "0x" + "11" * 32)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
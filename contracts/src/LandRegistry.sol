@@ -18,6 +18,9 @@ contract LandRegistry is ERC721URIStorage, AccessControl {
     // Required number of verifications before minting
     uint256 public constant REQUIRED_VERIFICATIONS = 3;
     
+    // Maximum number of tokens per verifyLandBatch / rejectLandBatch call
+    uint256 public constant MAX_BATCH_SIZE = 50;
+    
     // Token ID counter (replaces Counters library)
     uint256 private _nextTokenId;
     
@@ -91,6 +94,17 @@ contract LandRegistry is ERC721URIStorage, AccessControl {
         string newIpfsHash
     );
     
+    event VerificationRecorded(
+        uint256 indexed tokenId,
+        address indexed verifier,
+        uint256 verificationCount
+    );
+    
+    event BatchItemSkipped(
+        uint256 indexed tokenId,
+        string reason
+    );
+    
     /**
      * @dev Constructor to initialize the contract
      */
@@ -156,29 +170,35 @@ contract LandRegistry is ERC721URIStorage, AccessControl {
      * @param tokenId ID of the land to verify
      */
     function verifyLand(uint256 tokenId, address verifierAddress) public onlyRole(VERIFIER_ROLE) {
-        require(_landMetadata[tokenId].currentOwner != address(0), "Land does not exist");
-        require(
-            _landMetadata[tokenId].status == VerificationStatus.Pending,
-            "Land is not pending verification"
-        );
-        require(!_hasVerified[tokenId][verifierAddress], "You have already verified this land");
+        string memory blocker = _verificationBlocker(tokenId, verifierAddress);
+        require(bytes(blocker).length == 0, blocker);
         
-        _hasVerified[tokenId][verifierAddress] = true;
-        _verificationCounts[tokenId]++;
+        _recordVerification(tokenId, verifierAddress);
+    }
+    
+    /**
+     * @dev Verify several land parcels in one transaction (only verifiers).
+     * Tokens that cannot be verified are skipped with BatchItemSkipped
+     * instead of reverting the whole batch.
+     * @param tokenIds IDs of the lands to verify
+     * @param verifierAddress Verifier on whose behalf the verifications are recorded
+     * @return recorded Number of verifications recorded
+     */
+    function verifyLandBatch(uint256[] calldata tokenIds, address verifierAddress)
+        external
+        onlyRole(VERIFIER_ROLE)
+        returns (uint256 recorded)
+    {
+        require(tokenIds.length > 0 && tokenIds.length <= MAX_BATCH_SIZE, "Invalid batch size");
         
-        if (_verificationCounts[tokenId] == REQUIRED_VERIFICATIONS) {
-            // Mint NFT to the owner finally
-            _safeMint(_landMetadata[tokenId].currentOwner, tokenId);
-            _setTokenURI(tokenId, _landMetadata[tokenId].ipfsHash);
-            
-            _landMetadata[tokenId].status = VerificationStatus.Verified;
-            _landMetadata[tokenId].verifiedAt = block.timestamp;
-            _landMetadata[tokenId].verifiedBy = verifierAddress;
-            
-            emit LandVerified(tokenId, verifierAddress, block.timestamp);
-        } else {
-            // Partial Verification
-            _landMetadata[tokenId].verifiedBy = verifierAddress;
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            string memory blocker = _verificationBlocker(tokenIds[i], verifierAddress);
+            if (bytes(blocker).length > 0) {
+                emit BatchItemSkipped(tokenIds[i], blocker);
+                continue;
+            }
+            _recordVerification(tokenIds[i], verifierAddress);
+            recorded++;
         }
     }
     
@@ -191,17 +211,40 @@ contract LandRegistry is ERC721URIStorage, AccessControl {
         public 
         onlyRole(VERIFIER_ROLE) 
     {
-        require(_landMetadata[tokenId].currentOwner != address(0), "Land does not exist");
-        require(
-            _landMetadata[tokenId].status == VerificationStatus.Pending,
-            "Land is not pending verification"
-        );
+        string memory blocker = _rejectionBlocker(tokenId);
+        require(bytes(blocker).length == 0, blocker);
         
         _landMetadata[tokenId].status = VerificationStatus.Rejected;
         
         emit LandRejected(tokenId, msg.sender, reason);
     }
     
+    /**
+     * @dev Reject several land parcels with the same reason (only verifiers).
+     * Tokens that cannot be rejected are skipped with BatchItemSkipped.
+     * @param tokenIds IDs of the lands to reject
+     * @param reason Reason for rejection
+     * @return rejected Number of lands rejected
+     */
+    function rejectLandBatch(uint256[] calldata tokenIds, string calldata reason)
+        external
+        onlyRole(VERIFIER_ROLE)
+        returns (uint256 rejected)
+    {
+        require(tokenIds.length > 0 && tokenIds.length <= MAX_BATCH_SIZE, "Invalid batch size");
+        
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            string memory blocker = _rejectionBlocker(tokenIds[i]);
+            if (bytes(blocker).length > 0) {
+                emit BatchItemSkipped(tokenIds[i], blocker);
+                continue;
+            }
+            _landMetadata[tokenIds[i]].status = VerificationStatus.Rejected;
+            emit LandRejected(tokenIds[i], msg.sender, reason);
+            rejected++;
+        }
+    }
+    
     /**
      * @dev Transfer land ownership (only verified lands can be transferred)
      * @param to Address of the new owner
@@ -294,6 +337,65 @@ contract LandRegistry is ERC721URIStorage, AccessControl {
         return _nextTokenId;
     }
     
+    /**
+     * @dev Reason a verification cannot be recorded, empty if it can
+     * @param tokenId ID of the land
+     * @param verifierAddress Verifier on whose behalf it would be recorded
+     */
+    function _verificationBlocker(uint256 tokenId, address verifierAddress) private view returns (string memory) {
+        if (_landMetadata[tokenId].currentOwner == address(0)) {
+            return "Land does not exist";
+        }
+        if (_landMetadata[tokenId].status != VerificationStatus.Pending) {
+            return "Land is not pending verification";
+        }
+        if (_hasVerified[tokenId][verifierAddress]) {
+            return "You have already verified this land";
+        }
+        return "";
+    }
+    
+    /**
+     * @dev Reason a land cannot be rejected, empty if it can
+     * @param tokenId ID of the land
+     */
+    function _rejectionBlocker(uint256 tokenId) private view returns (string memory) {
+        if (_landMetadata[tokenId].currentOwner == address(0)) {
+            return "Land does not exist";
+        }
+        if (_landMetadata[tokenId].status != VerificationStatus.Pending) {
+            return "Land is not pending verification";
+        }
+        return "";
+    }
+    
+    /**
+     * @dev Record one verification, minting the NFT on the last required one
+     * @param tokenId ID of the land
+     * @param verifierAddress Verifier on whose behalf it is recorded
+     */
+    function _recordVerification(uint256 tokenId, address verifierAddress) private {
+        _hasVerified[tokenId][verifierAddress] = true;
+        uint256 count = ++_verificationCounts[tokenId];
+        
+        emit VerificationRecorded(tokenId, verifierAddress, count);
+        
+        if (count == REQUIRED_VERIFICATIONS) {
+            // Mint NFT to the owner finally
+            _safeMint(_landMetadata[tokenId].currentOwner, tokenId);
+            _setTokenURI(tokenId, _landMetadata[tokenId].ipfsHash);
+            
+            _landMetadata[tokenId].status = VerificationStatus.Verified;
+            _landMetadata[tokenId].verifiedAt = block.timestamp;
+            _landMetadata[tokenId].verifiedBy = verifierAddress;
+            
+            emit LandVerified(tokenId, verifierAddress, block.timestamp);
+        } else {
+            // Partial Verification
+            _landMetadata[tokenId].verifiedBy = verifierAddress;
+        }
+    }
+    
     /**
      * @dev Internal function to remove token from owner's list
      * @param owner Address of the owner
@@ -205,6 +205,102 @@ contract LandRegistryTest is Test {
         landRegistry.verifyLand(tokenId, verifier1);
     }
     
+    // ============ Batch Tests ============
+    
+    function _registerThree() internal returns (uint256[] memory tokenIds) {
+        tokenIds = new uint256[](3);
+        vm.startPrank(user1);
+        tokenIds[0] = landRegistry.registerLand(PROP_ID_1, IPFS_HASH, LAND_AREA, LAND_PRICE, LOCATION);
+        tokenIds[1] = landRegistry.registerLand(PROP_ID_2, IPFS_HASH, LAND_AREA, LAND_PRICE, LOCATION);
+        tokenIds[2] = landRegistry.registerLand(PROP_ID_3, IPFS_HASH, LAND_AREA, LAND_PRICE, LOCATION);
+        vm.stopPrank();
+    }
+    
+    function testVerifyLandBatch() public {
+        uint256[] memory tokenIds = _registerThree();
+        
+        vm.prank(adminRelayer);
+        uint256 recorded = landRegistry.verifyLandBatch(tokenIds, verifier1);
+        
+        assertEq(recorded, 3);
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            assertEq(landRegistry.getVerificationCount(tokenIds[i]), 1);
+        }
+    }
+    
+    function testVerifyLandBatchMintsOnFinalVerification() public {
+        uint256[] memory tokenIds = _registerThree();
+        
+        vm.prank(adminRelayer);
+        landRegistry.verifyLandBatch(tokenIds, verifier1);
+        vm.prank(adminRelayer);
+        landRegistry.verifyLandBatch(tokenIds, verifier2);
+        
+        vm.prank(adminRelayer);
+        vm.expectEmit(true, true, false, true);
+        emit LandRegistry.LandVerified(tokenIds[1], verifier3, block.timestamp);
+        landRegistry.verifyLandBatch(tokenIds, verifier3);
+        
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            LandRegistry.LandMetadata memory metadata = landRegistry.getLandDetails(tokenIds[i]);
+            assertTrue(metadata.status == LandRegistry.VerificationStatus.Verified);
+            assertEq(landRegistry.ownerOf(tokenIds[i]), user1);
+        }
+    }
+    
+    function testVerifyLandBatchSkipsInvalidTokens() public {
+        uint256[] memory registered = _registerThree();
+        vm.prank(adminRelayer);
+        landRegistry.verifyLand(registered[1], verifier1);
+        
+        uint256[] memory tokenIds = new uint256[](3);
+        tokenIds[0] = registered[0];
+        tokenIds[1] = registered[1];
+        tokenIds[2] = 999;
+        
+        vm.prank(adminRelayer);
+        vm.expectEmit(true, false, false, true);
+        emit LandRegistry.BatchItemSkipped(registered[1], "You have already verified this land");
+        vm.expectEmit(true, false, false, true);
+        emit LandRegistry.BatchItemSkipped(999, "Land does not exist");
+        uint256 recorded = landRegistry.verifyLandBatch(tokenIds, verifier1);
+        
+        assertEq(recorded, 1);
+        assertEq(landRegistry.getVerificationCount(registered[0]), 1);
+        assertEq(landRegistry.getVerificationCount(registered[1]), 1);
+    }
+    
+    function testVerifyLandBatchRevertsForNonVerifier() public {
+        uint256[] memory tokenIds = _registerThree();
+        
+        vm.prank(user2);
+        vm.expectRevert();
+        landRegistry.verifyLandBatch(tokenIds, verifier1);
+    }
+    
+    function testVerifyLandBatchRevertsWhenTooLarge() public {
+        uint256[] memory tokenIds = new uint256[](landRegistry.MAX_BATCH_SIZE() + 1);
+        
+        vm.prank(adminRelayer);
+        vm.expectRevert("Invalid batch size");
+        landRegistry.verifyLandBatch(tokenIds, verifier1);
+    }
+    
+    function testRejectLandBatch() public {
+        uint256[] memory tokenIds = _registerThree();
+        _fullyVerify(tokenIds[2]);
+        
+        vm.prank(adminRelayer);
+        vm.expectEmit(true, false, false, true);
+        emit LandRegistry.BatchItemSkipped(tokenIds[2], "Land is not pending verification");
+        uint256 rejected = landRegistry.rejectLandBatch(tokenIds, "Invalid documents");
+        
+        assertEq(rejected, 2);
+        assertTrue(landRegistry.getLandDetails(tokenIds[0]).status == LandRegistry.VerificationStatus.Rejected);
+        assertTrue(landRegistry.getLandDetails(tokenIds[1]).status == LandRegistry.VerificationStatus.Rejected);
+        assertTrue(landRegistry.getLandDetails(tokenIds[2]).status == LandRegistry.VerificationStatus.Verified);
+    }
+    
     // ============ Transfer Tests ============
     
     function testTransferVerifiedLand() public {
@@ -306,6 +402,16 @@ contract LandRegistryTest is Test {
         landRegistry.verifyLand(tokenId, verifier3);
     }
     
+    function testVerificationRecordedEvent() public {
+        vm.prank(user1);
+        uint256 tokenId = landRegistry.registerLand(PROP_ID_1, IPFS_HASH, LAND_AREA, LAND_PRICE, LOCATION);
+        
+        vm.prank(adminRelayer);
+        vm.expectEmit(true, true, false, true);
+        emit LandRegistry.VerificationRecorded(tokenId, verifier1, 1);
+        landRegistry.verifyLand(tokenId, verifier1);
+    }
+    
     // ============ Access Control Tests ============
     
     function testAdminRole() public {
@@ -0,0 +1,37 @@
+import { useCallback, useState } from "react"
+
+// State for a cursor-paginated list endpoint ({ items, next_cursor }).
+// fetchPage(cursor) returns one page; load() replaces the list with the
+// first page and loadMore() appends the next one. Errors are left to the
+// caller, which knows what to tell the user.
+export function useCursorList(fetchPage) {
+  const [items, setItems] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+
+  const load = useCallback(async () => {
+    setLoading(true)
+    try {
+      const page = await fetchPage()
+      setItems(page.items)
+      setNextCursor(page.next_cursor)
+    } finally {
+      setLoading(false)
+    }
+  }, [fetchPage])
+
+  const loadMore = useCallback(async () => {
+    if (!nextCursor) return
+    setLoadingMore(true)
+    try {
+      const page = await fetchPage(nextCursor)
+      setItems((current) => [...current, ...page.items])
+      setNextCursor(page.next_cursor)
+    } finally {
+      setLoadingMore(false)
+    }
+  }, [fetchPage, nextCursor])
+
+  return { items, setItems, loading, loadingMore, hasMore: Boolean(nextCursor), load, loadMore }
+}
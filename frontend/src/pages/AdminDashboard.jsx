@@ -32,6 +32,7 @@ import { Shield, Users, RefreshCw, Crown, UserCheck, User as UserIcon, Gavel, Al
 import { toast } from 'sonner';
 import { adminAPI } from '@/services/api';
 import { useAuth } from '@/contexts/AuthContext';
+import { useCursorList } from '@/hooks/use-cursor-list';
 
 const ROLE_CONFIG = {
     admin: { label: 'Admin', color: 'bg-amber-500/20 text-amber-400 border-amber-500/30', icon: Crown },
@@ -53,27 +54,35 @@ const RoleBadge = ({ role }) => {
 export const AdminDashboard = () => {
     const { user: currentUser } = useAuth();
     const navigate = useNavigate();
-    const [users, setUsers] = useState([]);
-    const [disputes, setDisputes] = useState([]);
-    const [loading, setLoading] = useState(true);
+    const usersList = useCursorList(adminAPI.getUsers);
+    const disputesList = useCursorList(adminAPI.getDisputedTransfers);
+    const users = usersList.items;
+    const disputes = disputesList.items;
+    const loading = usersList.loading || disputesList.loading;
     const [pendingChange, setPendingChange] = useState(null); // { userId, newRole, userName }
 
     const fetchData = async () => {
-        setLoading(true);
         try {
-            const [usersData, disputesData] = await Promise.all([
-                adminAPI.getUsers(),
-                adminAPI.getDisputedTransfers()
-            ]);
-            setUsers(usersData);
-            setDisputes(disputesData);
+            await Promise.all([usersList.load(), disputesList.load()]);
         } catch (err) {
             toast.error('Failed to load users');
-        } finally {
-            setLoading(false);
         }
     };
 
+    const LoadMore = ({ list, label }) => list.hasMore && (
+        <div className="text-center mt-4">
+            <Button
+                variant="outline"
+                size="sm"
+                disabled={list.loadingMore}
+                onClick={() => list.loadMore().catch(() => toast.error(`Failed to load more ${label}`))}
+            >
+                <RefreshCw className={`w-4 h-4 mr-2 ${list.loadingMore ? 'animate-spin' : ''}`} />
+                Load more {label}
+            </Button>
+        </div>
+    );
+
     useEffect(() => { fetchData(); }, []);
 
     const handleRoleSelect = (userId, newRole, userName) => {
@@ -104,7 +113,7 @@ export const AdminDashboard = () => {
     };
 
     const stats = {
-        total: users.length,
+        total: `${users.length}${usersList.hasMore ? '+' : ''}`,
         users: users.filter(u => u.role === 'user').length,
         verifiers: users.filter(u => u.role === 'verifier').length,
         admins: users.filter(u => u.role === 'admin').length,
@@ -222,6 +231,7 @@ export const AdminDashboard = () => {
                                 </TableBody>
                             </Table>
                         )}
+                        {!loading && <LoadMore list={usersList} label="users" />}
                     </CardContent>
                 </Card>
 
@@ -264,6 +274,7 @@ export const AdminDashboard = () => {
                                     </div>
                                 ))}
                             </div>
+                            <LoadMore list={disputesList} label="disputes" />
                         </CardContent>
                     </Card>
                 )}
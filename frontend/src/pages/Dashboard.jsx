@@ -34,13 +34,16 @@ import {
   ThumbsUp,
 } from 'lucide-react';
 import { landAPI, userAPI } from '@/services/api';
+import { useCursorList } from '@/hooks/use-cursor-list';
 import { toast } from 'sonner';
 import { useNavigate } from 'react-router-dom';
 
 export const Dashboard = () => {
   const navigate = useNavigate();
   const [selectedProperty, setSelectedProperty] = useState(null);
-  const [lands, setLands] = useState([]);
+  const {
+    items: lands, hasMore: hasMoreLands, loadingMore: loadingMoreLands, load: loadLands, loadMore: loadMoreLands,
+  } = useCursorList(landAPI.getMyLands);
   const [loading, setLoading] = useState(true);
 
   // Verify Ownership Modal state
@@ -73,11 +76,10 @@ export const Dashboard = () => {
   const fetchDashboardData = async () => {
     try {
       setLoading(true);
-      const [landsData, transfersData] = await Promise.all([
-        landAPI.getMyLands(),
+      const [, transfersData] = await Promise.all([
+        loadLands(),
         landAPI.getMyTransfers()
       ]);
-      setLands(landsData);
       setTransfers(transfersData);
     } catch (err) {
       console.error('Failed to fetch dashboard data:', err);
@@ -95,7 +97,7 @@ export const Dashboard = () => {
   const dashboardStats = [
     {
       title: 'Total Properties',
-      value: lands.length.toString(),
+      value: `${lands.length}${hasMoreLands ? '+' : ''}`,
       change: `+${lands.length}`,
       trend: 'up',
       icon: Building,
@@ -819,6 +821,17 @@ export const Dashboard = () => {
                     )}
                   </TabsContent>
                 </Tabs>
+                {hasMoreLands && (
+                  <Button
+                    variant="outline"
+                    className="w-full mt-4"
+                    disabled={loadingMoreLands}
+                    onClick={() => loadMoreLands().catch(() => toast.error('Failed to load more properties'))}
+                  >
+                    {loadingMoreLands && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
+                    Load more properties
+                  </Button>
+                )}
               </CardContent>
             </Card>
           </div>
@@ -10,7 +10,7 @@ import { Dialog, DialogContent, DialogDescription, DialogFooter, DialogHeader, D
 import { CheckCircle, XCircle, MapPin, FileText, DollarSign, User, Calendar, ArrowLeft, ExternalLink, Cpu, RefreshCw } from 'lucide-react';
 import { toast } from 'sonner';
 
-import { landAPI, verifierAPI } from '@/services/api';
+import { landAPI, verifierAPI, documentUrl } from '@/services/api';
 import { MapView } from '@/components/MapView';
 import { useAuth } from '@/contexts/AuthContext';
 
@@ -43,8 +43,9 @@ export const ReviewLand = () => {
 
             // Fetch existing registered lands for context map
             try {
-                const verifiedLandsData = await verifierAPI.getVerifiedLands();
-                const filtered = verifiedLandsData.filter(l => l.id !== landId);
+                // First page only: the overlay is context, not a complete list
+                const verifiedLandsPage = await verifierAPI.getVerifiedLands();
+                const filtered = verifiedLandsPage.items.filter(l => l.id !== landId);
                 setExistingLands(filtered);
             } catch (err) {
                 console.warn('Could not fetch verified lands for map overlay', err);
@@ -355,7 +356,7 @@ export const ReviewLand = () => {
                                                             </p>
                                                         </div>
                                                         <a
-                                                            href={`https://gateway.pinata.cloud/ipfs/${doc.ipfs_hash}`}
+                                                            href={documentUrl(doc.ipfs_hash)}
                                                             target="_blank"
                                                             rel="noopener noreferrer"
                                                             className="text-primary hover:underline text-sm flex items-center gap-1"
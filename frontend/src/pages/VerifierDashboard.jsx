@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useEffect, useCallback } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
@@ -9,25 +9,21 @@ import { toast } from 'sonner';
 
 import { verifierAPI } from '@/services/api';
 import { useAuth } from '@/contexts/AuthContext';
+import { useCursorList } from '@/hooks/use-cursor-list';
 
 export const VerifierDashboard = () => {
-    const [allLands, setAllLands] = useState([]);
-    const [loading, setLoading] = useState(true);
+    const {
+        items: allLands, loading, loadingMore, hasMore, load, loadMore,
+    } = useCursorList(verifierAPI.getAllPendingLands);
     const navigate = useNavigate();
 
-    const fetchLands = useCallback(async () => {
-        try {
-            setLoading(true);
-            const lands = await verifierAPI.getAllPendingLands();
-            setAllLands(lands);
-        } catch (error) {
-            console.error('Error fetching lands:', error);
-            const msg = error.response?.data?.detail || 'Failed to fetch lands';
-            toast.error(msg);
-        } finally {
-            setLoading(false);
-        }
-    }, []);
+    const reportError = (error) => {
+        console.error('Error fetching lands:', error);
+        const msg = error.response?.data?.detail || 'Failed to fetch lands';
+        toast.error(msg);
+    };
+
+    const fetchLands = useCallback(() => load().catch(reportError), [load]);
 
     useEffect(() => {
         fetchLands();
@@ -145,13 +141,28 @@ export const VerifierDashboard = () => {
                 <p className="mt-4 text-muted-foreground">Loading applications...</p>
             </div>
         );
-        if (lands.length === 0) return <EmptyState icon={CheckCircle} title={emptyTitle} desc={emptyDesc} />;
+        // The queue is paged, so a tab can be empty until more is loaded
+        const loadMoreButton = hasMore && (
+            <div className="text-center mt-6">
+                <Button variant="outline" onClick={() => loadMore().catch(reportError)} disabled={loadingMore}>
+                    <RefreshCw className={`w-4 h-4 mr-2 ${loadingMore ? 'animate-spin' : ''}`} />
+                    Load more
+                </Button>
+            </div>
+        );
+        if (lands.length === 0) return (
+            <>
+                <EmptyState icon={CheckCircle} title={emptyTitle} desc={emptyDesc} />
+                {loadMoreButton}
+            </>
+        );
         return (
             <>
                 {hint && <p className="text-sm text-muted-foreground mb-4">{hint}</p>}
                 <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-3">
                     {lands.map(land => <LandCard key={land.id} land={land} />)}
                 </div>
+                {loadMoreButton}
             </>
         );
     };
@@ -174,7 +185,7 @@ export const VerifierDashboard = () => {
             <div className="grid grid-cols-3 gap-4 mb-8">
                 <Card>
                     <CardContent className="pt-6 text-center">
-                        <p className="text-3xl font-bold">{allLands.length}</p>
+                        <p className="text-3xl font-bold">{allLands.length}{hasMore ? '+' : ''}</p>
                         <p className="text-sm text-muted-foreground mt-1">Total in Queue</p>
                     </CardContent>
                 </Card>
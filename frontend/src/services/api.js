@@ -39,6 +39,45 @@ api.interceptors.response.use(
     }
 );
 
+// Mint/verify/reject run as background blockchain jobs: the backend answers
+// 202 with a job id. Poll the job until it settles and return its result so
+// callers get the same payload the endpoints used to return synchronously.
+const waitForTxJob = async (accepted, { intervalMs = 2000, timeoutMs = 600000 } = {}) => {
+    if (!accepted?.job_id) {
+        return accepted; // completed synchronously (e.g. pre-mint rejection)
+    }
+
+    const deadline = Date.now() + timeoutMs;
+    while (Date.now() < deadline) {
+        const response = await api.get(`/tx-jobs/${accepted.job_id}`);
+        const job = response.data;
+        if (job.status === 'confirmed') {
+            return job.result;
+        }
+        if (job.status === 'failed') {
+            const detail = job.error || 'Blockchain transaction failed';
+            const error = new Error(detail);
+            error.response = { data: { detail } };
+            throw error;
+        }
+        await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+    throw new Error('Timed out waiting for the blockchain transaction');
+};
+
+// List endpoints return { items, next_cursor }; one page per call. Pass the
+// previous page's next_cursor to get the following one (null on the last)
+const fetchPage = async (url, cursor, params = {}) => {
+    const response = await api.get(url, { params: { ...params, cursor: cursor || undefined } });
+    return response.data;
+};
+
+// First page of a list endpoint, e.g. the newest entries of a feed
+const fetchFirstPage = async (url, params = {}) => {
+    const response = await api.get(url, { params });
+    return response.data.items;
+};
+
 // Auth API functions
 export const authAPI = {
     // Register new user
@@ -100,10 +139,9 @@ export const landAPI = {
         return response.data;
     },
 
-    // Get user's lands
-    getMyLands: async () => {
-        const response = await api.get('/land/my-lands');
-        return response.data;
+    // Page of the user's lands: { items, next_cursor }
+    getMyLands: async (cursor) => {
+        return fetchPage('/land/my-lands', cursor);
     },
 
     // Get land by ID
@@ -194,34 +232,43 @@ export const userAPI = {
 
 // Verifier API functions
 export const verifierAPI = {
-    // Get all lands needing verifier action (not_minted + pending)
-    getAllPendingLands: async () => {
-        const response = await api.get('/land/all-pending');
-        return response.data;
+    // Page of lands needing verifier action (not_minted + pending)
+    getAllPendingLands: async (cursor) => {
+        return fetchPage('/land/all-pending', cursor);
     },
 
-    // Get only minted-but-unreviewed lands
-    getPendingLands: async () => {
-        const response = await api.get('/land/pending/list');
-        return response.data;
+    // Page of minted-but-unreviewed lands
+    getPendingLands: async (cursor) => {
+        return fetchPage('/land/pending/list', cursor);
     },
 
-    // Get all verified lands
-    getVerifiedLands: async () => {
-        const response = await api.get('/land/verified/list');
-        return response.data;
+    // Page of verified lands
+    getVerifiedLands: async (cursor) => {
+        return fetchPage('/land/verified/list', cursor);
     },
 
     // Mint a land NFT on-chain (moves not_minted → pending)
     mintLand: async (landId) => {
         const response = await api.post(`/land/${landId}/mint`);
-        return response.data;
+        return waitForTxJob(response.data);
     },
 
     // Verify a land (admin key used on backend, no private key needed)
     verifyLand: async (landId) => {
         const response = await api.post(`/land/${landId}/verify`, {});
-        return response.data;
+        return waitForTxJob(response.data);
+    },
+
+    // Verify many lands in batched transactions. Resolves to
+    // { lands: [{ land_id, token_id, outcome, reason? }], skipped: [{ land_id, reason }] }
+    // where outcome is 'recorded', 'verified' or 'skipped' (on-chain).
+    verifyLandsBatch: async (landIds) => {
+        const response = await api.post('/land/batch/verify', { land_ids: landIds });
+        const results = await Promise.all(response.data.jobs.map((job) => waitForTxJob(job)));
+        return {
+            lands: results.flatMap((result) => result.lands),
+            skipped: response.data.skipped,
+        };
     },
 
     // Reject a land (reason only, no private key needed)
@@ -229,16 +276,15 @@ export const verifierAPI = {
         const response = await api.post(`/land/${landId}/reject`, {
             reason: reason,
         });
-        return response.data;
+        return waitForTxJob(response.data);
     },
 };
 
 // Admin API functions (admin role only)
 export const adminAPI = {
-    // List all users
-    getUsers: async () => {
-        const response = await api.get('/admin/users');
-        return response.data;
+    // Page of users
+    getUsers: async (cursor) => {
+        return fetchPage('/admin/users', cursor);
     },
 
     // Update a user's role
@@ -261,12 +307,27 @@ export const adminAPI = {
         return response.data;
     },
 
-    getDisputedTransfers: async () => {
-        const response = await api.get('/admin/transfers/disputed');
+    // Page of lands with a disputed escrow transfer
+    getDisputedTransfers: async (cursor) => {
+        return fetchPage('/admin/transfers/disputed', cursor);
+    },
+
+    // Full dump of lands or users ('ndjson' or 'csv') as a Blob to save
+    exportLands: async (format = 'csv') => {
+        const response = await api.get('/admin/export/lands', { params: { format }, responseType: 'blob' });
+        return response.data;
+    },
+
+    exportUsers: async (format = 'csv') => {
+        const response = await api.get('/admin/export/users', { params: { format }, responseType: 'blob' });
         return response.data;
     },
 };
 
+// Registration documents are served by the backend from its document cache
+// (public, like the IPFS gateways, so plain links work)
+export const documentUrl = (cid) => `${API_BASE_URL}/documents/${cid}`;
+
 // Explorer API functions (public — no auth required)
 export const explorerAPI = {
     // Aggregate property/user counts for the stats cards
@@ -275,16 +336,14 @@ export const explorerAPI = {
         return response.data;
     },
 
-    // 20 most-recently-updated land records as "transactions"
+    // 20 most recent contract events (or land updates) as "transactions"
     getTransactions: async () => {
-        const response = await api.get('/explorer/transactions');
-        return response.data;
+        return fetchFirstPage('/explorer/transactions', { limit: 20 });
     },
 
-    // 20 most-recent land records for the Properties tab
+    // 50 most recently updated verified lands for sale, for the Properties tab
     getProperties: async () => {
-        const response = await api.get('/explorer/properties');
-        return response.data;
+        return fetchFirstPage('/explorer/properties', { limit: 50 });
     },
 
     // Live Sepolia network info (block number, gas price, etc.)